@@ -0,0 +1,174 @@
+"""Background publish jobs for the admin world builder."""
+
+import asyncio
+import logging
+import secrets
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JsonDict = Dict[str, Any]
+OutputCallback = Callable[[str, str], None]
+PublishRunner = Callable[[OutputCallback], Awaitable[Any]]
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Finished jobs kept for the status endpoint; the oldest are dropped first.
+MAX_FINISHED_JOBS = 20
+# Output lines kept per job; a runaway test run keeps only its tail.
+MAX_OUTPUT_LINES = 2000
+
+
+def _utc_now() -> str:
+    return (
+        datetime.now(timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+
+
+class PublishInProgressError(Exception):
+    """Raised when a publish is requested while another one is running."""
+
+    def __init__(self, job: "PublishJob") -> None:
+        super().__init__(f"Publish job {job.id} is still running.")
+        self.job = job
+
+
+@dataclass
+class PublishJob:
+    id: str
+    draft_id: Optional[str] = None
+    status: str = JOB_QUEUED
+    step: str = ""
+    error: str = ""
+    result: Optional[JsonDict] = None
+    created_at: str = field(default_factory=_utc_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    output: List[str] = field(default_factory=list)
+    # Absolute index of output[0]; grows as old lines are trimmed.
+    output_offset: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+    def append_output(self, step: str, line: str) -> None:
+        self.step = step
+        self.output.append(line)
+        overflow = len(self.output) - MAX_OUTPUT_LINES
+        if overflow > 0:
+            del self.output[:overflow]
+            self.output_offset += overflow
+
+    def to_dict(self, offset: Optional[int] = 0) -> JsonDict:
+        """
+        Serialize the job. Output lines from absolute index ``offset`` on are
+        included (None omits output); ``next_offset`` is what a poller should
+        send next time to receive only new lines.
+        """
+        data: JsonDict = {
+            "id": self.id,
+            "draft_id": self.draft_id,
+            "status": self.status,
+            "step": self.step,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "next_offset": self.output_offset + len(self.output),
+        }
+        if offset is not None:
+            start = max(offset - self.output_offset, 0)
+            data["output"] = self.output[start:]
+        if self.result is not None:
+            data["publish"] = self.result
+        return data
+
+
+class PublishJobManager:
+    """Runs one publish at a time as an asyncio task and remembers recent jobs."""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS) -> None:
+        self.max_finished = max_finished
+        self.jobs: "OrderedDict[str, PublishJob]" = OrderedDict()
+        self._tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+    def running(self) -> Optional[PublishJob]:
+        for job in self.jobs.values():
+            if not job.finished:
+                return job
+        return None
+
+    def get(self, job_id: str) -> Optional[PublishJob]:
+        return self.jobs.get(job_id)
+
+    def recent(self) -> List[PublishJob]:
+        """Known jobs, newest first."""
+        return list(reversed(self.jobs.values()))
+
+    def start(
+        self, run: PublishRunner, *, draft_id: Optional[str] = None
+    ) -> PublishJob:
+        """
+        Start ``run(on_output)`` in the background and return its job.
+
+        Raises PublishInProgressError if a publish is already running: two
+        publishes racing on the same git checkout would corrupt each other.
+        """
+        running = self.running()
+        if running is not None:
+            raise PublishInProgressError(running)
+        job = PublishJob(id=secrets.token_hex(8), draft_id=draft_id)
+        self.jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job, run))
+        return job
+
+    async def wait(self, job_id: str) -> Optional[PublishJob]:
+        """Wait for a job to finish (tests, shutdown)."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return self.jobs.get(job_id)
+
+    async def _run(self, job: PublishJob, run: PublishRunner) -> None:
+        job.status = JOB_RUNNING
+        job.started_at = _utc_now()
+        try:
+            result = await run(job.append_output)
+        except asyncio.CancelledError:
+            job.status = JOB_FAILED
+            job.error = "Publish cancelled."
+            raise
+        except Exception as error:
+            logger.exception("Publish job %s crashed", job.id)
+            job.status = JOB_FAILED
+            job.error = str(error) or error.__class__.__name__
+        else:
+            payload = result.to_dict() if hasattr(result, "to_dict") else dict(result)
+            job.result = payload
+            job.step = str(payload.get("step") or job.step)
+            if payload.get("ok", False):
+                job.status = JOB_SUCCEEDED
+            else:
+                job.status = JOB_FAILED
+                job.error = str(
+                    payload.get("error") or payload.get("output") or "Publish failed."
+                )
+        finally:
+            job.finished_at = _utc_now()
+            self._tasks.pop(job.id, None)
+            self._trim()
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
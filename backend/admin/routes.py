@@ -8,10 +8,15 @@ from typing import Any, Callable, Dict, List, Optional
 
 from aiohttp import web
 
+from admin.publish_jobs import PublishInProgressError, PublishJobManager
 from globals import SPAWN_ROOM
 from managers.mob_definitions import get_mob_definitions
+from models.ItemIndex import item_index
 from models.Levels import levels
 from models.Mobile import Mobile
+from models.Player import Player
+from models.Room import HiddenItems, Room
+from services.tick_metrics import get_tick_profiler
 
 ADMIN_USERNAME = "stupidgem"
 
@@ -68,6 +73,40 @@ def _error_response(error: str, message: str, status: int) -> web.Response:
     return _json_response({"error": error, "message": message}, status=status)
 
 
+ITEM_SEARCH_LIMIT = 200
+
+
+def _serialize_item_location(
+    item: Any, rooms: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Where an indexed item is: its room, player or mob, and the containers in
+    between. None for items that are nowhere, or in a room not in ``rooms``
+    (a discarded world build).
+    """
+    chain = item_index.chain(item)
+    if not chain:
+        return None
+    location: Dict[str, Any] = {
+        "containers": [str(holder.owner.id) for holder in chain[:-1]]
+    }
+    outer = chain[-1]
+    owner = outer.owner
+    if isinstance(owner, Room):
+        room_id = owner.room_id
+        if rooms.get(room_id) is not owner:
+            return None
+        location["room"] = room_id
+        location["hidden"] = isinstance(outer, HiddenItems)
+    elif isinstance(owner, Player):
+        location["player"] = owner.name
+    elif isinstance(owner, Mobile):
+        location["mob"] = owner.id
+    else:
+        return None
+    return location
+
+
 # Mobile constructor parameters a definition may override. Anything absent
 # falls back to the defaults declared on Mobile.__init__ itself, so the
 # stat defaults live in exactly one place (models/Mobile.py).
@@ -155,6 +194,7 @@ class AdminRouteController:
         self.world_builder = world_builder
         self.world_factory = world_factory
         self.publish_checks = publish_checks or []
+        self.publish_jobs = PublishJobManager()
 
     def _require_admin(self, request: Any) -> Optional[web.Response]:
         session = _find_admin_session(self.online_sessions, _extract_token(request))
@@ -206,6 +246,55 @@ class AdminRouteController:
             {"admin": True, "player": getattr(player, "name", ADMIN_USERNAME)}
         )
 
+    async def tick_metrics(self, request: Any) -> web.Response:
+        unauthorized = self._require_admin(request)
+        if unauthorized is not None:
+            return unauthorized
+
+        profiler = get_tick_profiler()
+        if profiler is None:
+            return _error_response(
+                "metrics_unavailable", "The tick profiler is not running.", 503
+            )
+        return _json_response({"metrics": profiler.snapshot()})
+
+    async def reset_tick_metrics(self, request: Any) -> web.Response:
+        unauthorized = self._require_admin(request)
+        if unauthorized is not None:
+            return unauthorized
+
+        profiler = get_tick_profiler()
+        if profiler is None:
+            return _error_response(
+                "metrics_unavailable", "The tick profiler is not running.", 503
+            )
+        snapshot = profiler.snapshot()
+        profiler.reset()
+        return _json_response({"metrics": snapshot, "reset": True})
+
+    async def search_items(self, request: Any) -> web.Response:
+        unauthorized = self._require_admin(request)
+        if unauthorized is not None:
+            return unauthorized
+
+        term = str(request.query.get("q", "")).strip()
+        if not term:
+            return _error_response("invalid_query", "Pass a search term as q.", 400)
+        try:
+            limit = min(int(request.query.get("limit", 50)), ITEM_SEARCH_LIMIT)
+        except ValueError:
+            return _error_response("invalid_query", "limit must be a number.", 400)
+
+        rooms = getattr(self.game_state, "rooms", {})
+        results: List[Dict[str, Any]] = []
+        for item in item_index.matching(term) + item_index.with_id(term):
+            location = _serialize_item_location(item, rooms)
+            if location is not None:
+                results.append({"id": item.id, "name": item.name, "location": location})
+        return _json_response(
+            {"items": results[:limit], "truncated": len(results) > limit}
+        )
+
     async def get_world(self, request: Any) -> web.Response:
         unauthorized = self._require_admin(request)
         if unauthorized is not None:
@@ -330,6 +419,18 @@ class AdminRouteController:
             )
 
         save_result = self.world_builder.save(world_data)
+        if hasattr(self.world_builder, "publish_async"):
+            checks = self._publish_checks()
+            return self._start_publish_job(
+                lambda on_output: self.world_builder.publish_async(
+                    world_data,
+                    checks=checks,
+                    message="Publish world data",
+                    on_output=on_output,
+                ),
+                saved=save_result,
+                validation=validation,
+            )
         publish_result = self.world_builder.publish(
             world_data, checks=self._publish_checks(), message="Publish world data"
         )
@@ -579,6 +680,25 @@ class AdminRouteController:
             )
 
         effective_draft_id = self._request_draft_id(request, draft_id)
+        if hasattr(self.world_builder, "publish_async"):
+            try:
+                self.world_builder.save_draft(effective_draft_id, world_data)
+            except KeyError as error:
+                return _error_response("draft_not_found", str(error), 404)
+            except ValueError as error:
+                return _error_response("invalid_draft", str(error), 400)
+            checks = self._publish_checks()
+            return self._start_publish_job(
+                lambda on_output: self.world_builder.publish_async(
+                    world_data,
+                    checks=checks,
+                    message="Publish world data",
+                    on_output=on_output,
+                ),
+                saved={"draft_id": effective_draft_id},
+                validation=validation,
+                draft_id=effective_draft_id,
+            )
         try:
             publish_result = self.world_builder.publish_draft(
                 effective_draft_id,
@@ -615,6 +735,62 @@ class AdminRouteController:
             }
         )
 
+    async def list_publish_jobs(self, request: Any) -> web.Response:
+        unauthorized = self._require_admin(request)
+        if unauthorized is not None:
+            return unauthorized
+
+        return _json_response(
+            {"jobs": [job.to_dict(offset=None) for job in self.publish_jobs.recent()]}
+        )
+
+    async def get_publish_job(
+        self, request: Any, job_id: Optional[str] = None
+    ) -> web.Response:
+        unauthorized = self._require_admin(request)
+        if unauthorized is not None:
+            return unauthorized
+
+        effective_job_id = job_id or str(
+            getattr(request, "match_info", {}).get("job_id") or ""
+        )
+        job = self.publish_jobs.get(effective_job_id)
+        if job is None:
+            return _error_response(
+                "job_not_found", f"Unknown publish job: {effective_job_id}", 404
+            )
+        try:
+            offset = max(0, int(request.query.get("offset", 0)))
+        except (TypeError, ValueError):
+            return _error_response("invalid_offset", "offset must be an integer.", 400)
+        return _json_response({"job": job.to_dict(offset=offset)})
+
+    def _start_publish_job(
+        self,
+        run: Callable[..., Any],
+        *,
+        saved: Dict[str, Any],
+        validation: Dict[str, Any],
+        draft_id: Optional[str] = None,
+    ) -> web.Response:
+        # Checks and git run as a background job so the tick loop never
+        # waits on them; the admin UI polls the job for output and result.
+        try:
+            job = self.publish_jobs.start(run, draft_id=draft_id)
+        except PublishInProgressError as error:
+            return _json_response(
+                {
+                    "error": "publish_in_progress",
+                    "message": str(error),
+                    "job": error.job.to_dict(offset=None),
+                },
+                status=409,
+            )
+        return _json_response(
+            {"job": job.to_dict(), "saved": saved, "validation": validation},
+            status=202,
+        )
+
     def _validation_to_dict(self, validation: Any) -> Dict[str, Any]:
         if hasattr(validation, "to_dict"):
             validation = validation.to_dict()
@@ -696,10 +872,19 @@ def register_admin_routes(
         "/admin/api/session": {
             "GET": controller.session,
         },
+        "/admin/api/metrics/tick": {
+            "GET": controller.tick_metrics,
+        },
+        "/admin/api/metrics/tick/reset": {
+            "POST": controller.reset_tick_metrics,
+        },
         "/admin/api/world": {
             "GET": controller.get_world,
             "POST": controller.save_world,
         },
+        "/admin/api/world/items": {
+            "GET": controller.search_items,
+        },
         "/admin/api/world/mob-definitions": {
             "GET": controller.list_mob_definitions,
         },
@@ -715,6 +900,12 @@ def register_admin_routes(
         "/admin/api/world/publish": {
             "POST": controller.publish_world,
         },
+        "/admin/api/world/publish/jobs": {
+            "GET": controller.list_publish_jobs,
+        },
+        "/admin/api/world/publish/jobs/{job_id}": {
+            "GET": controller.get_publish_job,
+        },
         "/admin/api/world/drafts": {
             "GET": controller.list_world_drafts,
             "POST": controller.create_world_draft,
@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+
+from admin import publish_jobs
+from admin.publish_jobs import (
+    JOB_FAILED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    PublishInProgressError,
+    PublishJobManager,
+)
+from admin.world_builder import PublishResult
+
+
+class PublishJobManagerTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.jobs = PublishJobManager()
+
+    async def test_successful_job_records_output_and_result(self):
+        async def run(on_output):
+            on_output("check", "ran 10 tests")
+            on_output("push", "main -> main")
+            return PublishResult(ok=True, step="push", output="done")
+
+        job = self.jobs.start(run)
+        await self.jobs.wait(job.id)
+
+        self.assertEqual(job.status, JOB_SUCCEEDED)
+        data = job.to_dict()
+        self.assertEqual(data["output"], ["ran 10 tests", "main -> main"])
+        self.assertEqual(data["next_offset"], 2)
+        self.assertTrue(data["publish"]["ok"])
+        self.assertIsNotNone(data["finished_at"])
+
+    async def test_failed_result_marks_job_failed_with_error(self):
+        async def run(on_output):
+            return {"ok": False, "step": "check", "error": "tests failed"}
+
+        job = self.jobs.start(run)
+        await self.jobs.wait(job.id)
+
+        self.assertEqual(job.status, JOB_FAILED)
+        self.assertEqual(job.step, "check")
+        self.assertEqual(job.error, "tests failed")
+
+    async def test_crashing_runner_marks_job_failed(self):
+        async def run(on_output):
+            raise FileNotFoundError("git")
+
+        with self.assertLogs("admin.publish_jobs", level="ERROR"):
+            job = self.jobs.start(run)
+            await self.jobs.wait(job.id)
+
+        self.assertEqual(job.status, JOB_FAILED)
+        self.assertEqual(job.error, "git")
+
+    async def test_second_publish_is_rejected_while_one_runs(self):
+        release = asyncio.Event()
+
+        async def run(on_output):
+            await release.wait()
+            return {"ok": True, "step": "push"}
+
+        first = self.jobs.start(run)
+        await asyncio.sleep(0)
+        self.assertEqual(first.status, JOB_RUNNING)
+
+        with self.assertRaises(PublishInProgressError) as raised:
+            self.jobs.start(run)
+        self.assertIs(raised.exception.job, first)
+
+        release.set()
+        await self.jobs.wait(first.id)
+        second = self.jobs.start(run)
+        await self.jobs.wait(second.id)
+        self.assertEqual([job.id for job in self.jobs.recent()], [second.id, first.id])
+
+    async def test_to_dict_offset_returns_only_new_lines(self):
+        async def run(on_output):
+            for n in range(3):
+                on_output("check", f"line {n}")
+            return {"ok": True}
+
+        job = self.jobs.start(run)
+        await self.jobs.wait(job.id)
+
+        self.assertEqual(job.to_dict(offset=2)["output"], ["line 2"])
+        self.assertNotIn("output", job.to_dict(offset=None))
+
+    async def test_output_keeps_tail_and_absolute_offsets(self):
+        self.addCleanup(setattr, publish_jobs, "MAX_OUTPUT_LINES", 2000)
+        publish_jobs.MAX_OUTPUT_LINES = 2
+
+        async def run(on_output):
+            for n in range(5):
+                on_output("check", f"line {n}")
+            return {"ok": True}
+
+        job = self.jobs.start(run)
+        await self.jobs.wait(job.id)
+
+        self.assertEqual(job.to_dict()["output"], ["line 3", "line 4"])
+        self.assertEqual(job.to_dict(offset=4)["output"], ["line 4"])
+        self.assertEqual(job.to_dict()["next_offset"], 5)
+
+    async def test_finished_jobs_are_trimmed(self):
+        jobs = PublishJobManager(max_finished=2)
+
+        async def run(on_output):
+            return {"ok": True}
+
+        ids = []
+        for _ in range(3):
+            job = jobs.start(run)
+            await jobs.wait(job.id)
+            ids.append(job.id)
+
+        self.assertIsNone(jobs.get(ids[0]))
+        self.assertEqual([job.id for job in jobs.recent()], [ids[2], ids[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
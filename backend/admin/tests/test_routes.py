@@ -1,3 +1,4 @@
+import asyncio
 import json
 import unittest
 from types import SimpleNamespace
@@ -9,13 +10,18 @@ from admin.routes import (
     create_admin_token,
     is_admin_session,
 )
+from models.ContainerItem import ContainerItem
+from models.Item import Item
+from models.Room import Room
+from services.tick_metrics import TickProfiler, set_tick_profiler
 
 
 class FakeRequest:
-    def __init__(self, headers=None, payload=None, match_info=None):
+    def __init__(self, headers=None, payload=None, match_info=None, query=None):
         self.headers = headers or {}
         self._payload = payload
         self.match_info = match_info or {}
+        self.query = query or {}
 
     async def json(self):
         if self._payload is None:
@@ -161,6 +167,23 @@ class FakeWorldBuilder:
         return {"ok": True, "step": "push"}
 
 
+class FakeAsyncWorldBuilder(FakeWorldBuilder):
+    def __init__(self):
+        super().__init__()
+        self.release = None
+        self.result = {"ok": True, "step": "push", "output": "pushed"}
+
+    async def publish_async(
+        self, world_data, checks=None, message=None, on_output=None
+    ):
+        self.published = {"world_data": world_data, "checks": checks or []}
+        on_output("check", "Ran 3 tests")
+        if self.release is not None:
+            await self.release.wait()
+        on_output("push", "main -> main")
+        return self.result
+
+
 class AdminRouteControllerTest(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.player = SimpleNamespace(name="Stupidgem")
@@ -215,6 +238,86 @@ class AdminRouteControllerTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(response.status, 200)
         self.assertEqual(self.decode(response), {"admin": False})
 
+    async def test_tick_metrics_returns_profiler_snapshot(self):
+        profiler = TickProfiler()
+        profiler.record("stage", "mob_ai", 0.002)
+        profiler.record_tick(0.6)
+        set_tick_profiler(profiler)
+        self.addCleanup(set_tick_profiler, None)
+
+        response = await self.controller.tick_metrics(self.request())
+
+        metrics = self.decode(response)["metrics"]
+        self.assertEqual(response.status, 200)
+        self.assertEqual(metrics["overruns"], 1)
+        self.assertEqual(metrics["series"]["stage"]["mob_ai"]["count"], 1)
+
+    async def test_reset_tick_metrics_clears_after_snapshot(self):
+        profiler = TickProfiler()
+        profiler.record_tick(0.1)
+        set_tick_profiler(profiler)
+        self.addCleanup(set_tick_profiler, None)
+
+        response = await self.controller.reset_tick_metrics(self.request())
+
+        self.assertEqual(self.decode(response)["metrics"]["ticks"], 1)
+        self.assertEqual(profiler.ticks, 0)
+
+    async def test_tick_metrics_get_ignores_reset_query(self):
+        profiler = TickProfiler()
+        profiler.record_tick(0.1)
+        set_tick_profiler(profiler)
+        self.addCleanup(set_tick_profiler, None)
+        request = FakeRequest(
+            headers={"Authorization": "Bearer token-123"}, query={"reset": "1"}
+        )
+
+        response = await self.controller.tick_metrics(request)
+
+        self.assertNotIn("reset", self.decode(response))
+        self.assertEqual(profiler.ticks, 1)
+
+    async def test_search_items_reports_locations_from_index(self):
+        hall = Room("hall", "Hall", "A hall.")
+        chest = ContainerItem("chest", "chest_1", "A chest.")
+        chest.items.append(Item("silver bell", "bell_1", "A bell."))
+        hall.add_item(chest)
+        self.controller.game_state = SimpleNamespace(rooms={"hall": hall})
+        request = FakeRequest(
+            headers={"Authorization": "Bearer token-123"}, query={"q": "silver b"}
+        )
+
+        response = await self.controller.search_items(request)
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(
+            self.decode(response)["items"],
+            [
+                {
+                    "id": "bell_1",
+                    "name": "silver bell",
+                    "location": {
+                        "containers": ["chest_1"],
+                        "room": "hall",
+                        "hidden": False,
+                    },
+                }
+            ],
+        )
+
+    async def test_search_items_requires_a_term(self):
+        response = await self.controller.search_items(self.request())
+
+        self.assertEqual(response.status, 400)
+        self.assertEqual(self.decode(response)["error"], "invalid_query")
+
+    async def test_tick_metrics_unavailable_without_profiler(self):
+        set_tick_profiler(None)
+
+        response = await self.controller.tick_metrics(self.request())
+
+        self.assertEqual(response.status, 503)
+
     async def test_save_world_rejects_invalid_json(self):
         response = await self.controller.save_world(
             FakeRequest(headers={"Authorization": "Bearer token-123"})
@@ -545,6 +648,118 @@ class AdminRouteControllerTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.decode(missing)["error"], "draft_not_found")
 
 
+class AdminPublishJobRouteTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.player = SimpleNamespace(name="Stupidgem")
+        self.sessions = {"sid1": {"player": self.player, "admin_token": "token-123"}}
+        self.builder = FakeAsyncWorldBuilder()
+        self.controller = AdminRouteController(
+            game_state=SimpleNamespace(rooms={}),
+            mob_manager=SimpleNamespace(mobs={}),
+            online_sessions=self.sessions,
+            world_builder=self.builder,
+            world_factory=Mock(return_value={}),
+            publish_checks=["python -m unittest"],
+        )
+        self.world = {"version": 1, "rooms": [{"id": "square"}]}
+
+    def request(self, payload=None, query=None):
+        return FakeRequest(
+            headers={"Authorization": "Bearer token-123"},
+            payload=payload,
+            query=query,
+        )
+
+    def decode(self, response):
+        return json.loads(response.text)
+
+    async def test_publish_world_starts_background_job(self):
+        response = await self.controller.publish_world(
+            self.request({"world": self.world})
+        )
+
+        self.assertEqual(response.status, 202)
+        body = self.decode(response)
+        self.assertEqual(self.builder.saved, self.world)
+        job_id = body["job"]["id"]
+        job = await self.controller.publish_jobs.wait(job_id)
+        self.assertEqual(job.status, "succeeded")
+        self.assertEqual(
+            self.builder.published["checks"], [["python", "-m", "unittest"]]
+        )
+
+    async def test_publish_job_status_streams_output_from_offset(self):
+        response = await self.controller.publish_world(
+            self.request({"world": self.world})
+        )
+        job_id = self.decode(response)["job"]["id"]
+        await self.controller.publish_jobs.wait(job_id)
+
+        status = await self.controller.get_publish_job(
+            self.request(query={"offset": "1"}), job_id
+        )
+
+        self.assertEqual(status.status, 200)
+        job = self.decode(status)["job"]
+        self.assertEqual(job["output"], ["main -> main"])
+        self.assertEqual(job["next_offset"], 2)
+        self.assertTrue(job["publish"]["ok"])
+
+        listing = await self.controller.list_publish_jobs(self.request())
+        self.assertEqual(self.decode(listing)["jobs"][0]["id"], job_id)
+
+    async def test_publish_while_running_returns_conflict(self):
+        self.builder.release = asyncio.Event()
+        first = await self.controller.publish_world(self.request({"world": self.world}))
+        await asyncio.sleep(0)
+
+        second = await self.controller.publish_world_draft(
+            self.request({"world": self.world}), "main"
+        )
+
+        self.assertEqual(second.status, 409)
+        self.assertEqual(self.decode(second)["error"], "publish_in_progress")
+        self.builder.release.set()
+        await self.controller.publish_jobs.wait(self.decode(first)["job"]["id"])
+
+    async def test_publish_world_draft_job_reports_failure(self):
+        self.builder.result = {"ok": False, "step": "check", "error": "tests failed"}
+
+        response = await self.controller.publish_world_draft(
+            self.request({"world": self.world}), "main"
+        )
+
+        self.assertEqual(response.status, 202)
+        job = await self.controller.publish_jobs.wait(
+            self.decode(response)["job"]["id"]
+        )
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error, "tests failed")
+        self.assertEqual(job.draft_id, "main")
+
+    async def test_publish_world_draft_missing_draft_is_404_before_job(self):
+        response = await self.controller.publish_world_draft(
+            self.request({"world": self.world}), "missing"
+        )
+
+        self.assertEqual(response.status, 404)
+        self.assertEqual(self.controller.publish_jobs.recent(), [])
+
+    async def test_get_publish_job_unknown_and_bad_offset(self):
+        missing = await self.controller.get_publish_job(self.request(), "nope")
+        self.assertEqual(missing.status, 404)
+
+        response = await self.controller.publish_world(
+            self.request({"world": self.world})
+        )
+        job_id = self.decode(response)["job"]["id"]
+        await self.controller.publish_jobs.wait(job_id)
+        bad = await self.controller.get_publish_job(
+            self.request(query={"offset": "x"}), job_id
+        )
+        self.assertEqual(bad.status, 400)
+
+
 class AdminRouteAuthorizationTest(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.player = SimpleNamespace(name="Stupidgem")
@@ -579,6 +794,11 @@ class AdminRouteAuthorizationTest(unittest.IsolatedAsyncioTestCase):
             self.controller.apply_world_draft,
             self.controller.publish_world_draft,
             self.controller.list_mob_definitions,
+            self.controller.tick_metrics,
+            self.controller.reset_tick_metrics,
+            self.controller.search_items,
+            self.controller.list_publish_jobs,
+            self.controller.get_publish_job,
         ]
 
     async def test_every_admin_handler_rejects_missing_token(self):
@@ -665,6 +885,9 @@ class RegisterAdminRoutesTest(unittest.TestCase):
         self.assertIn(("GET", "/admin/api/world/mob-definitions"), registered)
         self.assertIn(("OPTIONS", "/admin/api/world/mob-definitions"), registered)
         self.assertIn(("POST", "/admin/api/world/validate"), registered)
+        self.assertIn(("GET", "/admin/api/metrics/tick"), registered)
+        self.assertNotIn(("POST", "/admin/api/metrics/tick"), registered)
+        self.assertIn(("POST", "/admin/api/metrics/tick/reset"), registered)
         self.assertIsInstance(controller, AdminRouteController)
 
     def test_register_admin_routes_defaults_world_builder_spawn_to_global(self):
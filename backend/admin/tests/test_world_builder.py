@@ -1,16 +1,20 @@
+import asyncio
 import json
 import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import call, patch
 
+from admin import world_builder
 from admin.world_builder import (
     WorldBuilder,
     apply_world_data,
     export_live_world,
     load_world_data,
     run_git_publish,
+    run_git_publish_async,
     save_script_files,
     save_world_data,
     validate_world_data,
@@ -1789,6 +1793,128 @@ class WorldBuilderPublishTests(unittest.TestCase):
         self.assertEqual("backend", first_call.kwargs["env"]["PYTHONPATH"])
 
 
+class WorldBuilderAsyncPublishTests(unittest.IsolatedAsyncioTestCase):
+    def world(self):
+        return {
+            "version": 1,
+            "spawn_room_id": "spawn",
+            "rooms": [{"id": "spawn", "name": "Spawn", "description": "Start."}],
+            "mobs": [],
+        }
+
+    async def test_run_git_publish_async_streams_check_output_and_fails_closed(self):
+        lines = []
+        check = [sys.executable, "-c", "print('ran 3 tests'); raise SystemExit(1)"]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = await run_git_publish_async(
+                self.world(),
+                Path(tmpdir) / "world.json",
+                repo_path=tmpdir,
+                checks=[check],
+                on_output=lambda step, line: lines.append((step, line)),
+            )
+            self.assertTrue((Path(tmpdir) / "world.json").exists())
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.step, "check")
+        self.assertIn("ran 3 tests", result.error)
+        self.assertEqual(lines, [("check", "ran 3 tests")])
+
+    async def test_run_git_publish_async_runs_git_steps_in_order(self):
+        lines = []
+
+        def fake_commands(data_path, script_paths, message):
+            return [
+                (step, [sys.executable, "-c", f"print('{step}')"])
+                for step in ("add", "commit", "push")
+            ]
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch(
+            "admin.world_builder._git_publish_commands", side_effect=fake_commands
+        ):
+            result = await run_git_publish_async(
+                self.world(),
+                Path(tmpdir) / "world.json",
+                repo_path=tmpdir,
+                on_output=lambda step, line: lines.append((step, line)),
+            )
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.step, "push")
+        self.assertEqual(
+            lines, [("add", "add"), ("commit", "commit"), ("push", "push")]
+        )
+
+    async def test_run_git_publish_async_rejects_invalid_world_before_running(self):
+        with tempfile.TemporaryDirectory() as tmpdir, patch(
+            "admin.world_builder.asyncio.create_subprocess_exec"
+        ) as exec_mock:
+            world = self.world()
+            world["rooms"][0]["exits"] = {"north": "nowhere"}
+            result = await run_git_publish_async(world, Path(tmpdir) / "world.json")
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.step, "validate")
+        exec_mock.assert_not_called()
+
+    async def test_run_command_async_handles_lines_past_the_stream_limit(self):
+        script = "import sys; sys.stdout.write('x' * 100000 + '\\nok\\n')"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            returncode, output = await world_builder._run_command_async(
+                [sys.executable, "-c", script], tmpdir, "check", None
+            )
+
+        self.assertEqual(returncode, 0)
+        lines = output.split("\n")
+        self.assertEqual(lines[-1], "ok")
+        self.assertEqual("".join(lines[:-1]), "x" * 100000)
+        self.assertTrue(
+            all(len(line) <= world_builder.COMMAND_LINE_LIMIT for line in lines)
+        )
+
+    async def test_run_command_async_keeps_only_the_output_tail(self):
+        script = "for i in range(50): print(i)"
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+            world_builder, "COMMAND_OUTPUT_LINES", 10
+        ):
+            _, output = await world_builder._run_command_async(
+                [sys.executable, "-c", script], tmpdir, "check", None
+            )
+
+        self.assertEqual(output.split("\n"), [str(i) for i in range(40, 50)])
+
+    async def test_cancelled_run_command_async_kills_the_process(self):
+        started = asyncio.Event()
+        script = "import time; print('started', flush=True); time.sleep(60)"
+        processes = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def tracking_exec(*args, **kwargs):
+            process = await real_exec(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch(
+            "admin.world_builder.asyncio.create_subprocess_exec",
+            side_effect=tracking_exec,
+        ):
+            task = asyncio.create_task(
+                world_builder._run_command_async(
+                    [sys.executable, "-c", script],
+                    tmpdir,
+                    "check",
+                    lambda step, line: started.set(),
+                )
+            )
+            await asyncio.wait_for(started.wait(), timeout=10)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.assertIsNotNone(processes[0].returncode)
+
+
 class WorldBuilderFacadeTests(unittest.TestCase):
     def test_world_builder_facade_loads_saved_data_or_exports_current_world(self):
         game_state = GameState()
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import json
 import math
@@ -33,6 +34,8 @@ from models.Weapon import Weapon
 
 JsonDict = Dict[str, Any]
 PathLike = Union[str, Path]
+# Receives (step, line) for each line a publish subprocess prints.
+OutputCallback = Callable[[str, str], None]
 
 WORLD_DATA_VERSION = 1
 HEX_DIGITS = set("0123456789abcdefABCDEF")
@@ -43,6 +46,11 @@ DEFAULT_LAYER_ID = "surface"
 DEFAULT_GRID_SIZE = 24
 DEFAULT_SPAWN_ROOM_ID = "square"
 DRAFT_MANIFEST_VERSION = 1
+# Publish step output: read in chunks so no line can overrun the stream
+# buffer, split lines longer than the cap, and keep only the tail.
+COMMAND_READ_CHUNK = 64 * 1024
+COMMAND_LINE_LIMIT = 8 * 1024
+COMMAND_OUTPUT_LINES = 2000
 
 REGION_COLOR_PALETTE: Tuple[str, ...] = (
     "#4f8fba",
@@ -556,7 +564,7 @@ def apply_world_data(
             condition = existing_hidden_conditions.get(room_id, {}).get(
                 item_id, _hidden_item_condition
             )
-            room.hidden_items[item_id] = (item, condition)
+            room.add_hidden_item(item, condition, item_id=item_id)
 
         new_rooms[room_id] = room
 
@@ -583,6 +591,72 @@ def run_git_publish(
     message: Optional[str] = None,
     checks: Optional[Sequence[Sequence[str]]] = None,
 ) -> PublishResult:
+    prepared = _prepare_publish(world_data, data_path, repo_path)
+    if isinstance(prepared, PublishResult):
+        return prepared
+
+    repo_cwd = str(repo_path)
+    for check_command in checks or []:
+        completed = _run_command(check_command, repo_cwd)
+        if completed.returncode != 0:
+            return _failed_publish_result("check", completed)
+
+    output_parts: List[str] = []
+    for step, command in _git_publish_commands(data_path, prepared, message):
+        completed = _run_command(command, repo_cwd)
+        output_parts.append(_combined_output(completed))
+        if completed.returncode != 0:
+            return _failed_publish_result(step, completed)
+
+    return PublishResult(ok=True, step="push", output="\n".join(output_parts))
+
+
+async def run_git_publish_async(
+    world_data: Mapping[str, Any],
+    data_path: PathLike,
+    *,
+    repo_path: PathLike = ".",
+    message: Optional[str] = None,
+    checks: Optional[Sequence[Sequence[str]]] = None,
+    on_output: Optional[OutputCallback] = None,
+) -> PublishResult:
+    """
+    run_git_publish without blocking the event loop.
+
+    Checks and git commands run through asyncio subprocesses and their
+    output (stdout and stderr interleaved) is handed to ``on_output`` line
+    by line as it is produced; file writes happen in a worker thread.
+    """
+    prepared = await asyncio.to_thread(
+        _prepare_publish, world_data, data_path, repo_path
+    )
+    if isinstance(prepared, PublishResult):
+        return prepared
+
+    repo_cwd = str(repo_path)
+    for check_command in checks or []:
+        returncode, output = await _run_command_async(
+            check_command, repo_cwd, "check", on_output
+        )
+        if returncode != 0:
+            return PublishResult(ok=False, step="check", output=output, error=output)
+
+    output_parts: List[str] = []
+    for step, command in _git_publish_commands(data_path, prepared, message):
+        returncode, output = await _run_command_async(
+            command, repo_cwd, step, on_output
+        )
+        output_parts.append(output)
+        if returncode != 0:
+            return PublishResult(ok=False, step=step, output=output, error=output)
+
+    return PublishResult(ok=True, step="push", output="\n".join(output_parts))
+
+
+def _prepare_publish(
+    world_data: Mapping[str, Any], data_path: PathLike, repo_path: PathLike
+) -> Union[PublishResult, List[Path]]:
+    """Validate and write the world; returns the script paths or a failure."""
     validation = validate_world_data(world_data)
     if not validation.ok:
         return PublishResult(
@@ -593,28 +667,18 @@ def run_git_publish(
         )
 
     save_world_data(world_data, data_path)
-    script_paths = save_script_files(world_data, repo_path)
+    return save_script_files(world_data, repo_path)
 
-    repo_cwd = str(repo_path)
-    for check_command in checks or []:
-        completed = _run_command(check_command, repo_cwd)
-        if completed.returncode != 0:
-            return _failed_publish_result("check", completed)
 
+def _git_publish_commands(
+    data_path: PathLike, script_paths: Sequence[Path], message: Optional[str]
+) -> List[Tuple[str, Sequence[str]]]:
     add_paths = [str(data_path)] + [str(script_path) for script_path in script_paths]
-    commands: List[Tuple[str, Sequence[str]]] = [
+    return [
         ("add", ["git", "add", *add_paths]),
         ("commit", ["git", "commit", "-m", message or "Publish world data"]),
         ("push", ["git", "push"]),
     ]
-    output_parts: List[str] = []
-    for step, command in commands:
-        completed = _run_command(command, repo_cwd)
-        output_parts.append(_combined_output(completed))
-        if completed.returncode != 0:
-            return _failed_publish_result(step, completed)
-
-    return PublishResult(ok=True, step="push", output="\n".join(output_parts))
 
 
 def _utc_now() -> str:
@@ -1032,6 +1096,23 @@ class WorldBuilder:
             checks=checks,
         )
 
+    async def publish_async(
+        self,
+        world_data: Mapping[str, Any],
+        *,
+        message: Optional[str] = None,
+        checks: Optional[Sequence[Sequence[str]]] = None,
+        on_output: Optional[OutputCallback] = None,
+    ) -> PublishResult:
+        return await run_git_publish_async(
+            world_data,
+            self.data_path,
+            repo_path=self.repo_path,
+            message=message,
+            checks=checks,
+            on_output=on_output,
+        )
+
 
 def _serialize_room(
     room: Room, *, index: int = 0, derived_region_id: Optional[str] = None
@@ -2119,6 +2200,57 @@ def _run_command(command: Sequence[str], cwd: str) -> subprocess.CompletedProces
     return subprocess.run(argv, **run_kwargs)
 
 
+async def _run_command_async(
+    command: Sequence[str],
+    cwd: str,
+    step: str,
+    on_output: Optional[OutputCallback],
+) -> Tuple[int, str]:
+    argv, env_updates = _split_command_env_assignments(command)
+    env: Optional[Dict[str, str]] = None
+    if env_updates:
+        env = os.environ.copy()
+        env.update(env_updates)
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=cwd,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    lines: deque[str] = deque(maxlen=COMMAND_OUTPUT_LINES)
+
+    def record(raw_line: bytes) -> None:
+        for start in range(0, max(len(raw_line), 1), COMMAND_LINE_LIMIT):
+            piece = raw_line[start : start + COMMAND_LINE_LIMIT]
+            line = piece.decode(errors="replace").rstrip("\r")
+            lines.append(line)
+            if on_output is not None:
+                on_output(step, line)
+
+    assert process.stdout is not None
+    try:
+        pending = b""
+        while chunk := await process.stdout.read(COMMAND_READ_CHUNK):
+            *complete, pending = (pending + chunk).split(b"\n")
+            for raw_line in complete:
+                record(raw_line)
+            if len(pending) > COMMAND_LINE_LIMIT:
+                cut = len(pending) - len(pending) % COMMAND_LINE_LIMIT
+                record(pending[:cut])
+                pending = pending[cut:]
+        if pending:
+            record(pending)
+        returncode = await process.wait()
+    except asyncio.CancelledError:
+        # A cancelled publish must not leave git or the test run behind.
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+        raise
+    return returncode, "\n".join(lines)
+
+
 def _split_command_env_assignments(
     command: Sequence[str],
 ) -> Tuple[List[str], Dict[str, str]]:
@@ -2164,6 +2296,7 @@ __all__ = [
     "export_live_world",
     "load_world_data",
     "run_git_publish",
+    "run_git_publish_async",
     "save_script_files",
     "save_world_data",
     "validate_world_data",
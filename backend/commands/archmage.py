@@ -2,6 +2,12 @@
 
 from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 from commands.registry import command_registry
+from models.ItemIndex import item_index
+from models.Mobile import Mobile
+from models.Room import Room
+from managers.session_registry import find_player_by_name, find_player_sid
+from services.invisibility_service import set_invisible
+from services.tick_metrics import get_tick_profiler
 from managers.world.shared_items import (
     create_bone,
     create_coin,
@@ -83,16 +89,9 @@ async def handle_set_points(
         if not player_name or not points_str:
             return "Specify both player name and points. (Usage: set <player_name> <points>)"
 
-        # Find player in online sessions or player manager
-        target_sid = None
-
-        # First check online players
-        for sid, session_data in online_sessions.items():
-            other_player = session_data.get("player")
-            if other_player and other_player.name.lower() == player_name.lower():
-                target_player = other_player
-                target_sid = sid
-                break
+        # Find player in online sessions or player manager,
+        # checking online players first
+        target_player, _ = find_player_by_name(player_name, online_sessions)
 
         # If not found online, try player_manager
         if not target_player:
@@ -122,11 +121,7 @@ async def handle_set_points(
     player_manager.save_players()
 
     # Find target player's session
-    target_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == target_player:
-            target_sid = sid
-            break
+    target_sid = find_player_sid(target_player, online_sessions)
 
     # If player is online, update their stats
     if target_sid and sio and utils:
@@ -190,6 +185,9 @@ async def handle_reset(
             except Exception as e:
                 logger.error(f"Error disconnecting client {sid}: {e}")
 
+        # exec skips the write-behind flusher's final flush; save now
+        player_manager.save_now()
+
         # Option 1: Restart the program (Python process)
         # This is the most reliable way to reset everything
         logger.info("Restarting the server process...")
@@ -220,11 +218,7 @@ async def handle_invisible(
         return "You do not have the authority to use this command."
 
     # Find player's session
-    current_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found."
@@ -234,7 +228,7 @@ async def handle_invisible(
         return "You are already invisible."
 
     # Set invisible flag
-    online_sessions[current_sid]["invisible"] = True
+    set_invisible(player, online_sessions, True)
 
     return "You fade from view. You are now invisible."
 
@@ -257,11 +251,7 @@ async def handle_visible(
         return "You do not have the authority to use this command."
 
     # Find player's session
-    current_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found."
@@ -271,11 +261,41 @@ async def handle_visible(
         return "You are already visible."
 
     # Clear invisible flag
-    online_sessions[current_sid]["invisible"] = False
+    set_invisible(player, online_sessions, False)
 
     return "You shimmer back into view. You are now visible."
 
 
+async def handle_tickstats(
+    cmd: Dict[str, Any],
+    player: Any,
+    game_state: Any,
+    player_manager: Any,
+    online_sessions: Dict[str, Dict[str, Any]],
+    sio: Any,
+    utils: Any,
+) -> str:
+    """
+    Show tick timing percentiles, overruns and the slowest stages,
+    commands and combat pairs. Archmage-only command.
+    Usage: tickstats [reset]
+    """
+    # Check if the player is an Archmage
+    if player.level != "Archmage":
+        return "You do not have the authority to use this command."
+
+    profiler = get_tick_profiler()
+    if profiler is None:
+        return "The tick profiler is not running."
+
+    report = profiler.format_report()
+    words = str(cmd.get("original") or "").lower().split()
+    if "reset" in words[1:] or str(cmd.get("subject") or "").lower() == "reset":
+        profiler.reset()
+        report += "\nTick statistics reset."
+    return report
+
+
 async def handle_godmode(
     cmd: Dict[str, Any],
     player: Any,
@@ -290,11 +310,7 @@ async def handle_godmode(
     Usage: godmodeplz
     """
     # Find player's session for stats update
-    player_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            player_sid = sid
-            break
+    player_sid = find_player_sid(player, online_sessions)
 
     # Grant the points
     player.add_points(100000, player_manager)
@@ -326,40 +342,38 @@ _ITEM_FACTORIES: Tuple[Callable[[], Any], ...] = (
 )
 
 
-def _iter_candidate_items(game_state: Any, utils: Any) -> Iterator[Any]:
-    """Yield every item in the live world, then factory templates.
+def _in_world(item: Any, game_state: Any) -> bool:
+    """Whether an indexed item lies in one of this world's rooms (hidden or
+    not, at any container depth) or in a mob's loot table or shop stock."""
+    chain = item_index.chain(item)
+    if not chain:
+        return False
+    owner = chain[-1].owner
+    if isinstance(owner, Room):
+        rooms = getattr(game_state, "rooms", None) or {}
+        return rooms.get(owner.room_id) is owner
+    # Loot tables are shared by every spawn of a definition, so a template
+    # stays valid after the mob that last listed it has died.
+    return isinstance(owner, Mobile)
+
+
+def _iter_candidate_items(name: str, game_state: Any) -> Iterator[Any]:
+    """Yield live world items whose name, synonym or id matches, then
+    factory templates.
 
-    Covers room items, container contents, hidden items, mob loot
-    tables and mob shop stock.
+    Looked up in the world item index, so this costs O(matches) rather than
+    a walk over every room, container, hidden item and mob.
     """
-    rooms = getattr(game_state, "rooms", None) or {}
-    for room in rooms.values():
-        for item in list(getattr(room, "items", None) or []):
+    lowered = name.lower()
+    for item in item_index.matching(lowered) + item_index.with_id(lowered):
+        if _in_world(item, game_state):
             yield item
-            for inner in list(getattr(item, "items", None) or []):
-                yield inner
-        hidden = getattr(room, "hidden_items", None) or {}
-        for hidden_item, _condition in hidden.values():
-            yield hidden_item
-            for inner in list(getattr(hidden_item, "items", None) or []):
-                yield inner
-
-    mob_manager = getattr(utils, "mob_manager", None)
-    if mob_manager is not None:
-        mobs = getattr(mob_manager, "mobs", None) or {}
-        for mob in mobs.values():
-            entries = list(getattr(mob, "loot_table", None) or [])
-            entries += list(getattr(mob, "shop_stock", None) or [])
-            for entry in entries:
-                item = entry.get("item")
-                if item is not None:
-                    yield item
 
     for factory in _ITEM_FACTORIES:
         yield factory()
 
 
-def _find_item_template(name: str, game_state: Any, utils: Any) -> Optional[Any]:
+def _find_item_template(name: str, game_state: Any) -> Optional[Any]:
     """Find a takeable item matching name.
 
     An exact name/id match wins immediately; otherwise the first
@@ -367,7 +381,7 @@ def _find_item_template(name: str, game_state: Any, utils: Any) -> Optional[Any]
     """
     lowered = name.lower()
     partial: Optional[Any] = None
-    for item in _iter_candidate_items(game_state, utils):
+    for item in _iter_candidate_items(lowered, game_state):
         if not getattr(item, "takeable", False):
             continue
         item_id = str(getattr(item, "id", "") or "")
@@ -401,7 +415,7 @@ async def handle_conjure(
     if not item_name:
         return "Conjure what? (Usage: conjure <item name>)"
 
-    template = _find_item_template(item_name, game_state, utils)
+    template = _find_item_template(item_name, game_state)
     if template is None:
         return f"Nothing in this world matches '{item_name}'."
 
@@ -418,12 +432,16 @@ async def handle_conjure(
 
 # Register Archmage commands
 command_registry.register(
-    "set", handle_set_points, "Set points for a player (Archmage only)."
+    "set",
+    handle_set_points,
+    "Set points for a player (Archmage only).",
+    exclusive=True,
 )
 command_registry.register(
     "reset",
     handle_reset,
     "Reset the world to its start-of-week condition (Archmage only).",
+    exclusive=True,
 )
 command_registry.register(
     "invisible", handle_invisible, "Become invisible (Archmage only)."
@@ -434,7 +452,15 @@ command_registry.register(
 )
 command_registry.register_alias("vis", "visible")
 command_registry.register(
-    "conjure", handle_conjure, "Conjure any item into your hands (Archmage only)."
+    "conjure",
+    handle_conjure,
+    "Conjure any item into your hands (Archmage only).",
+    exclusive=True,
+)
+command_registry.register(
+    "tickstats",
+    handle_tickstats,
+    "Show tick timing and overrun statistics (Archmage only).",
 )
 
 # Secret cheat code - not listed in help
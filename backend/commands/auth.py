@@ -2,6 +2,7 @@
 
 from typing import Any, Dict
 from commands.registry import command_registry
+from managers.session_registry import find_player_sid
 import logging
 
 # Set up logging
@@ -22,11 +23,7 @@ async def handle_password(
     Handle changing a player's password.
     """
     # Get the current sid from the online_sessions
-    current_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
@@ -140,13 +137,8 @@ async def handle_password(
                 # Store original username for registration
                 username = player.name.lower()
 
-                # Attempt to update the password
-                # Since there might not be a direct "change_password" method,
-                # we might need to register with the same username and new password
-                auth_manager.credentials[username] = auth_manager.hash_password(
-                    username, pwd_change["new_password"]
-                )
-                auth_manager.save_credentials()
+                # Update just this user's stored hash
+                auth_manager.set_password(username, pwd_change["new_password"])
 
                 # Clear the password change state
                 del online_sessions[current_sid]["pwd_change"]
@@ -189,11 +181,7 @@ async def handle_password_input(
     It simply echoes back the password command to keep the flow in the password handler.
     """
     # This just ensures we correctly route back to the password handler
-    current_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid = find_player_sid(player, online_sessions)
 
     if current_sid and "pwd_change" in online_sessions[current_sid]:
         # Redirect the flow to the password handler with the original text
@@ -2,21 +2,26 @@
 
 import random
 import logging
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple
 from commands.registry import command_registry
 from models.Weapon import Weapon
 from models.CombatDialogue import CombatDialogue
 from commands.rest import wake_player
+from managers.session_registry import find_player_by_name as lookup_player_by_name
+from managers.session_registry import find_player_sid, sessions_in_room
 from models.Item import Item
 from services.notifications import broadcast_all, broadcast_item_drop
 from services.invisibility_service import is_invisible, break_invisibility
+from services.combat_state import Combat, Combatant, CombatRegistry
+from services.tick_metrics import COMBAT, get_tick_profiler
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global dictionary to track active combat sessions
-active_combats: Dict[str, Dict[str, Any]] = {}
+# Every combatant by combat key (player name or mob id); engagements between
+# them are Combat objects in active_combats.combats.
+active_combats: CombatRegistry = CombatRegistry()
 
 # List of commands that are blocked during combat
 RESTRICTED_COMMANDS = [
@@ -94,30 +99,27 @@ async def handle_attack(
             target_player = subject_obj
 
             # Find their session ID
-            for sid, session_data in online_sessions.items():
-                if session_data.get("player") == target_player:
-                    target_sid = sid
+            target_sid = find_player_sid(target_player, online_sessions)
 
-                    # Check if target is sleeping and wake them up
-                    if session_data.get("sleeping"):
-                        await wake_player(
-                            target_player,
-                            sid,
-                            online_sessions,
-                            sio,
-                            utils,
-                            woken_by=player,
-                        )
-                    break
+            # Check if target is sleeping and wake them up
+            if target_sid and online_sessions[target_sid].get("sleeping"):
+                await wake_player(
+                    target_player,
+                    target_sid,
+                    online_sessions,
+                    sio,
+                    utils,
+                    woken_by=player,
+                )
     else:
         # Find a player by name
         if online_sessions:
-            for sid, session_data in online_sessions.items():
-                other_player = session_data.get("player")
+            for sid, session_data in sessions_in_room(
+                online_sessions, player.current_room
+            ):
+                other_player = session_data["player"]
                 if (
-                    other_player
-                    and other_player.current_room == player.current_room
-                    and other_player != player
+                    other_player != player
                     and subject
                     and subject.lower() in other_player.name.lower()
                 ):
@@ -180,27 +182,19 @@ async def handle_attack(
         # Attacking breaks invisibility
         break_invisibility(player, online_sessions, reason="attacking player")
 
-        # Start combat tracking for attacker
-        active_combats[player.name] = {
-            "target": target_player,
-            "target_sid": target_sid,
-            "weapon": weapon_item,
-            "initiative": True,  # Attacker starts with initiative
-            "last_turn": None,  # No turn has happened yet
-            "is_mob": False,
-            "entity": player,
-        }
-
-        # Start combat tracking for target
-        active_combats[target_player.name] = {
-            "target": player,
-            "target_sid": player_sid,
-            "weapon": None,  # Target starts barehanded
-            "initiative": False,  # Defender doesn't have initiative
-            "last_turn": None,  # No turn has happened yet
-            "is_mob": False,
-            "entity": target_player,
-        }
+        # Start combat tracking; the attacker starts with initiative and the
+        # target barehanded.
+        active_combats[player.name] = Combatant(
+            player,
+            target_player,
+            sid=player_sid,
+            target_sid=target_sid,
+            weapon=weapon_item,
+            initiative=True,
+        )
+        active_combats[target_player.name] = Combatant(
+            target_player, player, sid=target_sid, target_sid=player_sid
+        )
 
         # Notify the target they are being attacked
         attack_msg = f"{player.name} attacks you"
@@ -513,15 +507,22 @@ async def handle_flee(
 
 # ===== COMBAT TICK PROCESSING =====
 def _has_combat_affliction(
-    entity: Any, online_sessions: Dict[str, Dict[str, Any]], affliction_type: str
+    entity: Any,
+    online_sessions: Dict[str, Dict[str, Any]],
+    affliction_type: str,
+    sid: Optional[str] = None,
 ) -> bool:
-    """Check an affliction on either a mob or a player (via their session)."""
+    """
+    Check an affliction on either a mob or a player (via their session).
+    ``sid`` skips the session search when the caller already knows it.
+    """
     from models.Mobile import Mobile
     from services.affliction_service import has_affliction, mob_has_affliction
 
     if isinstance(entity, Mobile):
         return mob_has_affliction(entity, affliction_type)
-    sid = find_player_sid(entity, online_sessions)
+    if sid is None:
+        sid = find_player_sid(entity, online_sessions)
     if sid is None:
         return False
     return has_affliction(online_sessions.get(sid, {}), affliction_type)
@@ -646,24 +647,10 @@ def ensure_combat_with_mob(player: Any, mob: Any, player_sid: Optional[str]) ->
     """
     if player.name in active_combats or mob.id in active_combats:
         return
-    active_combats[player.name] = {
-        "target": mob,
-        "target_sid": None,
-        "weapon": None,
-        "initiative": False,
-        "last_turn": None,
-        "is_mob": False,
-        "entity": player,
-    }
-    active_combats[mob.id] = {
-        "target": player,
-        "target_sid": player_sid,
-        "weapon": None,
-        "initiative": True,
-        "last_turn": None,
-        "is_mob": True,
-        "entity": mob,
-    }
+    active_combats[player.name] = Combatant(player, mob, sid=player_sid)
+    active_combats[mob.id] = Combatant(
+        mob, player, target_sid=player_sid, initiative=True, is_mob=True
+    )
     mob.target_player = player
 
 
@@ -697,232 +684,168 @@ async def process_combat_tick(
         utils (module): Utilities module
         mob_manager (MobManager, optional): The mob manager for mob combat
     """
-    from models.Mobile import Mobile
-
-    def _cleanup_entry(identifier: str) -> None:
-        entry = active_combats.pop(identifier, None)
-        if entry:
-            entity = entry.get("entity")
-            if isinstance(entity, Mobile):
-                entity.target_player = None
-
-    combat_players = list(active_combats.keys())
-    processed_pairs = set()
-
-    if combat_players:
-        logger.info(f"Processing combat tick. Active combats: {combat_players}")
-
-    for combat_key in combat_players:
-        combat_entry = active_combats.get(combat_key)
-        if not combat_entry:
-            continue
-
-        attacker_entity = combat_entry.get("entity")
-        defender_entity = combat_entry.get("target")
-
-        if not attacker_entity or not defender_entity:
-            logger.debug("Skipping %s due to missing entity or target", combat_key)
-            continue
-
-        attacker_is_mob = isinstance(attacker_entity, Mobile)
-        defender_is_mob = isinstance(defender_entity, Mobile)
+    # Sides whose opponent has gone (defeated, fled, disconnected) stop.
+    for combatant in active_combats.unpaired():
+        if combatant.entity is not None:
+            logger.debug("Opponent of %s is gone; ending its combat", combatant.key)
+            _drop_combatants([active_combats.pop(combatant.key)])
+
+    profiler = get_tick_profiler()
+    for combat in list(active_combats.combats):
+        if combat not in active_combats.combats:
+            continue  # Ended earlier this tick
+        round_started = profiler.clock() if profiler is not None else 0.0
+        await _process_combat_round(
+            combat,
+            sio,
+            online_sessions,
+            player_manager,
+            game_state,
+            utils,
+            mob_manager,
+        )
+        if profiler is not None:
+            profiler.record(COMBAT, combat.label, profiler.clock() - round_started)
 
-        if attacker_is_mob and attacker_entity.state != "alive":
-            logger.info("Cleaning up combat for dead mob %s", attacker_entity.id)
-            _cleanup_entry(attacker_entity.id)
-            continue
 
-        if defender_is_mob and defender_entity.state != "alive":
-            logger.info("Cleaning up combat for dead mob %s", defender_entity.id)
-            _cleanup_entry(
-                attacker_entity.id if attacker_is_mob else attacker_entity.name
-            )
-            _cleanup_entry(defender_entity.id)
-            continue
+def _drop_combatants(combatants: List[Combatant]) -> None:
+    """Release mobs from combatants that were just removed."""
+    from models.Mobile import Mobile
 
-        attacker_identifier = (
-            attacker_entity.id if attacker_is_mob else attacker_entity.name
-        )
-        defender_identifier = (
-            defender_entity.id if defender_is_mob else defender_entity.name
-        )
+    for combatant in combatants:
+        if isinstance(combatant.entity, Mobile):
+            combatant.entity.target_player = None
 
-        combat_pair = tuple(sorted([attacker_identifier, defender_identifier]))
-        if combat_pair in processed_pairs:
-            logger.info(f"Skipping pair {combat_pair} - already processed")
-            continue
-        processed_pairs.add(combat_pair)
-        logger.info(f"Processing pair: {combat_pair}")
 
-        defender_entry = active_combats.get(defender_identifier)
+def _combatant_sid(
+    combatant: Combatant, online_sessions: Dict[str, Dict[str, Any]]
+) -> Optional[str]:
+    """The combatant's session id: the cached one if still valid, else looked up."""
+    sid = combatant.sid
+    if sid is not None:
+        session = online_sessions.get(sid)
+        if session is not None and session.get("player") is combatant.entity:
+            return sid
+    sid = find_player_sid(combatant.entity, online_sessions)
+    combatant.sid = sid
+    return sid
+
+
+async def _process_combat_round(
+    combat: Combat,
+    sio: Any,
+    online_sessions: Dict[str, Dict[str, Any]],
+    player_manager: Any,
+    game_state: Any,
+    utils: Any,
+    mob_manager: Optional[Any],
+) -> None:
+    """One swing in ``combat`` by whichever side holds the initiative."""
+    from models.Mobile import Mobile
 
-        attacker_entry_ref = combat_entry
-        initiative_holder = None
+    first, second = combat.sides
+    if first.entity is None or second.entity is None:
+        return
 
-        if not defender_entry:
-            logger.info(
-                "Defender entry missing for %s; removing attacker combat state",
-                defender_identifier,
-            )
-            _cleanup_entry(attacker_identifier)
-            continue
+    for side in combat.sides:
+        if isinstance(side.entity, Mobile) and side.entity.state != "alive":
+            logger.debug("Cleaning up combat for dead mob %s", side.key)
+            _drop_combatants(active_combats.withdraw(side.key))
+            return
 
-        if combat_entry.get("initiative"):
-            initiative_holder = "attacker"
-        elif defender_entry and defender_entry.get("initiative"):
-            initiative_holder = "defender"
-        else:
-            combat_entry["initiative"] = True
-            initiative_holder = "attacker"
-
-        if initiative_holder == "attacker":
-            attacker = attacker_entity
-            defender = defender_entity
-            attacker_key = attacker_identifier
-            defender_key = defender_identifier
-        else:
-            if not defender_entry:
-                logger.debug(
-                    "Defender entry missing for %s; defaulting to attacker initiative",
-                    combat_pair,
-                )
-                attacker = attacker_entity
-                defender = defender_entity
-                attacker_key = attacker_identifier
-                defender_key = defender_identifier
-                attacker_entry_ref = combat_entry
-            else:
-                attacker = defender_entry.get("entity")
-                defender = defender_entry.get("target")
-                attacker_key = defender_identifier
-                defender_key = attacker_identifier
-                attacker_entry_ref = defender_entry
-
-        if not attacker or not defender:
-            logger.error(
-                "SKIPPING - attacker=%s, defender=%s, attacker_key=%s, defender_key=%s",
-                attacker,
-                defender,
-                attacker_key,
-                defender_key,
-            )
-            _cleanup_entry(attacker_key)
-            _cleanup_entry(defender_key)
-            continue
+    attacker_side, defender_side = combat.next_turn()
+    if attacker_side.target is not defender_side.entity:
+        # Group fight: this side is busy with someone else and yields the turn.
+        Combat.pass_initiative(attacker_side, defender_side)
+        return
 
-        attacker_is_mob = isinstance(attacker, Mobile)
-        defender_is_mob = isinstance(defender, Mobile)
+    attacker = attacker_side.entity
+    defender = defender_side.entity
+    attacker_is_mob = isinstance(attacker, Mobile)
+    defender_is_mob = isinstance(defender, Mobile)
 
-        attacker_sid = (
-            None if attacker_is_mob else find_player_sid(attacker, online_sessions)
-        )
-        defender_sid = (
-            None if defender_is_mob else find_player_sid(defender, online_sessions)
-        )
+    attacker_sid = (
+        None if attacker_is_mob else _combatant_sid(attacker_side, online_sessions)
+    )
+    defender_sid = (
+        None if defender_is_mob else _combatant_sid(defender_side, online_sessions)
+    )
 
-        logger.info(
-            "SID check - attacker_is_mob: %s, attacker_sid: %s, defender_is_mob: %s, defender_sid: %s",
-            attacker_is_mob,
-            attacker_sid,
-            defender_is_mob,
-            defender_sid,
+    if not attacker_is_mob and not attacker_sid:
+        logger.warning("Ending combat: attacker %s has no session", first.key)
+        _drop_combatants([active_combats.pop(first.key)])
+        return
+    if not defender_is_mob and not defender_sid:
+        logger.warning("Ending combat: defender %s has no session", second.key)
+        _drop_combatants(
+            [active_combats.pop(first.key), active_combats.pop(second.key)]
         )
+        return
 
-        if not attacker_is_mob and not attacker_sid:
-            logger.warning(
-                "Skipping - attacker %s is player but no SID found",
-                attacker_identifier,
+    # Affliction/casting gates: the attacker may lose this swing.
+    skip_attack = False
+    if attacker_side.skip_next_attack:
+        attacker_side.skip_next_attack = False
+        skip_attack = True
+        if attacker_sid:
+            await utils.send_message(
+                sio, attacker_sid, "You are still recovering from your casting."
             )
-            _cleanup_entry(attacker_identifier)
-            continue
-        if not defender_is_mob and not defender_sid:
-            logger.warning(
-                "Skipping - defender %s is player but no SID found",
-                defender_identifier,
+    elif _has_combat_affliction(attacker, online_sessions, "magic_sleep", attacker_sid):
+        skip_attack = True  # sleepers cannot act
+    elif (
+        _has_combat_affliction(attacker, online_sessions, "cripple", attacker_sid)
+        and random.random() < 0.5
+    ):
+        skip_attack = True
+        attacker_name = getattr(attacker, "name", "Your opponent")
+        if attacker_sid:
+            await utils.send_message(
+                sio,
+                attacker_sid,
+                "Your crippled limbs buckle - the blow goes wide!",
+            )
+        if defender_sid:
+            await utils.send_message(
+                sio,
+                defender_sid,
+                f"{attacker_name.capitalize()} stumbles on crippled limbs!",
             )
-            _cleanup_entry(attacker_identifier)
-            _cleanup_entry(defender_identifier)
-            continue
-
-        attacker_weapon = (
-            attacker_entry_ref.get("weapon") if attacker_entry_ref else None
-        )
-
-        # Affliction/casting gates: the attacker may lose this swing.
-        skip_attack = False
-        if attacker_entry_ref and attacker_entry_ref.pop("skip_next_attack", False):
-            skip_attack = True
-            if attacker_sid:
-                await utils.send_message(
-                    sio, attacker_sid, "You are still recovering from your casting."
-                )
-        elif _has_combat_affliction(attacker, online_sessions, "magic_sleep"):
-            skip_attack = True  # sleepers cannot act
-        elif (
-            _has_combat_affliction(attacker, online_sessions, "cripple")
-            and random.random() < 0.5
-        ):
-            skip_attack = True
-            attacker_name = getattr(attacker, "name", "Your opponent")
-            if attacker_sid:
-                await utils.send_message(
-                    sio, attacker_sid, "Your crippled limbs buckle - the blow goes wide!"
-                )
-            if defender_sid:
-                await utils.send_message(
-                    sio,
-                    defender_sid,
-                    f"{attacker_name.capitalize()} stumbles on crippled limbs!",
-                )
 
-        if skip_attack:
-            pass
-        elif attacker_is_mob or defender_is_mob:
-            if mob_manager:
-                logger.info(
-                    "Processing mob combat: %s vs %s",
-                    attacker_identifier,
-                    defender_identifier,
-                )
-                sid_for_attack = attacker_sid if not attacker_is_mob else defender_sid
-                await process_mob_combat_attack(
-                    attacker,
-                    defender,
-                    attacker_weapon,
-                    sid_for_attack,
-                    player_manager,
-                    game_state,
-                    online_sessions,
-                    mob_manager,
-                    sio,
-                    utils,
-                )
-            else:
-                logger.warning(
-                    "Mob combat skipped - no mob_manager! Attacker: %s, Defender: %s",
-                    attacker_identifier,
-                    defender_identifier,
-                )
-        else:
-            await process_combat_attack(
+    if skip_attack:
+        pass
+    elif attacker_is_mob or defender_is_mob:
+        if mob_manager:
+            sid_for_attack = attacker_sid if not attacker_is_mob else defender_sid
+            await process_mob_combat_attack(
                 attacker,
                 defender,
-                attacker_weapon,
-                attacker_sid,
-                defender_sid,
+                attacker_side.weapon,
+                sid_for_attack,
                 player_manager,
                 game_state,
                 online_sessions,
+                mob_manager,
                 sio,
                 utils,
             )
+        else:
+            logger.warning("Mob combat skipped - no mob_manager! %s", combat.label)
+    else:
+        await process_combat_attack(
+            attacker,
+            defender,
+            attacker_side.weapon,
+            attacker_sid,
+            defender_sid,
+            player_manager,
+            game_state,
+            online_sessions,
+            sio,
+            utils,
+        )
 
-        if attacker_key in active_combats:
-            active_combats[attacker_key]["initiative"] = False
-            logger.info(f"Toggled {attacker_key} initiative to False")
-        if defender_key in active_combats:
-            active_combats[defender_key]["initiative"] = True
-            logger.info(f"Toggled {defender_key} initiative to True")
+    Combat.pass_initiative(attacker_side, defender_side)
 
 
 async def process_combat_attack(
@@ -1255,31 +1178,12 @@ async def handle_player_defeat(
 
 
 # ===== HELPER FUNCTIONS =====
-def find_player_sid(
-    player_name_or_obj: Union[str, Any], online_sessions: Dict[str, Dict[str, Any]]
-) -> Optional[str]:
-    """Find a player's session ID from their name or object."""
-    for sid, session in online_sessions.items():
-        player = session.get("player")
-        if player:
-            if isinstance(player_name_or_obj, str):
-                if player.name.lower() == player_name_or_obj.lower():
-                    return sid
-            else:
-                if player == player_name_or_obj:
-                    return sid
-    return None
-
-
 def find_player_by_name(
     player_name: str, online_sessions: Dict[str, Dict[str, Any]]
 ) -> Optional[Any]:
     """Find a player object from their name."""
-    for session in online_sessions.values():
-        player = session.get("player")
-        if player and player.name.lower() == player_name.lower():
-            return player
-    return None
+    player, _sid = lookup_player_by_name(player_name, online_sessions)
+    return player
 
 
 def end_combat(player1_name: str, player2_name: str) -> None:
@@ -1475,27 +1379,12 @@ async def handle_mob_attack(
     # Attacking a mob breaks invisibility
     break_invisibility(player, online_sessions, reason="attacking mob")
 
-    # Start combat tracking for player
-    active_combats[player.name] = {
-        "target": mob,
-        "target_sid": None,  # Mobs don't have session IDs
-        "weapon": weapon,
-        "initiative": True,  # Attacker starts with initiative
-        "last_turn": None,
-        "is_mob": False,  # Player is not a mob
-        "entity": player,
-    }
-
-    # Start combat tracking for mob
-    active_combats[mob.id] = {
-        "target": player,
-        "target_sid": player_sid,
-        "weapon": None,  # Mobs use their base damage
-        "initiative": False,  # Defender doesn't have initiative
-        "last_turn": None,
-        "is_mob": True,  # This is a mob
-        "entity": mob,
-    }
+    # Start combat tracking; the attacker starts with initiative, mobs have
+    # no session and fight with their base damage.
+    active_combats[player.name] = Combatant(
+        player, mob, sid=player_sid, weapon=weapon, initiative=True
+    )
+    active_combats[mob.id] = Combatant(mob, player, target_sid=player_sid, is_mob=True)
 
     # Set mob's target
     mob.target_player = player
@@ -1566,27 +1455,12 @@ async def mob_initiate_attack(
     if mob.id in active_combats or player.name in active_combats:
         return
 
-    # Start combat tracking for mob
-    active_combats[mob.id] = {
-        "target": player,
-        "target_sid": player_sid,
-        "weapon": None,
-        "initiative": True,  # Mob gets initiative
-        "last_turn": None,
-        "is_mob": True,
-        "entity": mob,
-    }
-
-    # Start combat tracking for player
-    active_combats[player.name] = {
-        "target": mob,
-        "target_sid": None,
-        "weapon": None,  # Player starts barehanded
-        "initiative": False,
-        "last_turn": None,
-        "is_mob": False,
-        "entity": player,
-    }
+    # Start combat tracking; the mob gets initiative, the player starts
+    # barehanded.
+    active_combats[mob.id] = Combatant(
+        mob, player, target_sid=player_sid, initiative=True, is_mob=True
+    )
+    active_combats[player.name] = Combatant(player, mob, sid=player_sid)
 
     # Set mob's target
     mob.target_player = player
@@ -1994,10 +1868,18 @@ command_registry.register(
     handle_retaliate,
     "Use a weapon in combat. Usage: retaliate with <weapon>",
 )
+
+
+def flee_destinations(room: Any) -> List[str]:
+    """Flee takes the named exit or, without one, a random exit."""
+    return list(room.exits.values())
+
+
 command_registry.register(
     "flee",
     handle_flee,
     "Escape from combat, dropping all items and losing some points.",
+    moves_to=flee_destinations,
 )
 
 # Register aliases
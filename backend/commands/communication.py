@@ -2,6 +2,14 @@
 
 from typing import Dict, Any, Optional
 from commands.registry import command_registry
+from managers.session_registry import (
+    PLAYERS_CHANNEL,
+    find_player_by_name,
+    find_player_sid,
+    room_channel,
+    room_mirror_of,
+    sessions_in_room,
+)
 import logging
 from commands.rest import wake_player
 from services.invisibility_service import is_invisible
@@ -36,11 +44,7 @@ async def handle_shout(
     subject: Optional[str] = cmd.get("subject")
 
     # Get the current sid from the online_sessions
-    current_sid: Optional[str] = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid: Optional[str] = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
@@ -66,10 +70,13 @@ async def handle_shout(
         shout_text = f'{player.name} the {player.level} shouts "{subject}"'
 
     if online_sessions and sio and utils:
+        mirror = room_mirror_of(online_sessions)
+        skipped = [current_sid]
         for sid, session_data in online_sessions.items():
             if "player" in session_data and sid != current_sid:
                 # Skip players who are DEAF (cannot hear)
                 if has_affliction(session_data, "deaf"):
+                    skipped.append(sid)
                     continue
 
                 # Wake up sleeping players before sending the message
@@ -86,7 +93,12 @@ async def handle_shout(
                     )
 
                 # Send the shout message
-                await utils.send_message(sio, sid, shout_text)
+                if mirror is None:
+                    await utils.send_message(sio, sid, shout_text)
+
+        if mirror is not None:
+            # One emit to every player; the wake-up notices above went first
+            await mirror.emit("message", shout_text, PLAYERS_CHANNEL, skipped)
 
     return ""
 
@@ -122,11 +134,7 @@ async def handle_say(
         return "What do you want to say?"
 
     # Get the current sid from the online_sessions
-    current_sid: Optional[str] = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid: Optional[str] = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
@@ -146,17 +154,21 @@ async def handle_say(
 
     # Send to all players in the same room
     if online_sessions and sio and utils:
-        for sid, session_data in online_sessions.items():
-            other_player = session_data.get("player")
-            if (
-                other_player
-                and other_player.current_room == player.current_room
-                and sid != current_sid
-            ):
-                # Skip players who are DEAF (cannot hear)
-                if has_affliction(session_data, "deaf"):
-                    continue
+        mirror = room_mirror_of(online_sessions)
+        skipped = [current_sid]
+        for sid, session_data in sessions_in_room(online_sessions, player.current_room):
+            if sid == current_sid:
+                continue
+            # Skip players who are DEAF (cannot hear)
+            if has_affliction(session_data, "deaf"):
+                skipped.append(sid)
+                continue
+            if mirror is None:
                 await utils.send_message(sio, sid, room_msg)
+        if mirror is not None:
+            await mirror.emit(
+                "message", room_msg, room_channel(player.current_room), skipped
+            )
 
     # Spoken words can fire room speech triggers ('say dawnfather' must work
     # like typing the bare word — converse mode turns everything into say).
@@ -207,11 +219,7 @@ async def handle_tell(
         message = cmd.get("instrument")
 
     # Get the current sid from the online_sessions
-    current_sid: Optional[str] = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid: Optional[str] = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
@@ -236,15 +244,9 @@ async def handle_tell(
         return f"What do you want to tell {recipient_name}?"
 
     # Find the recipient
-    recipient_sid: Optional[str] = None
-    recipient_player: Optional[Any] = None
-
-    for sid, session_data in online_sessions.items():
-        other_player = session_data.get("player")
-        if other_player and other_player.name.lower() == recipient_name.lower():
-            recipient_sid = sid
-            recipient_player = other_player
-            break
+    recipient_player, recipient_sid = find_player_by_name(
+        recipient_name, online_sessions
+    )
 
     if recipient_sid and recipient_player:
         # Check if recipient is invisible (can't target invisible players)
@@ -294,11 +296,7 @@ async def handle_act(
         return "What do you want to do?"
 
     # Get the current sid from the online_sessions
-    current_sid: Optional[str] = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid: Optional[str] = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
@@ -338,11 +336,7 @@ async def handle_converse(
     Toggle converse mode for a player.
     """
     # Get the current sid from the online_sessions
-    current_sid: Optional[str] = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid: Optional[str] = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
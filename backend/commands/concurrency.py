@@ -0,0 +1,103 @@
+# backend/commands/concurrency.py
+
+"""
+Locks for running several sessions' commands at once.
+
+In TickService's concurrent command mode every ready session's command runs
+in its own task, so a handler that awaits a lot (a shout fanned out to
+everyone, a death, an error report) no longer delays the sessions behind
+it. Before it runs, a command takes the locks for what it may change:
+
+- the room its player stands in (items on the floor, mobs, occupants), and
+  every room it may move the player into: the exit's room for a direction
+  verb, the rooms a command registered with ``moves_to`` names (flee may
+  take any exit)
+- its player and, when fighting, each opponent, so commands in the same
+  combat serialize even if the fighters' rooms differ
+
+Locks are taken in sorted key order, so two commands never wait on each
+other in a cycle, and are granted first come, first served.
+
+Commands registered with ``exclusive=True`` (spells and archmage commands
+that reach players anywhere or the whole world) take no locks:
+command_lock_keys returns None for them and TickService runs them on their
+own once the concurrent batch is done.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterable, List, Optional
+
+from commands import combat
+from commands.natural_language_parser import (
+    split_chained_commands,
+    vocabulary_manager,
+)
+from commands.registry import command_registry
+from services.combat_state import combat_key
+
+
+def room_key(room_id: Any) -> str:
+    return f"room:{room_id}"
+
+
+def entity_key(key: Any) -> str:
+    """Lock key of the player or mob filed under ``key`` (see combat_key)."""
+    return f"entity:{key}"
+
+
+def command_lock_keys(
+    cmd_str: str, player: Any, game_state: Any
+) -> Optional[FrozenSet[str]]:
+    """
+    Lock keys for running ``cmd_str`` (only its first chained part runs this
+    tick) as ``player``, or None if the command is exclusive.
+    """
+    parts = split_chained_commands(cmd_str)
+    words = parts[0].split() if parts else []
+    verb = vocabulary_manager.expand_word(words[0]) if words else ""
+    if verb and command_registry.is_exclusive(verb):
+        return None
+
+    keys = {room_key(player.current_room), entity_key(combat_key(player))}
+    if verb:
+        get_room = getattr(game_state, "get_room", None)
+        room = get_room(player.current_room) if get_room is not None else None
+        if vocabulary_manager.is_direction(verb):
+            destination = getattr(room, "exits", {}).get(verb)
+            if destination is not None:
+                keys.add(room_key(destination))
+        else:
+            for destination in command_registry.destinations(verb, room):
+                keys.add(room_key(destination))
+
+    fighting = combat.active_combats.get(combat_key(player))
+    if fighting is not None:
+        if fighting.target is not None:
+            keys.add(entity_key(combat_key(fighting.target)))
+        for fight in fighting.combats:
+            keys.add(entity_key(fight.other(fighting).key))
+    return frozenset(keys)
+
+
+class CommandLocks:
+    """asyncio locks by key, created as commands ask for them."""
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @asynccontextmanager
+    async def hold(self, keys: Iterable[str]) -> AsyncIterator[None]:
+        """Hold the locks for ``keys`` (acquired in sorted order)."""
+        held: List[asyncio.Lock] = []
+        try:
+            for key in sorted(keys):
+                lock = self._locks.get(key)
+                if lock is None:
+                    lock = self._locks[key] = asyncio.Lock()
+                await lock.acquire()
+                held.append(lock)
+            yield
+        finally:
+            for lock in reversed(held):
+                lock.release()
@@ -4,6 +4,7 @@ from commands.registry import command_registry
 from typing import Any, Dict, cast
 
 from models.ContainerItem import ContainerItem
+from models.ItemList import find_named
 import logging
 from models.Player import Player
 from commands.player_interaction import handle_steal
@@ -411,11 +412,8 @@ async def handle_get_from(
                 item_to_get = item
                 break
 
-    if not item_to_get:
-        for item in container.items:
-            if subject and hasattr(item, "matches_name") and item.matches_name(subject):
-                item_to_get = item
-                break
+    if not item_to_get and subject:
+        item_to_get = find_named(container.items, subject)
 
     if not item_to_get:
         return f"There is no '{subject}' in the {container.name}."
@@ -4,6 +4,8 @@ Utility functions for handling darkness and visibility in rooms.
 
 from typing import Any, Dict
 
+from managers.session_registry import players_in_room
+
 
 def room_is_visible(
     room: Any, online_sessions: Dict[str, Dict[str, Any]], game_state: Any
@@ -35,17 +37,12 @@ def room_is_visible(
             return True
 
     # Check if any player in this room has a light source
-    for sid, session in online_sessions.items():
-        other_player = session.get("player")
-        if not other_player:
-            continue
-
-        if other_player.current_room == room.room_id:
-            if (
-                hasattr(other_player, "has_light_source")
-                and other_player.has_light_source()
-            ):
-                return True
+    for other_player in players_in_room(online_sessions, room.room_id):
+        if (
+            hasattr(other_player, "has_light_source")
+            and other_player.has_light_source()
+        ):
+            return True
 
     # No light source found anywhere
     return False
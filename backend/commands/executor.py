@@ -1,12 +1,22 @@
 # commands/executor.py (Patched)
 
 import logging
-from typing import Any, Dict, Optional, cast
+import weakref
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, cast
 
 from commands.parser import is_movement_command
 from commands.registry import command_registry
+from managers.session_registry import sessions_in_room
 from services.notifications import broadcast_arrival, broadcast_departure
 from services.invisibility_service import is_invisible
+from services import state_version
+from commands import combat
+from commands import utils as command_utils
+from commands.darkness_utils import room_is_visible, get_dark_room_description
+from managers.mob_manager import MobRegistry
+from models.ItemList import ItemList
+from models.Mobile import Mobile
+from models.Room import Room
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -230,6 +240,26 @@ async def handle_movement(
         return "You can't go that way."
 
 
+class _RoomText:
+    """Cached fragments of one room's look description, with their stamps."""
+
+    __slots__ = ("items_stamp", "items", "mobs_stamp", "mobs")
+
+    def __init__(self) -> None:
+        self.items_stamp: Optional[Tuple[Any, ...]] = None
+        self.items = ""
+        self.mobs_stamp: Optional[Tuple[Any, ...]] = None
+        self.mobs = ""
+
+
+# room -> its cached item and mob lines
+_room_text: "weakref.WeakKeyDictionary[Any, _RoomText]" = weakref.WeakKeyDictionary()
+# player -> (stamp, the line others see for them)
+_occupant_text: "weakref.WeakKeyDictionary[Any, Tuple[Tuple[Any, ...], str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def build_look_description(
     player: Any,
     game_state: Any,
@@ -237,14 +267,19 @@ def build_look_description(
     look: bool = False,
     mob_manager: Optional[Any] = None,
 ) -> str:
-    """Build a description of the current room (including mobs)."""
-    # This function remains largely unchanged
+    """
+    Build a description of the current room (including mobs).
+
+    The item lines, mob lines and the line for each other player are cached
+    and rebuilt only when what they show changed: the room's visible items,
+    its per-room version (mobs arriving or leaving), the combat registry,
+    or the other player's inventory, level and state. Walking back and forth
+    mostly just joins cached strings.
+    """
     current_room = game_state.get_room(player.current_room)
 
     # Check if room is visible (accounts for darkness)
     if online_sessions:
-        from commands.darkness_utils import room_is_visible, get_dark_room_description
-
         if not room_is_visible(current_room, online_sessions, game_state):
             return get_dark_room_description(current_room)
 
@@ -255,73 +290,104 @@ def build_look_description(
         room_desc += f"\n{current_room.description}"
         player.visited.add(current_room.room_id)
 
-    # Get all visible items (excluding mobs - they're listed separately)
-    visible_items = current_room.get_items(game_state)
-
-    # Filter out mobs from items (mobs are StatefulItems but we list them separately)
-    from models.Mobile import Mobile
-
-    non_mob_items = [item for item in visible_items if not isinstance(item, Mobile)]
-
-    # List items in the room
-    if non_mob_items:
-        items_desc = []
-        for item in non_mob_items:
-            items_desc.append(item.description)
-        if items_desc:
-            room_desc += "\n" + "\n".join(items_desc)
+    room_text = _room_text.get(current_room)
+    if room_text is None:
+        room_text = _room_text[current_room] = _RoomText()
 
-    # List mobs in the room
+    room_desc += _item_lines(room_text, current_room, game_state)
     if mob_manager:
-        mobs_in_room = mob_manager.get_mobs_in_room(current_room.room_id)
-        if mobs_in_room:
-            for mob in mobs_in_room:
-                # Check if mob is in combat
-                from commands.combat import is_in_combat
-
-                combat_status = " (in combat)" if is_in_combat(mob.id) else ""
-                room_desc += f"\n{mob.description}{combat_status}"
+        room_desc += _mob_lines(room_text, current_room, mob_manager)
 
     # List other players present in the room
     players_here = []
     if online_sessions:
-        for sid, session_data in online_sessions.items():
-            other_player = session_data.get("player")
-            if not other_player:
-                continue
+        for sid, session_data in sessions_in_room(
+            online_sessions, current_room.room_id
+        ):
+            other_player = session_data["player"]
             # Skip invisible players
             if is_invisible(other_player, online_sessions):
                 continue
-            if (
-                other_player.current_room == current_room.room_id
-                and other_player != player
-            ):
-                from commands.utils import get_player_inventory
-
-                inv_summary = get_player_inventory(other_player)
-                if inv_summary == "":
-                    inv_summary = "nothing"
-
-                # Check player states
-                statuses = []
-
-                # Check if the player is in combat
-                from commands.combat import is_in_combat
-
-                if is_in_combat(other_player.name):
-                    statuses.append("in combat")
-
-                # Check if the player is sleeping
-                if session_data.get("sleeping", False):
-                    statuses.append("asleep")
-
-                status_text = f" ({', '.join(statuses)})" if statuses else ""
-
-                players_here.append(
-                    f"{other_player.name} the {other_player.level}{status_text} is here, carrying {inv_summary}"
-                )
+            if other_player != player:
+                players_here.append(_occupant_line(other_player, session_data))
 
     if players_here:
         room_desc += "\n" + "\n".join(players_here)
 
     return room_desc.strip()
+
+
+def _item_lines(room_text: _RoomText, room: Any, game_state: Any) -> str:
+    if not isinstance(room, Room):
+        return _describe_items(room.get_items(game_state))
+    # Item descriptions change with their state (or a container's contents),
+    # both of which move the global version.
+    visible_items = room.visible_items(game_state)
+    stamp = (game_state, visible_items, state_version.global_version())
+    if room_text.items_stamp != stamp:
+        room_text.items = _describe_items(visible_items)
+        room_text.items_stamp = stamp
+    return room_text.items
+
+
+def _describe_items(items: Iterable[Any]) -> str:
+    # Mobs are StatefulItems too but are listed separately
+    return "".join(
+        f"\n{item.description}" for item in items if not isinstance(item, Mobile)
+    )
+
+
+def _mob_lines(room_text: _RoomText, room: Any, mob_manager: Any) -> str:
+    # Only a real MobRegistry bumps the room version when mobs move
+    cacheable = isinstance(getattr(mob_manager, "mobs", None), MobRegistry)
+    stamp = (
+        mob_manager,
+        state_version.room_version(room.room_id),
+        state_version.global_version(),
+        combat.active_combats.version,
+    )
+    if not cacheable or room_text.mobs_stamp != stamp:
+        room_text.mobs = "".join(
+            f"\n{mob.description}{' (in combat)' if combat.is_in_combat(mob.id) else ''}"
+            for mob in mob_manager.get_mobs_in_room(room.room_id)
+        )
+        room_text.mobs_stamp = stamp if cacheable else None
+    return room_text.mobs
+
+
+def _occupant_line(other_player: Any, session_data: Mapping[str, Any]) -> str:
+    """'<name> the <level> (<states>) is here, carrying <items>'."""
+    in_combat = combat.is_in_combat(other_player.name)
+    sleeping = bool(session_data.get("sleeping"))
+    inventory = other_player.inventory
+    stamp = (
+        other_player.name,
+        other_player.level,
+        in_combat,
+        sleeping,
+        id(inventory),
+        getattr(inventory, "version", None),
+        state_version.global_version(),
+    )
+    cached = (
+        _occupant_text.get(other_player) if isinstance(inventory, ItemList) else None
+    )
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    inv_summary = command_utils.get_player_inventory(other_player)
+    if inv_summary == "":
+        inv_summary = "nothing"
+
+    # Check player states
+    statuses = []
+    if in_combat:
+        statuses.append("in combat")
+    if sleeping:
+        statuses.append("asleep")
+    status_text = f" ({', '.join(statuses)})" if statuses else ""
+
+    line = f"{other_player.name} the {other_player.level}{status_text} is here, carrying {inv_summary}"
+    if isinstance(inventory, ItemList):
+        _occupant_text[other_player] = (stamp, line)
+    return line
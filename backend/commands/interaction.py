@@ -9,22 +9,13 @@ import traceback
 from services.error_reporter import report_error
 from services.notifications import broadcast_room
 from commands.combat import active_combats
+from managers.session_registry import find_player_sid
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
-def _find_player_sid(
-    player: Any, online_sessions: Dict[str, Dict[str, Any]]
-) -> Optional[str]:
-    """Find the session ID for a player."""
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            return sid
-    return None
-
-
 async def _handle_trap_death(
     player: Any,
     game_state: Any,
@@ -41,7 +32,7 @@ async def _handle_trap_death(
     Similar to Finger of Death spell: drop all items, put player in limbo,
     prompt for respawn.
     """
-    player_sid = _find_player_sid(player, online_sessions)
+    player_sid = find_player_sid(player, online_sessions)
     current_room = game_state.get_room(player.current_room)
 
     # Drop all items
@@ -55,8 +46,8 @@ async def _handle_trap_death(
         del active_combats[player.name]
 
     # Also check if player was being targeted in combat
-    for combatant, target in list(active_combats.items()):
-        if target == player.name:
+    for combatant, entry in list(active_combats.items()):
+        if entry.get("target") is player:
             del active_combats[combatant]
 
     # Broadcast death to other players in room
@@ -109,7 +100,7 @@ async def _handle_trap_damage(
     Reduces player stamina. If stamina reaches 0, triggers death.
     Returns death message if player died, None if they survived.
     """
-    player_sid = _find_player_sid(player, online_sessions)
+    player_sid = find_player_sid(player, online_sessions)
 
     # Apply damage
     player.stamina -= damage
@@ -18,9 +18,11 @@ import time
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
 
-from models.ContainerItem import ContainerItem
+from models.ItemIndex import item_index
+from models.Player import Player
+from models.Room import HiddenItems, Room
 
 from commands.registry import command_registry
 from commands.natural_language_parser import vocabulary_manager
@@ -33,6 +35,7 @@ from services.affliction_service import (
     has_affliction,
 )
 from services.invisibility_service import break_invisibility
+from services.state_version import condition_holds
 from services.notifications import broadcast_all, broadcast_item_drop
 
 # Set up logging
@@ -760,6 +763,46 @@ async def handle_force(
     return f"You force {target.name} to '{forced_command}'!"
 
 
+def _describe_item_location(
+    item: Any, game_state: Any, online_players: Set[int]
+) -> Optional[str]:
+    """
+    Where ``item`` is, as the WHERE spell words it: in a room, carried by an
+    online player, or inside a container in one of those. None for items the
+    spell cannot see (unrevealed, deeper in containers, or outside the world).
+    """
+    chain = item_index.chain(item)
+    if not chain or len(chain) > 2:
+        return None
+    outer = chain[-1]
+    owner = outer.owner
+    if isinstance(owner, Room):
+        if game_state.rooms.get(owner.room_id) is not owner:
+            return None
+        if isinstance(outer, HiddenItems):
+            top = chain[0].owner if len(chain) == 2 else item
+            conditions = [
+                condition
+                for hidden, condition in owner.hidden_items.values()
+                if hidden is top
+            ]
+            if not conditions or not condition_holds(conditions[0], game_state):
+                return None
+        place = f"in the room described as {owner.name}"
+    elif isinstance(owner, Player) and id(owner) in online_players:
+        room = game_state.get_room(owner.current_room)
+        room_name = room.name if room else "an unknown location"
+        place = (
+            f"carried by {owner.name} the {owner.level} "
+            f"in the room described as {room_name}"
+        )
+    else:
+        return None
+    if len(chain) == 2:
+        return f"inside the {chain[0].owner.name} {place}"
+    return place
+
+
 async def handle_where(
     cmd: Dict[str, Any],
     player: Any,
@@ -820,44 +863,20 @@ async def handle_where(
             lines.append("Your spell worked!")
             return "\n".join(lines)
 
-    # Search for items - collect all locations with counts
+    # Search for items - collect all locations with counts. The world item
+    # index hands over only the items whose names match.
     locations: Dict[str, int] = defaultdict(int)
-
-    # Search items in all rooms
-    for room_id, room in game_state.rooms.items():
-        for item in room.get_items(game_state):
-            if target_lower in item.name.lower():
-                locations[f"in the room described as {room.name}"] += 1
-            # Check if item is a container
-            if isinstance(item, ContainerItem):
-                for contained in item.items:
-                    if target_lower in contained.name.lower():
-                        loc = f"inside the {item.name} in the room described as {room.name}"
-                        locations[loc] += 1
-
-    # Search player inventories
-    for sid, session in online_sessions.items():
-        other_player = session.get("player")
-        if other_player:
-            player_room = game_state.get_room(other_player.current_room)
-            room_name = player_room.name if player_room else "an unknown location"
-            player_desc = f"{other_player.name} the {other_player.level}"
-
-            for item in other_player.inventory:
-                if target_lower in item.name.lower():
-                    loc = (
-                        f"carried by {player_desc} in the room described as {room_name}"
-                    )
-                    locations[loc] += 1
-                # Check if item is a container
-                if isinstance(item, ContainerItem):
-                    for contained in item.items:
-                        if target_lower in contained.name.lower():
-                            loc = (
-                                f"inside the {item.name} carried by {player_desc} "
-                                f"in the room described as {room_name}"
-                            )
-                            locations[loc] += 1
+    online_players = {
+        id(session["player"])
+        for session in online_sessions.values()
+        if session.get("player") is not None
+    }
+    for item in item_index.matching(target_lower):
+        if target_lower not in item.name.lower():
+            continue  # Only a synonym matched
+        location = _describe_item_location(item, game_state, online_players)
+        if location:
+            locations[location] += 1
 
     # Format output
     if locations:
@@ -1519,6 +1538,7 @@ async def handle_fod(
         end_combat,
         active_combats,
     )
+    from services.combat_state import combat_key
 
     _spell_def = SPELL_DEFINITIONS["fod"]
     caster_sid = find_player_sid(player, online_sessions)
@@ -1536,9 +1556,8 @@ async def handle_fod(
 
         # End any combat
         if player.name in active_combats:
-            combat_data = active_combats[player.name]
-            target_name = combat_data.get("target", "")
-            end_combat(player.name, target_name)
+            combat_target = active_combats[player.name].get("target")
+            end_combat(player.name, combat_key(combat_target) if combat_target else "")
 
         # Notify room
         from services.notifications import broadcast_room
@@ -1635,9 +1654,8 @@ async def handle_fod(
 
         # End any combat the target is in
         if target.name in active_combats:
-            combat_data = active_combats[target.name]
-            combat_target_name = combat_data.get("target", "")
-            end_combat(target.name, combat_target_name)
+            combat_target = active_combats[target.name].get("target")
+            end_combat(target.name, combat_key(combat_target) if combat_target else "")
 
         # Notify room
         from services.notifications import broadcast_room
@@ -1805,29 +1823,49 @@ async def handle_spells(
 
 def register_spell_commands() -> None:
     """Register all spell commands with the command registry."""
-    # Spell commands
+    # Spell commands. Spells that act on a target find it anywhere in the
+    # world, so they are exclusive (see commands.concurrency).
     command_registry.register(
-        "summon", handle_summon, "Summon a player to your location."
+        "summon", handle_summon, "Summon a player to your location.", exclusive=True
     )
     command_registry.register(
-        "force", handle_force, "Force a player to execute a command."
+        "force",
+        handle_force,
+        "Force a player to execute a command.",
+        exclusive=True,
     )
     command_registry.register("where", handle_where, "Locate an item or player.")
     command_registry.register_aliases(["wh"], "where")
-    command_registry.register("change", handle_change, "Change target's sex.")
+    command_registry.register(
+        "change", handle_change, "Change target's sex.", exclusive=True
+    )
     command_registry.register("wish", handle_wish, "Send a message to Archmages.")
-    command_registry.register("deafen", handle_deafen, "Make target unable to hear.")
-    command_registry.register("blind", handle_blind, "Make target unable to see.")
-    command_registry.register("dumb", handle_dumb, "Make target unable to speak.")
-    command_registry.register("cripple", handle_cripple, "Make target unable to move.")
     command_registry.register(
-        "bolt", handle_bolt, "Hurl raw force at a target (resisted by magic)."
+        "deafen", handle_deafen, "Make target unable to hear.", exclusive=True
+    )
+    command_registry.register(
+        "blind", handle_blind, "Make target unable to see.", exclusive=True
+    )
+    command_registry.register(
+        "dumb", handle_dumb, "Make target unable to speak.", exclusive=True
     )
     command_registry.register(
-        "cure", handle_cure, "Remove all afflictions from target."
+        "cripple", handle_cripple, "Make target unable to move.", exclusive=True
     )
     command_registry.register(
-        "fod", handle_fod, "Finger of Death - Archmage only instant kill."
+        "bolt",
+        handle_bolt,
+        "Hurl raw force at a target (resisted by magic).",
+        exclusive=True,
+    )
+    command_registry.register(
+        "cure", handle_cure, "Remove all afflictions from target.", exclusive=True
+    )
+    command_registry.register(
+        "fod",
+        handle_fod,
+        "Finger of Death - Archmage only instant kill.",
+        exclusive=True,
     )
 
     # Spells list command
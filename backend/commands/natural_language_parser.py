@@ -2,8 +2,11 @@
 
 import logging
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional, Any, Set, Union
-from services.get_online_players import get_online_players
+from models.ItemList import find_named
+from services.get_online_players import find_online_player
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -99,49 +102,41 @@ class Token:
         return f"Token({self.type}, '{self.value}', {self.position})"
 
 
-def tokenize(command_str: str) -> List[Token]:
-    """
-    Split input string into tokens.
+# Token patterns, tried in order at each position
+TOKEN_PATTERNS: List[Tuple[str, str]] = [
+    (r'"([^"]*)"', TokenType.QUOTED_STRING),  # Quoted strings
+    (r"\d+", TokenType.NUMBER),  # Numbers
+    (r"[.,;:!?]", TokenType.PUNCTUATION),  # Punctuation
+    (r"\S+", TokenType.WORD),  # Words (anything non-whitespace)
+]
 
-    Handles:
-    - Regular words
-    - Quoted strings
-    - Numbers
-    - Punctuation
-    """
-    tokens = []
+# Combined pattern, compiled once rather than on every call
+TOKEN_RE = re.compile("|".join(f"({p})" for p, _ in TOKEN_PATTERNS))
+
+# Distinct inputs whose tokens / syntax stages are kept (LRU)
+PARSE_CACHE_SIZE = 1024
+
+# (type, value, position) triples; Token objects are built fresh from these
+# per call because the parser expands token values in place.
+RawToken = Tuple[str, str, int]
 
-    logger.debug(f"Tokenizing input: '{command_str}'")
+# Cached front half of a parse: (command, needs no binding) or None
+SyntaxResult = Optional[Tuple[Dict[str, Any], bool]]
 
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _scan_tokens(command_str: str) -> Tuple[RawToken, ...]:
     # Special case for commands that start with a quotation mark (say)
     if command_str.startswith('"'):
-        logger.debug(
-            f"Detected quote-prefixed command, mapping to say: '{command_str}'"
-        )
-        # Create a special token for "say"
-        tokens.append(Token(TokenType.WORD, "say", 0))
-        # Rest of the string becomes the message content
+        # A "say" token; the rest of the string becomes the message content
         content = command_str[1:].strip()
         if content:
-            tokens.append(Token(TokenType.QUOTED_STRING, content, 1))
-        return tokens
-
-    # Define regex patterns
-    patterns = [
-        (r'"([^"]*)"', TokenType.QUOTED_STRING),  # Quoted strings
-        (r"\d+", TokenType.NUMBER),  # Numbers
-        (r"[.,;:!?]", TokenType.PUNCTUATION),  # Punctuation
-        (r"\S+", TokenType.WORD),  # Words (anything non-whitespace)
-    ]
-
-    # Combined pattern
-    pattern = "|".join(f"({p})" for p, _ in patterns)
+            return ((TokenType.WORD, "say", 0), (TokenType.QUOTED_STRING, content, 1))
+        return ((TokenType.WORD, "say", 0),)
 
-    # Find all matches
-    for match in re.finditer(pattern, command_str):
-        # Determine the type by finding which group matched
+    raw: List[RawToken] = []
+    for match in TOKEN_RE.finditer(command_str):
         matched_value = match.group(0)
-        matched_position = match.start()
 
         # Default to WORD type
         token_type = TokenType.WORD
@@ -158,9 +153,25 @@ def tokenize(command_str: str) -> List[Token]:
         elif matched_value in ".,;:!?":
             token_type = TokenType.PUNCTUATION
 
-        tokens.append(Token(token_type, matched_value.lower(), matched_position))
+        raw.append((token_type, matched_value.lower(), match.start()))
+    return tuple(raw)
+
+
+def tokenize(command_str: str) -> List[Token]:
+    """
+    Split input string into tokens.
 
-    logger.debug(f"Tokenization result: {tokens}")
+    Handles:
+    - Regular words
+    - Quoted strings
+    - Numbers
+    - Punctuation
+    """
+    tokens = [
+        Token(type_, value, position)
+        for type_, value, position in _scan_tokens(command_str)
+    ]
+    logger.debug("Tokenized %r: %s", command_str, tokens)
     return tokens
 
 
@@ -179,8 +190,13 @@ class VocabularyManager:
     preposition_types: Dict[str, str]
     adverbs: Set[str]
     directions: Set[str]
+    version: int
 
     def __init__(self) -> None:
+        # Bumped by every add_* call so parsers can drop cached parses; change
+        # the vocabulary through those methods, not by editing the sets.
+        self.version = 0
+
         # Dictionary of abbreviations: {"g": "get", "n": "north", ...}
         # Now enhanced to support context-aware abbreviations
         # Format: {
@@ -373,6 +389,7 @@ class VocabularyManager:
             else:
                 self.abbreviations[abbreviation] = full_word
 
+        self.version += 1
         logger.debug(
             f"Added abbreviation: {abbreviation} -> {full_word}"
             + (f" (context: {context})" if context else "")
@@ -381,11 +398,13 @@ class VocabularyManager:
     def add_synonym(self, synonym: str, base_word: str) -> None:
         """Add a new synonym."""
         self.synonyms[synonym.lower()] = base_word.lower()
+        self.version += 1
         logger.debug(f"Added synonym: {synonym} -> {base_word}")
 
     def add_verb(self, verb: str) -> None:
         """Add a new verb to the vocabulary."""
         self.verbs.add(verb.lower())
+        self.version += 1
         logger.debug(f"Added verb: {verb}")
 
     def add_preposition(
@@ -394,16 +413,19 @@ class VocabularyManager:
         """Add a new preposition to the vocabulary."""
         self.prepositions.add(preposition.lower())
         self.preposition_types[preposition.lower()] = preposition_type
+        self.version += 1
         logger.debug(f"Added preposition: {preposition} (type: {preposition_type})")
 
     def add_adverb(self, adverb: str) -> None:
         """Add a new adverb to the vocabulary."""
         self.adverbs.add(adverb.lower())
+        self.version += 1
         logger.debug(f"Added adverb: {adverb}")
 
     def add_direction(self, direction: str) -> None:
         """Add a new direction to the vocabulary."""
         self.directions.add(direction.lower())
+        self.version += 1
         logger.debug(f"Added direction: {direction}")
 
     def expand_word(self, word: str, position: int = 0, total_words: int = 1) -> str:
@@ -883,6 +905,18 @@ CONTAINER_COMMAND = CommandStructure(
 # Movement command (just one word)
 MOVEMENT_COMMAND = CommandStructure([SyntaxPattern("VERB", priority=10)])
 
+# Every syntax pattern the parser tries, highest priority first
+ALL_SYNTAX_PATTERNS: List[SyntaxPattern] = sorted(
+    CONTAINER_COMMAND.syntax_patterns
+    + STANDARD_SYNTAX_COMMAND.syntax_patterns
+    + REVERSED_SYNTAX_COMMAND.syntax_patterns
+    + ONE_WORD_COMMAND.syntax_patterns
+    + VERB_OBJECT_COMMAND.syntax_patterns,
+    key=lambda p: -p.priority,
+)
+
+COMMUNICATION_VERBS = ("say", "tell", "shout", "act", "whisper")
+
 
 # -------------------------------------------------------------------------
 # Object Binding
@@ -917,13 +951,10 @@ class ObjectBinder:
             logger.debug("Subject is 'all', returning special token")
             return "all"
 
-        # If there's a method to get online players
-        online_players = get_online_players()
-
-        for other_player in online_players:
-            if other_player.name.lower() == entity_name.lower():
-                logger.debug(f"Found {other_player.name} as entity, binding...")
-                return other_player
+        other_player = find_online_player(entity_name)
+        if other_player is not None:
+            logger.debug(f"Found {other_player.name} as entity, binding...")
+            return other_player
 
         # If not a player, let the existing binding code handle it
         return None
@@ -977,18 +1008,17 @@ class ObjectBinder:
             logger.debug("Subject is 'treasure', returning special token")
             return "treasure"
 
-        # Check player's inventory first (using matches_name for synonym support)
-        for item in player.inventory:
-            if hasattr(item, "matches_name") and item.matches_name(subject_str):
-                logger.debug(f"Found matching item in inventory: {item.name}")
-                return item
+        # Check player's inventory first, then the room (name/synonym index)
+        item = find_named(player.inventory, subject_str)
+        if item is not None:
+            logger.debug(f"Found matching item in inventory: {item.name}")
+            return item
 
-        # Then try matching in room (using matches_name for synonym support)
         current_room = game_state.get_room(player.current_room)
-        for item in current_room.get_items(game_state):
-            if hasattr(item, "matches_name") and item.matches_name(subject_str):
-                logger.debug(f"Found matching item in room: {item.name}")
-                return item
+        item = current_room.find_item(subject_str, game_state)
+        if item is not None:
+            logger.debug(f"Found matching item in room: {item.name}")
+            return item
 
         # Try exact name matching for other players
         for other_player in get_players_in_room(player.current_room, game_state):
@@ -1041,18 +1071,17 @@ class ObjectBinder:
             logger.debug(f"Resolved pronoun '{instrument_str}' to {result}")
             return result
 
-        # First try matches in inventory (using matches_name for synonym support)
-        for item in player.inventory:
-            if hasattr(item, "matches_name") and item.matches_name(instrument_str):
-                logger.debug(f"Found matching item in inventory: {item.name}")
-                return item
+        # Check player's inventory first, then the room (name/synonym index)
+        item = find_named(player.inventory, instrument_str)
+        if item is not None:
+            logger.debug(f"Found matching item in inventory: {item.name}")
+            return item
 
-        # Then try matches in room (using matches_name for synonym support)
         current_room = game_state.get_room(player.current_room)
-        for item in current_room.get_items(game_state):
-            if hasattr(item, "matches_name") and item.matches_name(instrument_str):
-                logger.debug(f"Found matching item in room: {item.name}")
-                return item
+        item = current_room.find_item(instrument_str, game_state)
+        if item is not None:
+            logger.debug(f"Found matching item in room: {item.name}")
+            return item
 
         # Try exact matching for other players
         for other_player in get_players_in_room(player.current_room, game_state):
@@ -1094,6 +1123,9 @@ class NaturalLanguageParser:
         self.context = CommandContext(mob_manager=mob_manager)
         self.object_binder = ObjectBinder()
         self.command_registry = None  # Will be set by __init__.py
+        # (input, direct message?, vocabulary versions) -> _match_syntax result
+        self._syntax_cache: "OrderedDict[Tuple[str, bool, int, int], SyntaxResult]"
+        self._syntax_cache = OrderedDict()
         logger.debug("NaturalLanguageParser initialized")
 
     def set_mob_manager(self, mob_manager: Any) -> None:
@@ -1106,6 +1138,10 @@ class NaturalLanguageParser:
         """
         Parse a command string into structured command objects.
 
+        Tokenizing, chain splitting and pattern matching depend only on the
+        input and the vocabulary, so their result is cached per input string;
+        a repeated command only pays for object binding.
+
         Args:
             command_str: The command string to parse
             player: The player object
@@ -1114,32 +1150,25 @@ class NaturalLanguageParser:
         Returns:
             A list of parsed command objects
         """
-        logger.debug(f"Starting to parse command: '{command_str}'")
-
         # Handle empty commands
         if not command_str.strip():
-            logger.debug("Empty command string, returning empty list")
             return []
 
         # Handle command chaining
-        chained_commands = self._detect_chained_commands(command_str)
+        chained_commands = split_chained_commands(command_str)
         if len(chained_commands) > 1:
-            logger.debug(f"Detected chained command with {len(chained_commands)} parts")
             results = []
             for cmd in chained_commands:
-                parsed = self.parse(cmd, player, game_state)
-                results.extend(parsed)
+                results.extend(self.parse(cmd, player, game_state))
             return results
 
         # Tokenize the command
         tokens = tokenize(command_str)
         if not tokens:
-            logger.debug("No tokens found, returning empty list")
             return []
 
         # Special case for commands starting with a quote (say command)
         if command_str.startswith('"'):
-            logger.debug("Processing quote-prefixed command as 'say'")
             say_cmd: Dict[str, Any] = {
                 "verb": "say",
                 "subject": command_str[1:].strip(),
@@ -1149,7 +1178,7 @@ class NaturalLanguageParser:
 
         # Check if first token might be a player name (for direct messaging)
         is_direct_message = False
-        if tokens and player and game_state:
+        if player and game_state:
             first_token = tokens[0].value.lower()
             # Check if this matches a player name in the room
             players_in_room = get_players_in_room(player.current_room, game_state)
@@ -1161,92 +1190,142 @@ class NaturalLanguageParser:
                     is_direct_message = True
                     break
 
+        syntax = self._match_syntax(command_str, tokens, is_direct_message)
+        if syntax is None:
+            logger.debug("Parsing failed completely, returning empty list")
+            return []
+        cached_cmd, complete = syntax
+        parsed_cmd = dict(cached_cmd)
+        if complete:
+            return [parsed_cmd]
+
+        # Add subject if present and not a communication command
+        if "subject" in parsed_cmd and parsed_cmd["subject"]:
+            # Skip binding for communication command messages
+            if parsed_cmd.get("verb") not in COMMUNICATION_VERBS:
+                parsed_cmd["subject_object"] = self.object_binder.bind_subject(
+                    parsed_cmd["subject"], player, game_state, self.context
+                )
+
+        # Add instrument if present
+        if "instrument" in parsed_cmd and parsed_cmd["instrument"]:
+            # Skip binding for tell command messages
+            if parsed_cmd.get("verb") != "tell":
+                parsed_cmd["instrument_object"] = self.object_binder.bind_instrument(
+                    parsed_cmd["instrument"], player, game_state, self.context
+                )
+
+        # Store the original command string
+        parsed_cmd["original"] = command_str
+
+        # Handle direct message special case
+        if is_direct_message and parsed_cmd and not parsed_cmd.get("verb") == "tell":
+            # If first token matched a player name, but wasn't parsed as a tell command
+            # we'll convert it to one
+            parts = command_str.split(maxsplit=1)
+            recipient = parts[0]
+            message = parts[1] if len(parts) > 1 else ""
+
+            direct_msg_cmd: Dict[str, Any] = {
+                "verb": "tell",
+                "subject": recipient,
+                "instrument": message,  # Use exact message
+                "original": command_str,
+                "is_direct_message": True,
+            }
+            parsed_cmd = direct_msg_cmd
+            logger.debug(f"Converted to direct player message: {parsed_cmd}")
+
+        # Update context with this command
+        if not (is_direct_message or parsed_cmd.get("verb") in COMMUNICATION_VERBS):
+            self.context.update(
+                verb=parsed_cmd.get("verb"),
+                subject=parsed_cmd.get("subject_object"),
+                instrument=parsed_cmd.get("instrument_object"),
+            )
+
+        logger.debug(f"Final parsed command after binding: {parsed_cmd}")
+        return [parsed_cmd]
+
+    def _match_syntax(
+        self, command_str: str, tokens: List[Token], is_direct_message: bool
+    ) -> SyntaxResult:
+        """
+        Cached front of ``parse``: word expansion and pattern matching.
+
+        Returns (command, complete) where ``complete`` means the command
+        needs no binding (movement), or None if nothing could be parsed.
+        Callers must copy the command before changing it.
+        """
+        key = (
+            command_str,
+            is_direct_message,
+            self.vocabulary.version,
+            vocabulary_manager.version,
+        )
+        cache = self._syntax_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = self._expand_and_match(command_str, tokens, is_direct_message)
+        cache[key] = result
+        if len(cache) > PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _expand_and_match(
+        self, command_str: str, tokens: List[Token], is_direct_message: bool
+    ) -> SyntaxResult:
         # Count total number of words for context-aware expansion
         total_words = len(tokens)
 
         # Only expand the first token (verb) - don't expand the rest of the tokens for communication commands
-        if tokens:
-            # Save original first token (verb)
-            original_verb = tokens[0].value
-            # Expand the verb (first token) with position context
-            tokens[0].value = self.vocabulary.expand_word(original_verb, 0, total_words)
-            expanded_verb = tokens[0].value
-            logger.debug(f"Verb: '{original_verb}' -> '{expanded_verb}'")
-
-            # Check if this is a communication command
-            is_communication_cmd = expanded_verb in [
-                "say",
-                "tell",
-                "shout",
-                "act",
-                "whisper",
-            ]
-
-            # Only expand other tokens if this is NOT a communication command or direct message
-            if not (is_communication_cmd or is_direct_message):
-                # Now expand all other tokens with position context
-                for i in range(1, len(tokens)):
-                    original_value = tokens[i].value
-                    expanded_value = self.vocabulary.expand_word(
-                        original_value, i, total_words
-                    )
-                    if original_value != expanded_value:
-                        tokens[i].value = expanded_value
-                        logger.debug(
-                            f"Expanded token at position {i}: '{original_value}' -> '{expanded_value}'"
-                        )
-
-            # Handle special 'go' cases
-            if original_verb.lower() == "go" and len(tokens) > 1:
-                direction = tokens[1].value.lower()
-                expanded_direction = self.vocabulary.expand_word(
-                    direction, 1, total_words
+        # Save original first token (verb)
+        original_verb = tokens[0].value
+        # Expand the verb (first token) with position context
+        tokens[0].value = self.vocabulary.expand_word(original_verb, 0, total_words)
+        expanded_verb = tokens[0].value
+        logger.debug(f"Verb: '{original_verb}' -> '{expanded_verb}'")
+
+        # Check if this is a communication command
+        is_communication_cmd = expanded_verb in COMMUNICATION_VERBS
+
+        # Only expand other tokens if this is NOT a communication command or direct message
+        if not (is_communication_cmd or is_direct_message):
+            # Now expand all other tokens with position context
+            for i in range(1, len(tokens)):
+                tokens[i].value = self.vocabulary.expand_word(
+                    tokens[i].value, i, total_words
                 )
 
+        # Handle special 'go' cases
+        if original_verb.lower() == "go" and len(tokens) > 1:
+            direction = tokens[1].value.lower()
+            expanded_direction = self.vocabulary.expand_word(direction, 1, total_words)
+            if self.vocabulary.is_direction(expanded_direction):
                 logger.debug(
-                    f"Checking for direction after 'go': '{direction}' -> '{expanded_direction}'"
+                    f"'go {direction}' is a movement command, using '{expanded_direction}'"
                 )
-
-                if self.vocabulary.is_direction(expanded_direction):
-                    logger.debug(
-                        f"'go {direction}' is a movement command, using '{expanded_direction}'"
-                    )
-                    go_cmd: Dict[str, Any] = {
-                        "verb": expanded_direction,
-                        "is_movement": True,
-                        "original": command_str,
-                    }
-                    return [go_cmd]
+                go_cmd: Dict[str, Any] = {
+                    "verb": expanded_direction,
+                    "is_movement": True,
+                    "original": command_str,
+                }
+                return go_cmd, True
 
         # Check for movement command (just single direction command)
-        if tokens and self.vocabulary.is_direction(tokens[0].value):
+        if self.vocabulary.is_direction(tokens[0].value):
             logger.debug(f"Detected simple movement command: '{tokens[0].value}'")
             move_cmd: Dict[str, Any] = {
                 "verb": tokens[0].value,
                 "is_movement": True,
                 "original": command_str,
             }
-            return [move_cmd]
-
-        # Try all command structures
-        parsed_cmd: Optional[Dict[str, Any]] = None
-
-        # IMPORTANT CHANGE: Create a combined list of all syntax patterns
-        all_patterns: List[SyntaxPattern] = []
-        all_patterns.extend(CONTAINER_COMMAND.syntax_patterns)
-        all_patterns.extend(STANDARD_SYNTAX_COMMAND.syntax_patterns)
-        all_patterns.extend(REVERSED_SYNTAX_COMMAND.syntax_patterns)
-        all_patterns.extend(ONE_WORD_COMMAND.syntax_patterns)
-        all_patterns.extend(VERB_OBJECT_COMMAND.syntax_patterns)
-
-        # Sort by priority (highest first)
-        all_patterns.sort(key=lambda p: -p.priority)
+            return move_cmd, True
 
         # Try patterns in order of priority
-        for pattern in all_patterns:
-            logger.debug(
-                f"Trying pattern: '{pattern.pattern_str}' with priority {pattern.priority}"
-            )
+        parsed_cmd: Optional[Dict[str, Any]] = None
+        for pattern in ALL_SYNTAX_PATTERNS:
             matched, bindings = pattern.matches(tokens)
             if matched:
                 parsed_cmd = bindings
@@ -1255,104 +1334,37 @@ class NaturalLanguageParser:
                 )
                 break
 
-        # If no command structure matched but we have tokens, try a fallback approach
-        if not parsed_cmd and tokens:
+        # If no command structure matched, try a fallback approach
+        if not parsed_cmd:
             # If we have exactly two tokens, it's most likely "VERB SUBJECT"
             if len(tokens) == 2:
-                logger.debug(
-                    "No pattern matched, but have 2 tokens. Using VERB SUBJECT fallback."
-                )
                 parsed_cmd = {"verb": tokens[0].value, "subject": tokens[1].value}
             # Otherwise just use the verb
             else:
-                logger.debug(
-                    f"No command structure matched. Using verb-only default: '{tokens[0].value}'"
-                )
                 parsed_cmd = {"verb": tokens[0].value}
 
         # Final fallback for parsing errors
         if not parsed_cmd:
-            logger.debug("Parsing failed completely, returning empty list")
-            return []
+            return None
 
         # For communication commands, use the original message from the command string
-        if parsed_cmd and "verb" in parsed_cmd:
+        if "verb" in parsed_cmd:
             verb = parsed_cmd["verb"]
-            if verb in ["say", "tell", "shout", "act", "whisper"]:
+            if verb in COMMUNICATION_VERBS:
                 # For "tell <player> <message>" format
                 if verb == "tell" and "subject" in parsed_cmd:
                     # Extract the message part - everything after "tell player"
                     parts = command_str.split(maxsplit=2)
                     if len(parts) > 2:
                         parsed_cmd["instrument"] = parts[2]  # Use exact message
-                        logger.debug(
-                            f"Using original message for tell command: {parsed_cmd['instrument']}"
-                        )
                 # For other communication commands
                 elif "subject" in parsed_cmd:
                     # Extract the message part - everything after the verb
                     parts = command_str.split(maxsplit=1)
                     if len(parts) > 1:
                         parsed_cmd["subject"] = parts[1]  # Use exact message
-                        logger.debug(
-                            f"Using original message for {verb} command: {parsed_cmd['subject']}"
-                        )
-
-        # Handle object binding
-        logger.debug(f"Final parsed command before binding: {parsed_cmd}")
-
-        # Add subject if present and not a communication command
-        if "subject" in parsed_cmd and parsed_cmd["subject"]:
-            # Skip binding for communication command messages
-            if parsed_cmd.get("verb") not in ["say", "tell", "shout", "act", "whisper"]:
-                logger.debug(f"Binding subject: {parsed_cmd['subject']}")
-                parsed_cmd["subject_object"] = self.object_binder.bind_subject(
-                    parsed_cmd["subject"], player, game_state, self.context
-                )
 
-        # Add instrument if present
-        if "instrument" in parsed_cmd and parsed_cmd["instrument"]:
-            # Skip binding for tell command messages
-            if parsed_cmd.get("verb") != "tell":
-                logger.debug(f"Binding instrument: {parsed_cmd['instrument']}")
-                parsed_cmd["instrument_object"] = self.object_binder.bind_instrument(
-                    parsed_cmd["instrument"], player, game_state, self.context
-                )
-
-        # Store the original command string
-        parsed_cmd["original"] = command_str
-
-        # Handle direct message special case
-        if is_direct_message and parsed_cmd and not parsed_cmd.get("verb") == "tell":
-            # If first token matched a player name, but wasn't parsed as a tell command
-            # we'll convert it to one
-            parts = command_str.split(maxsplit=1)
-            recipient = parts[0]
-            message = parts[1] if len(parts) > 1 else ""
-
-            direct_msg_cmd: Dict[str, Any] = {
-                "verb": "tell",
-                "subject": recipient,
-                "instrument": message,  # Use exact message
-                "original": command_str,
-                "is_direct_message": True,
-            }
-            parsed_cmd = direct_msg_cmd
-            logger.debug(f"Converted to direct player message: {parsed_cmd}")
-
-        # Update context with this command
-        if not (
-            is_direct_message
-            or parsed_cmd.get("verb") in ["say", "tell", "shout", "act", "whisper"]
-        ):
-            self.context.update(
-                verb=parsed_cmd.get("verb"),
-                subject=parsed_cmd.get("subject_object"),
-                instrument=parsed_cmd.get("instrument_object"),
-            )
-
-        logger.debug(f"Final parsed command after binding: {parsed_cmd}")
-        return [parsed_cmd]
+        return parsed_cmd, False
 
     def _detect_chained_commands(self, command_str: str) -> List[str]:
         """
@@ -1364,27 +1376,25 @@ class NaturalLanguageParser:
         Returns:
             A list of individual command strings
         """
-        # Split by commas, but preserve commas inside quoted strings
-        pattern = r',\s*(?=(?:[^"]*"[^"]*")*[^"]*$)'
-        parts = re.split(pattern, command_str)
+        return list(split_chained_commands(command_str))
 
-        # Also split by "and" or "then" but not inside quotes
-        final_parts = []
-        for part in parts:
-            # Split by " and " or " then "
-            and_pattern = r'\s+and\s+(?=(?:[^"]*"[^"]*")*[^"]*$)'
-            then_pattern = r'\s+then\s+(?=(?:[^"]*"[^"]*")*[^"]*$)'
 
-            # First split by "and"
-            and_parts = re.split(and_pattern, part, flags=re.IGNORECASE)
+# Chain separators: commas, " and ", " then ", except inside quotes
+CHAIN_COMMA_RE = re.compile(r',\s*(?=(?:[^"]*"[^"]*")*[^"]*$)')
+CHAIN_AND_RE = re.compile(r'\s+and\s+(?=(?:[^"]*"[^"]*")*[^"]*$)', re.IGNORECASE)
+CHAIN_THEN_RE = re.compile(r'\s+then\s+(?=(?:[^"]*"[^"]*")*[^"]*$)', re.IGNORECASE)
+
 
-            # Then split each of those by "then"
-            for and_part in and_parts:
-                then_parts = re.split(then_pattern, and_part, flags=re.IGNORECASE)
-                final_parts.extend(then_parts)
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def split_chained_commands(command_str: str) -> Tuple[str, ...]:
+    """Split a chained command ("get sword and n, look") into its parts."""
+    final_parts = []
+    for part in CHAIN_COMMA_RE.split(command_str):
+        for and_part in CHAIN_AND_RE.split(part):
+            final_parts.extend(CHAIN_THEN_RE.split(and_part))
 
-        # Return non-empty parts
-        return [p.strip() for p in final_parts if p.strip()]
+    # Return non-empty parts
+    return tuple(p.strip() for p in final_parts if p.strip())
 
 
 # -------------------------------------------------------------------------
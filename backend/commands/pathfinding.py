@@ -4,7 +4,7 @@ Commands:
 - swamp (alias: zw): Move one room toward the swamp (outdoor rooms only)
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from commands.registry import command_registry
 from commands.executor import handle_movement
@@ -73,8 +73,17 @@ async def handle_swamp(
     )
 
 
+def swamp_destinations(room: Any) -> List[str]:
+    """The room one step along the current room's swamp_direction."""
+    destination = room.exits.get(getattr(room, "swamp_direction", None))
+    return [destination] if destination is not None else []
+
+
 # Register commands
 command_registry.register(
-    "swamp", handle_swamp, "Move one room toward the swamp (outdoor rooms only)."
+    "swamp",
+    handle_swamp,
+    "Move one room toward the swamp (outdoor rooms only).",
+    moves_to=swamp_destinations,
 )
 command_registry.register_aliases(["zw"], "swamp")
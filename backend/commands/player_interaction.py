@@ -1,6 +1,7 @@
 # backend/commands/player_interaction.py
 from typing import Dict, Any
 from commands.registry import command_registry
+from managers.session_registry import find_player_sid
 import random
 import logging
 
@@ -189,10 +190,7 @@ async def handle_give(
         if target_obj.current_room == player.current_room:
             target_player = target_obj
             # Find their session ID
-            for sid, session in online_sessions.items():
-                if session.get("player") == target_player:
-                    target_sid = sid
-                    break
+            target_sid = find_player_sid(target_player, online_sessions)
     else:
         # Find by name (only search players, not mobs)
         for sid, session in online_sessions.items():
@@ -300,10 +298,7 @@ async def handle_steal(
         if subject_obj.current_room == player.current_room:
             target_player = subject_obj
             # Find their session ID
-            for sid, session in online_sessions.items():
-                if session.get("player") == target_player:
-                    target_sid = sid
-                    break
+            target_sid = find_player_sid(target_player, online_sessions)
     else:
         # Find by name (only search players, not mobs)
         for sid, session in online_sessions.items():
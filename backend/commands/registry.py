@@ -1,6 +1,6 @@
 # commands/registry.py (Updated)
 
-from typing import List, Callable, Optional, Dict, Any
+from typing import List, Callable, Iterable, Optional, Dict, Any
 from commands.natural_language_parser import vocabulary_manager
 
 
@@ -50,6 +50,8 @@ class CommandRegistry:
         handler: Callable[..., Any],
         help_text: Optional[str] = None,
         hidden: bool = False,
+        exclusive: bool = False,
+        moves_to: Optional[Callable[[Any], Iterable[str]]] = None,
     ) -> None:
         """
         Register a command handler.
@@ -59,6 +61,13 @@ class CommandRegistry:
             handler: The function to handle the command
             help_text: Optional help text for the command
             hidden: If True, command won't appear in help listings
+            exclusive: If True, the command reaches beyond the player's room
+                (other players anywhere, the whole world) and never runs
+                alongside other commands (see commands.concurrency)
+            moves_to: For commands that can move the player other than by a
+                direction verb, a function of the player's current Room
+                returning the ids of every room the command may move them
+                into; those rooms are locked while it runs
         """
         verb_lower = verb.lower()
 
@@ -66,6 +75,8 @@ class CommandRegistry:
             "handler": handler,
             "help_text": help_text or f"No help available for '{verb}'.",
             "hidden": hidden,
+            "exclusive": exclusive,
+            "moves_to": moves_to,
         }
 
         # Add to vocabulary
@@ -92,6 +103,19 @@ class CommandRegistry:
         handler: Optional[Callable[..., Any]] = command_entry.get("handler")
         return handler
 
+    def is_exclusive(self, verb: str) -> bool:
+        """Whether ``verb`` (or the command it abbreviates) is exclusive."""
+        verb = vocabulary_manager.expand_word(verb.lower())
+        return bool(self.commands.get(verb, {}).get("exclusive", False))
+
+    def destinations(self, verb: str, room: Any) -> List[str]:
+        """Rooms ``verb`` may move its player into from ``room`` (see moves_to)."""
+        verb = vocabulary_manager.expand_word(verb.lower())
+        moves_to = self.commands.get(verb, {}).get("moves_to")
+        if moves_to is None or room is None:
+            return []
+        return list(moves_to(room))
+
     def get_help(self, verb: Optional[str] = None) -> str:
         """
         Get help text for a specific verb or all commands.
@@ -1,10 +1,12 @@
 # backend/commands/rest.py
 
 from commands.registry import command_registry
+from managers.session_registry import find_player_sid
 from typing import Any, Dict, Optional
 
 from services.affliction_service import has_affliction
 from services.notifications import broadcast_room
+from services.scheduler import SLEEP_HEAL, get_scheduler
 import logging
 
 # Set up logging
@@ -13,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 # Number of ticks between each healing point while sleeping
 SLEEP_HEALING_INTERVAL = 2  # Healing occurs every 2 ticks
+# The same cadence in seconds (2 ticks of 0.5s) for the scheduler
+SLEEP_HEALING_SECONDS = 1.0
 
 
 async def handle_sleep(
@@ -47,9 +51,9 @@ async def handle_sleep(
 
     # No target - this is rest/healing sleep
     # Check if player is already sleeping
-    for sid, session in online_sessions.items():
-        if session.get("player") == player and session.get("sleeping"):
-            return "You are already asleep."
+    current_sid = find_player_sid(player, online_sessions)
+    if current_sid and online_sessions[current_sid].get("sleeping"):
+        return "You are already asleep."
 
     # Check if player is in combat
     from commands.combat import is_in_combat
@@ -63,19 +67,15 @@ async def handle_sleep(
             f"You are already at full stamina ({player.stamina}/{player.max_stamina})."
         )
 
-    # Find the player's session ID
-    current_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
-
     if not current_sid:
         return "Error: Session not found"
 
     # Mark the player as sleeping
     online_sessions[current_sid]["sleeping"] = True
     online_sessions[current_sid]["sleep_tick_counter"] = 0
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        scheduler.schedule_in(SLEEP_HEAL, current_sid, SLEEP_HEALING_SECONDS)
 
     # Broadcast to room that player has fallen asleep
     await broadcast_room(
@@ -105,11 +105,7 @@ async def handle_wake(
     subject_obj = cmd.get("subject_object")
 
     # Find the player's session ID
-    current_sid = None
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            current_sid = sid
-            break
+    current_sid = find_player_sid(player, online_sessions)
 
     if not current_sid:
         return "Error: Session not found"
@@ -127,10 +123,7 @@ async def handle_wake(
         if subject_obj.current_room == player.current_room and subject_obj != player:
             target_player = subject_obj
             # Find their session ID
-            for sid, session in online_sessions.items():
-                if session.get("player") == target_player:
-                    target_sid = sid
-                    break
+            target_sid = find_player_sid(target_player, online_sessions)
     elif subject:
         # Find the target player by name in the same room
         for sid, session in online_sessions.items():
@@ -207,6 +200,9 @@ async def wake_player(
 
     # Wake up the player
     session["sleeping"] = False
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        scheduler.cancel(SLEEP_HEAL, sid)
     if "sleep_tick_counter" in session:
         del session["sleep_tick_counter"]
     if "healing_message_count" in session:
@@ -241,14 +237,34 @@ async def wake_player(
 
 async def process_sleeping_players(
     sio: Any,
-    online_sessions: Dict[str, Dict[str, Any]],
+    online_sessions: Dict[str, Any],
     player_manager: Any,
     utils: Any,
 ) -> None:
     """
     Process all sleeping players to heal them at regular intervals.
     This should be called by the tick service.
+
+    With a scheduler installed only sleepers whose next heal is due are
+    visited; otherwise every session is scanned and counts ticks.
     """
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        for key, _payload in scheduler.pop_due(SLEEP_HEAL):
+            sid = str(key)
+            session = online_sessions.get(sid)
+            player = session.get("player") if session else None
+            if not player or not session or not session.get("sleeping"):
+                continue
+            # Magic sleep doesn't heal; keep the timer for when it lifts
+            if not has_affliction(session, "magic_sleep"):
+                await _heal_sleeper(
+                    sid, session, player, online_sessions, player_manager, sio, utils
+                )
+            if session.get("sleeping"):
+                scheduler.schedule_in(SLEEP_HEAL, sid, SLEEP_HEALING_SECONDS)
+        return
+
     for sid, session in list(online_sessions.items()):
         player = session.get("player")
         if not player or not session.get("sleeping"):
@@ -268,43 +284,57 @@ async def process_sleeping_players(
         if session["sleep_tick_counter"] >= SLEEP_HEALING_INTERVAL:
             # Reset counter
             session["sleep_tick_counter"] = 0
+            await _heal_sleeper(
+                sid, session, player, online_sessions, player_manager, sio, utils
+            )
 
-            # Check if player is at max stamina already
-            if player.stamina >= player.max_stamina:
-                # Wake the player up via the common function
-                await wake_player(
-                    player, sid, online_sessions, sio, utils, max_stamina_reached=True
-                )
-            elif player.stamina == player.max_stamina - 1:
-                # This heal will max out stamina
-                player.stamina += 1
 
-                # Send updated stats to the player
-                await utils.send_stats_update(sio, sid, player)
+async def _heal_sleeper(
+    sid: str,
+    session: Dict[str, Any],
+    player: Any,
+    online_sessions: Dict[str, Dict[str, Any]],
+    player_manager: Any,
+    sio: Any,
+    utils: Any,
+) -> None:
+    """Heal a sleeping player by one stamina point, waking them once full."""
+    # Check if player is at max stamina already
+    if player.stamina >= player.max_stamina:
+        # Wake the player up via the common function
+        await wake_player(
+            player, sid, online_sessions, sio, utils, max_stamina_reached=True
+        )
+    elif player.stamina == player.max_stamina - 1:
+        # This heal will max out stamina
+        player.stamina += 1
 
-                # Wake the player up via the common function
-                await wake_player(
-                    player, sid, online_sessions, sio, utils, max_stamina_reached=True
-                )
-            else:
-                # Normal healing case - not yet at max stamina
-                player.stamina += 1
+        # Send updated stats to the player
+        await utils.send_stats_update(sio, sid, player)
 
-                # Send updated stats to the player
-                await utils.send_stats_update(sio, sid, player)
+        # Wake the player up via the common function
+        await wake_player(
+            player, sid, online_sessions, sio, utils, max_stamina_reached=True
+        )
+    else:
+        # Normal healing case - not yet at max stamina
+        player.stamina += 1
 
-                # Send healing message periodically (every 3 healing ticks)
-                if session.get("healing_message_count", 0) % 3 == 0:
-                    await utils.send_message(sio, sid, "ZZZzzz...")
+        # Send updated stats to the player
+        await utils.send_stats_update(sio, sid, player)
 
-                # Increment healing message counter
-                if "healing_message_count" not in session:
-                    session["healing_message_count"] = 1
-                else:
-                    session["healing_message_count"] += 1
+        # Send healing message periodically (every 3 healing ticks)
+        if session.get("healing_message_count", 0) % 3 == 0:
+            await utils.send_message(sio, sid, "ZZZzzz...")
+
+        # Increment healing message counter
+        if "healing_message_count" not in session:
+            session["healing_message_count"] = 1
+        else:
+            session["healing_message_count"] += 1
 
-                # Save player state
-                player_manager.save_players()
+        # Save player state
+        player_manager.save_players()
 
 
 # Register sleep and wake commands
@@ -24,9 +24,12 @@ from commands.archmage import (
     handle_visible,
     handle_godmode,
     handle_conjure,
+    handle_tickstats,
 )
+from services.tick_metrics import TickProfiler, set_tick_profiler
 from models.ContainerItem import ContainerItem
 from models.Item import Item
+from models.Mobile import Mobile
 from models.Room import Room
 
 
@@ -476,6 +479,29 @@ class HandleResetConfirmationTest(AsyncTestCase):
         # Should restart the process
         mock_execl.assert_called_once()
 
+    @patch("commands.archmage.asyncio.sleep", new_callable=AsyncMock)
+    @patch("commands.archmage.os.execl")
+    async def test_handle_reset_saves_players_before_restart(
+        self, mock_execl, mock_sleep
+    ):
+        """Test pending player saves are written before the process is replaced."""
+        calls = []
+        self.mock_player_manager.save_now.side_effect = lambda: calls.append("save")
+        mock_execl.side_effect = lambda *args: calls.append("exec")
+        cmd = {"subject": "confirm", "original": "reset confirm"}
+
+        await handle_reset(
+            cmd,
+            self.archmage_player,
+            self.mock_game_state,
+            self.mock_player_manager,
+            self.online_sessions,
+            self.mock_sio,
+            self.mock_utils,
+        )
+
+        self.assertEqual(calls, ["save", "exec"])
+
     @patch("commands.archmage.asyncio.sleep", new_callable=AsyncMock)
     @patch("commands.archmage.os.execl")
     async def test_handle_reset_broadcasts_warning_message(
@@ -1012,9 +1038,12 @@ class HandleConjureLookupTest(ConjureTestCase):
             value=0,
             takeable=True,
         )
-        mob = Mock()
-        mob.loot_table = [{"item": golden_key, "chance": 0.02}]
-        mob.shop_stock = None
+        mob = Mobile(
+            "guard",
+            "guard_1",
+            "A guard.",
+            loot_table=[{"item": golden_key, "chance": 0.02}],
+        )
         mob_manager = Mock()
         mob_manager.mobs = {"mob_1": mob}
         self.mock_utils.mob_manager = mob_manager
@@ -1144,5 +1173,51 @@ class HandleConjureInventoryTest(ConjureTestCase):
         self.mock_player_manager.save_players.assert_not_called()
 
 
+class HandleTickstatsTest(AsyncTestCase):
+    """Test the tickstats profiler report command."""
+
+    def setUp(self):
+        super().setUp()
+        self.profiler = TickProfiler()
+        set_tick_profiler(self.profiler)
+        self.addCleanup(set_tick_profiler, None)
+
+    async def _run(self, player, original="tickstats"):
+        return await handle_tickstats(
+            {"verb": "tickstats", "original": original},
+            player,
+            self.mock_game_state,
+            self.mock_player_manager,
+            self.online_sessions,
+            self.mock_sio,
+            self.mock_utils,
+        )
+
+    async def test_handle_tickstats_denies_non_archmage(self) -> None:
+        """Test tickstats is Archmage-only."""
+        result = await self._run(self.normal_player)
+
+        self.assertEqual(result, "You do not have the authority to use this command.")
+
+    async def test_handle_tickstats_reports_slowest_stage(self) -> None:
+        """Test the report lists overruns and recorded stages."""
+        self.profiler.record("stage", "mob_ai", 0.3)
+        self.profiler.record_tick(0.7)
+
+        result = await self._run(self.archmage_player)
+
+        self.assertIn("overruns: 1", result)
+        self.assertIn("mob_ai", result)
+
+    async def test_handle_tickstats_reset_clears_statistics(self) -> None:
+        """Test 'tickstats reset' reports and then clears the counters."""
+        self.profiler.record_tick(0.1)
+
+        result = await self._run(self.archmage_player, "tickstats reset")
+
+        self.assertIn("reset", result)
+        self.assertEqual(self.profiler.ticks, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -309,9 +309,7 @@ class HandlePasswordConfirmationTest(BaseCommandTest):
         cmd = {"original": "newpass456"}
 
         mock_auth = Mock()
-        mock_auth.credentials = {}
-        mock_auth.hash_password = Mock(return_value="hashed_password")
-        mock_auth.save_credentials = Mock()
+        mock_auth.set_password = Mock()
         self.mock_player_manager.auth_manager = mock_auth
 
         # Act
@@ -328,7 +326,9 @@ class HandlePasswordConfirmationTest(BaseCommandTest):
         # Assert
         self.assertNotIn("pwd_change", self.online_sessions[sid])
         self.assertIn("successfully", result)
-        mock_auth.save_credentials.assert_called_once()
+        mock_auth.set_password.assert_called_once_with(
+            self.player.name.lower(), "newpass456"
+        )
         self.mock_sio.emit.assert_called_with("setInputType", "text", room=sid)
 
     async def test_handle_password_rejects_mismatched_confirmation(self):
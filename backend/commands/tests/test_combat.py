@@ -32,6 +32,7 @@ from commands.combat import (
     active_combats,
     process_mob_combat_attack,
 )
+from managers.session import Session
 from services.world_clock import WorldClock, set_world_clock
 from models.Mobile import Mobile
 from models.Weapon import Weapon
@@ -75,7 +76,7 @@ class HelperFunctionsTest(unittest.TestCase):
         self.player = Mock()
         self.player.name = "TestPlayer"
 
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
 
     def test_find_player_sid_by_name(self):
         """Test find_player_sid finds player by name string."""
@@ -687,8 +688,8 @@ class ProcessCombatTickTest(unittest.IsolatedAsyncioTestCase):
 
         sio = AsyncMock()
         online_sessions = {
-            "player1_sid": {"player": player1},
-            "player2_sid": {"player": player2},
+            "player1_sid": Session({"player": player1}),
+            "player2_sid": Session({"player": player2}),
         }
         player_manager = Mock()
         game_state = Mock()
@@ -790,8 +791,8 @@ class HandleAttackAdvancedTest(unittest.IsolatedAsyncioTestCase):
 
         target_sid = "target_sid"
         self.online_sessions = {
-            "attacker_sid": {"player": self.player},
-            target_sid: {"player": self.target, "sleeping": True},
+            "attacker_sid": Session({"player": self.player}),
+            target_sid: Session({"player": self.target, "sleeping": True}),
         }
 
         cmd = {"verb": "attack", "subject": "Target", "subject_object": self.target}
@@ -844,8 +845,8 @@ class HandleAttackAdvancedTest(unittest.IsolatedAsyncioTestCase):
         weapon.damage = 10
         self.player.inventory = [weapon]
         self.online_sessions = {
-            "attacker_sid": {"player": self.player},
-            "target_sid": {"player": self.target},
+            "attacker_sid": Session({"player": self.player}),
+            "target_sid": Session({"player": self.target}),
         }
 
         cmd = {
@@ -1102,9 +1103,9 @@ class HandleFleeAdvancedTest(unittest.IsolatedAsyncioTestCase):
         other_player.current_room = "room1"
 
         self.online_sessions = {
-            "player_sid": {"player": self.player},
-            "opponent_sid": {"player": self.opponent},
-            "observer_sid": {"player": other_player},
+            "player_sid": Session({"player": self.player}),
+            "opponent_sid": Session({"player": self.opponent}),
+            "observer_sid": Session({"player": other_player}),
         }
 
         cmd = {"verb": "flee", "subject": "north"}
@@ -1136,7 +1137,7 @@ class HandleFleeAdvancedTest(unittest.IsolatedAsyncioTestCase):
         new_room_player.name = "NewRoomPlayer"
         new_room_player.current_room = "room2"
 
-        self.online_sessions = {"new_room_sid": {"player": new_room_player}}
+        self.online_sessions = {"new_room_sid": Session({"player": new_room_player})}
 
         cmd = {"verb": "flee"}
 
@@ -1251,8 +1252,8 @@ class ProcessCombatAttackTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager = Mock()
         self.player_manager.save_players = Mock()
         self.online_sessions = {
-            "attacker_sid": {"player": self.player},
-            "defender_sid": {"player": self.target},
+            "attacker_sid": Session({"player": self.player}),
+            "defender_sid": Session({"player": self.target}),
         }
         self.sio = AsyncMock()
         self.utils = Mock()
@@ -1374,8 +1375,8 @@ class HandlePlayerDefeatTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager.save_players = Mock()
 
         self.online_sessions = {
-            "attacker_sid": {"player": self.attacker},
-            "defender_sid": {"player": self.defender},
+            "attacker_sid": Session({"player": self.attacker}),
+            "defender_sid": Session({"player": self.defender}),
         }
         self.sio = AsyncMock()
         self.utils = Mock()
@@ -1473,7 +1474,7 @@ class HandleMobAttackTest(unittest.IsolatedAsyncioTestCase):
 
         self.player_manager = Mock()
         self.mob_manager = Mock()
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -1547,7 +1548,7 @@ class HandlePlayerDefeatByMobTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager.spawn_room = "spawn_room"
         self.player_manager.save_players = Mock()
 
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -1627,7 +1628,7 @@ class HandleMobDefeatTest(unittest.IsolatedAsyncioTestCase):
         self.mob_manager = Mock()
         self.mob_manager.remove_mob = Mock()
 
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -1808,7 +1809,7 @@ class HandleMobDefeatGoldDropTest(unittest.IsolatedAsyncioTestCase):
 
         self.player_manager = Mock()
         self.mob_manager = Mock()
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -1917,7 +1918,7 @@ class ProcessMobCombatAttackTest(unittest.IsolatedAsyncioTestCase):
         self.game_state = Mock()
         self.player_manager = Mock()
         self.mob_manager = Mock()
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -2037,7 +2038,7 @@ class MobInitiateAttackTest(unittest.IsolatedAsyncioTestCase):
 
         self.game_state = Mock()
         self.player_manager = Mock()
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -2117,8 +2118,8 @@ class AdvancedCombatDisconnectTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager.save_players = Mock()
 
         self.online_sessions = {
-            "player_sid": {"player": self.player},
-            "opponent_sid": {"player": self.opponent},
+            "player_sid": Session({"player": self.player}),
+            "opponent_sid": Session({"player": self.opponent}),
         }
         self.sio = AsyncMock()
         self.utils = Mock()
@@ -2184,8 +2185,8 @@ class AttackFindingPlayerByNameTest(unittest.IsolatedAsyncioTestCase):
         self.utils.mob_manager.get_mobs_in_room = Mock(return_value=[])
 
         self.online_sessions = {
-            "attacker_sid": {"player": self.player},
-            "target_sid": {"player": self.target},
+            "attacker_sid": Session({"player": self.player}),
+            "target_sid": Session({"player": self.target}),
         }
 
         active_combats.clear()
@@ -2242,7 +2243,7 @@ class AttackMobByNameTest(unittest.IsolatedAsyncioTestCase):
         self.utils.send_message = AsyncMock()
         self.utils.mob_manager = self.mob_manager
 
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
 
         active_combats.clear()
 
@@ -2418,7 +2419,7 @@ class HandleRespawnChoiceTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager.spawn_room = "village_center"
         self.player_manager.save_players = Mock()
 
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -2546,7 +2547,7 @@ class HandleNonCombatDeathTest(unittest.IsolatedAsyncioTestCase):
         self.game_state.get_room = Mock(return_value=self.current_room)
 
         self.player_manager = Mock()
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -2640,8 +2641,8 @@ class UpdatedPlayerDefeatTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager.save_players = Mock()
 
         self.online_sessions = {
-            "attacker_sid": {"player": self.attacker},
-            "defender_sid": {"player": self.defender},
+            "attacker_sid": Session({"player": self.attacker}),
+            "defender_sid": Session({"player": self.defender}),
         }
         self.sio = AsyncMock()
         self.utils = Mock()
@@ -2714,7 +2715,7 @@ class UpdatedMobDefeatPlayerTest(unittest.IsolatedAsyncioTestCase):
         self.game_state.get_room = Mock(return_value=self.current_room)
 
         self.player_manager = Mock()
-        self.online_sessions = {"player_sid": {"player": self.player}}
+        self.online_sessions = {"player_sid": Session({"player": self.player})}
         self.sio = AsyncMock()
         self.utils = Mock()
         self.utils.send_message = AsyncMock()
@@ -2800,8 +2801,8 @@ class RespawnIssuesTest(unittest.IsolatedAsyncioTestCase):
         self.player_manager.save_players = Mock()
 
         self.online_sessions = {
-            "player_sid": {"player": self.player},
-            "other_sid": {"player": self.other_player},
+            "player_sid": Session({"player": self.player}),
+            "other_sid": Session({"player": self.other_player}),
         }
         self.sio = AsyncMock()
         self.utils = Mock()
@@ -3218,8 +3219,8 @@ class ProcessCombatTickSkipCastTest(unittest.IsolatedAsyncioTestCase):
         }
 
         self.online_sessions = {
-            "player1_sid": {"player": self.player1},
-            "player2_sid": {"player": self.player2},
+            "player1_sid": Session({"player": self.player1}),
+            "player2_sid": Session({"player": self.player2}),
         }
 
         self.sio = AsyncMock()
@@ -3283,6 +3284,35 @@ class ProcessCombatTickSkipCastTest(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(active_combats["Player1"]["initiative"])
         self.assertTrue(active_combats["Player2"]["initiative"])
 
+    async def test_process_combat_tick_uses_cached_sids(self):
+        """Test rounds alternate attackers without searching sessions for sids."""
+        # Arrange
+        from commands.combat import process_combat_tick
+
+        # Act
+        with patch("commands.combat.find_player_sid") as find_sid, patch(
+            "commands.combat.process_combat_attack", new_callable=AsyncMock
+        ) as attack:
+            for _ in range(3):
+                await process_combat_tick(
+                    self.sio,
+                    self.online_sessions,
+                    self.player_manager,
+                    self.game_state,
+                    self.utils,
+                    Mock(),
+                )
+
+        # Assert - tick 1 was skipped (casting), then Player2 and Player1 swung
+        find_sid.assert_not_called()
+        self.assertEqual(
+            [(c.args[0], c.args[3], c.args[4]) for c in attack.call_args_list],
+            [
+                (self.player2, "player2_sid", "player1_sid"),
+                (self.player1, "player1_sid", "player2_sid"),
+            ],
+        )
+
 
 class MaybeFireMobAbilityTest(unittest.IsolatedAsyncioTestCase):
     """Test _maybe_fire_mob_ability spell-like mob abilities."""
@@ -3445,7 +3475,7 @@ class NightHitBonusTest(unittest.IsolatedAsyncioTestCase):
         # Equal dexterity => base hit chance of exactly 50
         self.player.get_effective_dexterity = Mock(return_value=50)
 
-        self.online_sessions = {"sid1": {"player": self.player}}
+        self.online_sessions = {"sid1": Session({"player": self.player})}
         self.game_state = Mock()
         self.game_state.get_room = Mock(return_value=Room("road", "Road", "A road."))
         self.player_manager = Mock()
@@ -25,7 +25,16 @@ from commands.communication import (
     handle_converse,
     handle_pending_communication,
 )
+from managers.session import Session
+from managers.session_registry import (
+    PLAYERS_CHANNEL,
+    RoomMirror,
+    SessionRegistry,
+    room_channel,
+)
 from models.Player import Player
+from services.outbound import OutboundBuffer, manager_recipients
+from tests.test_helpers import create_mirrored_sio, record_deliveries
 
 
 class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
@@ -49,9 +58,9 @@ class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
 
         # Set up online sessions
         self.online_sessions = {
-            "sid1": {"player": self.player},
-            "sid2": {"player": self.other_player},
-            "sid3": {"player": self.remote_player},
+            "sid1": Session({"player": self.player}),
+            "sid2": Session({"player": self.other_player}),
+            "sid3": Session({"player": self.remote_player}),
         }
 
         self.game_state = None
@@ -592,5 +601,76 @@ class InvisibilityCommunicationTest(AsyncTestCase):
         self.assertNotIn("TestPlayer", message)
 
 
+class MirroredCommunicationTest(AsyncTestCase):
+    """Test say and shout fan out through mirrored Socket.IO rooms."""
+
+    def setUp(self):
+        super().setUp()
+        self.sio = create_mirrored_sio()
+        self.online_sessions = SessionRegistry(self.online_sessions)
+        self.online_sessions.set_room_mirror(RoomMirror(self.sio))
+
+    async def _run(self, handler, subject):
+        return await handler(
+            {"verb": handler.__name__, "subject": subject},
+            self.player,
+            self.game_state,
+            self.player_manager,
+            self.online_sessions,
+            self.sio,
+            self.utils,
+        )
+
+    async def test_say_emits_once_to_room_channel(self):
+        """Test say reaches the room with one emit, skipping the speaker."""
+        await self._run(handle_say, "hi")
+
+        self.utils.send_message.assert_not_called()
+        self.sio.emit.assert_awaited_once_with(
+            "message",
+            'TestPlayer the Neophyte says "hi"',
+            room=room_channel("test_room"),
+            skip_sid=["sid1"],
+        )
+
+    async def test_shout_skips_deaf_players(self):
+        """Test shout emits once to everyone but the shouter and the deaf."""
+        with patch(
+            "services.affliction_service.has_affliction",
+            side_effect=lambda session, kind: kind == "deaf"
+            and session is self.online_sessions["sid3"],
+        ):
+            await self._run(handle_shout, "hey")
+
+        self.sio.emit.assert_awaited_once()
+        _args, kwargs = self.sio.emit.await_args
+        self.assertEqual(kwargs["room"], PLAYERS_CHANNEL)
+        self.assertEqual(kwargs["skip_sid"], ["sid1", "sid3"])
+
+    async def test_say_in_a_tick_reaches_who_was_there(self):
+        """Test a say buffered in a tick skips players who walk in afterwards."""
+        outbound = OutboundBuffer(self.sio, recipients=manager_recipients(self.sio))
+        self.online_sessions.set_room_mirror(RoomMirror(outbound))
+
+        deliveries = record_deliveries(self.sio)
+
+        async with outbound.collecting():
+            await handle_say(
+                {"verb": "say", "subject": "hi"},
+                self.player,
+                self.game_state,
+                self.player_manager,
+                self.online_sessions,
+                outbound,
+                self.utils,
+            )
+            self.other_player.current_room = "other_room"
+            self.remote_player.current_room = "test_room"
+
+        self.assertEqual(
+            deliveries, [("message", 'TestPlayer the Neophyte says "hi"', ["sid2"])]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for the command locks behind the concurrent tick mode.
+
+Tests cover:
+- Lock keys: the player's room and self, the rooms a move, flee or swamp
+  may lead into, combat opponents
+- Exclusive commands getting no keys
+- CommandLocks serializing holders of a shared key
+"""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import commands  # noqa: F401  (registers the command verbs)
+from commands.concurrency import (
+    CommandLocks,
+    command_lock_keys,
+    entity_key,
+    room_key,
+)
+from models.Room import Room
+from services.combat_state import CombatRegistry
+
+
+def make_player(name, room="hall"):
+    return SimpleNamespace(name=name, current_room=room)
+
+
+class CommandLockKeysTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("commands.combat.active_combats", CombatRegistry())
+        self.active_combats = patcher.start()
+        self.addCleanup(patcher.stop)
+        hall = Room("hall", "Hall", "", exits={"north": "yard", "east": "road"})
+        hall.swamp_direction = "east"
+        self.game_state = SimpleNamespace(get_room={"hall": hall}.get)
+
+    def test_room_and_self(self):
+        keys = command_lock_keys("get sword", make_player("Alice"), self.game_state)
+
+        self.assertEqual(keys, {room_key("hall"), entity_key("Alice")})
+
+    def test_movement_locks_the_destination(self):
+        keys = command_lock_keys("n", make_player("Alice"), self.game_state)
+
+        self.assertIn(room_key("yard"), keys)
+        self.assertIn(room_key("hall"), keys)
+
+    def test_flee_locks_every_exit(self):
+        keys = command_lock_keys("run", make_player("Alice"), self.game_state)
+
+        self.assertEqual(
+            keys,
+            {
+                room_key("hall"),
+                room_key("yard"),
+                room_key("road"),
+                entity_key("Alice"),
+            },
+        )
+
+    def test_swamp_locks_the_next_room_on_the_way(self):
+        keys = command_lock_keys("swamp", make_player("Alice"), self.game_state)
+
+        self.assertIn(room_key("road"), keys)
+        self.assertNotIn(room_key("yard"), keys)
+
+    def test_exclusive_command_has_no_keys(self):
+        player = make_player("Alice")
+
+        self.assertIsNone(command_lock_keys("summon bob", player, self.game_state))
+        self.assertIsNotNone(command_lock_keys("wh sword", player, self.game_state))
+
+    def test_combat_opponent_is_locked(self):
+        alice, bob = make_player("Alice"), make_player("Bob", room="yard")
+        self.active_combats["Alice"] = {"target": bob}
+        self.active_combats["Bob"] = {"target": alice}
+
+        keys = command_lock_keys("attack bob", alice, self.game_state)
+
+        self.assertIn(entity_key("Bob"), keys)
+
+
+class CommandLocksTest(unittest.IsolatedAsyncioTestCase):
+    async def test_shared_key_serializes_in_arrival_order(self):
+        locks = CommandLocks()
+        events = []
+
+        async def command(name, keys):
+            async with locks.hold(keys):
+                events.append(("start", name))
+                await asyncio.sleep(0)
+                events.append(("end", name))
+
+        async with asyncio.TaskGroup() as group:
+            group.create_task(command("a", ["room:x", "entity:a"]))
+            group.create_task(command("b", ["entity:b", "room:x"]))
+            group.create_task(command("c", ["room:y"]))
+
+        self.assertLess(events.index(("end", "a")), events.index(("start", "b")))
+        self.assertLess(events.index(("start", "c")), events.index(("end", "a")))
+
+
+if __name__ == "__main__":
+    unittest.main()
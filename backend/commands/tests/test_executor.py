@@ -18,9 +18,15 @@ from unittest.mock import AsyncMock, Mock, patch
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from commands.executor import execute_command, handle_movement, build_look_description
+from commands.combat import active_combats
+from managers.mob_manager import MobRegistry
+from managers.session import Session
+from models.ContainerItem import ContainerItem
 from models.Room import Room
 from models.Item import Item
 from models.Mobile import Mobile
+from models.Player import Player
+from services.combat_state import Combatant
 
 
 class ExecuteCommandTest(unittest.IsolatedAsyncioTestCase):
@@ -274,7 +280,7 @@ class HandleMovementTest(unittest.IsolatedAsyncioTestCase):
         mob.target_player = None
 
         self.utils.mob_manager.get_mobs_in_room = Mock(return_value=[mob])
-        self.online_sessions["player_sid"] = {"player": self.player}
+        self.online_sessions["player_sid"] = Session({"player": self.player})
 
         with patch("commands.executor.broadcast_departure", new=AsyncMock()):
             with patch("commands.executor.broadcast_arrival", new=AsyncMock()):
@@ -312,7 +318,7 @@ class HandleMovementTest(unittest.IsolatedAsyncioTestCase):
         mob.target_player = None
 
         self.utils.mob_manager.get_mobs_in_room = Mock(return_value=[mob])
-        self.online_sessions["player_sid"] = {"player": self.player}
+        self.online_sessions["player_sid"] = Session({"player": self.player})
 
         with patch("commands.executor.broadcast_departure", new=AsyncMock()):
             with patch("commands.executor.broadcast_arrival", new=AsyncMock()):
@@ -348,7 +354,7 @@ class HandleMovementTest(unittest.IsolatedAsyncioTestCase):
         mob.target_player = Mock()  # Has a target
 
         self.utils.mob_manager.get_mobs_in_room = Mock(return_value=[mob])
-        self.online_sessions["player_sid"] = {"player": self.player}
+        self.online_sessions["player_sid"] = Session({"player": self.player})
 
         with patch("commands.executor.broadcast_departure", new=AsyncMock()):
             with patch("commands.executor.broadcast_arrival", new=AsyncMock()):
@@ -386,7 +392,7 @@ class HandleMovementTest(unittest.IsolatedAsyncioTestCase):
         mob.target_player = None  # No target (previous player left)
 
         self.utils.mob_manager.get_mobs_in_room = Mock(return_value=[mob])
-        self.online_sessions["player_sid"] = {"player": self.player}
+        self.online_sessions["player_sid"] = Session({"player": self.player})
 
         with patch("commands.executor.broadcast_departure", new=AsyncMock()):
             with patch("commands.executor.broadcast_arrival", new=AsyncMock()):
@@ -518,7 +524,7 @@ class BuildLookDescriptionTest(unittest.TestCase):
         other_player.current_room = "room1"
         other_player.inventory = []
 
-        self.online_sessions["other_sid"] = {"player": other_player}
+        self.online_sessions["other_sid"] = Session({"player": other_player})
 
         with patch("commands.utils.get_player_inventory", return_value="a sword"):
             with patch("commands.combat.is_in_combat", return_value=False):
@@ -537,7 +543,9 @@ class BuildLookDescriptionTest(unittest.TestCase):
         other_player.current_room = "room1"
         other_player.inventory = []
 
-        self.online_sessions["other_sid"] = {"player": other_player, "sleeping": False}
+        self.online_sessions["other_sid"] = Session(
+            {"player": other_player, "sleeping": False}
+        )
 
         with patch("commands.utils.get_player_inventory", return_value=""):
             with patch("commands.combat.is_in_combat", return_value=True):
@@ -555,7 +563,9 @@ class BuildLookDescriptionTest(unittest.TestCase):
         other_player.current_room = "room1"
         other_player.inventory = []
 
-        self.online_sessions["other_sid"] = {"player": other_player, "sleeping": True}
+        self.online_sessions["other_sid"] = Session(
+            {"player": other_player, "sleeping": True}
+        )
 
         with patch("commands.utils.get_player_inventory", return_value=""):
             with patch("commands.combat.is_in_combat", return_value=False):
@@ -567,7 +577,7 @@ class BuildLookDescriptionTest(unittest.TestCase):
 
     def test_build_look_description_excludes_self(self):
         """Test description doesn't list the player themselves."""
-        self.online_sessions["player_sid"] = {"player": self.player}
+        self.online_sessions["player_sid"] = Session({"player": self.player})
 
         with patch("commands.combat.is_in_combat", return_value=False):
             result = build_look_description(
@@ -580,6 +590,87 @@ class BuildLookDescriptionTest(unittest.TestCase):
             self.assertEqual(len(player_lines), 0)
 
 
+class BuildLookDescriptionCacheTest(unittest.TestCase):
+    """Test the cached fragments of build_look_description."""
+
+    def setUp(self):
+        """Set up a real room, players and mob registry."""
+        self.room = Room(room_id="cache_room", name="Cache Room", description="")
+        self.game_state = Mock()
+        self.game_state.get_room.return_value = self.room
+        self.viewer = Player("Viewer")
+        self.viewer.current_room = "cache_room"
+        self.other = Player("Other")
+        self.other.current_room = "cache_room"
+        self.online_sessions = {"other_sid": Session({"player": self.other})}
+        self.mob_manager = Mock()
+        self.mob_manager.mobs = MobRegistry()
+        self.mob_manager.get_mobs_in_room = lambda room_id: [
+            self.mob_manager.mobs[mob_id]
+            for mob_id in self.mob_manager.mobs.ids_in_room(room_id)
+        ]
+
+    def _look(self):
+        return build_look_description(
+            self.viewer,
+            self.game_state,
+            online_sessions=self.online_sessions,
+            mob_manager=self.mob_manager,
+        )
+
+    def test_repeat_look_reuses_the_fragments(self):
+        """Test an unchanged room is not re-rendered."""
+        self.room.add_item(Item("Lamp", "lamp_1", "A brass lamp sits here."))
+        self._look()
+
+        with patch("commands.executor._describe_items") as describe_items, patch(
+            "commands.utils.get_player_inventory"
+        ) as get_player_inventory:
+            result = self._look()
+
+        describe_items.assert_not_called()
+        get_player_inventory.assert_not_called()
+        self.assertIn("A brass lamp sits here.", result)
+        self.assertIn("Other the", result)
+
+    def test_item_changes_are_shown(self):
+        """Test adding an item or filling a container refreshes the item lines."""
+        self._look()
+        bag = ContainerItem("Bag", "bag_1", "A bag")
+        self.room.add_item(bag)
+        self.assertIn("The Bag contains nothing", self._look())
+
+        bag.add_item(Item("Coin", "coin_1", "A coin."))
+
+        self.assertIn("The Bag contains Coin", self._look())
+
+    def test_mob_arrival_and_combat_are_shown(self):
+        """Test the mob lines follow the room version and the combat registry."""
+        self._look()
+        mob = Mobile(
+            name="rat",
+            id="rat_cache",
+            description="A rat scurries about.",
+            max_stamina=5,
+            current_room="cache_room",
+        )
+        self.mob_manager.mobs["rat_cache"] = mob
+        self.assertIn("A rat scurries about.\n", self._look() + "\n")
+
+        active_combats["rat_cache"] = Combatant(mob)
+        self.addCleanup(active_combats.pop, "rat_cache", None)
+
+        self.assertIn("A rat scurries about. (in combat)", self._look())
+
+    def test_other_player_line_follows_their_inventory(self):
+        """Test picking up an item refreshes the line others see."""
+        self.assertIn("carrying nothing", self._look())
+
+        self.other.add_item(Item("Sword", "sword_1", "A sword."))
+
+        self.assertIn("carrying Sword", self._look())
+
+
 class ExecuteCommandSpeechTriggerTest(unittest.IsolatedAsyncioTestCase):
     """Test execute_command speech trigger functionality."""
 
@@ -49,7 +49,11 @@ from commands.magic import (
     handle_cripple,
     handle_fod,
 )
+from managers.session import Session
+from models.Item import Item
 from models.Mobile import Mobile
+from models.Player import Player
+from models.Room import Room
 
 
 class CalculateSuccessChanceTest(unittest.TestCase):
@@ -474,18 +478,11 @@ class HandleWhereTest(unittest.IsolatedAsyncioTestCase):
     async def test_where_finds_multiple_items_different_rooms(self):
         """Test WHERE finds same item in multiple rooms with counts."""
         # Create two swords in two different rooms
-        sword1 = Mock(spec=["name"])
-        sword1.name = "sword"
-        sword2 = Mock(spec=["name"])
-        sword2.name = "sword"
+        room1 = Room("room1", "The Armory", "Racks of weapons.")
+        room1.add_item(Item("sword", "sword_1", "A sword."))
 
-        room1 = Mock()
-        room1.name = "The Armory"
-        room1.get_items = Mock(return_value=[sword1])
-
-        room2 = Mock()
-        room2.name = "The Barracks"
-        room2.get_items = Mock(return_value=[sword2])
+        room2 = Room("room2", "The Barracks", "Rows of bunks.")
+        room2.add_item(Item("sword", "sword_2", "A sword."))
 
         self.game_state.rooms = {"room1": room1, "room2": room2}
 
@@ -508,14 +505,9 @@ class HandleWhereTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_where_counts_multiple_items_same_room(self):
         """Test WHERE counts multiple items of same type in one room."""
-        sword1 = Mock(spec=["name"])
-        sword1.name = "sword"
-        sword2 = Mock(spec=["name"])
-        sword2.name = "sword"
-
-        room1 = Mock()
-        room1.name = "The Armory"
-        room1.get_items = Mock(return_value=[sword1, sword2])
+        room1 = Room("room1", "The Armory", "Racks of weapons.")
+        room1.add_item(Item("sword", "sword_1", "A sword."))
+        room1.add_item(Item("sword", "sword_2", "A sword."))
 
         self.game_state.rooms = {"room1": room1}
 
@@ -537,18 +529,12 @@ class HandleWhereTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_where_finds_item_carried_by_player(self):
         """Test WHERE finds item carried by player with MUD1 format."""
-        carrier = Mock()
-        carrier.name = "Bob"
+        carrier = Player("Bob")
         carrier.level = "Novice"
         carrier.current_room = "room1"
+        carrier.inventory = [Item("sword", "sword_1", "A sword.")]
 
-        sword = Mock(spec=["name"])
-        sword.name = "sword"
-        carrier.inventory = [sword]
-
-        room1 = Mock()
-        room1.name = "The Tavern"
-        room1.get_items = Mock(return_value=[])
+        room1 = Room("room1", "The Tavern", "A smoky tavern.")
 
         self.game_state.rooms = {"room1": room1}
         self.game_state.get_room = Mock(return_value=room1)
@@ -581,15 +567,10 @@ class HandleWhereTest(unittest.IsolatedAsyncioTestCase):
             description="A wooden chest",
             state="open",
         )
-        key = Mock(spec=["name", "id", "weight"])
-        key.name = "key"
-        key.id = "key_1"
-        key.weight = 1
-        chest.items = [key]
+        chest.items = [Item("key", "key_1", "A key.")]
 
-        room1 = Mock()
-        room1.name = "The Treasury"
-        room1.get_items = Mock(return_value=[chest])
+        room1 = Room("room1", "The Treasury", "Gold glitters here.")
+        room1.add_item(chest)
 
         self.game_state.rooms = {"room1": room1}
 
@@ -620,21 +601,14 @@ class HandleWhereTest(unittest.IsolatedAsyncioTestCase):
             description="A leather bag",
             state="open",
         )
-        key = Mock(spec=["name", "id", "weight"])
-        key.name = "key"
-        key.id = "key_1"
-        key.weight = 1
-        bag.items = [key]
-
-        carrier = Mock()
-        carrier.name = "Alice"
+        bag.items = [Item("key", "key_1", "A key.")]
+
+        carrier = Player("Alice")
         carrier.level = "Scholar"
         carrier.current_room = "room1"
         carrier.inventory = [bag]
 
-        room1 = Mock()
-        room1.name = "The Library"
-        room1.get_items = Mock(return_value=[])
+        room1 = Room("room1", "The Library", "Shelves of books.")
 
         self.game_state.rooms = {"room1": room1}
         self.game_state.get_room = Mock(return_value=room1)
@@ -656,6 +630,24 @@ class HandleWhereTest(unittest.IsolatedAsyncioTestCase):
         self.assertIn("in the room described as The Library", result)
         self.assertIn("Your spell worked!", result)
 
+    async def test_where_skips_unrevealed_hidden_items(self):
+        """Test WHERE sees hidden items only once their condition holds."""
+        room1 = Room("room1", "The Crypt", "Cold stone.")
+        revealed = []
+        room1.add_hidden_item(
+            Item("skull", "skull_1", "A skull."), lambda gs: bool(revealed)
+        )
+        self.game_state.rooms = {"room1": room1}
+        cmd = {"verb": "where", "subject": "skull"}
+        args = (self.player_manager, {}, self.sio, self.utils)
+
+        hidden = await handle_where(cmd, self.player, self.game_state, *args)
+        revealed.append(True)
+        shown = await handle_where(cmd, self.player, self.game_state, *args)
+
+        self.assertEqual(hidden, "You cannot locate 'skull'.")
+        self.assertIn("1 in the room described as The Crypt.", shown)
+
 
 class HandleWishTest(unittest.IsolatedAsyncioTestCase):
     """Test handle_wish spell."""
@@ -835,7 +827,7 @@ class FindTargetPlayerOrMobTest(unittest.TestCase):
         """Test finds online player by name."""
         target = Mock()
         target.name = "TargetPlayer"
-        online_sessions = {"sid1": {"player": target}}
+        online_sessions = {"sid1": Session({"player": target})}
 
         result = find_target_player_or_mob(
             "Target", self.player, self.game_state, online_sessions, self.utils
@@ -923,7 +915,7 @@ class HandleSummonTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_summon_cannot_summon_self(self):
         """Test cannot summon yourself."""
-        online_sessions = {"sid1": {"player": self.player}}
+        online_sessions = {"sid1": Session({"player": self.player})}
         cmd = {"verb": "summon", "subject": "Caster"}
 
         with patch(
@@ -1108,7 +1100,7 @@ class HandleForceTest(unittest.IsolatedAsyncioTestCase):
                 self.player,
                 self.game_state,
                 self.player_manager,
-                {"sid1": {"player": self.target}},
+                {"sid1": Session({"player": self.target})},
                 self.sio,
                 self.utils,
             )
@@ -1161,7 +1153,7 @@ class HandleForceTest(unittest.IsolatedAsyncioTestCase):
                 self.player,
                 self.game_state,
                 self.player_manager,
-                {"sid1": {"player": self.player}},
+                {"sid1": Session({"player": self.player})},
                 self.sio,
                 self.utils,
             )
@@ -1285,7 +1277,7 @@ class HandleChangeTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_change_success_changes_sex(self):
         """Test successful change alters target's sex."""
-        online_sessions = {"sid1": {"player": self.target}}
+        online_sessions = {"sid1": Session({"player": self.target})}
         cmd = {"verb": "change", "subject": "Target"}
 
         with patch(
@@ -1414,7 +1406,7 @@ class HandleSleepSpellTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_sleep_fails_on_combat_target(self):
         """Test cannot sleep target in combat."""
-        online_sessions = {"sid1": {"player": self.target}}
+        online_sessions = {"sid1": Session({"player": self.target})}
         cmd = {"verb": "sleep", "subject": "Target"}
 
         with patch(
@@ -1521,7 +1513,7 @@ class HandleAfflictionSpellsTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_deafen_applies_affliction(self):
         """Test deafen applies deaf affliction."""
-        online_sessions = {"sid1": {"player": self.target, "afflictions": {}}}
+        online_sessions = {"sid1": Session({"player": self.target, "afflictions": {}})}
         cmd = {"verb": "deafen", "subject": "Target"}
 
         with patch(
@@ -1595,7 +1587,7 @@ class HandleFodTest(unittest.IsolatedAsyncioTestCase):
         """Test non-Archmage dies when casting FOD."""
         self.player.level = "Warlock"
         self.player.current_room = "room1"
-        online_sessions = {"caster_sid": {"player": self.player}}
+        online_sessions = {"caster_sid": Session({"player": self.player})}
         cmd = {"verb": "fod", "subject": "Target"}
 
         with patch("commands.magic.find_player_sid", return_value="caster_sid"):
@@ -1618,7 +1610,7 @@ class HandleFodTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_fod_cannot_target_self(self):
         """Test cannot FOD yourself."""
-        online_sessions = {"sid1": {"player": self.player}}
+        online_sessions = {"sid1": Session({"player": self.player})}
         cmd = {"verb": "fod", "subject": "Caster"}
 
         with patch(
@@ -2266,7 +2258,7 @@ class HandleWhereSuccessTest(unittest.IsolatedAsyncioTestCase):
         self.game_state.rooms = {}  # Empty rooms dict
         self.player.inventory = []
 
-        online_sessions = {"caster_sid": {"player": self.player}}
+        online_sessions = {"caster_sid": Session({"player": self.player})}
         cmd = {"verb": "where", "subject": "Goblin"}
 
         result = await handle_where(
@@ -2285,18 +2277,14 @@ class HandleWhereSuccessTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_where_finds_item_in_room(self):
         """Test where spell finds item in a room with MUD1 format."""
-        mock_item = Mock(spec=["name"])  # Spec ensures no ContainerItem attributes
-        mock_item.name = "sword"
-
-        room1 = Mock()
-        room1.name = "The Marketplace"
-        room1.get_items = Mock(return_value=[mock_item])
+        room1 = Room("room1", "The Marketplace", "Stalls line the square.")
+        room1.add_item(Item("sword", "sword_1", "A sword."))
 
         self.game_state.rooms = {"room1": room1}
         self.game_state.get_room = Mock(return_value=room1)
         self.player.inventory = []
 
-        online_sessions = {"caster_sid": {"player": self.player}}
+        online_sessions = {"caster_sid": Session({"player": self.player})}
         cmd = {"verb": "where", "subject": "sword"}
 
         result = await handle_where(
@@ -2388,7 +2376,7 @@ class HandleFodSuccessTest(unittest.IsolatedAsyncioTestCase):
         mob_manager.get_mobs_in_room = Mock(return_value=[mock_mob])
         self.utils.mob_manager = mob_manager
 
-        online_sessions = {"caster_sid": {"player": self.player}}
+        online_sessions = {"caster_sid": Session({"player": self.player})}
         cmd = {"verb": "fod", "subject": "Goblin"}
 
         with patch(
@@ -2613,7 +2601,7 @@ class HandleBoltTest(unittest.IsolatedAsyncioTestCase):
             current_room="room1",
         )
 
-        self.online_sessions = {"caster_sid": {"player": self.player}}
+        self.online_sessions = {"caster_sid": Session({"player": self.player})}
 
         self.game_state = Mock()
         self.player_manager = Mock()
@@ -2806,7 +2794,7 @@ class HandleAfflictionSpellMobTargetTest(unittest.IsolatedAsyncioTestCase):
             current_room="room1",
         )
 
-        self.online_sessions = {"caster_sid": {"player": self.player}}
+        self.online_sessions = {"caster_sid": Session({"player": self.player})}
 
         self.game_state = Mock()
         self.player_manager = Mock()
@@ -2891,7 +2879,7 @@ class HandleSleepSpellMobTargetTest(unittest.IsolatedAsyncioTestCase):
             current_room="room1",
         )
 
-        self.online_sessions = {"caster_sid": {"player": self.player}}
+        self.online_sessions = {"caster_sid": Session({"player": self.player})}
 
         self.game_state = Mock()
         self.player_manager = Mock()
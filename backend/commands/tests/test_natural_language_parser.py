@@ -9,11 +9,13 @@ Tests cover:
 - Object binding
 - Full command parsing
 - Command chaining
+- Caching of the context-free parse stages
 """
 
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
@@ -24,6 +26,7 @@ from commands.natural_language_parser import (
     CommandContext,
     SyntaxPattern,
     ObjectBinder,
+    NaturalLanguageParser,
     parse_command,
     is_movement_command,
 )
@@ -752,5 +755,83 @@ class AdditionalCoverageTest(unittest.TestCase):
         self.assertFalse(vocab.is_adverb("sword"))
 
 
+class ParseCacheTest(unittest.TestCase):
+    """Test repeated commands reuse tokenizing and pattern matching."""
+
+    def setUp(self):
+        """Set up a parser and a room with an item."""
+        self.parser = NaturalLanguageParser()
+        self.player = Player("TestHero")
+        self.game_state = GameState()
+        self.room = Room("test_room", "Test Room", "A test room")
+        self.game_state.add_room(self.room)
+        self.player.set_current_room("test_room")
+
+    def test_tokenize_returns_fresh_tokens(self):
+        """Test cached tokenizing still hands out tokens callers can change."""
+        first = tokenize("get sword")
+        first[0].value = "changed"
+
+        self.assertEqual(tokenize("get sword")[0].value, "get")
+
+    def test_repeated_command_skips_pattern_matching(self):
+        """Test the second parse of an input does not match patterns again."""
+        self.parser.parse("get sword", self.player, self.game_state)
+
+        with patch.object(SyntaxPattern, "matches") as matches:
+            commands = self.parser.parse("get sword", self.player, self.game_state)
+
+        matches.assert_not_called()
+        self.assertEqual(commands[0]["verb"], "get")
+        self.assertEqual(commands[0]["subject"], "sword")
+
+    def test_binding_runs_on_every_parse(self):
+        """Test a cached command is still bound to the current room."""
+        self.assertIsNone(
+            self.parser.parse("get sword", self.player, self.game_state)[0].get(
+                "subject_object"
+            )
+        )
+        sword = Item("Sword", "sword_1", "A sword")
+        self.room.add_item(sword)
+
+        commands = self.parser.parse("get sword", self.player, self.game_state)
+
+        self.assertIs(commands[0]["subject_object"], sword)
+
+    def test_results_are_not_shared(self):
+        """Test changing a returned command does not leak into the next parse."""
+        first = self.parser.parse("n", self.player, self.game_state)[0]
+        first["verb"] = "changed"
+
+        second = self.parser.parse("n", self.player, self.game_state)[0]
+
+        self.assertEqual(second["verb"], "north")
+
+    def test_vocabulary_change_invalidates(self):
+        """Test adding vocabulary is seen by inputs parsed before."""
+        self.assertEqual(
+            self.parser.parse("yoink sword", self.player, self.game_state)[0]["verb"],
+            "yoink",
+        )
+
+        self.parser.vocabulary.add_synonym("yoink", "get")
+
+        self.assertEqual(
+            self.parser.parse("yoink sword", self.player, self.game_state)[0]["verb"],
+            "get",
+        )
+
+    def test_cache_is_bounded(self):
+        """Test the oldest inputs are evicted past PARSE_CACHE_SIZE."""
+        with patch("commands.natural_language_parser.PARSE_CACHE_SIZE", 2):
+            for command in ("look", "inventory", "score"):
+                self.parser.parse(command, self.player, self.game_state)
+
+        self.assertEqual(
+            [key[0] for key in self.parser._syntax_cache], ["inventory", "score"]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -21,10 +21,13 @@ from commands.rest import (
     handle_wake,
     wake_player,
     process_sleeping_players,
+    SLEEP_HEALING_SECONDS,
 )
+from managers.session import Session
 from models.Player import Player
 from models.Room import Room
 from managers.game_state import GameState
+from services.scheduler import Scheduler, set_scheduler
 
 
 class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
@@ -56,8 +59,8 @@ class AsyncTestCase(unittest.IsolatedAsyncioTestCase):
 
         # Set up online sessions
         self.online_sessions = {
-            "sid1": {"player": self.player, "sleeping": False},
-            "sid2": {"player": self.other_player, "sleeping": False},
+            "sid1": Session({"player": self.player, "sleeping": False}),
+            "sid2": Session({"player": self.other_player, "sleeping": False}),
         }
 
 
@@ -368,5 +371,65 @@ class ProcessSleepingPlayersTest(AsyncTestCase):
         self.assertEqual(len(zzz_calls), 1)
 
 
+class ScheduledSleepingPlayersTest(AsyncTestCase):
+    """Test sleep healing driven by scheduler deadlines."""
+
+    def setUp(self):
+        super().setUp()
+        self.clock = [1000.0]
+        self.scheduler = Scheduler(time_func=lambda: self.clock[0])
+        set_scheduler(self.scheduler)
+        self.addCleanup(set_scheduler, None)
+
+    async def _sleep(self):
+        with patch("commands.rest.broadcast_room", new_callable=AsyncMock):
+            await handle_sleep(
+                {},
+                self.player,
+                self.game_state,
+                self.player_manager,
+                self.online_sessions,
+                self.sio,
+                self.utils,
+            )
+
+    async def test_sleep_schedules_first_heal(self):
+        """Test falling asleep registers a heal deadline."""
+        await self._sleep()
+
+        self.assertEqual(
+            self.scheduler.next_deadline("sleep_heal"), 1000.0 + SLEEP_HEALING_SECONDS
+        )
+
+    async def test_heal_waits_for_deadline_then_reschedules(self):
+        """Test healing happens only when due and re-arms the timer."""
+        await self._sleep()
+        initial_stamina = self.player.stamina
+
+        await process_sleeping_players(
+            self.sio, self.online_sessions, self.player_manager, self.utils
+        )
+        self.assertEqual(self.player.stamina, initial_stamina)
+
+        self.clock[0] += SLEEP_HEALING_SECONDS
+        await process_sleeping_players(
+            self.sio, self.online_sessions, self.player_manager, self.utils
+        )
+
+        self.assertEqual(self.player.stamina, initial_stamina + 1)
+        self.assertTrue(self.scheduler.is_scheduled("sleep_heal", "sid1"))
+
+    async def test_wake_cancels_heal_timer(self):
+        """Test waking up drops the pending heal."""
+        await self._sleep()
+
+        with patch("commands.rest.broadcast_room", new_callable=AsyncMock):
+            await wake_player(
+                self.player, "sid1", self.online_sessions, self.sio, self.utils
+            )
+
+        self.assertFalse(self.scheduler.is_scheduled("sleep_heal", "sid1"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,11 @@ from services.notifications import (
 )
 import re
 from globals import version
+from managers.command_queue import CommandQueue
+from managers.session import Session
+from managers.session_registry import bind_session_player, find_player_sid
+from services.invisibility_service import set_invisible
+from services.tick_metrics import REFUSED, get_tick_profiler
 
 
 def register_handlers(
@@ -28,7 +33,7 @@ def register_handlers(
     auth_manager: Any,
     player_manager: Any,
     game_state: Any,
-    online_sessions: Dict[str, Dict[str, Any]],
+    online_sessions: Dict[str, Any],
     utils: Any,
 ) -> None:
     """
@@ -52,14 +57,15 @@ def register_handlers(
         Ensures the player is set to the spawn room, sends updated stats,
         sends the initial room description, and broadcasts the player's arrival.
         """
-        # Ensure the player starts at the spawn room.
+        # Ensure the player starts at the spawn room (also files them in the
+        # session registry's occupancy index under that room).
         player.set_current_room(player_manager.spawn_room)
         player.visited = set()
         player_manager.save_players()
         player.last_active = datetime.now()
 
-        # Send updated stats to the client.
-        await utils.send_stats_update(sio, sid, player)
+        # Send updated stats to the client (in full: it may be a re-login).
+        await utils.send_stats_update(sio, sid, player, force=True)
 
         if player.name.lower() == ADMIN_USERNAME:
             token = create_admin_token()
@@ -172,24 +178,22 @@ def register_handlers(
                     return
 
             # Check if user is already logged in
-            for other_sid, other_session in online_sessions.items():
-                if other_sid != sid:
-                    other_player = other_session.get("player")
-                    if other_player and other_player.name.lower() == username.lower():
-                        await utils.send_message(
-                            sio,
-                            sid,
-                            "This persona is already logged in. Connection closed.",
-                        )
-                        await sio.disconnect(sid)
-                        return
+            other_sid = find_player_sid(username, online_sessions)
+            if other_sid is not None and other_sid != sid:
+                await utils.send_message(
+                    sio,
+                    sid,
+                    "This persona is already logged in. Connection closed.",
+                )
+                await sio.disconnect(sid)
+                return
 
             # Get the player and capture the last login time BEFORE updating it
             player = player_manager.login(username)
             last_login_time = player.last_active  # Store the previous login time
 
             # Now update the session and authentication state
-            session["player"] = player
+            bind_session_player(online_sessions, sid, player)
             del session["auth_state"]
             await sio.emit("setInputType", "text", room=sid)
 
@@ -305,7 +309,7 @@ def register_handlers(
                     await utils.send_message(sio, sid, f"Registration failed: {str(e)}")
                     return
                 player = player_manager.register(username, sex=sex, email=email)
-                session["player"] = player
+                bind_session_player(online_sessions, sid, player)
                 del session["auth_state"]
                 reg_message = f"Hello, {player.name} the {player.level}!\n"
                 await utils.send_message(sio, sid, reg_message)
@@ -320,13 +324,15 @@ def register_handlers(
         Sets up the session and sends the introductory splash message.
         """
         print(f"[Socket.IO] Client connected: {sid}")
-        online_sessions[sid] = {
-            "auth_state": "awaiting_name",
-            "temp_data": {},
-            "command_queue": [],
-            "last_active": asyncio.get_event_loop().time(),
-            "failedAttempts": 0,
-        }
+        online_sessions[sid] = Session(
+            auth_state="awaiting_name",
+            temp_data={},
+            command_queue=CommandQueue(),
+            last_active=asyncio.get_event_loop().time(),
+            failedAttempts=0,
+            # Client merges partial statsUpdates (see services.stats_updates)
+            stats_delta=isinstance(auth, dict) and bool(auth.get("statsDelta")),
+        )
         MYSTICAL_SPLASH = f"""\
                     The Mournvale - Version {version}
 
@@ -391,11 +397,14 @@ You stumble through the mists... What is your name?
                             player.current_room, player.name, item.name
                         )
                 # game_state.save_rooms()
-                player_manager.save_players()
+                player_manager.release(player.name)
 
                 # Broadcast logout to room
                 await broadcast_logout(player)
 
+                # Archmage invisibility lasts for the session only
+                set_invisible(player, online_sessions, False)
+
             # Remove the session
             del online_sessions[sid]
 
@@ -414,4 +423,14 @@ You stumble through the mists... What is your name?
         else:
             session["last_active"] = asyncio.get_event_loop().time()
             # Add command to the queue for processing
-            session["command_queue"].append(command_text)
+            command_queue = CommandQueue.from_list(session.get("command_queue"))
+            session["command_queue"] = command_queue
+            if not command_queue.push(command_text):
+                profiler = get_tick_profiler()
+                if profiler is not None:
+                    profiler.count_queue_event(REFUSED)
+                await utils.send_message(
+                    sio,
+                    sid,
+                    "You have too many commands queued; that one was ignored.",
+                )
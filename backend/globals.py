@@ -1,7 +1,8 @@
 # backend/globals.py
 
-from typing import Any, Dict
+from managers.session_registry import SessionRegistry
 
-online_sessions: Dict[str, Dict[str, Any]] = {}
+# sid -> session dict, with a room occupancy index (see SessionRegistry)
+online_sessions: SessionRegistry = SessionRegistry()
 version: str = "0.9"
 SPAWN_ROOM: str = "square"  # Default spawn room for new/respawning players
@@ -3,16 +3,26 @@
 import json
 import os
 import hashlib
-from typing import Dict
+from typing import Dict, Optional
+
+from managers.storage import RecordStore
 
 
 class AuthManager:
     save_file: str
     credentials: Dict[str, str]
+    store: Optional[RecordStore]
 
-    def __init__(self, save_file: str = "storage/auth.json") -> None:
+    def __init__(
+        self,
+        save_file: str = "storage/auth.json",
+        store: Optional[RecordStore] = None,
+    ) -> None:
         self.save_file = save_file
         self.credentials = {}
+        # With a store, hashes are looked up and upserted one row at a time
+        # and ``credentials`` stays empty; otherwise save_file is rewritten.
+        self.store = store
         # Ensure storage directory exists
         directory = os.path.dirname(self.save_file)
         if directory and not os.path.exists(directory):
@@ -20,13 +30,17 @@ class AuthManager:
         self.load_credentials()
 
     def load_credentials(self) -> None:
-        if os.path.exists(self.save_file):
+        if self.store is not None:
+            self.credentials = {}
+        elif os.path.exists(self.save_file):
             with open(self.save_file, "r") as f:
                 self.credentials = json.load(f)
         else:
             self.credentials = {}
 
     def save_credentials(self) -> None:
+        if self.store is not None:
+            return  # Every change is already upserted
         with open(self.save_file, "w") as f:
             json.dump(self.credentials, f, indent=4)
 
@@ -34,19 +48,33 @@ class AuthManager:
         salted = password + username
         return hashlib.sha256(salted.encode("utf-8")).hexdigest()
 
+    def _stored_hash(self, uname: str) -> Optional[str]:
+        if self.store is not None:
+            return self.store.get(uname)
+        return self.credentials.get(uname)
+
+    def set_password(self, username: str, password: str) -> None:
+        """Store a new password hash for ``username``."""
+        uname = username.lower()
+        hashed = self.hash_password(uname, password)
+        if self.store is not None:
+            self.store.put(uname, hashed)
+        else:
+            self.credentials[uname] = hashed
+            self.save_credentials()
+
     def register(self, username: str, password: str) -> bool:
         uname = username.lower()
-        if uname in self.credentials:
+        if self._stored_hash(uname) is not None:
             raise Exception("User already exists.")
-        hashed = self.hash_password(uname, password)
-        self.credentials[uname] = hashed
-        self.save_credentials()
+        self.set_password(uname, password)
         return True
 
     def login(self, username: str, password: str) -> bool:
         uname = username.lower()
         hashed = self.hash_password(uname, password)
-        if uname in self.credentials and self.credentials[uname] == hashed:
+        stored = self._stored_hash(uname)
+        if stored is not None and stored == hashed:
             return True
         else:
             raise Exception("Invalid credentials")
@@ -62,6 +90,8 @@ class AuthManager:
             bool: True if user was deleted, False if user not found
         """
         uname = username.lower()
+        if self.store is not None:
+            return self.store.delete(uname)
         if uname in self.credentials:
             del self.credentials[uname]
             self.save_credentials()
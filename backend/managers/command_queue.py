@@ -0,0 +1,131 @@
+# backend/managers/command_queue.py
+
+"""
+A session's queue of typed-ahead commands.
+
+Commands used to go into an unbounded list that the tick service consumed
+with ``list.pop(0)``, so a pasted 5,000-line script cost memory without
+limit and kept its session busy for 40 minutes of ticks. The queue is now a
+deque with:
+
+- a cap (MAX_QUEUED_COMMANDS): a command arriving at a full queue is
+  refused and the caller tells the client
+- a deadline (STALE_COMMAND_SECONDS): commands that have waited longer than
+  that are dropped before the next one runs, since what the player typed
+  no longer matches what is in front of them
+
+Each entry keeps the time it was queued. ``append`` and ``pop(0)`` (and
+``==`` against a list) still work for code written against the old list.
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+
+MAX_QUEUED_COMMANDS = 50
+STALE_COMMAND_SECONDS = 30.0
+
+
+class CommandQueue:
+    """FIFO of (command, queued_at) with a length cap and an age limit."""
+
+    __slots__ = ("_entries", "max_length", "max_age", "last_served")
+
+    def __init__(
+        self,
+        commands: Iterable[str] = (),
+        *,
+        max_length: int = MAX_QUEUED_COMMANDS,
+        max_age: float = STALE_COMMAND_SECONDS,
+        now: Optional[float] = None,
+    ) -> None:
+        self._entries: Deque[Tuple[str, float]] = deque()
+        self.max_length = max_length
+        self.max_age = max_age
+        # Tick number this queue last had a command run (TickService's
+        # fairness order); sessions waiting longest go first.
+        self.last_served = 0
+        if now is None:
+            now = time.time()
+        for command in commands:
+            self.push(command, now)
+
+    @classmethod
+    def from_list(cls, commands: Any, now: Optional[float] = None) -> "CommandQueue":
+        """``commands`` if it already is a CommandQueue, else a queue of them."""
+        if isinstance(commands, CommandQueue):
+            return commands
+        return cls(commands or (), now=now)
+
+    def push(self, command: str, now: Optional[float] = None) -> bool:
+        """Queue ``command``; False (and nothing queued) if the queue is full."""
+        if len(self._entries) >= self.max_length:
+            return False
+        self._entries.append((command, time.time() if now is None else now))
+        return True
+
+    def push_front(self, commands: List[str], queued_at: float) -> int:
+        """
+        Put ``commands`` (in order) ahead of everything queued, e.g. the rest
+        of a chained "n;get sword;s". They keep ``queued_at``, the time the
+        line they came from was queued. Commands beyond the cap are dropped;
+        returns how many.
+        """
+        room = max(0, self.max_length - len(self._entries))
+        kept = commands[:room]
+        self._entries.extendleft((command, queued_at) for command in reversed(kept))
+        return len(commands) - len(kept)
+
+    def drop_stale(self, now: float) -> int:
+        """Drop commands queued more than ``max_age`` seconds ago; how many."""
+        deadline = now - self.max_age
+        dropped = 0
+        while self._entries and self._entries[0][1] < deadline:
+            self._entries.popleft()
+            dropped += 1
+        return dropped
+
+    def peek(self) -> str:
+        """The oldest command, left in place; IndexError if empty."""
+        return self._entries[0][0]
+
+    def pop_next(self) -> Tuple[str, float]:
+        """The oldest (command, queued_at); IndexError if empty."""
+        return self._entries.popleft()
+
+    # ------------------------------------------------------------------
+    # list compatibility
+    # ------------------------------------------------------------------
+
+    def append(self, command: str) -> None:
+        """Queue ``command``, silently dropping it if the queue is full."""
+        self.push(command)
+
+    def pop(self, index: int = 0) -> str:
+        if index != 0:
+            raise IndexError("CommandQueue only pops from the front")
+        return self._entries.popleft()[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return (command for command, _ in self._entries)
+
+    def __contains__(self, command: object) -> bool:
+        return any(queued == command for queued, _ in self._entries)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CommandQueue):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CommandQueue({list(self)!r})"
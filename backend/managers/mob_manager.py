@@ -3,8 +3,16 @@
 import logging
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from managers.session_registry import (
+    room_channel,
+    room_mirror_of,
+    sessions_by_room,
+    sessions_in_room,
+)
 from models.Mobile import Mobile
+from services import state_version
 from services.invisibility_service import is_invisible
+from services.scheduler import RESPAWN, Scheduler
 
 if TYPE_CHECKING:
     from managers.game_state import GameState
@@ -15,13 +23,131 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class MobRegistry(Dict[str, Mobile]):
+    """
+    mob_id -> Mobile dict that also indexes mobs by room.
+
+    Every mob in the table reports its changes of ``current_room`` (walking,
+    patrols, summons, death) back to the registry, so "which mobs are in this
+    room?" costs O(mobs in the room) however many mobs the world holds.
+    Patrolling mobs are also indexed by every room on their route.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        # room_id -> insertion-ordered set of mob ids
+        self._rooms: Dict[str, Dict[str, None]] = {}
+        # mob_id -> room_id the index currently files the mob under
+        self._room_of: Dict[str, str] = {}
+        # id(mob) -> mob_id for mobs in the table
+        self._id_of_mob: Dict[int, str] = {}
+        # room_id -> ids of mobs whose patrol route includes it
+        self._patrols: Dict[str, Dict[str, None]] = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self) -> Any:
+        # Rebuild through __init__ so the index exists before items go in.
+        return (type(self), (dict(self),))
+
+    def __setitem__(self, mob_id: str, mob: Mobile) -> None:
+        if mob_id in self:
+            self._forget(mob_id)
+        super().__setitem__(mob_id, mob)
+        self._id_of_mob[id(mob)] = mob_id
+        mob.room_observer = self._mob_moved
+        self._file(mob_id, mob.current_room)
+        if len(mob.patrol_rooms) > 1:
+            for room_id in mob.patrol_rooms:
+                self._patrols.setdefault(room_id, {})[mob_id] = None
+
+    def __delitem__(self, mob_id: str) -> None:
+        self._forget(mob_id)
+        super().__delitem__(mob_id)
+
+    def pop(self, mob_id: str, *default: Any) -> Any:
+        if mob_id in self:
+            self._forget(mob_id)
+        return super().pop(mob_id, *default)
+
+    def popitem(self) -> Tuple[str, Mobile]:
+        mob_id = next(reversed(self.keys()))
+        return mob_id, self.pop(mob_id)
+
+    def clear(self) -> None:
+        for mob_id in list(self.keys()):
+            self._forget(mob_id)
+        super().clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for mob_id, mob in dict(*args, **kwargs).items():
+            self[mob_id] = mob
+
+    def setdefault(self, mob_id: str, default: Any = None) -> Any:
+        if mob_id not in self:
+            self[mob_id] = default
+        return self[mob_id]
+
+    def _forget(self, mob_id: str) -> None:
+        mob = self.get(mob_id)
+        if mob is not None:
+            self._id_of_mob.pop(id(mob), None)
+            if mob.room_observer == self._mob_moved:
+                mob.room_observer = None
+            for room_id in mob.patrol_rooms:
+                patrols = self._patrols.get(room_id)
+                if patrols is not None:
+                    patrols.pop(mob_id, None)
+                    if not patrols:
+                        del self._patrols[room_id]
+        self._unfile(mob_id)
+
+    def _mob_moved(
+        self, mob: Mobile, old_room: Optional[str], new_room: Optional[str]
+    ) -> None:
+        mob_id = self._id_of_mob.get(id(mob))
+        if mob_id is not None:
+            self._file(mob_id, new_room)
+
+    def _file(self, mob_id: str, room_id: Optional[str]) -> None:
+        self._unfile(mob_id)
+        if room_id is None:
+            return  # Dead or banished: in no room
+        self._rooms.setdefault(room_id, {})[mob_id] = None
+        self._room_of[mob_id] = room_id
+        state_version.bump_room(room_id)
+
+    def _unfile(self, mob_id: str) -> None:
+        room_id = self._room_of.pop(mob_id, None)
+        if room_id is None:
+            return
+        state_version.bump_room(room_id)
+        occupants = self._rooms.get(room_id)
+        if occupants is not None:
+            occupants.pop(mob_id, None)
+            if not occupants:
+                del self._rooms[room_id]
+
+    def ids_in_room(self, room_id: Optional[str]) -> List[str]:
+        """Ids of mobs (alive or not) currently filed under ``room_id``."""
+        if room_id is None:
+            return []
+        return list(self._rooms.get(room_id, ()))
+
+    def occupied_rooms(self) -> List[str]:
+        """Room ids holding at least one mob."""
+        return list(self._rooms)
+
+    def ids_patrolling(self, room_id: str) -> List[str]:
+        """Ids of mobs whose patrol route passes through ``room_id``."""
+        return list(self._patrols.get(room_id, ()))
+
+
 class MobManager:
     """
     Manages all mobs in the game world.
     Handles spawning, tracking, and AI ticking.
     """
 
-    mobs: Dict[str, Mobile]
     mob_definitions: Dict[str, Dict[str, Any]]
     global_tick_counter: int
 
@@ -29,8 +155,18 @@ class MobManager:
     # Definitions may opt in to timed repopulation via "respawn_seconds".
     DEFAULT_RESPAWN_SECONDS: Optional[float] = None
 
-    def __init__(self, *, time_func: Optional[Callable[[], float]] = None) -> None:
-        self.mobs = {}  # Dict of mob_id -> Mobile instance
+    # Exits from the nearest online player beyond which mob AI goes dormant
+    # (interest management); the server enables it with this radius.
+    DEFAULT_ACTIVITY_RADIUS = 3
+
+    def __init__(
+        self,
+        *,
+        time_func: Optional[Callable[[], float]] = None,
+        scheduler: Optional[Scheduler] = None,
+        activity_radius: Optional[int] = None,
+    ) -> None:
+        self.mobs = MobRegistry()  # mob_id -> Mobile, indexed by room
         self.mob_definitions = {}  # Dict of definition_id -> mob template
         self.global_tick_counter = 0  # Track ticks for movement timing
         self._time: Callable[[], float] = time_func or time.time
@@ -38,8 +174,35 @@ class MobManager:
         self._spawn_counter = 0
         # mob_id -> (definition_id, home_room) for respawn scheduling
         self.spawn_records: Dict[str, Tuple[str, str]] = {}
-        # (respawn_at, definition_id, home_room)
-        self.respawn_queue: List[Tuple[float, str, str]] = []
+        # Pending respawns live in the (shared) scheduler as RESPAWN timers
+        # carrying (definition_id, home_room); deadlines use self._time.
+        self.scheduler = scheduler or Scheduler(time_func=self._time)
+        self._respawn_counter = 0
+        # Mobs more than this many exits from every online player are not
+        # ticked; they are fast-forwarded when someone comes within range.
+        # None ticks every mob every tick.
+        self.activity_radius = activity_radius
+
+    @property
+    def mobs(self) -> MobRegistry:
+        return self._mobs
+
+    @mobs.setter
+    def mobs(self, mobs: Dict[str, Mobile]) -> None:
+        # Callers (admin world reloads) assign plain dicts; index them.
+        if not isinstance(mobs, MobRegistry):
+            mobs = MobRegistry(mobs)
+        self._mobs = mobs
+
+    @property
+    def respawn_queue(self) -> List[Tuple[float, str, str]]:
+        """Pending (respawn_at, definition_id, home_room), soonest first."""
+        return [
+            (respawn_at, definition_id, home_room)
+            for respawn_at, _key, (definition_id, home_room) in (
+                self.scheduler.pending(RESPAWN)
+            )
+        ]
 
     def load_mob_definitions(self, definitions: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -119,6 +282,7 @@ class MobManager:
 
         # Initialize aggro delay
         mob.initialize_aggro_delay()
+        mob.last_ai_tick = self.global_tick_counter
 
         # Add to tracking
         self.mobs[mob_id] = mob
@@ -176,8 +340,12 @@ class MobManager:
                 "respawn_seconds", self.DEFAULT_RESPAWN_SECONDS
             )
             if respawn_seconds is not None:
-                self.respawn_queue.append(
-                    (self._time() + float(respawn_seconds), definition_id, home_room)
+                self._respawn_counter += 1
+                self.scheduler.schedule(
+                    RESPAWN,
+                    self._respawn_counter,
+                    self._time() + float(respawn_seconds),
+                    (definition_id, home_room),
                 )
                 logger.info(
                     f"Scheduled respawn of '{definition_id}' in {respawn_seconds}s"
@@ -193,28 +361,42 @@ class MobManager:
         sio: Any = None,
         utils: Any = None,
     ) -> List[Mobile]:
-        """Spawn any queued mobs whose respawn time has arrived."""
-        now = self._time()
-        due = [entry for entry in self.respawn_queue if entry[0] <= now]
+        """
+        Spawn any queued mobs whose respawn time has arrived.
+
+        Everything due this tick is handled as one batch: each home room gets
+        a single message listing its returning mobs, sent as one room-wide
+        emit when a Socket.IO room mirror is installed. During a tick that
+        emit is split per occupant right away (see services.outbound), so
+        players who enter the room later in the tick do not see it.
+        """
+        due = self.scheduler.pop_due(RESPAWN, self._time())
         if not due:
             return []
-        self.respawn_queue = [e for e in self.respawn_queue if e[0] > now]
 
         respawned: List[Mobile] = []
-        for _respawn_at, definition_id, home_room in due:
+        arrivals: Dict[str, List[str]] = {}  # home room -> announcement lines
+        for _key, (definition_id, home_room) in due:
             mob = self.spawn_mob(definition_id, home_room, game_state)
             if not mob:
                 continue
             respawned.append(mob)
-            if online_sessions and sio and utils:
-                for sid, session in online_sessions.items():
-                    player = session.get("player")
-                    if player and player.current_room == home_room:
-                        await utils.send_message(
-                            sio,
-                            sid,
-                            f"{mob.name.capitalize()} pads out of the shadows.",
-                        )
+            arrivals.setdefault(home_room, []).append(
+                f"{mob.name.capitalize()} pads out of the shadows."
+            )
+
+        if online_sessions and sio and utils:
+            mirror = room_mirror_of(online_sessions)
+            for room_id, lines in arrivals.items():
+                occupants = sessions_in_room(online_sessions, room_id)
+                if not occupants:
+                    continue
+                message = "\n".join(lines)
+                if mirror is not None:
+                    await mirror.emit("message", message, room_channel(room_id))
+                    continue
+                for sid, _session in occupants:
+                    await utils.send_message(sio, sid, message)
         return respawned
 
     def get_mob(self, mob_id: str) -> Optional[Mobile]:
@@ -231,10 +413,12 @@ class MobManager:
         Returns:
             list: List of Mobile objects in the room
         """
+        mobs = self.mobs
         return [
             mob
-            for mob in self.mobs.values()
-            if mob.current_room == room_id and mob.state == "alive"
+            for mob_id in mobs.ids_in_room(room_id)
+            for mob in (mobs[mob_id],)
+            if mob.state == "alive"
         ]
 
     def get_all_mobs(self) -> List[Mobile]:
@@ -265,9 +449,15 @@ class MobManager:
 
         from commands.combat import is_in_combat
 
-        for mob_id, mob in list(self.mobs.items()):
+        if self.activity_radius is None:
+            mobs = list(self.mobs.items())
+        else:
+            mobs = await self._wake_active_mobs(game_state, online_sessions, sio, utils)
+
+        for mob_id, mob in mobs:
             if mob.state != "alive":
                 continue
+            mob.last_ai_tick = self.global_tick_counter
 
             if is_in_combat(mob_id):
                 logger.debug(f"Skipping movement for {mob.name} while in combat")
@@ -288,6 +478,89 @@ class MobManager:
                     mob, online_sessions, player_manager, game_state, sio, utils
                 )
 
+    def active_rooms(
+        self,
+        game_state: "GameState",
+        online_sessions: Dict[str, Dict[str, Any]],
+    ) -> List[str]:
+        """Rooms within ``activity_radius`` exits of an online player, nearest first."""
+        # Dict keys as an ordered set keep the tick order deterministic.
+        active: Dict[str, None] = dict.fromkeys(sessions_by_room(online_sessions))
+        frontier = list(active)
+        for _ in range(self.activity_radius or 0):
+            reached: List[str] = []
+            for room_id in frontier:
+                room = game_state.get_room(room_id)
+                if room is None:
+                    continue
+                for next_room_id in room.exits.values():
+                    if next_room_id not in active:
+                        active[next_room_id] = None
+                        reached.append(next_room_id)
+            if not reached:
+                break
+            frontier = reached
+        return list(active)
+
+    async def _wake_active_mobs(
+        self,
+        game_state: "GameState",
+        online_sessions: Dict[str, Dict[str, Any]],
+        sio: Any,
+        utils: Any,
+    ) -> List[Tuple[str, Mobile]]:
+        """
+        The mobs to tick this round: those in active rooms. Mobs waking from
+        dormancy are first caught up to the previous tick.
+
+        A dormant patrol whose route crosses an active room is caught up too,
+        since by now it may have walked into view; it is ticked if it has.
+        """
+        active_rooms = self.active_rooms(game_state, online_sessions)
+        active = [
+            (mob_id, self.mobs[mob_id])
+            for room_id in active_rooms
+            for mob_id in self.mobs.ids_in_room(room_id)
+        ]
+        caught_up_to = self.global_tick_counter - 1
+        for _mob_id, mob in active:
+            await self._catch_up(
+                mob, caught_up_to, game_state, online_sessions, sio, utils
+            )
+
+        seen = {mob_id for mob_id, _mob in active}
+        in_range = set(active_rooms)
+        for room_id in active_rooms:
+            for mob_id in self.mobs.ids_patrolling(room_id):
+                if mob_id in seen:
+                    continue
+                seen.add(mob_id)
+                mob = self.mobs[mob_id]
+                await self._catch_up(
+                    mob, caught_up_to, game_state, online_sessions, sio, utils
+                )
+                if mob.current_room in in_range:
+                    active.append((mob_id, mob))
+        return active
+
+    async def _catch_up(
+        self,
+        mob: Mobile,
+        caught_up_to: int,
+        game_state: "GameState",
+        online_sessions: Dict[str, Dict[str, Any]],
+        sio: Any,
+        utils: Any,
+    ) -> None:
+        """Fast-forward a dormant mob to ``caught_up_to``, moving it if due."""
+        if mob.state != "alive" or mob.last_ai_tick >= caught_up_to:
+            return
+        patrol_room = mob.fast_forward(caught_up_to)
+        if patrol_room is not None and patrol_room != mob.current_room:
+            await self._relocate_mob(
+                mob, patrol_room, game_state, online_sessions, sio, utils
+            )
+
     async def _process_mob_movement(
         self,
         mob: Mobile,
@@ -306,11 +579,24 @@ class MobManager:
             sio: Socket.IO instance
             utils: Utils module
         """
-        old_room_id = mob.current_room
         new_room_id = mob.choose_next_room()
-
-        if new_room_id == old_room_id:
+        if new_room_id == mob.current_room:
             return
+        await self._relocate_mob(
+            mob, new_room_id, game_state, online_sessions, sio, utils
+        )
+
+    async def _relocate_mob(
+        self,
+        mob: Mobile,
+        new_room_id: Optional[str],
+        game_state: "GameState",
+        online_sessions: Dict[str, Dict[str, Any]],
+        sio: Any,
+        utils: Any,
+    ) -> None:
+        """Move ``mob`` to ``new_room_id``, telling both rooms' players."""
+        old_room_id = mob.current_room
 
         # Remove from old room
         old_room = game_state.get_room(old_room_id) if old_room_id else None
@@ -319,12 +605,10 @@ class MobManager:
 
             # Notify players in old room
             if online_sessions and sio and utils:
-                for sid, session_data in online_sessions.items():
-                    player = session_data.get("player")
-                    if player and player.current_room == old_room_id:
-                        await utils.send_message(
-                            sio, sid, f"{mob.name.capitalize()} leaves."
-                        )
+                for sid, _session in sessions_in_room(online_sessions, old_room_id):
+                    await utils.send_message(
+                        sio, sid, f"{mob.name.capitalize()} leaves."
+                    )
 
         # Move mob
         if new_room_id is not None:
@@ -338,13 +622,11 @@ class MobManager:
             # Notify players in new room
             if online_sessions and sio and utils:
                 players_in_room = False
-                for sid, session_data in online_sessions.items():
-                    player = session_data.get("player")
-                    if player and player.current_room == new_room_id:
-                        players_in_room = True
-                        await utils.send_message(
-                            sio, sid, f"{mob.name.capitalize()} arrives."
-                        )
+                for sid, _session in sessions_in_room(online_sessions, new_room_id):
+                    players_in_room = True
+                    await utils.send_message(
+                        sio, sid, f"{mob.name.capitalize()} arrives."
+                    )
 
                 # If mob is aggressive and moved into room with players,
                 # reset aggro delay to give players time to react
@@ -376,18 +658,15 @@ class MobManager:
         target_sid = None
 
         if online_sessions:
-            for sid, session_data in online_sessions.items():
+            # Players in limbo (current_room == None) are in no room
+            for sid, session_data in sessions_in_room(
+                online_sessions, mob.current_room
+            ):
                 player = session_data.get("player")
-                # Players in limbo (current_room == None) won't match
                 # Invisible players can't be detected by mobs
-                if (
-                    player
-                    and player.current_room == mob.current_room
-                    and not is_invisible(player, online_sessions)
-                    and not (
-                        mob.spares_flagged
-                        and getattr(player, "flags", {}).get(mob.spares_flagged)
-                    )
+                if not is_invisible(player, online_sessions) and not (
+                    mob.spares_flagged
+                    and getattr(player, "flags", {}).get(mob.spares_flagged)
                 ):
                     target_player = player
                     target_sid = sid
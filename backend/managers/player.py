@@ -1,37 +1,66 @@
 # backend/managers/player.py
 
+import asyncio
 import json
+import logging
 import os
-from typing import Dict, Optional
+import tempfile
+from typing import Dict, Optional, Set, Union
 from models.Player import Player
 from managers.auth import AuthManager
+from managers.storage import RecordStore
 from globals import SPAWN_ROOM
 
+logger = logging.getLogger(__name__)
+
+# How long the write-behind flusher waits after the first change before
+# writing, so bursts of saves (a player walking the swamp) coalesce.
+WRITE_BEHIND_DELAY = 1.0
+
+# What a flush writes: the whole JSON file, or the changed rows of a store.
+SavePayload = Union[str, Dict[str, str]]
+
 
 class PlayerManager:
     save_file: str
     players: Dict[str, Player]
     spawn_room: str
     auth_manager: Optional[AuthManager]
+    store: Optional[RecordStore]
 
     def __init__(
         self,
         save_file: str = "storage/players.json",
         spawn_room: str = SPAWN_ROOM,
         auth_manager: Optional[AuthManager] = None,
+        store: Optional[RecordStore] = None,
     ) -> None:
         self.save_file = save_file
         self.players = {}
         self.spawn_room = spawn_room
         self.auth_manager = auth_manager  # Store reference to auth_manager
-        self.load_players()
+        # With a store, players are loaded on login and saved as row upserts;
+        # without one, everyone lives in memory and save_file is rewritten.
+        self.store = store
+        # uname -> serialized record as last written; only dirty players are
+        # re-serialized, the rest of the file is assembled from this cache.
+        self._records: Dict[str, str] = {}
+        # Set while run_write_behind() owns writing; save_players() then only
+        # signals it instead of writing synchronously on the caller's stack.
+        self._save_requested: Optional[asyncio.Event] = None
+        # Store mode: logged-out players to drop from memory once their last
+        # changes are written (see release()).
+        self._released: Set[str] = set()
+        if self.store is None:
+            self.load_players()
 
     def register(
         self, name: str, sex: str = "M", email: Optional[str] = None
     ) -> Player:
         uname = name.lower()
-        if uname in self.players:
-            return self.players[uname]
+        existing = self.login(uname)
+        if existing is not None:
+            return existing
         display_name = name.capitalize()
         new_player = Player(display_name, sex, email, spawn_room=self.spawn_room)
         self.players[uname] = new_player
@@ -39,7 +68,18 @@ class PlayerManager:
         return new_player
 
     def login(self, name: str) -> Optional[Player]:
-        return self.players.get(name.lower(), None)
+        uname = name.lower()
+        self._released.discard(uname)
+        player = self.players.get(uname)
+        if player is None and self.store is not None:
+            record = self.store.get(uname)
+            if record is not None:
+                player = Player.from_dict(json.loads(record))
+                player.inventory = []
+                player.dirty = False
+                self.players[uname] = player
+                self._records[uname] = record
+        return player
 
     def delete_player(self, name: str) -> bool:
         """
@@ -52,10 +92,17 @@ class PlayerManager:
             bool: True if player was deleted, False if player not found
         """
         uname = name.lower()
-        if uname in self.players:
-            del self.players[uname]
-            self.save_players()
+        if self.store is not None:
+            in_memory = self.players.pop(uname, None) is not None
+            self._records.pop(uname, None)
+            found = self.store.delete(uname) or in_memory
+        else:
+            found = uname in self.players
+            if found:
+                del self.players[uname]
+                self.save_players()
 
+        if found:
             # Also delete authentication credentials if auth_manager is available
             if self.auth_manager:
                 self.auth_manager.delete_user(uname)
@@ -63,15 +110,140 @@ class PlayerManager:
             return True
         return False
 
+    def release(self, name: str) -> None:
+        """
+        Save a player who is logging out. With a store they are also dropped
+        from memory once the write holding their last change has finished;
+        logging back in first cancels that.
+        """
+        uname = name.lower()
+        if self.store is not None and uname in self.players:
+            self._released.add(uname)
+        self.save_players()
+
     def save_players(self) -> None:
-        with open(self.save_file, "w") as f:
-            # Create a dictionary of player data without inventory
-            player_data: Dict[str, Dict[str, object]] = {}
-            for name, player in self.players.items():
-                player_dict = player.to_dict()
-                player_dict["inventory"] = []  # Clear inventory before saving
-                player_data[name] = player_dict
-            json.dump(player_data, f, indent=4)
+        """
+        Persist player changes.
+
+        While the write-behind flusher is running this just schedules a
+        coalesced background write; otherwise (tests, tools, shutdown) it
+        writes immediately.
+        """
+        if self._save_requested is not None:
+            self._save_requested.set()
+            return
+        payload = self._collect_changes()
+        if payload is not None:
+            self._write(payload)
+        self._evict_released()
+
+    def save_now(self) -> None:
+        """
+        Write pending changes synchronously even while the write-behind
+        flusher runs, for when the process is about to go away without
+        unwinding (the archmage reset re-executes the server).
+        """
+        payload = self._collect_changes()
+        if payload is not None:
+            self._write(payload)
+        self._evict_released()
+
+    async def flush(self) -> None:
+        """Write any pending changes now, off the event loop."""
+        payload = self._collect_changes()
+        if payload is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write, payload)
+        self._evict_released()
+
+    async def run_write_behind(self, delay: float = WRITE_BEHIND_DELAY) -> None:
+        """
+        Background flusher: coalesce save_players() calls into one write per
+        ``delay`` seconds, serialized on the loop and written in an executor.
+        Flushes whatever is pending when cancelled (shutdown).
+        """
+        self._save_requested = asyncio.Event()
+        logger.info("Player write-behind flusher running")
+        try:
+            while True:
+                await self._save_requested.wait()
+                await asyncio.sleep(delay)
+                self._save_requested.clear()
+                try:
+                    await self.flush()
+                except OSError as exc:
+                    logger.error("Failed to save players: %s", exc, exc_info=True)
+        finally:
+            self._save_requested = None
+            payload = self._collect_changes()
+            if payload is not None:
+                self._write(payload)
+            self._evict_released()
+            logger.info("Player write-behind flusher stopped")
+
+    def _evict_released(self) -> None:
+        """Drop released players whose changes have all been written."""
+        for uname in list(self._released):
+            player = self.players.get(uname)
+            if player is not None and player.dirty:
+                continue  # Changed again since the write; wait for the next
+            self.players.pop(uname, None)
+            self._records.pop(uname, None)
+            self._released.discard(uname)
+
+    def _collect_changes(self) -> Optional[SavePayload]:
+        """
+        Re-serialize dirty players and drop deleted ones from the record
+        cache. Returns the changed rows (store) or the file contents to write,
+        or None if nothing changed.
+        """
+        changed = False
+        if self.store is None:
+            for name in [n for n in self._records if n not in self.players]:
+                del self._records[name]
+                changed = True
+
+        rows: Dict[str, str] = {}
+        for name, player in self.players.items():
+            if not player.dirty and name in self._records:
+                continue
+            player_dict = player.to_dict()
+            player_dict["inventory"] = []  # Inventory is never persisted
+            rows[name] = self._records[name] = json.dumps(player_dict)
+            player.dirty = False
+            changed = True
+
+        if not changed:
+            return None
+        if self.store is not None:
+            return rows
+        body = ",\n".join(
+            f"{json.dumps(name)}: {record}" for name, record in self._records.items()
+        )
+        return "{\n" + body + "\n}\n"
+
+    def _write(self, payload: SavePayload) -> None:
+        if isinstance(payload, dict):
+            if self.store is not None:
+                self.store.put_many(payload)  # One transaction per flush
+        else:
+            self._write_atomic(payload)
+
+    def _write_atomic(self, payload: str) -> None:
+        """Write via a temp file + rename so readers never see a torn file."""
+        directory = os.path.dirname(self.save_file) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.save_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def load_players(self) -> None:
         if os.path.exists(self.save_file):
@@ -80,6 +252,10 @@ class PlayerManager:
                 self.players = {
                     name: Player.from_dict(p_data) for name, p_data in data.items()
                 }
-                # Ensure all loaded players start with empty inventory
-                for player in self.players.values():
+                # Ensure all loaded players start with empty inventory, and
+                # seed the record cache so untouched players are never
+                # re-serialized.
+                for name, player in self.players.items():
                     player.inventory = []
+                    self._records[name] = json.dumps(player.to_dict())
+                    player.dirty = False
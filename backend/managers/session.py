@@ -0,0 +1,192 @@
+# backend/managers/session.py
+
+"""
+Per-connection session state.
+
+A Session used to be a plain dict read with ``session.get("player")``,
+``session.get("sleeping")`` and so on in every fan-out loop. It is now a
+slotted object: the fields below are typed attributes (no per-session hash
+table, no string-key hashing on reads), while the mapping interface is kept
+so code still using ``session["key"]`` / ``.get`` / ``in`` / ``del`` keeps
+working. Code that can also be handed a plain dict (see
+managers.session_registry) must stay on the mapping interface.
+
+The mapping view behaves exactly like the old dict: a field is present once
+it has been assigned (by key or attribute) and absent again after ``del``.
+Reading an absent field as an attribute gives its default (None, False, 0,
+an empty container), which is what the ``.get(key, default)`` calls it
+replaces returned.
+
+Keys that are not fields (rare, per-feature state such as ``pwd_change``)
+live in a small dict created on first use.
+
+``sleep_observer`` is not part of the mapping: the session registry sets it
+to hear when ``sleeping`` flips, however it is assigned, so sleepers can be
+kept out of the Socket.IO channels broadcasts go to.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from managers.command_queue import CommandQueue
+
+if TYPE_CHECKING:
+    from models.Player import Player
+
+# field -> factory for its default value
+DEFAULTS: Dict[str, Callable[[], Any]] = {
+    "player": lambda: None,
+    "auth_state": lambda: None,
+    "temp_data": dict,
+    "command_queue": CommandQueue,
+    "last_active": float,
+    "failedAttempts": int,
+    "sleeping": bool,
+    "afflictions": lambda: None,
+    "invisible": bool,
+    "awaiting_respawn": bool,
+    "converse_mode": bool,
+    "pending_comm": lambda: None,
+    "should_disconnect": bool,
+    "stats_sent": lambda: None,
+    "stats_sent_at": float,
+    "stats_pending": bool,
+    "stats_delta": bool,
+}
+FIELDS: Tuple[str, ...] = tuple(DEFAULTS)
+# field -> its bit in Session._present
+_BITS: Dict[str, int] = {name: 1 << index for index, name in enumerate(FIELDS)}
+
+
+class Session(MutableMapping[str, Any]):
+    """One client connection; attributes for the hot fields, dict for the rest."""
+
+    __slots__ = FIELDS + ("_present", "_extra", "sleep_observer")
+
+    # The bound player (None until login)
+    player: Optional["Player"]
+    # Login / registration step; None once authenticated
+    auth_state: Optional[str]
+    temp_data: Dict[str, Any]
+    # Commands waiting for the tick service
+    command_queue: CommandQueue
+    last_active: float
+    failedAttempts: int
+    sleeping: bool
+    # affliction type -> affliction state (see services.affliction_service)
+    afflictions: Optional[Dict[str, Any]]
+    # Archmage invisibility (mirrored on the player, see invisibility_service)
+    invisible: bool
+    awaiting_respawn: bool
+    converse_mode: bool
+    pending_comm: Optional[Dict[str, Any]]
+    should_disconnect: bool
+    # statsUpdate bookkeeping (see services.stats_updates)
+    stats_sent: Optional[Dict[str, Any]]
+    stats_sent_at: float
+    stats_pending: bool
+    stats_delta: bool
+    # Bits of the fields that have been assigned (present as keys)
+    _present: int
+    _extra: Optional[Dict[str, Any]]
+    # Notified as (session, sleeping) whenever ``sleeping`` changes
+    sleep_observer: Optional[Callable[["Session", bool], None]]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        for name, default in DEFAULTS.items():
+            object.__setattr__(self, name, default())
+        object.__setattr__(self, "_present", 0)
+        object.__setattr__(self, "_extra", None)
+        object.__setattr__(self, "sleep_observer", None)
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        woke_or_slept = name == "sleeping" and bool(value) != bool(self.sleeping)
+        object.__setattr__(self, name, value)
+        bit = _BITS.get(name)
+        if bit is not None:
+            object.__setattr__(self, "_present", self._present | bit)
+        if woke_or_slept and self.sleep_observer is not None:
+            self.sleep_observer(self, bool(value))
+
+    @classmethod
+    def from_dict(cls, session: Mapping[str, Any]) -> "Session":
+        return session if isinstance(session, Session) else cls(session)
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, name: str) -> Any:
+        bit = _BITS.get(name)
+        if bit is not None:
+            if not self._present & bit:
+                raise KeyError(name)
+            return getattr(self, name)
+        if self._extra is None:
+            raise KeyError(name)
+        return self._extra[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        bit = _BITS.get(name)
+        if bit is not None:
+            return getattr(self, name) if self._present & bit else default
+        if self._extra is None:
+            return default
+        return self._extra.get(name, default)
+
+    def __contains__(self, name: object) -> bool:
+        bit = _BITS.get(name)  # type: ignore[call-overload]
+        if bit is not None:
+            return bool(self._present & bit)
+        return self._extra is not None and name in self._extra
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if name in _BITS:
+            setattr(self, name, value)
+        else:
+            if self._extra is None:
+                object.__setattr__(self, "_extra", {})
+            self._extra[name] = value  # type: ignore[index]
+
+    def __delitem__(self, name: str) -> None:
+        bit = _BITS.get(name)
+        if bit is not None:
+            if not self._present & bit:
+                raise KeyError(name)
+            self.__setattr__(name, DEFAULTS[name]())
+            object.__setattr__(self, "_present", self._present & ~bit)
+        elif self._extra is None:
+            raise KeyError(name)
+        else:
+            del self._extra[name]
+
+    def __iter__(self) -> Iterator[str]:
+        for name in FIELDS:
+            if self._present & _BITS[name]:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Session({dict(self.items())!r})"
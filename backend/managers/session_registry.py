@@ -0,0 +1,428 @@
+# backend/managers/session_registry.py
+
+"""
+Live session table with player lookup and room occupancy indexes.
+
+SessionRegistry is a drop-in replacement for the plain ``sid -> session``
+dict held in ``globals.online_sessions``. Alongside the sessions it keeps:
+
+- player object -> sid and lowercase name -> sid, so finding a player's
+  session is a dict probe rather than a scan of every connection;
+- a ``room_id -> sids`` index that follows every authenticated player around
+  the world: a player bound to a session reports each change of
+  ``current_room`` back to the registry, so "who is in this room?" costs
+  O(occupants).
+
+Call sites accept any mapping of sessions. The module-level helpers use the
+index when handed a SessionRegistry and fall back to a linear scan for ad-hoc
+dicts (tests, tools). Code that may be handed such a mapping reads sessions
+through the mapping interface (``session.get("player")``), which Session and
+dict share, so both keep working; attribute access (``session.player``) is
+for code that holds a Session it created or took from the registry.
+
+With a RoomMirror installed the registry also mirrors its index into
+Socket.IO rooms: every authenticated session sits in PLAYERS_CHANNEL and in
+the ``room_channel()`` of the game room its player stands in, and while its
+player is awake also in AWAKE_CHANNEL and the room's ``awake_channel()``.
+A room broadcast is then one ``emit(room=..., skip_sid=[...])`` whose
+fan-out happens inside python-socketio's manager (see ``RoomMirror.emit``),
+and one meant only for players who are awake needs no skip list for the
+sleepers. Through an OutboundBuffer the membership changes are queued in
+order with the tick's output, so a broadcast reaches the room as it was when
+the message was sent.
+"""
+
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from managers.session import Session
+
+logger = logging.getLogger(__name__)
+
+# Sessions are Session objects in a SessionRegistry and plain dicts in ad-hoc
+# mappings (tests, tools); both support the mapping interface.
+SessionPair = Tuple[str, Any]
+
+# Socket.IO room holding every authenticated session.
+PLAYERS_CHANNEL = "players"
+# ...and the ones of those whose player is not asleep.
+AWAKE_CHANNEL = "players:awake"
+
+
+def room_channel(room_id: str) -> str:
+    """Socket.IO room name mirroring the occupants of game room ``room_id``."""
+    return f"room:{room_id}"
+
+
+def awake_channel(room_id: str) -> str:
+    """Socket.IO room name mirroring the awake occupants of ``room_id``."""
+    return f"room:{room_id}:awake"
+
+
+class RoomMirror:
+    """
+    Keeps Socket.IO room membership in step with the registry's index.
+
+    Membership changes go through the manager's synchronous
+    ``basic_enter_room``/``basic_leave_room`` so they can happen inside the
+    player's room observer without awaiting. ``sio`` may be the server or
+    anything wrapping it (OutboundBuffer, whose ``manager`` queues the
+    changes with its buffered output) as long as it exposes ``manager`` and
+    ``emit``.
+    """
+
+    def __init__(self, sio: Any, namespace: str = "/") -> None:
+        self.sio = sio
+        self.namespace = namespace
+
+    def enter(self, sid: str, channel: str) -> None:
+        try:
+            self.sio.manager.basic_enter_room(sid, self.namespace, channel)
+        except (KeyError, ValueError):
+            # Not (or no longer) connected; nothing to mirror.
+            logger.debug("Cannot add %s to %s: not connected", sid, channel)
+
+    def leave(self, sid: str, channel: str) -> None:
+        self.sio.manager.basic_leave_room(sid, self.namespace, channel)
+
+    async def emit(
+        self, event: str, data: Any, channel: str, skip_sids: Iterable[str] = ()
+    ) -> None:
+        """
+        Send ``event`` to everyone in ``channel`` but ``skip_sids``. Through
+        an OutboundBuffer that is collecting, it reaches the channel as it is
+        now, not as it is when the tick's output is flushed.
+        """
+        skip = list(skip_sids)
+        await self.sio.emit(event, data, room=channel, skip_sid=skip or None)
+
+
+class SessionRegistry(Dict[str, Any]):
+    """
+    sid -> Session table that also indexes authenticated players by room.
+
+    Plain dicts stored in it are converted to Session objects. Values are
+    typed Any so handlers still annotated ``Dict[str, Dict[str, Any]]``
+    accept the registry while they migrate.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        # room_id -> insertion-ordered set of sids (dict keys keep order
+        # deterministic for "first player in the room" style lookups)
+        self._rooms: Dict[str, Dict[str, None]] = {}
+        # sid -> room_id the index currently files the session under
+        self._room_of: Dict[str, str] = {}
+        # id(player) -> sid for bound players
+        self._sid_of_player: Dict[int, str] = {}
+        # lowercase player name -> sid for bound players
+        self._sid_of_name: Dict[str, str] = {}
+        # Mirrors the index into Socket.IO rooms once the server installs one
+        self.room_mirror: Optional[RoomMirror] = None
+        self.update(*args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # dict mutators: keep the index in step with the session table
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, sid: str, session: MutableMapping[str, Any]) -> None:
+        if sid in self:
+            self.unbind_player(sid)
+        entry = Session.from_dict(session)
+        super().__setitem__(sid, entry)
+        player = entry.player
+        if player is not None:
+            self.bind_player(sid, player)
+
+    def __delitem__(self, sid: str) -> None:
+        self.unbind_player(sid)
+        super().__delitem__(sid)
+
+    def pop(self, sid: str, *default: Any) -> Any:
+        if sid in self:
+            self.unbind_player(sid)
+        return super().pop(sid, *default)
+
+    def popitem(self) -> Tuple[str, Session]:
+        sid, session = super().popitem()
+        self._forget(sid, session.player)
+        return sid, session
+
+    def clear(self) -> None:
+        for sid in list(self.keys()):
+            self.unbind_player(sid)
+        super().clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for sid, session in dict(*args, **kwargs).items():
+            self[sid] = session
+
+    def setdefault(self, sid: str, default: Any = None) -> Any:
+        if sid not in self:
+            self[sid] = default
+        return self[sid]
+
+    # ------------------------------------------------------------------
+    # Socket.IO room mirroring
+    # ------------------------------------------------------------------
+
+    def set_room_mirror(self, mirror: Optional[RoomMirror]) -> None:
+        """Start mirroring into Socket.IO rooms, enrolling current players."""
+        self.room_mirror = mirror
+        if mirror is None:
+            return
+        for sid in self._sid_of_player.values():
+            mirror.enter(sid, PLAYERS_CHANNEL)
+            if not self[sid].sleeping:
+                mirror.enter(sid, AWAKE_CHANNEL)
+        for sid, room_id in self._room_of.items():
+            mirror.enter(sid, room_channel(room_id))
+            if not self[sid].sleeping:
+                mirror.enter(sid, awake_channel(room_id))
+
+    # ------------------------------------------------------------------
+    # Player binding
+    # ------------------------------------------------------------------
+
+    def bind_player(self, sid: str, player: Any) -> None:
+        """
+        Attach an authenticated player to a session and start tracking them.
+
+        Sets ``session.player`` and subscribes to the player's room changes
+        so later moves (walking, fleeing, summons, limbo) update the index.
+        """
+        session = self.get(sid)
+        if session is None:
+            return
+        previous = session.player
+        if previous is not None and previous is not player:
+            self._forget(sid, previous)
+        session.player = player
+        self._sid_of_player[id(player)] = sid
+        self._sid_of_name[player.name.lower()] = sid
+        if self.room_mirror is not None:
+            self.room_mirror.enter(sid, PLAYERS_CHANNEL)
+            if not session.sleeping:
+                self.room_mirror.enter(sid, AWAKE_CHANNEL)
+        player.room_observer = self._player_moved
+        session.sleep_observer = self._session_slept
+        self._file(sid, getattr(player, "current_room", None))
+
+    def unbind_player(self, sid: str) -> None:
+        """Stop tracking the player bound to ``sid`` (session stays in place)."""
+        session = self.get(sid)
+        player = session.player if session is not None else None
+        if session is not None and session.sleep_observer == self._session_slept:
+            session.sleep_observer = None
+        self._forget(sid, player)
+
+    def _forget(self, sid: str, player: Any) -> None:
+        if player is not None and self._sid_of_player.get(id(player)) == sid:
+            del self._sid_of_player[id(player)]
+            if self._sid_of_name.get(player.name.lower()) == sid:
+                del self._sid_of_name[player.name.lower()]
+            if getattr(player, "room_observer", None) == self._player_moved:
+                player.room_observer = None
+            if self.room_mirror is not None:
+                self.room_mirror.leave(sid, PLAYERS_CHANNEL)
+                self.room_mirror.leave(sid, AWAKE_CHANNEL)
+        self._unfile(sid)
+
+    def _player_moved(
+        self, player: Any, old_room: Optional[str], new_room: Optional[str]
+    ) -> None:
+        sid = self._sid_of_player.get(id(player))
+        if sid is not None:
+            self._file(sid, new_room)
+
+    def _session_slept(self, session: Session, sleeping: bool) -> None:
+        sid = self._sid_of_player.get(id(session.player))
+        if sid is None or self.room_mirror is None or self.get(sid) is not session:
+            return
+        channels = [AWAKE_CHANNEL]
+        room_id = self._room_of.get(sid)
+        if room_id is not None:
+            channels.append(awake_channel(room_id))
+        for channel in channels:
+            if sleeping:
+                self.room_mirror.leave(sid, channel)
+            else:
+                self.room_mirror.enter(sid, channel)
+
+    def _file(self, sid: str, room_id: Optional[str]) -> None:
+        self._unfile(sid)
+        if room_id is None:
+            return  # Limbo: in no room until respawned
+        self._rooms.setdefault(room_id, {})[sid] = None
+        self._room_of[sid] = room_id
+        if self.room_mirror is not None:
+            self.room_mirror.enter(sid, room_channel(room_id))
+            if not self[sid].sleeping:
+                self.room_mirror.enter(sid, awake_channel(room_id))
+
+    def _unfile(self, sid: str) -> None:
+        room_id = self._room_of.pop(sid, None)
+        if room_id is None:
+            return
+        if self.room_mirror is not None:
+            self.room_mirror.leave(sid, room_channel(room_id))
+            self.room_mirror.leave(sid, awake_channel(room_id))
+        occupants = self._rooms.get(room_id)
+        if occupants is not None:
+            occupants.pop(sid, None)
+            if not occupants:
+                del self._rooms[room_id]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def sid_of_player(self, player: Any) -> Optional[str]:
+        """Session id the given player object is bound to, if online."""
+        return self._sid_of_player.get(id(player))
+
+    def sid_of_name(self, name: str) -> Optional[str]:
+        """Session id of the online player called ``name`` (case-insensitive)."""
+        return self._sid_of_name.get(name.lower())
+
+    def player_by_name(self, name: str) -> Optional[Any]:
+        """Online player called ``name`` (case-insensitive), if any."""
+        sid = self._sid_of_name.get(name.lower())
+        return self[sid].player if sid is not None else None
+
+    def sids_in_room(self, room_id: Optional[str]) -> List[str]:
+        """Session ids of authenticated players currently in ``room_id``."""
+        if room_id is None:
+            return []
+        return list(self._rooms.get(room_id, ()))
+
+    def sessions_in_room(self, room_id: Optional[str]) -> List[SessionPair]:
+        """(sid, session) pairs for authenticated players in ``room_id``."""
+        return [(sid, self[sid]) for sid in self.sids_in_room(room_id)]
+
+    def occupied_rooms(self) -> List[str]:
+        """Room ids holding at least one authenticated player."""
+        return list(self._rooms)
+
+
+def bind_session_player(online_sessions: Dict[str, Any], sid: str, player: Any) -> None:
+    """Attach ``player`` to session ``sid``, indexing it when possible."""
+    if isinstance(online_sessions, SessionRegistry):
+        online_sessions.bind_player(sid, player)
+    else:
+        online_sessions[sid]["player"] = player
+
+
+def find_player_sid(
+    player_name_or_obj: Union[str, Any], online_sessions: Mapping[str, Any]
+) -> Optional[str]:
+    """
+    Find a player's session ID from their name or object.
+
+    Args:
+        player_name_or_obj: Player object, or name (case-insensitive)
+        online_sessions: The online sessions mapping
+
+    Returns:
+        The session ID (sid) or None if the player is not online
+    """
+    by_name = isinstance(player_name_or_obj, str)
+    if isinstance(online_sessions, SessionRegistry):
+        if by_name:
+            return online_sessions.sid_of_name(player_name_or_obj)
+        return online_sessions.sid_of_player(player_name_or_obj)
+
+    name_lower = player_name_or_obj.lower() if by_name else None
+    for sid, session in online_sessions.items():
+        player = session.get("player")
+        if not player:
+            continue
+        if by_name:
+            if player.name.lower() == name_lower:
+                return sid
+        elif player == player_name_or_obj:
+            return sid
+    return None
+
+
+def find_player_by_name(
+    name: str, online_sessions: Mapping[str, Any]
+) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Find an online player and their session ID by name.
+
+    Args:
+        name: The player name to search for (case-insensitive)
+        online_sessions: The online sessions mapping
+
+    Returns:
+        Tuple of (player, sid) or (None, None) if not found
+    """
+    sid = find_player_sid(name, online_sessions)
+    if sid is None:
+        return None, None
+    return online_sessions[sid].get("player"), sid
+
+
+def sessions_in_room(
+    online_sessions: Mapping[str, Any], room_id: Optional[str]
+) -> List[SessionPair]:
+    """
+    Return (sid, session) pairs whose player stands in ``room_id``.
+
+    Uses the occupancy index for a SessionRegistry, otherwise scans.
+    """
+    if isinstance(online_sessions, SessionRegistry):
+        return online_sessions.sessions_in_room(room_id)
+    if room_id is None:
+        return []
+    pairs: List[SessionPair] = []
+    for sid, session in online_sessions.items():
+        player = session.get("player")
+        if player and player.current_room == room_id:
+            pairs.append((sid, session))
+    return pairs
+
+
+def players_in_room(
+    online_sessions: Mapping[str, Any], room_id: Optional[str]
+) -> List[Any]:
+    """Return the player objects standing in ``room_id``."""
+    return [
+        session["player"] for _, session in sessions_in_room(online_sessions, room_id)
+    ]
+
+
+def sessions_by_room(
+    online_sessions: Mapping[str, Any],
+) -> Dict[str, List[SessionPair]]:
+    """Group authenticated sessions by the room their player stands in."""
+    if isinstance(online_sessions, SessionRegistry):
+        return {
+            room_id: online_sessions.sessions_in_room(room_id)
+            for room_id in online_sessions.occupied_rooms()
+        }
+    grouped: Dict[str, List[SessionPair]] = {}
+    for sid, session in online_sessions.items():
+        player = session.get("player")
+        room_id = getattr(player, "current_room", None) if player else None
+        if room_id is not None:
+            grouped.setdefault(room_id, []).append((sid, session))
+    return grouped
+
+
+def room_mirror_of(online_sessions: Mapping[str, Any]) -> Optional[RoomMirror]:
+    """The Socket.IO room mirror behind ``online_sessions``, if one is installed."""
+    if isinstance(online_sessions, SessionRegistry):
+        return online_sessions.room_mirror
+    return None
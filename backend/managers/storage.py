@@ -0,0 +1,201 @@
+# backend/managers/storage.py
+
+"""
+Pluggable persistence for player records and credentials.
+
+PlayerManager and AuthManager historically kept every account in memory and
+rewrote ``players.json`` / ``auth.json`` wholesale. Handing either manager a
+RecordStore switches it to row-level persistence instead: records are read on
+demand (a player is loaded when they log in) and written as per-key upserts,
+with a batch of writes committed in one transaction.
+
+SQLiteStore is the production implementation. ``migrate_json_to_sqlite``
+copies the legacy JSON files into a database once.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PLAYERS_TABLE = "players"
+CREDENTIALS_TABLE = "credentials"
+
+
+class RecordStore(ABC):
+    """Key -> string record storage (JSON player records, password hashes)."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the record stored under ``key``, or None."""
+
+    @abstractmethod
+    def put_many(self, records: Mapping[str, str]) -> None:
+        """Upsert every record in ``records`` as one atomic batch."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove ``key``. Returns True if it existed."""
+
+    @abstractmethod
+    def keys(self) -> List[str]:
+        """All stored keys, sorted."""
+
+    def put(self, key: str, record: str) -> None:
+        """Upsert a single record."""
+        self.put_many({key: record})
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+class SQLiteStore(RecordStore):
+    """
+    RecordStore backed by one table of an SQLite database.
+
+    Several stores (players, credentials) may share a database file. Writes
+    happen from the event loop and from the write-behind executor thread, so
+    the connection is shared across threads behind a lock.
+    """
+
+    def __init__(self, db_path: str, table: str) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.db_path = db_path
+        self.table = table
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, record TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT record FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, records: Mapping[str, str]) -> None:
+        if not records:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table} (key, record) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET record = excluded.record",
+                list(records.items()),
+            )
+
+    def delete(self, key: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key = ?", (key,)
+            )
+        return cursor.rowcount > 0
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key FROM {self.table} ORDER BY key"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self.table}"
+            ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _load_json(path: str) -> Dict[str, object]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {}
+
+
+def migrate_json_to_sqlite(
+    db_path: str,
+    players_file: str = "storage/players.json",
+    auth_file: str = "storage/auth.json",
+) -> bool:
+    """
+    One-shot import of the legacy JSON files into an SQLite database.
+
+    Does nothing (and returns False) if the database already exists, so it is
+    safe to call on every boot. The database is built at ``db_path + ".tmp"``
+    and only renamed into place once both files are imported, so a crash
+    part way through leaves no database behind and the next boot starts the
+    import again. The JSON files are left in place as a backup.
+    """
+    if os.path.exists(db_path):
+        return False
+
+    players = _load_json(players_file)
+    credentials = _load_json(auth_file)
+
+    tmp_path = db_path + ".tmp"
+    _remove_database(tmp_path)  # left over from an interrupted import
+    try:
+        player_store = SQLiteStore(tmp_path, PLAYERS_TABLE)
+        credential_store = SQLiteStore(tmp_path, CREDENTIALS_TABLE)
+        try:
+            player_store.put_many(
+                {
+                    name.lower(): json.dumps({**record, "inventory": []})
+                    for name, record in players.items()
+                    if isinstance(record, dict)
+                }
+            )
+            credential_store.put_many(
+                {name.lower(): str(hashed) for name, hashed in credentials.items()}
+            )
+        finally:
+            player_store.close()
+            credential_store.close()
+    except BaseException:
+        _remove_database(tmp_path)
+        raise
+    os.replace(tmp_path, db_path)
+
+    logger.info(
+        "Migrated %d players and %d credentials into %s",
+        len(players),
+        len(credentials),
+        db_path,
+    )
+    return True
+
+
+def _remove_database(path: str) -> None:
+    """Delete an SQLite database file along with its WAL side files."""
+    for name in (path, path + "-wal", path + "-shm"):
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+
+
+def open_sqlite_stores(db_path: str) -> Tuple[SQLiteStore, SQLiteStore]:
+    """Return the (players, credentials) stores for ``db_path``."""
+    return SQLiteStore(db_path, PLAYERS_TABLE), SQLiteStore(db_path, CREDENTIALS_TABLE)
@@ -0,0 +1,73 @@
+"""
+Tests for the bounded, time-stamped command queue.
+
+Tests cover:
+- The length cap on push and on requeued chains
+- Dropping commands past their deadline
+- The list-compatible surface older callers use
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from managers.command_queue import CommandQueue
+
+
+class CommandQueueCapTest(unittest.TestCase):
+    def test_push_refuses_beyond_the_cap(self):
+        queue = CommandQueue(max_length=2)
+
+        self.assertTrue(queue.push("n", now=0.0))
+        self.assertTrue(queue.push("s", now=0.0))
+        self.assertFalse(queue.push("e", now=0.0))
+
+        self.assertEqual(queue, ["n", "s"])
+
+    def test_push_front_keeps_order_and_reports_overflow(self):
+        queue = CommandQueue(["look"], max_length=3, now=5.0)
+
+        refused = queue.push_front(["n", "get sword", "s"], queued_at=1.0)
+
+        self.assertEqual(refused, 1)
+        self.assertEqual(queue, ["n", "get sword", "look"])
+        self.assertEqual(queue.pop_next(), ("n", 1.0))
+
+
+class CommandQueueDeadlineTest(unittest.TestCase):
+    def test_drop_stale_removes_only_expired_commands(self):
+        queue = CommandQueue(max_age=10.0)
+        queue.push("n", now=0.0)
+        queue.push("s", now=4.0)
+        queue.push("e", now=12.0)
+
+        self.assertEqual(queue.drop_stale(now=13.0), 1)
+        self.assertEqual(queue, ["s", "e"])
+        self.assertEqual(queue.drop_stale(now=13.0), 0)
+
+
+class CommandQueueListCompatibilityTest(unittest.TestCase):
+    def test_append_pop_and_membership(self):
+        queue = CommandQueue()
+
+        queue.append("look")
+        queue.append("say hi")
+
+        self.assertIn("say hi", queue)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.pop(0), "look")
+        with self.assertRaises(IndexError):
+            queue.pop(1)
+
+    def test_from_list_keeps_an_existing_queue(self):
+        queue = CommandQueue()
+
+        self.assertIs(CommandQueue.from_list(queue), queue)
+        self.assertEqual(CommandQueue.from_list(["n"], now=0.0), ["n"])
+        self.assertEqual(CommandQueue.from_list(None), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
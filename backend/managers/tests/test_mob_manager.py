@@ -6,8 +6,8 @@ Tests cover:
 - Loading mob definitions
 - Spawning mobs from templates
 - Removing mobs
-- Getting mobs (by ID, in room, all)
-- Ticking mobs (AI, movement, aggression)
+- Getting mobs (by ID, in room, all) and the room index
+- Ticking mobs (AI, movement, aggression) and dormancy beyond the activity radius
 - Movement processing
 - Aggression processing
 """
@@ -21,14 +21,20 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from tests.test_base import BaseAsyncTest
 from tests.test_helpers import (
+    create_mirrored_sio,
     create_mock_player,
     create_mock_game_state,
     create_mock_room,
+    record_deliveries,
 )
 from managers.game_state import GameState
 from managers.mob_manager import MobManager
+from managers.session import Session
+from managers.session_registry import RoomMirror, SessionRegistry, room_channel
 from models.Mobile import Mobile
+from models.Player import Player
 from models.Room import Room
+from services.outbound import OutboundBuffer, manager_recipients
 
 
 class MobManagerInitializationTest(unittest.TestCase):
@@ -299,6 +305,40 @@ class MobManagerGetMobsTest(unittest.TestCase):
 
         self.assertEqual(mobs, [])
 
+    def test_get_mobs_in_room_follows_moves(self):
+        """Test the room index tracks move_to_room and direct room changes."""
+        self.mob1.move_to_room("room2", current_tick=1)
+        self.mob3.current_room = None
+
+        self.assertEqual(self.manager.get_mobs_in_room("room1"), [])
+        self.assertEqual(self.manager.get_mobs_in_room("room2"), [self.mob2, self.mob1])
+
+    def test_get_mobs_in_room_forgets_removed_mobs(self):
+        """Test removed mobs leave the index and stop reporting moves."""
+        self.manager.remove_mob(self.mob1.id, schedule_respawn=False)
+        self.mob1.current_room = "room2"
+
+        self.assertEqual(self.manager.get_mobs_in_room("room1"), [self.mob3])
+        self.assertEqual(self.manager.get_mobs_in_room("room2"), [self.mob2])
+        self.assertIsNone(self.mob1.room_observer)
+
+    def test_get_mobs_in_room_does_not_scan_other_mobs(self):
+        """Test a room lookup only touches the mobs filed under that room."""
+        for _ in range(50):
+            self.manager.spawn_mob("goblin", "elsewhere")
+
+        with patch.object(
+            type(self.manager.mobs), "values", side_effect=AssertionError
+        ):
+            self.assertEqual(len(self.manager.get_mobs_in_room("room1")), 2)
+
+    def test_assigning_plain_dict_indexes_mobs(self):
+        """Test replacing the mob table (admin reloads) keeps the index."""
+        self.manager.mobs = {self.mob2.id: self.mob2}
+
+        self.assertEqual(self.manager.get_mobs_in_room("room2"), [self.mob2])
+        self.assertEqual(self.manager.get_mobs_in_room("room1"), [])
+
     def test_get_all_mobs_returns_all_mobs(self):
         """Test get_all_mobs returns all mobs."""
         mobs = self.manager.get_all_mobs()
@@ -409,6 +449,132 @@ class MobManagerTickAllMobsTest(BaseAsyncTest):
             mock_movement.assert_not_called()
 
 
+class MobManagerActivityRadiusTest(BaseAsyncTest):
+    """Test dormant mob AI beyond activity_radius exits of any player."""
+
+    def setUp(self):
+        """Build a corridor r0 - r1 - r2 - r3 - r4 with a player in r0."""
+        super().setUp()
+        self.manager = MobManager(activity_radius=1)
+        self.manager.load_mob_definitions(
+            {
+                "goblin": {
+                    "name": "goblin",
+                    "aggressive": True,
+                    "loot_table": [],
+                },
+                "guard": {
+                    "name": "guard",
+                    "patrol_rooms": ["r3", "r4"],
+                    "movement_interval": 2,
+                    "loot_table": [],
+                },
+                "scout": {
+                    "name": "scout",
+                    "patrol_rooms": ["r4", "r1"],
+                    "movement_interval": 2,
+                    "loot_table": [],
+                },
+            }
+        )
+        self.game_state = GameState()
+        for index in range(5):
+            exits = {}
+            if index > 0:
+                exits["west"] = f"r{index - 1}"
+            if index < 4:
+                exits["east"] = f"r{index + 1}"
+            self.game_state.add_room(Room(f"r{index}", f"Room {index}", "", exits))
+        self.player = create_mock_player()
+        self.player.current_room = "r0"
+        self.sessions = {"sid1": Session({"player": self.player})}
+        self.utils = AsyncMock()
+
+    async def _tick(self, times=1):
+        for _ in range(times):
+            await self.manager.tick_all_mobs(
+                self.mock_sio, self.sessions, Mock(), self.game_state, self.utils
+            )
+
+    def test_active_rooms_stop_at_radius(self):
+        """Test only rooms within activity_radius exits are active."""
+        self.assertEqual(
+            self.manager.active_rooms(self.game_state, self.sessions), ["r0", "r1"]
+        )
+        self.manager.activity_radius = 3
+        self.assertEqual(
+            self.manager.active_rooms(self.game_state, self.sessions),
+            ["r0", "r1", "r2", "r3"],
+        )
+
+    @patch("commands.combat.is_in_combat", return_value=False)
+    async def test_distant_mobs_are_not_ticked(self, _is_in_combat):
+        """Test aggro timers only run down near players."""
+        near = self.manager.spawn_mob("goblin", "r1", self.game_state)
+        far = self.manager.spawn_mob("goblin", "r3", self.game_state)
+        near.aggro_tick_counter = far.aggro_tick_counter = 5
+
+        await self._tick(2)
+
+        self.assertEqual(near.aggro_tick_counter, 3)
+        self.assertEqual(far.aggro_tick_counter, 5)
+        self.assertEqual(far.last_ai_tick, 0)
+
+    @patch("commands.combat.is_in_combat", return_value=False)
+    async def test_waking_mob_is_fast_forwarded(self, _is_in_combat):
+        """Test a dormant mob catches up on aggro and patrol when approached."""
+        far = self.manager.spawn_mob("goblin", "r3", self.game_state)
+        guard = self.manager.spawn_mob("guard", "r3", self.game_state)
+        far.aggro_tick_counter = 5
+        await self._tick(6)
+
+        self.player.current_room = "r2"
+        await self._tick()
+
+        self.assertEqual(far.aggro_tick_counter, 0)
+        self.assertEqual(far.last_ai_tick, 7)
+        # Moves due at ticks 2, 4 and 6 were skipped, then one at tick 7 is
+        # not due yet: three steps along a two-room patrol lands in r4.
+        self.assertEqual(guard.current_room, "r4")
+        self.assertIn(guard, self.game_state.get_room("r4").items)
+        self.assertNotIn(guard, self.game_state.get_room("r3").items)
+
+    @patch("commands.combat.is_in_combat", return_value=False)
+    async def test_dormant_patrol_walking_into_range_is_woken(self, _is_in_combat):
+        """Test a far patrol is caught up once its route crosses an active room."""
+        scout = self.manager.spawn_mob("scout", "r4", self.game_state)
+
+        await self._tick(2)
+        self.assertEqual(scout.current_room, "r4")
+
+        # Its move due at tick 2 takes it to r1, next to the player.
+        await self._tick()
+
+        self.assertEqual(scout.current_room, "r1")
+        self.assertIn(scout, self.game_state.get_room("r1").items)
+        self.assertEqual(scout.last_ai_tick, 3)
+
+    def test_registry_indexes_patrol_routes(self):
+        """Test patrols are found by any room on their route until removed."""
+        scout = self.manager.spawn_mob("scout", "r4", self.game_state)
+        self.manager.spawn_mob("goblin", "r1", self.game_state)
+
+        self.assertEqual(self.manager.mobs.ids_patrolling("r1"), [scout.id])
+        self.manager.remove_mob(scout.id, self.game_state)
+        self.assertEqual(self.manager.mobs.ids_patrolling("r1"), [])
+
+    @patch("commands.combat.is_in_combat", return_value=False)
+    async def test_no_radius_ticks_every_mob(self, _is_in_combat):
+        """Test activity_radius None keeps ticking the whole world."""
+        self.manager.activity_radius = None
+        far = self.manager.spawn_mob("goblin", "r4", self.game_state)
+        far.aggro_tick_counter = 5
+
+        await self._tick(2)
+
+        self.assertEqual(far.aggro_tick_counter, 3)
+
+
 class MobManagerProcessMovementTest(BaseAsyncTest):
     """Test MobManager._process_mob_movement functionality."""
 
@@ -471,7 +637,7 @@ class MobManagerProcessMovementTest(BaseAsyncTest):
 
         player = create_mock_player(location="room1")
         player.current_room = "room1"
-        online_sessions = {"sid1": {"player": player}}
+        online_sessions = {"sid1": Session({"player": player})}
 
         await self.manager._process_mob_movement(
             mob, self.mock_game_state, online_sessions, self.mock_sio, self.mock_utils
@@ -488,7 +654,7 @@ class MobManagerProcessMovementTest(BaseAsyncTest):
 
         player = create_mock_player(location="room2")
         player.current_room = "room2"
-        online_sessions = {"sid1": {"player": player}}
+        online_sessions = {"sid1": Session({"player": player})}
 
         await self.manager._process_mob_movement(
             mob, self.mock_game_state, online_sessions, self.mock_sio, self.mock_utils
@@ -523,7 +689,7 @@ class MobManagerProcessMovementTest(BaseAsyncTest):
 
         player = create_mock_player(location="room2")
         player.current_room = "room2"
-        online_sessions = {"sid1": {"player": player}}
+        online_sessions = {"sid1": Session({"player": player})}
 
         # Act - mob moves into room with player
         await self.manager._process_mob_movement(
@@ -544,7 +710,7 @@ class MobManagerProcessMovementTest(BaseAsyncTest):
 
         player = create_mock_player(location="room2")
         player.current_room = "room2"
-        online_sessions = {"sid1": {"player": player}}
+        online_sessions = {"sid1": Session({"player": player})}
 
         # Act - mob moves into room with player
         await self.manager._process_mob_movement(
@@ -577,7 +743,7 @@ class MobManagerProcessAggressionTest(BaseAsyncTest):
         """Test _process_mob_aggression initiates attack on player."""
         player = create_mock_player(location="room1")
         player.current_room = "room1"
-        online_sessions = {"sid1": {"player": player}}
+        online_sessions = {"sid1": Session({"player": player})}
 
         await self.manager._process_mob_aggression(
             self.mob,
@@ -606,7 +772,7 @@ class MobManagerProcessAggressionTest(BaseAsyncTest):
         """Test _process_mob_aggression does nothing if no player in room."""
         player = create_mock_player(location="room2")
         player.current_room = "room2"
-        online_sessions = {"sid1": {"player": player}}
+        online_sessions = {"sid1": Session({"player": player})}
 
         await self.manager._process_mob_aggression(
             self.mob,
@@ -821,8 +987,8 @@ class MobManagerProcessRespawnsTest(BaseAsyncTest):
         elsewhere = create_mock_player(name="Elsewhere")
         elsewhere.current_room = "room2"
         online_sessions = {
-            "sid1": {"player": witness},
-            "sid2": {"player": elsewhere},
+            "sid1": Session({"player": witness}),
+            "sid2": Session({"player": elsewhere}),
         }
 
         # Act
@@ -835,6 +1001,81 @@ class MobManagerProcessRespawnsTest(BaseAsyncTest):
             self.mock_sio, "sid1", "Wolf pads out of the shadows."
         )
 
+    async def test_process_respawns_batches_announcements_per_room(self):
+        """Test a wave of respawns sends one message per occupied room."""
+        for _ in range(3):
+            mob = self.manager.spawn_mob("wolf", "room1", self.game_state)
+            self.manager.remove_mob(mob.id, self.game_state)
+        self.fake.advance(301.0)
+        witness = create_mock_player(name="Witness")
+        witness.current_room = "room1"
+
+        respawned = await self.manager.process_respawns(
+            self.game_state,
+            {"sid1": Session({"player": witness})},
+            self.mock_sio,
+            self.mock_utils,
+        )
+
+        self.assertEqual(len(respawned), 3)
+        self.mock_utils.send_message.assert_awaited_once_with(
+            self.mock_sio, "sid1", "\n".join(["Wolf pads out of the shadows."] * 3)
+        )
+
+    async def test_process_respawns_emits_once_through_room_mirror(self):
+        """Test mirrored sessions get a single room-wide emit."""
+        sio = create_mirrored_sio()
+        sessions = SessionRegistry()
+        sessions.set_room_mirror(RoomMirror(sio))
+        for sid, name in (("sid1", "Alice"), ("sid2", "Bob")):
+            player = Player(name)
+            player.current_room = "room1"
+            sessions[sid] = {"player": player}
+        for _ in range(2):
+            mob = self.manager.spawn_mob("wolf", "room1", self.game_state)
+            self.manager.remove_mob(mob.id, self.game_state)
+        self.fake.advance(301.0)
+
+        await self.manager.process_respawns(
+            self.game_state, sessions, sio, self.mock_utils
+        )
+
+        sio.emit.assert_awaited_once_with(
+            "message",
+            "Wolf pads out of the shadows.\nWolf pads out of the shadows.",
+            room=room_channel("room1"),
+            skip_sid=None,
+        )
+        self.mock_utils.send_message.assert_not_awaited()
+
+    async def test_buffered_respawn_message_reaches_the_room_as_it_was(self):
+        """Test a player entering later in the tick misses the arrival line."""
+        sio = create_mirrored_sio()
+        outbound = OutboundBuffer(sio, recipients=manager_recipients(sio))
+        sessions = SessionRegistry()
+        sessions.set_room_mirror(RoomMirror(outbound))
+        players = {}
+        for sid, name, room in (("sid1", "Alice", "room1"), ("sid2", "Bob", "room2")):
+            players[sid] = Player(name)
+            players[sid].current_room = room
+            sessions[sid] = {"player": players[sid]}
+        mob = self.manager.spawn_mob("wolf", "room1", self.game_state)
+        self.manager.remove_mob(mob.id, self.game_state)
+        self.fake.advance(301.0)
+
+        deliveries = record_deliveries(sio)
+
+        async with outbound.collecting():
+            await self.manager.process_respawns(
+                self.game_state, sessions, outbound, self.mock_utils
+            )
+            players["sid1"].current_room = "room2"
+            players["sid2"].current_room = "room1"
+
+        self.assertEqual(
+            deliveries, [("message", "Wolf pads out of the shadows.", ["sid1"])]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,12 +8,14 @@ Tests cover:
 - Player save/load
 - Inventory clearing behavior
 - Integration with auth_manager
+- Dirty-only, atomic, write-behind saving
 """
 
+import asyncio
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import tempfile
 import os
 import json
@@ -655,5 +657,105 @@ class PlayerManagerDeleteTest(unittest.TestCase):
             os.remove(auth_file)
 
 
+class PlayerManagerWriteBehindTest(unittest.IsolatedAsyncioTestCase):
+    """Test dirty tracking and the background flusher."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.save_file = os.path.join(self.tmpdir.name, "players.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _read(self):
+        with open(self.save_file) as f:
+            return json.load(f)
+
+    def test_save_players_skips_write_when_nothing_dirty(self):
+        """Test save_players leaves the file untouched with no changes."""
+        pm = PlayerManager(save_file=self.save_file)
+        pm.register("Alice")
+        mtime = os.stat(self.save_file).st_mtime_ns
+
+        with patch.object(pm, "_write_atomic") as write:
+            pm.save_players()
+
+        write.assert_not_called()
+        self.assertEqual(os.stat(self.save_file).st_mtime_ns, mtime)
+
+    def test_save_players_reserializes_only_dirty_players(self):
+        """Test save_players only calls to_dict for changed players."""
+        pm = PlayerManager(save_file=self.save_file)
+        alice = pm.register("Alice")
+        bob = pm.register("Bob")
+        alice.points = 42
+
+        with patch.object(bob, "to_dict", wraps=bob.to_dict) as bob_to_dict:
+            pm.save_players()
+
+        bob_to_dict.assert_not_called()
+        self.assertEqual(self._read()["alice"]["points"], 42)
+        self.assertIn("bob", self._read())
+
+    def test_save_players_leaves_no_temp_files(self):
+        """Test the atomic write renames its temp file into place."""
+        pm = PlayerManager(save_file=self.save_file)
+        pm.register("Alice")
+
+        self.assertEqual(os.listdir(self.tmpdir.name), ["players.json"])
+
+    def test_load_players_does_not_mark_loaded_players_dirty(self):
+        """Test players read from disk are not rewritten on the next save."""
+        PlayerManager(save_file=self.save_file).register("Alice")
+
+        pm = PlayerManager(save_file=self.save_file)
+
+        self.assertFalse(pm.players["alice"].dirty)
+
+    async def test_run_write_behind_coalesces_saves(self):
+        """Test several save_players calls produce a single background write."""
+        pm = PlayerManager(save_file=self.save_file)
+        alice = pm.register("Alice")
+        flusher = asyncio.create_task(pm.run_write_behind(delay=0.01))
+        await asyncio.sleep(0)
+
+        with patch.object(pm, "_write_atomic", wraps=pm._write_atomic) as write:
+            for points in (1, 2, 3):
+                alice.points = points
+                pm.save_players()
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(write.call_count, 1)
+            self.assertEqual(self._read()["alice"]["points"], 3)
+
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+
+    async def test_run_write_behind_flushes_pending_changes_on_cancel(self):
+        """Test shutting the flusher down writes unsaved changes."""
+        pm = PlayerManager(save_file=self.save_file)
+        alice = pm.register("Alice")
+        flusher = asyncio.create_task(pm.run_write_behind(delay=60))
+        await asyncio.sleep(0)
+
+        alice.gold = 99
+        pm.save_players()
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+
+        self.assertEqual(self._read()["alice"]["gold"], 99)
+        self.assertIsNone(pm._save_requested)
+
+    async def test_flush_writes_deletions(self):
+        """Test flush drops deleted players from the file."""
+        pm = PlayerManager(save_file=self.save_file)
+        pm.register("Alice")
+        del pm.players["alice"]
+
+        await pm.flush()
+
+        self.assertEqual(self._read(), {})
+
+
 if __name__ == "__main__":
     unittest.main()
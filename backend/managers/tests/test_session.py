@@ -0,0 +1,135 @@
+"""
+Tests for the slotted Session and its dict-compatible view.
+
+Tests cover:
+- Attribute defaults for fields that were never set
+- Presence semantics of the mapping view (in / get / del / iteration)
+- Keys that are not fields
+- Equality with plain dicts and coercion by the SessionRegistry
+- The sleep observer
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from managers.session import FIELDS, Session
+from managers.session_registry import SessionRegistry
+
+
+class SessionFieldsTest(unittest.TestCase):
+    def test_unset_fields_read_as_defaults(self):
+        session = Session()
+
+        self.assertIsNone(session.player)
+        self.assertFalse(session.sleeping)
+        self.assertEqual(session.command_queue, [])
+        self.assertEqual(session.stats_sent_at, 0.0)
+
+    def test_defaults_are_not_shared(self):
+        first, second = Session(), Session()
+
+        first.command_queue.append("look")
+
+        self.assertEqual(second.command_queue, [])
+
+    def test_no_instance_dict(self):
+        session = Session()
+
+        self.assertFalse(hasattr(session, "__dict__"))
+        with self.assertRaises(AttributeError):
+            session.not_a_field = 1
+
+
+class SessionMappingTest(unittest.TestCase):
+    def test_unset_field_is_absent_as_a_key(self):
+        session = Session()
+
+        self.assertNotIn("sleeping", session)
+        self.assertEqual(session.get("sleeping", "unset"), "unset")
+        with self.assertRaises(KeyError):
+            session["sleeping"]
+
+    def test_attribute_and_key_are_the_same_value(self):
+        session = Session()
+
+        session.sleeping = True
+        self.assertIn("sleeping", session)
+        self.assertTrue(session["sleeping"])
+
+        session["player"] = "alice"
+        self.assertEqual(session.player, "alice")
+
+    def test_del_resets_to_default(self):
+        session = Session(sleeping=True)
+
+        del session["sleeping"]
+
+        self.assertNotIn("sleeping", session)
+        self.assertFalse(session.sleeping)
+        with self.assertRaises(KeyError):
+            del session["sleeping"]
+
+    def test_extra_keys(self):
+        session = Session()
+
+        session["pwd_change"] = {"step": 1}
+
+        self.assertEqual(session["pwd_change"], {"step": 1})
+        self.assertEqual(session.get("pwd_change"), {"step": 1})
+        del session["pwd_change"]
+        self.assertNotIn("pwd_change", session)
+        with self.assertRaises(KeyError):
+            session["pwd_change"]
+
+    def test_iterates_set_keys_only(self):
+        session = Session(player="alice", custom=1)
+        session.sleeping = False
+
+        self.assertEqual(list(session), ["player", "sleeping", "custom"])
+        self.assertEqual(len(session), 3)
+        self.assertEqual(set(FIELDS) & set(session), {"player", "sleeping"})
+
+    def test_equals_the_dict_it_replaces(self):
+        session = Session({"player": "alice", "command_queue": []})
+
+        self.assertEqual(session, {"player": "alice", "command_queue": []})
+        self.assertNotEqual(session, {"player": "alice"})
+
+    def test_sleep_observer_hears_changes_only(self):
+        session = Session()
+        heard = []
+        session.sleep_observer = lambda s, sleeping: heard.append((s, sleeping))
+
+        session["sleeping"] = True
+        session.sleeping = True
+        del session["sleeping"]
+
+        self.assertEqual(heard, [(session, True), (session, False)])
+        self.assertNotIn("sleep_observer", session)
+
+
+class SessionRegistryCoercionTest(unittest.TestCase):
+    def test_registry_stores_sessions(self):
+        sessions = SessionRegistry()
+        queue = ["look"]
+
+        sessions["sid1"] = {"command_queue": queue}
+
+        session = sessions["sid1"]
+        self.assertIsInstance(session, Session)
+        self.assertIs(session.command_queue, queue)
+
+    def test_existing_session_is_kept(self):
+        sessions = SessionRegistry()
+        session = Session()
+
+        sessions["sid1"] = session
+
+        self.assertIs(sessions["sid1"], session)
+
+
+if __name__ == "__main__":
+    unittest.main()
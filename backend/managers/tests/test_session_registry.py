@@ -0,0 +1,364 @@
+"""
+Tests for the session registry and its room occupancy index.
+
+Tests cover:
+- Binding/unbinding players through dict mutators and bind_player
+- Index updates as Player.current_room changes (including limbo)
+- Player/name -> sid lookups
+- Module-level helpers on registries and plain dicts
+- Mirroring occupancy into Socket.IO rooms
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from managers.session import Session
+from managers.session_registry import (
+    AWAKE_CHANNEL,
+    PLAYERS_CHANNEL,
+    RoomMirror,
+    SessionRegistry,
+    bind_session_player,
+    find_player_by_name,
+    find_player_sid,
+    players_in_room,
+    awake_channel,
+    room_channel,
+    room_mirror_of,
+    sessions_by_room,
+    sessions_in_room,
+)
+from models.Player import Player
+from tests.test_helpers import create_mirrored_sio
+
+
+def _player(name: str, room: str) -> Player:
+    player = Player(name)
+    player.current_room = room
+    return player
+
+
+class SessionRegistryBindingTest(unittest.TestCase):
+    """Test how players enter and leave the occupancy index."""
+
+    def setUp(self):
+        self.sessions = SessionRegistry()
+
+    def test___setitem___indexes_preauthenticated_session(self):
+        """Test __setitem__ files a session that already carries a player."""
+        alice = _player("Alice", "square")
+
+        self.sessions["sid1"] = {"player": alice}
+
+        self.assertEqual(self.sessions.sids_in_room("square"), ["sid1"])
+
+    def test___setitem___ignores_unauthenticated_session(self):
+        """Test __setitem__ leaves sessions without a player out of the index."""
+        self.sessions["sid1"] = {"auth_state": "awaiting_name"}
+
+        self.assertEqual(self.sessions.occupied_rooms(), [])
+
+    def test_bind_player_sets_session_player_and_indexes(self):
+        """Test bind_player attaches the player and indexes their room."""
+        self.sessions["sid1"] = {"auth_state": "awaiting_password"}
+        alice = _player("Alice", "square")
+
+        self.sessions.bind_player("sid1", alice)
+
+        self.assertIs(self.sessions["sid1"]["player"], alice)
+        self.assertEqual(self.sessions.sids_in_room("square"), ["sid1"])
+
+    def test_bind_player_ignores_unknown_sid(self):
+        """Test bind_player is a no-op for a sid that is not connected."""
+        self.sessions.bind_player("ghost", _player("Alice", "square"))
+
+        self.assertEqual(self.sessions.occupied_rooms(), [])
+
+    def test_bind_player_replaces_previous_player(self):
+        """Test bind_player detaches the observer of a replaced player."""
+        alice = _player("Alice", "square")
+        bob = _player("Bob", "tavern")
+        self.sessions["sid1"] = {"player": alice}
+
+        self.sessions.bind_player("sid1", bob)
+
+        self.assertIsNone(alice.room_observer)
+        self.assertEqual(self.sessions.sids_in_room("square"), [])
+        self.assertEqual(self.sessions.sids_in_room("tavern"), ["sid1"])
+
+    def test___delitem___removes_from_index_and_detaches_observer(self):
+        """Test __delitem__ drops the session from its room."""
+        alice = _player("Alice", "square")
+        self.sessions["sid1"] = {"player": alice}
+
+        del self.sessions["sid1"]
+
+        self.assertEqual(self.sessions.sids_in_room("square"), [])
+        self.assertIsNone(alice.room_observer)
+
+    def test_pop_removes_from_index(self):
+        """Test pop unindexes the session and returns it."""
+        session = {"player": _player("Alice", "square")}
+        self.sessions["sid1"] = session
+
+        popped = self.sessions.pop("sid1")
+        self.assertIsInstance(popped, Session)
+        self.assertEqual(popped, session)
+        self.assertEqual(self.sessions.occupied_rooms(), [])
+        self.assertIsNone(self.sessions.pop("sid1", None))
+
+    def test_popitem_removes_from_index(self):
+        """Test popitem unindexes the popped session."""
+        self.sessions["sid1"] = {"player": _player("Alice", "square")}
+
+        self.sessions.popitem()
+
+        self.assertEqual(self.sessions.occupied_rooms(), [])
+
+    def test_clear_empties_index(self):
+        """Test clear drops every session from the index."""
+        self.sessions.update(
+            {
+                "sid1": {"player": _player("Alice", "square")},
+                "sid2": {"player": _player("Bob", "tavern")},
+            }
+        )
+
+        self.sessions.clear()
+
+        self.assertEqual(self.sessions.occupied_rooms(), [])
+
+    def test_setdefault_indexes_new_session(self):
+        """Test setdefault goes through the indexing __setitem__."""
+        self.sessions.setdefault("sid1", {"player": _player("Alice", "square")})
+
+        self.assertEqual(self.sessions.sids_in_room("square"), ["sid1"])
+
+
+class SessionRegistryMovementTest(unittest.TestCase):
+    """Test the index follows players as they move."""
+
+    def setUp(self):
+        self.sessions = SessionRegistry()
+        self.alice = _player("Alice", "square")
+        self.bob = _player("Bob", "square")
+        self.sessions["sid1"] = {"player": self.alice}
+        self.sessions["sid2"] = {"player": self.bob}
+
+    def test_set_current_room_moves_session_between_rooms(self):
+        """Test set_current_room refiles the session under the new room."""
+        self.alice.set_current_room("tavern")
+
+        self.assertEqual(self.sessions.sids_in_room("square"), ["sid2"])
+        self.assertEqual(self.sessions.sids_in_room("tavern"), ["sid1"])
+
+    def test_current_room_none_removes_player_from_all_rooms(self):
+        """Test assigning None (limbo) leaves the player in no room."""
+        self.alice.current_room = None
+
+        self.assertEqual(self.sessions.sids_in_room("square"), ["sid2"])
+        self.assertEqual(self.sessions.sids_in_room(None), [])
+
+    def test_occupied_rooms_drops_emptied_rooms(self):
+        """Test occupied_rooms only lists rooms with someone in them."""
+        self.alice.set_current_room("tavern")
+        self.bob.set_current_room("tavern")
+
+        self.assertEqual(self.sessions.occupied_rooms(), ["tavern"])
+
+    def test_sessions_in_room_returns_sid_session_pairs(self):
+        """Test sessions_in_room pairs each sid with its session."""
+        pairs = self.sessions.sessions_in_room("square")
+
+        self.assertEqual(
+            pairs, [("sid1", self.sessions["sid1"]), ("sid2", self.sessions["sid2"])]
+        )
+
+    def test_unbound_player_moves_are_ignored(self):
+        """Test a logged-out player's moves no longer touch the index."""
+        del self.sessions["sid1"]
+
+        self.alice.set_current_room("tavern")
+
+        self.assertEqual(self.sessions.sids_in_room("tavern"), [])
+
+
+class SessionRegistryLookupTest(unittest.TestCase):
+    """Test O(1) player and name lookups."""
+
+    def setUp(self):
+        self.sessions = SessionRegistry()
+        self.alice = _player("Alice", "square")
+        self.sessions["sid1"] = {"player": self.alice}
+
+    def test_sid_of_player_returns_bound_sid(self):
+        """Test sid_of_player finds the sid for a bound player object."""
+        self.assertEqual(self.sessions.sid_of_player(self.alice), "sid1")
+        self.assertIsNone(self.sessions.sid_of_player(_player("Alice", "square")))
+
+    def test_sid_of_name_is_case_insensitive(self):
+        """Test sid_of_name matches names regardless of case."""
+        self.assertEqual(self.sessions.sid_of_name("aLiCe"), "sid1")
+        self.assertIsNone(self.sessions.sid_of_name("Bob"))
+
+    def test_player_by_name_returns_player(self):
+        """Test player_by_name resolves to the bound player object."""
+        self.assertIs(self.sessions.player_by_name("alice"), self.alice)
+        self.assertIsNone(self.sessions.player_by_name("bob"))
+
+    def test_unbind_player_clears_lookups(self):
+        """Test unbind_player removes the player and name entries."""
+        self.sessions.unbind_player("sid1")
+
+        self.assertIsNone(self.sessions.sid_of_player(self.alice))
+        self.assertIsNone(self.sessions.sid_of_name("alice"))
+        self.assertIn("sid1", self.sessions)
+
+
+class SessionRegistryHelpersTest(unittest.TestCase):
+    """Test the module-level helpers on registries and plain dicts."""
+
+    def _populate(self, sessions):
+        sessions["sid1"] = {"player": _player("Alice", "square")}
+        sessions["sid2"] = {"player": _player("Bob", "tavern")}
+        sessions["sid3"] = {"auth_state": "awaiting_name"}
+        return sessions
+
+    def test_sessions_in_room_matches_on_registry_and_plain_dict(self):
+        """Test sessions_in_room gives the same sids for both mappings."""
+        for sessions in (self._populate(SessionRegistry()), self._populate({})):
+            with self.subTest(kind=type(sessions).__name__):
+                sids = [sid for sid, _ in sessions_in_room(sessions, "square")]
+                self.assertEqual(sids, ["sid1"])
+                self.assertEqual(sessions_in_room(sessions, None), [])
+
+    def test_players_in_room_returns_player_objects(self):
+        """Test players_in_room unwraps the sessions' players."""
+        sessions = self._populate({})
+
+        players = players_in_room(sessions, "tavern")
+
+        self.assertEqual([p.name for p in players], ["Bob"])
+
+    def test_sessions_by_room_groups_on_registry_and_plain_dict(self):
+        """Test sessions_by_room groups authenticated sessions by room."""
+        for sessions in (self._populate(SessionRegistry()), self._populate({})):
+            with self.subTest(kind=type(sessions).__name__):
+                grouped = sessions_by_room(sessions)
+                self.assertEqual(sorted(grouped), ["square", "tavern"])
+                self.assertEqual(grouped["tavern"][0][0], "sid2")
+
+    def test_find_player_sid_by_object_and_name(self):
+        """Test find_player_sid accepts objects or names for both mappings."""
+        for sessions in (self._populate(SessionRegistry()), self._populate({})):
+            with self.subTest(kind=type(sessions).__name__):
+                bob = sessions["sid2"]["player"]
+                self.assertEqual(find_player_sid(bob, sessions), "sid2")
+                self.assertEqual(find_player_sid("BOB", sessions), "sid2")
+                self.assertIsNone(find_player_sid("carol", sessions))
+                self.assertIsNone(find_player_sid(_player("Bob", "x"), sessions))
+
+    def test_find_player_by_name_returns_player_and_sid(self):
+        """Test find_player_by_name returns a (player, sid) pair."""
+        for sessions in (self._populate(SessionRegistry()), self._populate({})):
+            with self.subTest(kind=type(sessions).__name__):
+                player, sid = find_player_by_name("alice", sessions)
+                self.assertEqual((player.name, sid), ("Alice", "sid1"))
+                self.assertEqual(find_player_by_name("carol", sessions), (None, None))
+
+    def test_bind_session_player_works_with_plain_dict(self):
+        """Test bind_session_player falls back to a plain assignment."""
+        sessions = {"sid1": {}}
+        alice = _player("Alice", "square")
+
+        bind_session_player(sessions, "sid1", alice)
+
+        self.assertIs(sessions["sid1"]["player"], alice)
+
+    def test_bind_session_player_indexes_registry(self):
+        """Test bind_session_player indexes players in a registry."""
+        sessions = SessionRegistry({"sid1": {}})
+
+        bind_session_player(sessions, "sid1", _player("Alice", "square"))
+
+        self.assertEqual(sessions.sids_in_room("square"), ["sid1"])
+
+
+class SessionRegistryRoomMirrorTest(unittest.TestCase):
+    """Test Socket.IO room membership follows the occupancy index."""
+
+    def setUp(self):
+        self.sio = create_mirrored_sio()
+        self.manager = self.sio.manager
+        self.sessions = SessionRegistry()
+        self.sessions.set_room_mirror(RoomMirror(self.sio))
+        self.alice = _player("Alice", "square")
+        self.sessions["sid1"] = {"player": self.alice}
+
+    def test_bound_player_joins_players_and_room_channels(self):
+        """Test binding enrols the sid in the global and room channels."""
+        self.assertEqual(self.manager.members(PLAYERS_CHANNEL), {"sid1"})
+        self.assertEqual(self.manager.members(room_channel("square")), {"sid1"})
+
+    def test_movement_switches_room_channel(self):
+        """Test a move leaves the old room channel and enters the new one."""
+        self.alice.set_current_room("tavern")
+
+        self.assertEqual(self.manager.members(room_channel("square")), set())
+        self.assertEqual(self.manager.members(room_channel("tavern")), {"sid1"})
+
+    def test_sleeping_leaves_the_awake_channels(self):
+        """Test a sleeper is only in the channels that include sleepers."""
+        self.assertEqual(self.manager.members(AWAKE_CHANNEL), {"sid1"})
+        self.assertEqual(self.manager.members(awake_channel("square")), {"sid1"})
+
+        self.sessions["sid1"]["sleeping"] = True
+        self.alice.set_current_room("tavern")
+
+        self.assertEqual(self.manager.members(AWAKE_CHANNEL), set())
+        self.assertEqual(self.manager.members(awake_channel("tavern")), set())
+        self.assertEqual(self.manager.members(room_channel("tavern")), {"sid1"})
+
+        self.sessions["sid1"].sleeping = False
+
+        self.assertEqual(self.manager.members(AWAKE_CHANNEL), {"sid1"})
+        self.assertEqual(self.manager.members(awake_channel("tavern")), {"sid1"})
+
+    def test_logout_leaves_every_channel(self):
+        """Test removing the session drops it from all mirrored rooms."""
+        session = self.sessions["sid1"]
+        del self.sessions["sid1"]
+
+        for channel in (
+            PLAYERS_CHANNEL,
+            AWAKE_CHANNEL,
+            room_channel("square"),
+            awake_channel("square"),
+        ):
+            self.assertEqual(self.manager.members(channel), set())
+        self.assertIsNone(session.sleep_observer)
+
+    def test_set_room_mirror_enrols_existing_sessions(self):
+        """Test installing a mirror late catches up with current players."""
+        sessions = SessionRegistry(
+            {
+                "sid2": {"player": _player("Bob", "road")},
+                "sid3": {"player": _player("Carol", "road"), "sleeping": True},
+            }
+        )
+        sio = create_mirrored_sio()
+
+        sessions.set_room_mirror(RoomMirror(sio))
+
+        self.assertEqual(sio.manager.members(room_channel("road")), {"sid2", "sid3"})
+        self.assertEqual(sio.manager.members(awake_channel("road")), {"sid2"})
+        self.assertEqual(sio.manager.members(AWAKE_CHANNEL), {"sid2"})
+        self.assertIs(room_mirror_of(sessions), sessions.room_mirror)
+        self.assertIsNone(room_mirror_of({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,356 @@
+"""
+Tests for the SQLite account storage.
+
+Tests cover:
+- SQLiteStore upserts, batches, deletes and key listing
+- One-shot migration from the JSON files
+- PlayerManager lazy loading and row saves through a store
+- AuthManager per-row credential storage
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from managers.auth import AuthManager
+from managers.player import PlayerManager
+from managers.storage import (
+    CREDENTIALS_TABLE,
+    PLAYERS_TABLE,
+    SQLiteStore,
+    migrate_json_to_sqlite,
+    open_sqlite_stores,
+)
+
+
+class _TempDirTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "mud.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+
+class SQLiteStoreTest(_TempDirTest):
+    """Test the key/record table."""
+
+    def setUp(self):
+        super().setUp()
+        self.store = SQLiteStore(self.db_path, PLAYERS_TABLE)
+        self.addCleanup(self.store.close)
+
+    def test_put_and_get_round_trip(self):
+        """Test put stores a record that get returns."""
+        self.store.put("alice", '{"name": "Alice"}')
+
+        self.assertEqual(self.store.get("alice"), '{"name": "Alice"}')
+        self.assertIsNone(self.store.get("bob"))
+
+    def test_put_many_upserts_existing_rows(self):
+        """Test put_many overwrites existing keys and adds new ones."""
+        self.store.put("alice", "old")
+
+        self.store.put_many({"alice": "new", "bob": "b"})
+
+        self.assertEqual(self.store.get("alice"), "new")
+        self.assertEqual(self.store.keys(), ["alice", "bob"])
+        self.assertEqual(len(self.store), 2)
+
+    def test_delete_reports_whether_row_existed(self):
+        """Test delete returns True only for stored keys."""
+        self.store.put("alice", "a")
+
+        self.assertTrue(self.store.delete("alice"))
+        self.assertFalse(self.store.delete("alice"))
+        self.assertNotIn("alice", self.store)
+
+    def test_tables_in_one_database_are_independent(self):
+        """Test players and credentials tables can share a file."""
+        credentials = SQLiteStore(self.db_path, CREDENTIALS_TABLE)
+        self.addCleanup(credentials.close)
+
+        self.store.put("alice", "record")
+        credentials.put("alice", "hash")
+
+        self.assertEqual(self.store.get("alice"), "record")
+        self.assertEqual(credentials.get("alice"), "hash")
+
+    def test_rejects_invalid_table_name(self):
+        """Test table names must be plain identifiers."""
+        with self.assertRaises(ValueError):
+            SQLiteStore(self.db_path, "players; DROP TABLE x")
+
+
+class MigrateJsonToSqliteTest(_TempDirTest):
+    """Test the one-shot JSON import."""
+
+    def _write_json(self, name, data):
+        path = self._path(name)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+    def test_imports_players_and_credentials(self):
+        """Test both JSON files are copied into their tables."""
+        players = self._write_json(
+            "players.json",
+            {"alice": {"name": "Alice", "points": 5, "inventory": ["x"]}},
+        )
+        auth = self._write_json("auth.json", {"alice": "hash"})
+
+        self.assertTrue(migrate_json_to_sqlite(self.db_path, players, auth))
+
+        player_store, credential_store = open_sqlite_stores(self.db_path)
+        self.addCleanup(player_store.close)
+        self.addCleanup(credential_store.close)
+        record = json.loads(player_store.get("alice"))
+        self.assertEqual(record["points"], 5)
+        self.assertEqual(record["inventory"], [])
+        self.assertEqual(credential_store.get("alice"), "hash")
+
+    def test_skips_when_database_exists(self):
+        """Test an existing database is never re-imported."""
+        SQLiteStore(self.db_path, PLAYERS_TABLE).close()
+        players = self._write_json("players.json", {"alice": {"name": "Alice"}})
+
+        self.assertFalse(
+            migrate_json_to_sqlite(self.db_path, players, self._path("auth.json"))
+        )
+
+    def test_failed_import_leaves_no_database(self):
+        """Test a crash part way through is retried on the next boot."""
+        players = self._write_json("players.json", {"alice": {"name": "Alice"}})
+        auth = self._write_json("auth.json", {"alice": "hash"})
+        put_many = SQLiteStore.put_many
+        calls = []
+
+        def fail_on_credentials(store, records):
+            calls.append(store.table)
+            if store.table == CREDENTIALS_TABLE:
+                raise sqlite3.OperationalError("disk I/O error")
+            put_many(store, records)
+
+        with patch.object(SQLiteStore, "put_many", fail_on_credentials):
+            with self.assertRaises(sqlite3.OperationalError):
+                migrate_json_to_sqlite(self.db_path, players, auth)
+
+        self.assertEqual(calls, [PLAYERS_TABLE, CREDENTIALS_TABLE])
+        self.assertFalse(os.path.exists(self.db_path))
+        self.assertFalse(os.path.exists(self.db_path + ".tmp"))
+        self.assertTrue(migrate_json_to_sqlite(self.db_path, players, auth))
+        player_store, credential_store = open_sqlite_stores(self.db_path)
+        self.addCleanup(player_store.close)
+        self.addCleanup(credential_store.close)
+        self.assertEqual(credential_store.get("alice"), "hash")
+
+    def test_missing_json_files_create_empty_database(self):
+        """Test migration with no legacy files still creates the tables."""
+        migrate_json_to_sqlite(
+            self.db_path, self._path("none.json"), self._path("none2.json")
+        )
+
+        player_store, _ = open_sqlite_stores(self.db_path)
+        self.addCleanup(player_store.close)
+        self.assertEqual(player_store.keys(), [])
+
+
+class PlayerManagerStoreTest(_TempDirTest):
+    """Test PlayerManager on top of a store."""
+
+    def setUp(self):
+        super().setUp()
+        self.store = SQLiteStore(self.db_path, PLAYERS_TABLE)
+        self.addCleanup(self.store.close)
+
+    def _manager(self, **kwargs):
+        return PlayerManager(
+            save_file=self._path("players.json"), store=self.store, **kwargs
+        )
+
+    def test___init___loads_nothing(self):
+        """Test startup does not read any player records."""
+        self.store.put("alice", json.dumps({"name": "Alice"}))
+
+        with patch.object(self.store, "get") as get:
+            pm = self._manager()
+
+        get.assert_not_called()
+        self.assertEqual(pm.players, {})
+
+    def test_login_loads_player_on_demand(self):
+        """Test login reads one row and caches the player."""
+        first = self._manager()
+        first.register("Alice").points = 7
+        first.save_players()
+        pm = self._manager()
+
+        player = pm.login("ALICE")
+
+        self.assertEqual(player.points, 7)
+        self.assertIs(pm.login("alice"), player)
+        self.assertEqual(list(pm.players), ["alice"])
+        self.assertIsNone(pm.login("bob"))
+
+    def test_register_writes_only_the_new_row(self):
+        """Test registering upserts a single row."""
+        pm = self._manager()
+        pm.register("Alice")
+
+        with patch.object(self.store, "put_many", wraps=self.store.put_many) as put:
+            pm.register("Bob")
+
+        put.assert_called_once()
+        self.assertEqual(list(put.call_args.args[0]), ["bob"])
+        self.assertEqual(self.store.keys(), ["alice", "bob"])
+        self.assertFalse(os.path.exists(self._path("players.json")))
+
+    def test_register_returns_stored_player(self):
+        """Test register does not overwrite a player who is not loaded yet."""
+        first = self._manager()
+        first.register("Alice").points = 3
+        first.save_players()
+
+        player = self._manager().register("alice")
+
+        self.assertEqual(player.points, 3)
+
+    def test_delete_player_removes_row_and_credentials(self):
+        """Test delete_player works for players that were never loaded."""
+        credentials = SQLiteStore(self.db_path, CREDENTIALS_TABLE)
+        self.addCleanup(credentials.close)
+        auth = AuthManager(save_file=self._path("auth.json"), store=credentials)
+        auth.register("alice", "pw")
+        self._manager().register("Alice")
+
+        self.assertTrue(self._manager(auth_manager=auth).delete_player("Alice"))
+
+        self.assertNotIn("alice", self.store)
+        self.assertNotIn("alice", auth.store)
+        self.assertFalse(self._manager().delete_player("Alice"))
+
+    def test_flush_batches_dirty_players_in_one_call(self):
+        """Test the write-behind flush upserts every dirty player at once."""
+        pm = self._manager()
+        alice = pm.register("Alice")
+        bob = pm.register("Bob")
+        alice.points = 1
+        bob.points = 2
+
+        with patch.object(self.store, "put_many", wraps=self.store.put_many) as put:
+            asyncio.run(pm.flush())
+
+        put.assert_called_once()
+        self.assertEqual(sorted(put.call_args.args[0]), ["alice", "bob"])
+        self.assertEqual(json.loads(self.store.get("bob"))["points"], 2)
+
+    def test_release_evicts_player_once_write_behind_saved_them(self):
+        """Test a logged-out player leaves memory only after their last write."""
+        pm = self._manager()
+        alice = pm.register("Alice")
+
+        async def log_out():
+            flusher = asyncio.create_task(pm.run_write_behind(delay=0))
+            await asyncio.sleep(0)
+            alice.points = 9
+            pm.release("Alice")
+            loaded_until_written = "alice" in pm.players
+            while "alice" in pm.players:
+                await asyncio.sleep(0.01)
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+            return loaded_until_written
+
+        self.assertTrue(asyncio.run(asyncio.wait_for(log_out(), 5)))
+        self.assertEqual(json.loads(self.store.get("alice"))["points"], 9)
+        self.assertIsNot(pm.login("alice"), alice)
+        self.assertEqual(pm.login("alice").points, 9)
+
+    def test_save_now_writes_while_write_behind_runs(self):
+        """Test save_now does not just signal the flusher."""
+        pm = self._manager()
+        alice = pm.register("Alice")
+
+        async def save_and_exit():
+            flusher = asyncio.create_task(pm.run_write_behind(delay=60))
+            await asyncio.sleep(0)
+            alice.points = 4
+            pm.save_now()
+            saved = json.loads(self.store.get("alice"))["points"]
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+            return saved
+
+        self.assertEqual(asyncio.run(save_and_exit()), 4)
+
+    def test_login_before_the_write_keeps_player_loaded(self):
+        """Test logging back in cancels a pending eviction."""
+        pm = self._manager()
+        alice = pm.register("Alice")
+
+        async def log_out_and_in():
+            flusher = asyncio.create_task(pm.run_write_behind(delay=60))
+            await asyncio.sleep(0)
+            pm.release("Alice")
+            self.assertIs(pm.login("alice"), alice)
+            await pm.flush()
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+
+        asyncio.run(log_out_and_in())
+
+        self.assertIs(pm.players["alice"], alice)
+
+
+class AuthManagerStoreTest(_TempDirTest):
+    """Test AuthManager on top of a store."""
+
+    def setUp(self):
+        super().setUp()
+        self.store = SQLiteStore(self.db_path, CREDENTIALS_TABLE)
+        self.addCleanup(self.store.close)
+        self.auth = AuthManager(save_file=self._path("auth.json"), store=self.store)
+
+    def test_register_and_login_use_store(self):
+        """Test credentials round-trip through the store, not memory."""
+        self.auth.register("Alice", "secret")
+
+        self.assertEqual(self.auth.credentials, {})
+        self.assertTrue(self.auth.login("alice", "secret"))
+        with self.assertRaises(Exception):
+            self.auth.login("alice", "wrong")
+        self.assertFalse(os.path.exists(self._path("auth.json")))
+
+    def test_register_rejects_existing_user(self):
+        """Test duplicate registration is detected from the store."""
+        self.auth.register("alice", "secret")
+
+        with self.assertRaises(Exception):
+            AuthManager(save_file=self._path("auth.json"), store=self.store).register(
+                "Alice", "other"
+            )
+
+    def test_set_password_upserts_single_row(self):
+        """Test changing a password replaces just that user's hash."""
+        self.auth.register("alice", "old")
+        self.auth.register("bob", "pw")
+
+        self.auth.set_password("Alice", "new")
+
+        self.assertTrue(self.auth.login("alice", "new"))
+        self.assertTrue(self.auth.login("bob", "pw"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+Tests for the on-disk world snapshot.
+
+Tests cover:
+- Round-tripping a generated world with its mobs, quest items and doors
+- Closures rebuilt from their code objects, with shared cells kept shared
+- Live MobManager references re-linked on load
+- Stale snapshots (changed sources, other format) being ignored
+- load_or_generate_world only generating when there is no usable snapshot
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from managers.game_state import GameState
+from managers.mob_definitions import get_mob_definitions
+from managers.mob_manager import MobManager
+from managers.world import generate_world
+from managers import world_snapshot
+from managers.world_snapshot import (
+    load_or_generate_world,
+    load_world_snapshot,
+    save_world_snapshot,
+    world_source_hash,
+)
+from models.Room import Room
+from services import golden_doors, quest_items
+
+
+def _mob_manager():
+    manager = MobManager()
+    manager.load_mob_definitions(get_mob_definitions())
+    return manager
+
+
+class _SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "world.snapshot")
+
+
+class WorldSnapshotRoundTripTest(_SnapshotTest):
+    """Test a generated world survives save and load."""
+
+    def setUp(self):
+        super().setUp()
+        self.manager = _mob_manager()
+        self.rooms = generate_world(mob_manager=self.manager)
+        self.doors = dict(golden_doors.DOOR_REGISTRY)
+        self.anchor_count = len(quest_items.export_quest_items())
+        save_world_snapshot(self.path, self.rooms, self.manager)
+
+    def test_rooms_and_mobs_are_restored(self):
+        """Test every room and spawned mob comes back."""
+        manager = _mob_manager()
+
+        rooms = load_world_snapshot(self.path, manager)
+
+        self.assertEqual(set(rooms), set(self.rooms))
+        self.assertEqual(set(manager.mobs), set(self.manager.mobs))
+        self.assertEqual(manager._spawn_counter, self.manager._spawn_counter)
+        for mob in manager.mobs.values():
+            self.assertIn(mob, rooms[mob.current_room].items)
+
+    def test_hidden_item_conditions_still_evaluate(self):
+        """Test rebuilt condition closures give the same answers."""
+        game_state = GameState()
+
+        rooms = load_world_snapshot(self.path, _mob_manager())
+
+        checked = 0
+        for room_id, room in self.rooms.items():
+            for item_id, (_item, condition) in room.hidden_items.items():
+                restored = rooms[room_id].hidden_items[item_id][1]
+                self.assertIsInstance(restored, types.FunctionType)
+                self.assertIs(restored.__code__, condition.__code__)
+                self.assertEqual(restored(game_state), condition(game_state))
+                checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_registries_are_restored(self):
+        """Test quest item anchors and golden doors are re-registered."""
+        quest_items.clear_quest_item_registry()
+        golden_doors.reset_doors()
+
+        load_world_snapshot(self.path, _mob_manager())
+
+        self.assertEqual(len(quest_items.export_quest_items()), self.anchor_count)
+        self.assertEqual(set(golden_doors.DOOR_REGISTRY), set(self.doors))
+
+    def test_stale_source_hash_is_ignored(self):
+        """Test a snapshot from different world sources is not loaded."""
+        with patch.object(world_snapshot, "world_source_hash", return_value="other"):
+            self.assertIsNone(load_world_snapshot(self.path, _mob_manager()))
+
+    def test_other_format_version_is_ignored(self):
+        """Test a snapshot written in another format is not loaded."""
+        with patch.object(world_snapshot, "SNAPSHOT_FORMAT_VERSION", 99):
+            self.assertIsNone(load_world_snapshot(self.path, _mob_manager()))
+
+
+class WorldSnapshotClosureTest(_SnapshotTest):
+    """Test closures are rebuilt by stable id."""
+
+    def _room_with_counter(self, mob_manager):
+        room = Room("hall", "Hall", "A hall.")
+        count = [0]
+
+        def bump(player, game_state, *args):
+            count[0] += 1
+
+        def visible(game_state):
+            return count[0] > 0 and mob_manager is not None
+
+        room.add_speech_trigger("bump", "You bump.", effect_fn=bump)
+        room.hidden_items["token"] = (object(), visible)
+        return room
+
+    def test_closures_share_cells_after_load(self):
+        """Test two closures over one variable still see each other's writes."""
+        save_world_snapshot(
+            self.path, {"hall": self._room_with_counter(MobManager())}, MobManager()
+        )
+
+        room = load_world_snapshot(self.path, MobManager())["hall"]
+
+        visible = room.hidden_items["token"][1]
+        self.assertFalse(visible(None))
+        room.speech_triggers["bump"][0]["effect_fn"](None, None)
+        self.assertTrue(visible(None))
+
+    def test_mob_manager_reference_is_relinked(self):
+        """Test a captured MobManager resolves to the live one on load."""
+        saved = MobManager()
+        save_world_snapshot(self.path, {"hall": self._room_with_counter(saved)}, saved)
+        live = MobManager()
+
+        room = load_world_snapshot(self.path, live)["hall"]
+
+        visible = room.hidden_items["token"][1]
+        cells = dict(zip(visible.__code__.co_freevars, visible.__closure__))
+        self.assertIs(cells["mob_manager"].cell_contents, live)
+
+    def test_missing_code_is_not_loaded(self):
+        """Test a closure whose code moved makes the snapshot unusable."""
+        save_world_snapshot(
+            self.path, {"hall": self._room_with_counter(MobManager())}, MobManager()
+        )
+        world_snapshot._code_index.clear()
+
+        with patch.object(
+            world_snapshot, "_iter_module_code", return_value=[]
+        ), self.assertLogs(world_snapshot.logger, "WARNING"):
+            self.assertIsNone(load_world_snapshot(self.path, MobManager()))
+        world_snapshot._code_index.clear()
+
+
+class LoadOrGenerateWorldTest(_SnapshotTest):
+    """Test the boot-time entry point."""
+
+    def test_generates_once_then_loads(self):
+        """Test the world is generated and saved, then read from disk."""
+        generate = MagicMock(
+            side_effect=lambda mob_manager: {"hall": Room("hall", "Hall", "A hall.")}
+        )
+
+        first = load_or_generate_world(self.path, generate, MobManager())
+        second = load_or_generate_world(self.path, generate, MobManager())
+
+        generate.assert_called_once()
+        self.assertEqual(set(first), set(second))
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_without_path_always_generates(self):
+        """Test an unset snapshot path keeps the old behaviour."""
+        generate = MagicMock(return_value={})
+
+        load_or_generate_world(None, generate, MobManager())
+        load_or_generate_world(None, generate, MobManager())
+
+        self.assertEqual(generate.call_count, 2)
+
+    def test_source_hash_covers_level_sources(self):
+        """Test editing a level generator changes the hash."""
+        root = Path(self.tmpdir.name)
+        level = root / "managers" / "world" / "level_9.py"
+        level.parent.mkdir(parents=True)
+        level.write_text("ROOMS = 1\n")
+        before = world_source_hash(root)
+
+        level.write_text("ROOMS = 2\n")
+
+        self.assertNotEqual(world_source_hash(root), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from models.StatefulItem import StatefulItem
 from models.ContainerItem import ContainerItem
 from models.Weapon import Weapon
 from models.SpecializedRooms import SwampRoom
+from services.state_version import STATE, depends_on
 
 # ============================================================================
 # PUZZLE CONDITION FUNCTIONS
@@ -3027,6 +3028,7 @@ def add_regular_items(rooms: Dict[str, Room]) -> None:
     )
 
     # Hidden until corpse is searched
+    @depends_on(STATE)
     def corpse_searched(game_state: Any) -> bool:
         room = game_state.get_room("crossroads")
         if not room:
@@ -3096,6 +3098,7 @@ def add_regular_items(rooms: Dict[str, Room]) -> None:
         value=5,
     )
 
+    @depends_on(STATE)
     def gallows_puzzle_solved(game_state: Any) -> bool:
         room = game_state.get_room("square")
         if not room:
@@ -3624,6 +3627,7 @@ def add_weapons(rooms: Dict[str, Room]) -> None:
     sunsword.emits_light = True  # It's a sword made of sunlight!
 
     # Hidden until pedestal is opened - condition checks pedestal state
+    @depends_on(STATE)
     def pedestal_is_open(game_state: Any) -> bool:
         room = game_state.get_room("treasury")
         if not room:
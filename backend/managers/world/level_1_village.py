@@ -27,6 +27,7 @@ from .shared_conditions import (
     player_is_novice_or_below,
 )
 from services.quest_items import register_quest_item
+from services.state_version import STATE, depends_on
 
 
 class Level1Village(LevelGenerator):
@@ -684,6 +685,7 @@ class Level1Village(LevelGenerator):
         safe.update_description()
 
         # Only add safe as hidden until painting moved
+        @depends_on(STATE)
         def painting_moved(game_state: Any) -> bool:
             room = game_state.get_room("tavern")
             if not room:
@@ -1068,6 +1070,7 @@ class Level1Village(LevelGenerator):
         self._rooms["undercroft"].add_item(phylactery)
 
         # Bones - hidden until phylactery opened
+        @depends_on(STATE)
         def phylactery_opened(game_state: Any) -> bool:
             room = game_state.get_room("undercroft")
             if not room:
@@ -1865,6 +1868,7 @@ class Level1Village(LevelGenerator):
         self._rooms["well"].add_item(well_bucket)
 
         # Coins become visible after raising the bucket with treasure
+        @depends_on(STATE)
         def bucket_has_treasure(game_state: Any) -> bool:
             room = game_state.get_room("well")
             if not room:
@@ -2022,7 +2026,7 @@ class Level1Village(LevelGenerator):
             ) -> None:
                 """Grant blessing that allows passage through mists."""
                 # Persisted on the player so it survives logout.
-                player.flags["dawnfather_blessing"] = True
+                player.set_flag("dawnfather_blessing")
                 player_manager.save_players()
                 # Blessing granted - but player still needs token and keyword!
 
@@ -2079,7 +2083,7 @@ class Level1Village(LevelGenerator):
                 sio: Any,
                 utils: Any,
             ) -> None:
-                player.flags["dawnfather_blessing"] = True
+                player.set_flag("dawnfather_blessing")
                 player_manager.save_players()
 
             church_room.add_speech_trigger(
@@ -2136,7 +2140,7 @@ class Level1Village(LevelGenerator):
                     for sid, session in online_sessions.items():
                         player = session.get("player")
                         if player and player.current_room == "church":
-                            player.flags["dawnfather_blessing"] = True
+                            player.set_flag("dawnfather_blessing")
                 except ImportError:
                     pass
 
@@ -30,6 +30,7 @@ from models.StatefulItem import StatefulItem
 from models.ContainerItem import ContainerItem
 from models.Weapon import Weapon
 from services.quest_items import register_quest_item
+from services.state_version import STATE, depends_on
 from .level_base import LevelGenerator
 from .shared_items import (
     create_torch,
@@ -727,6 +728,7 @@ class Level2Woods(LevelGenerator):
             ),
         )
 
+        @depends_on(STATE)
         def corpse_searched(game_state: Any) -> bool:
             room = game_state.get_room("crossroads")
             if not room:
@@ -1097,6 +1099,7 @@ class Level2Woods(LevelGenerator):
             synonyms=["crest", "silver medallion", "knight medallion"],
         )
 
+        @depends_on(STATE)
         def bones_searched(game_state: Any) -> bool:
             room = game_state.get_room("wolf_den")
             if not room:
@@ -1177,6 +1180,7 @@ class Level2Woods(LevelGenerator):
         )
         rusty_dagger.synonyms = ["rusty dagger", "knife"]
 
+        @depends_on(STATE)
         def satchel_opened(game_state: Any) -> bool:
             room = game_state.get_room("wolf_den")
             if not room:
@@ -1225,7 +1229,7 @@ class Level2Woods(LevelGenerator):
             """Mark the player's palm with the Watchfire (persisted flag)."""
             if player.flags.get("watchfire_mark"):
                 return None
-            player.flags["watchfire_mark"] = True
+            player.set_flag("watchfire_mark")
             return (
                 "The knight presses two spectral fingers to your palm. Cold "
                 "silver fire blooms there and sinks beneath the skin, leaving "
@@ -1683,6 +1687,7 @@ class Level2Woods(LevelGenerator):
         )
         fine_sword.synonyms = ["fine longsword", "sword", "ancient sword"]
 
+        @depends_on(STATE)
         def sarcophagus_opened(game_state: Any) -> bool:
             room = game_state.get_room("barrow")
             if not room:
@@ -1788,6 +1793,7 @@ class Level2Woods(LevelGenerator):
             message="The lockbox's lock is so rusted it might break with enough force.",
         )
 
+        @depends_on(STATE)
         def cache_uncovered(game_state: Any) -> bool:
             room = game_state.get_room("dark_grove")
             if not room:
@@ -1830,6 +1836,7 @@ class Level2Woods(LevelGenerator):
             synonyms=["gold coins", "gold", "money"],
         )
 
+        @depends_on(STATE)
         def lockbox_opened(game_state: Any) -> bool:
             room = game_state.get_room("dark_grove")
             if not room:
@@ -2011,6 +2018,7 @@ class Level2Woods(LevelGenerator):
             synonyms=["golden acorn", "magic acorn"],
         )
 
+        @depends_on(STATE)
         def box_opened(game_state: Any) -> bool:
             room = game_state.get_room("mushroom_glade")
             if not room:
@@ -2075,6 +2083,7 @@ class Level2Woods(LevelGenerator):
             synonyms=["flint", "striker"],
         )
 
+        @depends_on(STATE)
         def pack_opened(game_state: Any) -> bool:
             room = game_state.get_room("fallen_tree")
             if not room:
@@ -2169,6 +2178,7 @@ class Level2Woods(LevelGenerator):
             synonyms=["silver ring", "small ring"],
         )
 
+        @depends_on(STATE)
         def droppings_searched(game_state: Any) -> bool:
             room = game_state.get_room("raven_roost")
             if not room:
@@ -2288,7 +2298,7 @@ class Level2Woods(LevelGenerator):
                                 50, send_notification=False
                             )
                             # Persisted; wolves check this when picking prey.
-                            player.flags["nature_blessing"] = True
+                            player.set_flag("nature_blessing")
                 except ImportError:
                     pass
 
@@ -2436,6 +2446,7 @@ class Level2Woods(LevelGenerator):
         )
         hunters_crossbow.synonyms = ["hunters crossbow", "bow"]
 
+        @depends_on(STATE)
         def chest_opened(game_state: Any) -> bool:
             room = game_state.get_room("hunters_cache")
             if not room:
@@ -2516,8 +2527,8 @@ class Level2Woods(LevelGenerator):
         """Configure NPC interactions for Level 2."""
 
         def find_mob_in_room(name: str, room_id: str) -> Any:
-            for mob_id, mob in mob_manager.mobs.items():
-                if mob.name.lower() == name.lower() and mob.current_room == room_id:
+            for mob in mob_manager.get_mobs_in_room(room_id):
+                if mob.name.lower() == name.lower():
                     return mob
             return None
 
@@ -8,6 +8,8 @@ quest-item done-checks use (game_state) only — build those with item_state_is.
 
 from typing import Any, Callable
 
+from services.state_version import STATE, depends_on
+
 # ============================================================================
 # PLAYER CONDITIONS
 # ============================================================================
@@ -41,6 +43,7 @@ def item_state_is(room_id: str, item_id: str, state: str) -> Callable[[Any], boo
     Wrap with a lambda for (player, game_state) interaction conditions.
     """
 
+    @depends_on(STATE)
     def check(game_state: Any) -> bool:
         room = game_state.get_room(room_id)
         if not room:
@@ -0,0 +1,361 @@
+# backend/managers/world_snapshot.py
+
+"""
+On-disk snapshot of the generated world.
+
+Every boot used to rebuild the world from the level generators. The snapshot
+stores the result (rooms, spawned mobs, quest item anchors and golden door
+state) in a versioned pickle keyed by a hash of the generator sources, so a
+restart with unchanged world code loads it straight from disk and any edit to
+a level invalidates it.
+
+The world is full of closures (exit conditions, item effect_fns, NPC hooks)
+that plain pickle refuses. They are written by stable id instead: module,
+qualified name and first line of their code object, plus their captured
+cells. Loading looks the code object up again in the live module and
+rebuilds the function around the restored cells, so closures that shared a
+cell before the save still share it afterwards.
+
+The live MobManager and level generators are never copied: references to them
+are saved as placeholders and re-linked to the running instances on load.
+"""
+
+import hashlib
+import importlib
+import io
+import logging
+import os
+import pickle
+import sys
+import types
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+# Sources whose edits change what generate_world() builds.
+SOURCE_PATTERNS: Tuple[str, ...] = (
+    "managers/world/**/*.py",
+    "managers/world/**/*.json",
+    "managers/mob_definitions.py",
+    "models/*.py",
+    "services/golden_doors.py",
+    "services/quest_items.py",
+)
+
+MOB_MANAGER_ID = "mob_manager"
+LEVEL_ID_PREFIX = "level:"
+
+# (module, qualname, first line, free variable names)
+FunctionId = Tuple[str, str, int, Tuple[str, ...]]
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot cannot be written or re-linked."""
+
+
+def world_source_hash(root: Optional[Path] = None) -> str:
+    """Hash the world generator sources, format version and Python version."""
+    base = root or BACKEND_ROOT
+    digest = hashlib.sha256()
+    digest.update(f"format={SNAPSHOT_FORMAT_VERSION}\n".encode())
+    # Code objects and pickled cells are only portable within a minor release.
+    digest.update(f"python={sys.version_info[0]}.{sys.version_info[1]}\n".encode())
+    paths = sorted({path for pattern in SOURCE_PATTERNS for path in base.glob(pattern)})
+    for path in paths:
+        if "tests" in path.relative_to(base).parts:
+            continue
+        digest.update(path.relative_to(base).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _qualname(code: types.CodeType) -> str:
+    return getattr(code, "co_qualname", code.co_name)
+
+
+def _is_importable(func: types.FunctionType) -> bool:
+    """True if plain pickle can save ``func`` as a module attribute."""
+    module = sys.modules.get(func.__module__ or "")
+    target: Any = module
+    for part in func.__qualname__.split("."):
+        target = getattr(target, part, None)
+        if target is None:
+            return False
+    return target is func
+
+
+def _iter_code(code: types.CodeType) -> Iterable[types.CodeType]:
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_code(const)
+
+
+def _iter_module_code(module: types.ModuleType) -> Iterable[types.CodeType]:
+    seen = set()
+    pending: List[Any] = list(vars(module).values())
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, (staticmethod, classmethod)):
+            pending.append(value.__func__)
+        elif isinstance(value, property):
+            pending.extend(f for f in (value.fget, value.fset, value.fdel) if f)
+        elif isinstance(value, types.FunctionType):
+            if value.__module__ == module.__name__:
+                yield from _iter_code(value.__code__)
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            pending.extend(vars(value).values())
+
+
+_code_index: Dict[str, Dict[Tuple[str, int], types.CodeType]] = {}
+
+
+def _find_code(module_name: str, qualname: str, firstlineno: int) -> types.CodeType:
+    index = _code_index.get(module_name)
+    if index is None:
+        module = importlib.import_module(module_name)
+        index = {
+            (_qualname(code), code.co_firstlineno): code
+            for code in _iter_module_code(module)
+        }
+        _code_index[module_name] = index
+    code = index.get((qualname, firstlineno))
+    if code is None:
+        raise SnapshotError(f"No code for {module_name}.{qualname}:{firstlineno}")
+    return code
+
+
+def _rebuild_function(
+    function_id: FunctionId, closure: Optional[Tuple[types.CellType, ...]]
+) -> types.FunctionType:
+    module_name, qualname, firstlineno, freevars = function_id
+    code = _find_code(module_name, qualname, firstlineno)
+    if code.co_freevars != freevars:
+        raise SnapshotError(f"Captured variables of {module_name}.{qualname} changed")
+    module = sys.modules[module_name]
+    return types.FunctionType(code, vars(module), code.co_name, None, closure)
+
+
+def _set_function_state(func: types.FunctionType, state: Dict[str, Any]) -> None:
+    func.__defaults__ = state["defaults"]
+    func.__kwdefaults__ = state["kwdefaults"]
+    func.__qualname__ = state["qualname"]
+    func.__dict__.update(state["dict"])
+
+
+def _new_cell() -> types.CellType:
+    return types.CellType()
+
+
+def _set_cell_contents(cell: types.CellType, contents: Any) -> None:
+    cell.cell_contents = contents
+
+
+class _WorldPickler(pickle.Pickler):
+    def __init__(self, file: IO[bytes], live: Dict[int, str]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._live = live
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return self._live.get(id(obj))
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, types.CellType):
+            try:
+                contents = obj.cell_contents
+            except ValueError:  # Empty cell (variable assigned later)
+                return (_new_cell, ())
+            # Contents go in as state so a cell reached again through its own
+            # contents resolves from the memo instead of recursing.
+            return (_new_cell, (), contents, None, None, _set_cell_contents)
+        if isinstance(obj, types.FunctionType) and not _is_importable(obj):
+            code = obj.__code__
+            function_id: FunctionId = (
+                obj.__module__,
+                _qualname(code),
+                code.co_firstlineno,
+                code.co_freevars,
+            )
+            state = {
+                "defaults": obj.__defaults__,
+                "kwdefaults": obj.__kwdefaults__,
+                "qualname": obj.__qualname__,
+                "dict": obj.__dict__,
+            }
+            return (
+                _rebuild_function,
+                (function_id, obj.__closure__),
+                state,
+                None,
+                None,
+                _set_function_state,
+            )
+        return NotImplemented
+
+
+class _WorldUnpickler(pickle.Unpickler):
+    def __init__(self, file: IO[bytes], live: Dict[str, Any]) -> None:
+        super().__init__(file)
+        self._live = live
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid not in self._live:
+            raise SnapshotError(f"Snapshot needs live object {pid!r}")
+        return self._live[pid]
+
+
+def _live_objects(mob_manager: Optional[Any], levels: List[Any]) -> Dict[str, Any]:
+    live: Dict[str, Any] = {
+        f"{LEVEL_ID_PREFIX}{type(level).__name__}": level for level in levels
+    }
+    if mob_manager is not None:
+        live[MOB_MANAGER_ID] = mob_manager
+        if getattr(mob_manager, "scheduler", None) is not None:
+            live["scheduler"] = mob_manager.scheduler
+    return live
+
+
+def _default_levels() -> List[Any]:
+    from managers.world import LEVEL_GENERATORS
+
+    return list(LEVEL_GENERATORS)
+
+
+def save_world_snapshot(
+    path: str,
+    rooms: Dict[str, Any],
+    mob_manager: Optional[Any] = None,
+    levels: Optional[List[Any]] = None,
+) -> None:
+    """Write the freshly generated world to ``path`` (atomically)."""
+    from services import golden_doors, quest_items
+
+    levels = _default_levels() if levels is None else levels
+    live = _live_objects(mob_manager, levels)
+    payload: Dict[str, Any] = {
+        "rooms": rooms,
+        "levels": {
+            key: dict(vars(level))
+            for key, level in live.items()
+            if key.startswith(LEVEL_ID_PREFIX)
+        },
+        "quest_items": quest_items.export_quest_items(),
+        "golden_doors": dict(golden_doors.DOOR_REGISTRY),
+        "mobs": None,
+    }
+    if mob_manager is not None:
+        payload["mobs"] = {
+            "mobs": mob_manager.mobs,
+            "spawn_records": mob_manager.spawn_records,
+            "spawn_counter": mob_manager._spawn_counter,
+        }
+
+    buffer = io.BytesIO()
+    try:
+        _WorldPickler(buffer, {id(obj): key for key, obj in live.items()}).dump(payload)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        raise SnapshotError(f"World is not snapshottable: {error}") from error
+
+    header = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "source_hash": world_source_hash(),
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(buffer.getbuffer())
+    os.replace(temp_path, path)
+
+
+def load_world_snapshot(
+    path: str,
+    mob_manager: Optional[Any] = None,
+    levels: Optional[List[Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the world saved at ``path`` and restore its global registries.
+
+    Returns the rooms, or None if there is no snapshot, it was built from
+    different world sources, or it cannot be re-linked; the caller should
+    then generate the world and save a new one.
+    """
+    if not os.path.exists(path):
+        return None
+    levels = _default_levels() if levels is None else levels
+    live = _live_objects(mob_manager, levels)
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if (
+                not isinstance(header, dict)
+                or header.get("format") != SNAPSHOT_FORMAT_VERSION
+                or header.get("source_hash") != world_source_hash()
+            ):
+                logger.info("World snapshot %s is stale; ignoring it.", path)
+                return None
+            payload = _WorldUnpickler(f, live).load()
+    except Exception as error:
+        logger.warning("Could not load world snapshot %s: %s", path, error)
+        return None
+
+    mobs = payload["mobs"]
+    if mobs is not None and mob_manager is None:
+        logger.info("World snapshot %s has mobs but no MobManager; ignoring it.", path)
+        return None
+    _restore(payload, mob_manager, live)
+    rooms: Dict[str, Any] = payload["rooms"]
+    return rooms
+
+
+def _restore(payload: Dict[str, Any], mob_manager: Any, live: Dict[str, Any]) -> None:
+    from services import golden_doors, quest_items
+
+    for key, state in payload["levels"].items():
+        level = live.get(key)
+        if level is not None:
+            vars(level).update(state)
+    quest_items.restore_quest_items(payload["quest_items"])
+    golden_doors.reset_doors()
+    golden_doors.DOOR_REGISTRY.update(payload["golden_doors"])
+    mobs = payload["mobs"]
+    if mobs is not None:
+        mob_manager.mobs.update(mobs["mobs"])
+        mob_manager.spawn_records.update(mobs["spawn_records"])
+        mob_manager._spawn_counter = max(
+            mob_manager._spawn_counter, mobs["spawn_counter"]
+        )
+
+
+def load_or_generate_world(
+    path: Optional[str],
+    generate: Callable[..., Dict[str, Any]],
+    mob_manager: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Boot from the snapshot at ``path`` if it is current, else generate and save."""
+    if path:
+        rooms = load_world_snapshot(path, mob_manager)
+        if rooms is not None:
+            logger.info("World loaded from snapshot %s.", path)
+            return rooms
+    rooms = generate(mob_manager=mob_manager)
+    if path:
+        try:
+            save_world_snapshot(path, rooms, mob_manager)
+        except (OSError, SnapshotError) as error:
+            logger.warning("Could not save world snapshot %s: %s", path, error)
+        else:
+            logger.info("World snapshot saved to %s.", path)
+    return rooms
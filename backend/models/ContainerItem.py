@@ -1,6 +1,8 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 from models.StatefulItem import StatefulItem
 from models.Item import Item
+from models.ItemList import ItemList
+from services import state_version
 
 
 class ContainerItem(StatefulItem):
@@ -8,7 +10,7 @@ class ContainerItem(StatefulItem):
     base_weight: int
     capacity_limit: int
     capacity_weight: int
-    items: List[Item]
+    _items: ItemList  # Of Item
     no_removal: bool
     no_removal_message: Optional[str]
     no_removal_condition: Optional[Callable[[Any], Tuple[bool, Optional[str]]]]
@@ -56,6 +58,16 @@ class ContainerItem(StatefulItem):
         # Add default open/close interactions
         self.setup_default_interactions()
 
+    @property
+    def items(self) -> ItemList:
+        """Contained items, indexed by name (see models.ItemList)."""
+        return self._items
+
+    @items.setter
+    def items(self, items: Iterable[Item]) -> None:
+        self._items = items if isinstance(items, ItemList) else ItemList(items)
+        self._items.owner = self
+
     def setup_default_interactions(self) -> None:
         """Set up the default open and close interactions for containers."""
         # Only add these if we have the add_interaction method (from StatefulItem)
@@ -115,6 +127,9 @@ class ContainerItem(StatefulItem):
             full_desc = f"{self.base_description}, closed.\n"
         full_desc += self.get_contained()
         self.description = full_desc
+        # The contents changed, or the state did (already bumped); either way
+        # text rendered from this container is stale
+        state_version.bump(state_version.DESCRIPTIONS)
 
     def set_state(self, new_state: str, game_state: Any = None) -> bool:
         """
@@ -188,7 +203,7 @@ class ContainerItem(StatefulItem):
         """
         for index, contained_item in enumerate(self.items):
             if contained_item.id == item_id:
-                removed = self.items.pop(index)
+                removed: Item = self.items.pop(index)
                 self.update_weight()
                 self.update_description()
                 return removed
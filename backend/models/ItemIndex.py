@@ -0,0 +1,170 @@
+# backend/models/ItemIndex.py
+
+"""
+World-wide index of items by id and name, with where each item is.
+
+Everything that holds items tells the index as items arrive:
+
+- ItemList: room floors, inventories and container contents (its ``owner``
+  is the Room, Player or ContainerItem)
+- Room.hidden (HiddenItems): a room's hidden items
+- Mobile.loot (MobLoot): a mob's loot table and shop stock
+
+A holder is anything with an ``owner`` and a ``holds(item)`` check. The
+index keeps the holder an item was last given to and verifies it on lookup,
+so removing an item needs no bookkeeping. Items are held weakly: one that
+leaves the world and is garbage collected drops out of the index by itself.
+
+``where`` and ``conjure`` look items up here in O(matches) (plus a pass over
+the distinct names for substring terms) instead of walking every room,
+container and session. The index is process-wide, so callers check that the
+room or player at the end of an item's holder chain belongs to their world.
+"""
+
+import weakref
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Protocol, Set
+
+from models.Item import Item
+
+# Containers nest a few levels at most; guards against holder cycles.
+MAX_DEPTH = 32
+
+
+class Holder(Protocol):
+    owner: Any
+
+    def holds(self, item: Any) -> bool: ...
+
+
+# Longest substring of a name word used as an index key
+NAME_KEY_LENGTH = 3
+
+
+def name_keys(item: Item) -> FrozenSet[str]:
+    """Index keys of an item: every substring of up to NAME_KEY_LENGTH
+    characters of every word of its names."""
+    keys: Set[str] = set()
+    for name in [item.name, *item.synonyms]:
+        for word in name.lower().split():
+            for length in range(1, NAME_KEY_LENGTH + 1):
+                keys.update(
+                    word[start : start + length]
+                    for start in range(len(word) - length + 1)
+                )
+    return frozenset(keys)
+
+
+def name_key(term: str) -> Optional[str]:
+    """The key every item matching ``term`` is indexed under, if any.
+
+    A match puts the term's first word inside one word of a name, so the
+    item carries that word's leading NAME_KEY_LENGTH characters as a key.
+    """
+    words = term.lower().split()
+    return words[0][:NAME_KEY_LENGTH] if words else None
+
+
+def _names(item: Item) -> FrozenSet[str]:
+    return frozenset(name.lower() for name in [item.name, *item.synonyms])
+
+
+class ItemIndex:
+    """item id / name -> live items, and item -> the holder it is in."""
+
+    def __init__(self) -> None:
+        self._holders: "weakref.WeakKeyDictionary[Item, Holder]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Names (lowercased name and synonyms) each item is indexed under
+        self._names: "weakref.WeakKeyDictionary[Item, FrozenSet[str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # lowercased id / name -> {id(item): item}, in the order items arrived
+        self._by_id: Dict[str, "weakref.WeakValueDictionary[int, Item]"] = {}
+        self._by_name: Dict[str, "weakref.WeakValueDictionary[int, Item]"] = {}
+
+    # ------------------------------------------------------------------
+    # Updates (called by holders)
+    # ------------------------------------------------------------------
+
+    def add(self, item: Item, holder: Holder) -> None:
+        """Record that ``holder`` now holds ``item``."""
+        self._holders[item] = holder
+        if item not in self._names:
+            self._register(item)
+
+    def rename(self, item: Item) -> None:
+        """Re-index an item whose name or synonyms changed."""
+        for name in self._names.pop(item, frozenset()):
+            bucket = self._by_name.get(name)
+            if bucket is not None:
+                bucket.pop(id(item), None)
+        self._register(item)
+
+    def _register(self, item: Item) -> None:
+        names = _names(item)
+        self._names[item] = names
+        for name in names:
+            _bucket(self._by_name, name)[id(item)] = item
+        _bucket(self._by_id, str(item.id).lower())[id(item)] = item
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def holder(self, item: Any) -> Optional[Holder]:
+        """The holder ``item`` is in, or None if it is in none."""
+        holder = self._holders.get(item)
+        if holder is None or not holder.holds(item):
+            return None
+        return holder
+
+    def chain(self, item: Any) -> List[Holder]:
+        """
+        Holders from ``item`` outwards: e.g. [chest.items, room.items] for an
+        item in a chest on a room's floor. Empty if the item is not held.
+        """
+        holders: List[Holder] = []
+        for _ in range(MAX_DEPTH):
+            holder = self.holder(item)
+            if holder is None:
+                break
+            holders.append(holder)
+            item = holder.owner
+            if not isinstance(item, Item) or item not in self._holders:
+                break  # A room, player or mob: the end of the chain
+        return holders
+
+    def with_id(self, item_id: str) -> List[Item]:
+        """Held items whose id is ``item_id`` (case-insensitive)."""
+        return self._held(self._by_id.get(item_id.lower(), {}).values())
+
+    def named(self, term: str) -> List[Item]:
+        """Held items whose name or a synonym is ``term`` (case-insensitive)."""
+        return self._held(self._by_name.get(term.lower(), {}).values())
+
+    def matching(self, term: str) -> List[Item]:
+        """Held items whose name or a synonym contains ``term``."""
+        term = term.lower()
+        found: Dict[int, Item] = {}
+        for name, bucket in list(self._by_name.items()):
+            if not bucket:
+                del self._by_name[name]  # Every item under it was collected
+            elif term in name:
+                found.update(bucket)
+        return self._held(found.values())
+
+    def _held(self, items: Iterable[Item]) -> List[Item]:
+        return [item for item in list(items) if self.holder(item) is not None]
+
+
+def _bucket(
+    table: Dict[str, "weakref.WeakValueDictionary[int, Item]"], key: str
+) -> "weakref.WeakValueDictionary[int, Item]":
+    bucket = table.get(key)
+    if bucket is None:
+        bucket = table[key] = weakref.WeakValueDictionary()
+    return bucket
+
+
+item_index = ItemIndex()
@@ -0,0 +1,192 @@
+# backend/models/ItemList.py
+
+"""
+A list of items that indexes them by name.
+
+Rooms, inventories and containers hold their items in an ItemList. It is an
+ordinary list, but every mutation also maintains an inverted index from the
+short substrings of each word of an item's name and synonyms ("s", "sw",
+"swo", "w", "wo", "wor", ...) to the items carrying them, so resolving the
+noun a player typed is a dict probe plus a matches_name check on the few
+candidates instead of a matches_name call on everything in a crowded room.
+
+Item.matches_name accepts any substring, and every item it can accept is in
+the probed bucket, which keeps list order; so ``find`` returns the same item
+a scan of the list would ("sword" still picks a broadsword listed first).
+
+Every item added is also reported to the world-wide models.ItemIndex with
+the list as its holder; ``owner`` says whose items these are.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from models.Item import Item
+from models.ItemIndex import item_index, name_key, name_keys
+
+
+class ItemList(List[Any]):
+    """List of items with a substring index of their names and synonyms."""
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        super().__init__()
+        # key -> {id(item): item}, in the order the items were added
+        self._index: Dict[str, Dict[int, Any]] = {}
+        # id(item) -> (keys it was indexed under, copies in the list)
+        self._entries: Dict[int, Tuple[FrozenSet[str], int]] = {}
+        # Non-Item entries that still answer matches_name (test doubles)
+        self._unindexed = 0
+        # Bumped by every mutation, for caches derived from the contents
+        self.version = 0
+        # The Room, Player or container whose items these are
+        self.owner: Any = None
+        self.extend(items)
+
+    def __reduce__(self) -> Any:
+        # Rebuild through __init__ so the index exists before items arrive.
+        return (self.__class__, (list(self),), {"owner": self.owner})
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def find(self, term: str) -> Optional[Any]:
+        """The first item whose name or a synonym contains ``term``."""
+        key = name_key(term)
+        if key is None or self._unindexed:
+            return _scan(self, term)
+        for item in self._index.get(key, {}).values():
+            if item.matches_name(term):
+                return item
+        return None
+
+    def holds(self, item: Any) -> bool:
+        """Whether this very item (not just an equal one) is in the list."""
+        return id(item) in self._entries
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _add(self, item: Any) -> None:
+        self.version += 1
+        if not isinstance(item, Item):
+            if hasattr(item, "matches_name"):
+                self._unindexed += 1
+            return
+        item_index.add(item, self)
+        key = id(item)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], entry[1] + 1)
+            return
+        keys = name_keys(item)
+        self._entries[key] = (keys, 1)
+        for word_key in keys:
+            self._index.setdefault(word_key, {})[key] = item
+
+    def _discard(self, item: Any) -> None:
+        self.version += 1
+        key = id(item)
+        entry = self._entries.get(key)
+        if entry is None:
+            if hasattr(item, "matches_name") and self._unindexed:
+                self._unindexed -= 1
+            return
+        keys, count = entry
+        if count > 1:
+            # The remaining copy may sit behind items it was indexed ahead of
+            self.reindex()
+            return
+        del self._entries[key]
+        for word_key in keys:
+            bucket = self._index[word_key]
+            del bucket[key]
+            if not bucket:
+                del self._index[word_key]
+
+    def reindex(self) -> None:
+        """Rebuild the index, e.g. after an item in the list was renamed."""
+        self._index = {}
+        self._entries = {}
+        self._unindexed = 0
+        self.version += 1
+        for item in self:
+            if isinstance(item, Item):
+                item_index.rename(item)
+            self._add(item)
+
+    # ------------------------------------------------------------------
+    # list mutators
+    # ------------------------------------------------------------------
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._add(item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items: Iterable[Any]) -> "ItemList":  # type: ignore[misc]
+        self.extend(items)
+        return self
+
+    def insert(self, index: Any, item: Any) -> None:
+        at_end = index >= len(self)
+        super().insert(index, item)
+        if at_end:
+            self._add(item)
+        else:
+            self.reindex()  # Keep index order matching list order
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._discard(item)
+
+    def pop(self, index: Any = -1) -> Any:
+        item = super().pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.reindex()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self.reindex()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.reindex()
+
+    def __imul__(self, count: Any) -> "ItemList":  # type: ignore[misc]
+        super().__imul__(count)
+        self.reindex()
+        return self
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.reindex()
+
+
+def find_named(items: Iterable[Any], term: str) -> Optional[Any]:
+    """
+    The first of ``items`` whose name or a synonym contains ``term``.
+
+    Uses the index when ``items`` is an ItemList, else scans.
+    """
+    if isinstance(items, ItemList):
+        return items.find(term)
+    return _scan(items, term)
+
+
+def _scan(items: Iterable[Any], term: str) -> Optional[Any]:
+    for item in items:
+        if hasattr(item, "matches_name") and item.matches_name(term):
+            return item
+    return None
@@ -1,8 +1,9 @@
 # backend/models/Mobile.py
 
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from models.StatefulItem import StatefulItem
 from models.Item import Item
+from models.ItemIndex import item_index
 import random
 import logging
 
@@ -14,6 +15,27 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class MobLoot:
+    """The holder (see models.ItemIndex) of a mob's loot table and shop stock."""
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: "Mobile") -> None:
+        self.owner = owner
+
+    def items(self) -> List[Any]:
+        entries = self.owner.loot_table + self.owner.shop_stock
+        return [entry.get("item") for entry in entries]
+
+    def holds(self, item: Any) -> bool:
+        return any(entry is item for entry in self.items())
+
+    def register(self) -> None:
+        for item in self.items():
+            if isinstance(item, Item):
+                item_index.add(item, self)
+
+
 class Mobile(StatefulItem):
     """
     Mobile (Mob) - An NPC that can move, fight, and interact with players.
@@ -35,9 +57,10 @@ class Mobile(StatefulItem):
     patrol_rooms: List[str]
     movement_interval: int
     last_move_tick: int
+    last_ai_tick: int
     current_patrol_index: int
     loot_table: List[Dict[str, Any]]
-    current_room: Optional[str]
+    room_observer: Optional[Callable[["Mobile", Optional[str], Optional[str]], None]]
     pronouns: str
 
     def __init__(
@@ -134,12 +157,19 @@ class Mobile(StatefulItem):
         self.patrol_rooms = patrol_rooms if patrol_rooms else []
         self.movement_interval = movement_interval
         self.last_move_tick = 0
+        # Last tick the AI loop accounted for; a dormant mob is fast-forwarded
+        # from here when a player comes within range.
+        self.last_ai_tick = 0
         self.current_patrol_index = 0
 
         # Loot
         self.loot_table = loot_table if loot_table else []
+        self.loot = MobLoot(self)
+        self.loot.register()
 
-        # Location and identity
+        # Location and identity. The mob table (MobRegistry) subscribes to
+        # room changes to keep its room index current.
+        self.room_observer = None
         self.current_room = current_room
         self.pronouns = pronouns
 
@@ -249,6 +279,29 @@ class Mobile(StatefulItem):
         )
         return self.patrol_rooms[self.current_patrol_index]
 
+    @property
+    def current_room(self) -> Optional[str]:
+        return self._current_room
+
+    @current_room.setter
+    def current_room(self, room_id: Optional[str]) -> None:
+        old_room: Optional[str] = getattr(self, "_current_room", None)
+        self._current_room = room_id
+        if self.room_observer is not None and old_room != room_id:
+            self.room_observer(self, old_room, room_id)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and pickles start unobserved; the registry that adopts them
+        # subscribes again.
+        state = self.__dict__.copy()
+        state["room_observer"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.loot = MobLoot(self)  # Not the original's, for copies
+        self.loot.register()
+
     def move_to_room(self, room_id: str, current_tick: int) -> None:
         """
         Move the mob to a new room.
@@ -262,6 +315,37 @@ class Mobile(StatefulItem):
         self.last_move_tick = current_tick
         logger.info(f"{self.name} moved from {old_room} to {room_id}")
 
+    def fast_forward(self, to_tick: int) -> Optional[str]:
+        """
+        Catch up on the AI ticks after ``last_ai_tick`` up to ``to_tick``
+        without simulating them one by one.
+
+        Aggro counters run down and the patrol advances by as many steps as
+        should_move() would have allowed. Returns the patrol room the mob
+        should now stand in, or None if it would not have moved; the caller
+        relocates it.
+        """
+        elapsed = to_tick - self.last_ai_tick
+        if elapsed <= 0 or self.state != "alive":
+            return None
+        self.last_ai_tick = to_tick
+
+        if self.aggro_tick_counter is not None and self.aggro_tick_counter > 0:
+            self.aggro_tick_counter = max(0, self.aggro_tick_counter - elapsed)
+
+        if not self.should_move(to_tick):
+            return None  # No patrol, held in place, or not due yet
+        interval = max(self.movement_interval, 1)
+        first_move = max(to_tick - elapsed + 1, self.last_move_tick + interval)
+        if first_move > to_tick:
+            return None
+        moves = (to_tick - first_move) // interval + 1
+        self.current_patrol_index = (self.current_patrol_index + moves) % len(
+            self.patrol_rooms
+        )
+        self.last_move_tick = first_move + (moves - 1) * interval
+        return self.patrol_rooms[self.current_patrol_index]
+
     def take_damage(self, amount: int) -> Tuple[bool, int]:
         """
         Apply damage to the mob.
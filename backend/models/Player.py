@@ -2,10 +2,19 @@
 
 import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from models.Levels import levels
 from models.Item import Item
+from models.ItemList import ItemList
 from globals import SPAWN_ROOM
+from managers.session_registry import find_player_sid
+from services import state_version
+
+# Attributes written to storage by Player.to_dict (inventory is never saved).
+# Assigning any of them marks the player dirty for the write-behind flusher.
+PERSISTED_FIELDS = frozenset(
+    {"name", "email", "sex", "points", "level", "current_room", "flags", "gold"}
+)
 
 
 class Player:
@@ -13,7 +22,7 @@ class Player:
     email: Optional[str]
     sex: str
     points: int
-    inventory: List[Item]
+    _inventory: ItemList  # Of Item
     stamina: int
     max_stamina: int
     strength: int
@@ -25,10 +34,20 @@ class Player:
     current_level_at: int
     next_level_at: int
     created_at: datetime
-    current_room: str
     last_active: datetime
     flags: Dict[str, bool]
     gold: int
+    # Notified as (player, old_room, new_room) whenever current_room changes;
+    # the session registry uses it to keep its room occupancy index current.
+    room_observer: Optional[Callable[["Player", Optional[str], Optional[str]], None]]
+    # True when persisted fields changed since PlayerManager last wrote them.
+    dirty: bool
+    # Invisibility, kept by services.invisibility_service: the archmage toggle
+    # (for this session only) and the deadline of the invisibility item being
+    # carried, cached as of inventory version invisibility_stamp.
+    invisible_by_command: bool
+    invisible_until: Optional[float]
+    invisibility_stamp: Optional[int]
 
     def __init__(
         self,
@@ -41,6 +60,7 @@ class Player:
         self.email = email
         self.sex = sex
         self.points = 0
+        self.invisible_by_command = False
         self.inventory = []  # List of Item objects
         self.stamina = levels[0]["stamina"]
         self.max_stamina = levels[0]["stamina"]
@@ -55,6 +75,7 @@ class Player:
         self.current_level_at = 0
         self.next_level_at = 400
         self.created_at = datetime.now()
+        self.room_observer = None
         self.current_room = spawn_room  # Always start at spawn room on login/restart
         self.last_active = datetime.now()
         # Persistent progression flags (blessings, story gates) — survive logout.
@@ -62,6 +83,21 @@ class Player:
         # Currency for shops. Persists across logout; zeroed on combat death.
         self.gold = 0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in PERSISTED_FIELDS:
+            object.__setattr__(self, "dirty", True)
+
+    def mark_dirty(self) -> None:
+        """Flag the player for the next save (for in-place mutations)."""
+        self.dirty = True
+
+    def set_flag(self, flag: str, value: bool = True) -> None:
+        """Set a persistent progression flag and mark the player dirty."""
+        self.flags[flag] = value
+        self.dirty = True
+        state_version.bump(state_version.FLAGS)
+
     def level_up(
         self,
         sio: Optional[Any] = None,
@@ -118,12 +154,11 @@ class Player:
         # Send level up notification if level changed
         if leveled_up and sio and online_sessions:
             # Find the player's session ID
-            for sid, session in online_sessions.items():
-                if session.get("player") == self:
-                    # Send the level up notification to the player
-                    notification = f"Your level of experience is now {self.level}."
-                    asyncio.create_task(sio.emit("message", notification, room=sid))
-                    break
+            sid = find_player_sid(self, online_sessions)
+            if sid:
+                # Send the level up notification to the player
+                notification = f"Your level of experience is now {self.level}."
+                asyncio.create_task(sio.emit("message", notification, room=sid))
 
         # Return whether the level changed
         return leveled_up
@@ -158,11 +193,10 @@ class Player:
         # Send points notification if requested
         if send_notification and sio and online_sessions:
             # Find the player's session ID
-            for sid, session in online_sessions.items():
-                if session.get("player") == self:
-                    # Send just the points notification to the player
-                    asyncio.create_task(sio.emit("message", notification, room=sid))
-                    break
+            sid = find_player_sid(self, online_sessions)
+            if sid:
+                # Send just the points notification to the player
+                asyncio.create_task(sio.emit("message", notification, room=sid))
 
         # Call level_up to recalculate level based on new point total
         # Pass sio and online_sessions so level_up can send its own notification
@@ -203,6 +237,29 @@ class Player:
         self.inventory.clear()
         return dropped_items
 
+    @property
+    def inventory(self) -> ItemList:
+        """Carried items, indexed by name (see models.ItemList)."""
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, items: Iterable[Item]) -> None:
+        self._inventory = items if isinstance(items, ItemList) else ItemList(items)
+        self._inventory.owner = self
+        self.invisible_until = None
+        self.invisibility_stamp = None
+
+    @property
+    def current_room(self) -> str:
+        return self._current_room
+
+    @current_room.setter
+    def current_room(self, room_id: str) -> None:
+        old_room: Optional[str] = getattr(self, "_current_room", None)
+        self._current_room = room_id
+        if self.room_observer is not None and old_room != room_id:
+            self.room_observer(self, old_room, room_id)
+
     def set_current_room(self, room_id: str) -> None:
         self.current_room = room_id
 
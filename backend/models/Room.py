@@ -1,16 +1,43 @@
 # Update models/Room.py to add hidden items support
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from models.Item import Item
+from models.ItemIndex import item_index
+from models.ItemList import ItemList, find_named
+from services import state_version
 
 if False:  # TYPE_CHECKING
     pass
 
 
+class HiddenItems:
+    """The holder (see models.ItemIndex) of a room's hidden items."""
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner: "Room") -> None:
+        self.owner = owner
+
+    def holds(self, item: Any) -> bool:
+        return any(hidden is item for hidden, _ in self.owner.hidden_items.values())
+
+
 class Room:
     room_id: str
     name: str
     description: str
-    items: List[Any]  # List["Item"]
+    _items: ItemList  # Of "Item"
     hidden_items: Dict[
         str, Tuple[Any, Callable[[Any], bool]]
     ]  # Dict[str, Tuple["Item", Callable[["GameState"], bool]]]
@@ -36,6 +63,13 @@ class Room:
         self.description = description
         self.items = []  # Holds all visible items in the room
         self.hidden_items = {}  # Maps item_id to (item, condition_func) pairs
+        self.hidden = HiddenItems(self)
+        # Bumped by add/remove_hidden_item; get_items caches on it
+        self._hidden_version = 0
+        # (game_state, items list, stamp, visible items) from the last get_items
+        self._visible: Optional[
+            Tuple[Any, ItemList, Tuple[int, ...], Tuple[Any, ...]]
+        ] = None
         self.exits = exits if exits is not None else {}
         self.is_dark = is_dark  # Whether room requires light source to see
         self.is_outdoor = is_outdoor  # Whether room is outdoors (for swamp command)
@@ -85,12 +119,42 @@ class Room:
             trigger["reciprocal_exit"] = reciprocal_exit
         self.speech_triggers[key].append(trigger)
 
+    @property
+    def items(self) -> ItemList:
+        """Visible items, indexed by name (see models.ItemList)."""
+        return self._items
+
+    @items.setter
+    def items(self, items: Iterable[Any]) -> None:
+        self._items = items if isinstance(items, ItemList) else ItemList(items)
+        self._items.owner = self
+
+    def find_item(self, term: str, game_state: Optional[Any] = None) -> Optional[Any]:
+        """
+        The first item get_items(game_state) would list whose name or a
+        synonym contains ``term``. Hidden items' conditions are only
+        evaluated for the ones whose name matches.
+        """
+        item = find_named(self._items, term)
+        if item is None and game_state:
+            for hidden, condition in self.hidden_items.values():
+                if (
+                    hasattr(hidden, "matches_name")
+                    and hidden.matches_name(term)
+                    and state_version.condition_holds(condition, game_state)
+                ):
+                    return hidden
+        return item
+
     def add_item(self, item: Any) -> None:  # item: "Item"
         """Add a visible item to the room."""
         self.items.append(item)
 
     def add_hidden_item(
-        self, item: Any, condition_func: Callable[[Any], bool]
+        self,
+        item: Any,
+        condition_func: Callable[[Any], bool],
+        item_id: Optional[str] = None,
     ) -> None:  # item: "Item", condition_func: Callable[["GameState"], bool]
         """
         Add a hidden item that only appears when a condition is met.
@@ -98,8 +162,12 @@ class Room:
         Args:
             item: The item to add
             condition_func: A function that takes (game_state) and returns True when item should be visible
+            item_id: Key in hidden_items (defaults to item.id)
         """
-        self.hidden_items[item.id] = (item, condition_func)
+        self.hidden_items[item_id or item.id] = (item, condition_func)
+        self._hidden_version += 1
+        if isinstance(item, Item):
+            item_index.add(item, self.hidden)
 
     def remove_item(self, item: Any) -> bool:  # item: "Item"
         """Remove an item from the room."""
@@ -112,6 +180,7 @@ class Room:
         """Remove a hidden item from the room."""
         if item_id in self.hidden_items:
             del self.hidden_items[item_id]
+            self._hidden_version += 1
             return True
         return False
 
@@ -122,14 +191,48 @@ class Room:
         Get all visible items in the room, including hidden items
         whose conditions are satisfied.
         """
-        visible_items: List[Any] = list(self.items)
+        return list(self.visible_items(game_state))
+
+    def visible_items(self, game_state: Optional[Any] = None) -> Tuple[Any, ...]:
+        """
+        get_items as a tuple, cached until the room's items or hidden items
+        change or, when every hidden condition declared its dependencies
+        (services.state_version.depends_on), until one of those is bumped.
+        """
+        stamp = (
+            self._items.version,
+            self._hidden_version,
+            len(self.hidden_items),
+            state_version.global_version(),
+        )
+        cached = self._visible
+        if (
+            cached is not None
+            and cached[0] is game_state
+            and cached[1] is self._items
+            and cached[2] == stamp
+        ):
+            return cached[3]
 
+        visible_items: List[Any] = list(self._items)
+        cacheable = True
         if game_state:
-            for item_id, (item, condition) in self.hidden_items.items():
-                if condition(game_state):
+            for item, condition in self.hidden_items.values():
+                if state_version.dependencies(condition) is None:
+                    cacheable = False
+                if state_version.condition_holds(condition, game_state):
                     visible_items.append(item)
 
-        return visible_items
+        result = tuple(visible_items)
+        self._visible = (game_state, self._items, stamp, result) if cacheable else None
+        return result
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Unpickled rooms skip add_hidden_item; re-register their hidden items.
+        self.__dict__.update(state)
+        for item, _condition in self.hidden_items.values():
+            if isinstance(item, Item):
+                item_index.add(item, self.hidden)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the room to a dictionary for serialization."""
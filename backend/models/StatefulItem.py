@@ -2,6 +2,7 @@
 
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from models.Item import Item
+from services import state_version
 import logging
 
 if False:  # TYPE_CHECKING
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 class StatefulItem(Item):
-    state: Optional[str]
+    _state: Optional[str]
     state_descriptions: Dict[str, str]
     interactions: Dict[str, List[Dict[str, Any]]]
     room_id: Optional[str]
@@ -44,6 +45,17 @@ class StatefulItem(Item):
             # When a state is provided, use the given description for that state.
             self.state_descriptions[state] = description
 
+    @property
+    def state(self) -> Optional[str]:
+        return self._state
+
+    @state.setter
+    def state(self, new_state: Optional[str]) -> None:
+        # Hidden-item conditions that read item states are cached on this.
+        if getattr(self, "_state", None) != new_state:
+            state_version.bump(state_version.STATE)
+        self._state = new_state
+
     def add_state_description(self, state: str, description: str) -> None:
         """Add a description for a specific state."""
         self.state_descriptions[state] = description
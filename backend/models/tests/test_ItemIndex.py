@@ -0,0 +1,134 @@
+"""
+Tests for the world-wide item index.
+
+Tests cover:
+- Lookups by id, exact name and substring
+- Holders following items as they move
+- Hidden items and mob loot as holders
+"""
+
+import gc
+import pickle
+import sys
+import unittest
+import weakref
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from models.ContainerItem import ContainerItem
+from models.Item import Item
+from models.ItemIndex import item_index
+from models.Mobile import Mobile
+from models.Player import Player
+from models.Room import Room
+
+
+class ItemIndexLookupTest(unittest.TestCase):
+    """Test items are found by id and name once placed."""
+
+    def setUp(self):
+        self.room = Room("hall", "Hall", "A hall.")
+        self.lamp = Item("brass lamp", "Lamp_7", "A lamp.", synonyms=["lantern"])
+        self.room.add_item(self.lamp)
+
+    def test_with_id_is_case_insensitive(self):
+        """Test an item is found by its id in any case."""
+        self.assertIn(self.lamp, item_index.with_id("lamp_7"))
+
+    def test_named_matches_name_and_synonyms(self):
+        """Test exact name and synonym lookups."""
+        self.assertIn(self.lamp, item_index.named("Brass Lamp"))
+        self.assertIn(self.lamp, item_index.named("lantern"))
+        self.assertNotIn(self.lamp, item_index.named("brass"))
+
+    def test_matching_finds_substrings(self):
+        """Test substring lookups, including mid-word ones."""
+        self.assertIn(self.lamp, item_index.matching("ass la"))
+        self.assertIn(self.lamp, item_index.matching("tern"))
+
+    def test_removed_items_are_not_returned(self):
+        """Test an item in no holder is not a match."""
+        self.room.remove_item(self.lamp)
+
+        self.assertNotIn(self.lamp, item_index.with_id("lamp_7"))
+
+    def test_collected_items_leave_the_index(self):
+        """Test the index does not keep items alive."""
+        ghost = Item("ghostly orb", "orb_1", "An orb.")
+        self.room.add_item(ghost)
+        self.room.remove_item(ghost)
+        ref = weakref.ref(ghost)
+        del ghost
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_rename_reindexes(self):
+        """Test ItemList.reindex picks up a changed name."""
+        self.lamp.name = "copper lamp"
+        self.room.items.reindex()
+
+        self.assertIn(self.lamp, item_index.named("copper lamp"))
+        self.assertNotIn(self.lamp, item_index.named("brass lamp"))
+
+
+class ItemIndexHolderTest(unittest.TestCase):
+    """Test holders and holder chains."""
+
+    def setUp(self):
+        self.room = Room("hall", "Hall", "A hall.")
+        self.token = Item("token", "token_1", "A token.")
+
+    def test_holder_follows_moves(self):
+        """Test the holder is the list the item was last added to."""
+        player = Player("Tester")
+        self.room.add_item(self.token)
+        self.assertIs(item_index.holder(self.token).owner, self.room)
+
+        self.room.remove_item(self.token)
+        self.assertIsNone(item_index.holder(self.token))
+        player.inventory.append(self.token)
+
+        self.assertIs(item_index.holder(self.token).owner, player)
+
+    def test_chain_runs_through_containers(self):
+        """Test the chain goes from the item out to the room."""
+        bag = ContainerItem("bag", "bag_1", "A bag.")
+        bag.items.append(self.token)
+        self.room.add_item(bag)
+
+        chain = item_index.chain(self.token)
+
+        self.assertEqual([holder.owner for holder in chain], [bag, self.room])
+
+    def test_hidden_items_are_held_by_the_room(self):
+        """Test a hidden item's holder is the room's hidden holder."""
+        self.room.add_hidden_item(self.token, lambda gs: False)
+
+        self.assertIs(item_index.holder(self.token), self.room.hidden)
+
+        self.room.remove_hidden_item("token_1")
+        self.assertIsNone(item_index.holder(self.token))
+
+    def test_mob_loot_is_held_by_the_mob(self):
+        """Test loot table items are held by the mob's loot holder."""
+        mob = Mobile(
+            "wolf", "wolf_1", "A wolf.", loot_table=[{"item": self.token, "chance": 1}]
+        )
+
+        self.assertIs(item_index.holder(self.token).owner, mob)
+
+    def test_unpickled_rooms_reregister_hidden_items(self):
+        """Test a pickled room's hidden items are indexed again on load."""
+        self.room.add_hidden_item(self.token, None)
+
+        restored = pickle.loads(pickle.dumps(self.room))
+
+        (copy, _condition) = restored.hidden_items["token_1"]
+        self.assertIs(item_index.holder(copy), restored.hidden)
+        self.assertIs(restored.hidden.owner, restored)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+Tests for ItemList, the name-indexed item list.
+
+Tests cover:
+- Finding items by word prefix, mid-word substring, synonym and multi-word terms
+- The index following appends, removals, pops and reordering
+- Matches resolving in list order, as a scan would
+- Non-Item entries falling back to a scan
+- Pickling
+- Rooms, inventories and containers holding ItemLists
+"""
+
+import pickle
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from models.ContainerItem import ContainerItem
+from models.Item import Item
+from models.ItemList import ItemList, find_named
+from models.Player import Player
+from models.Room import Room
+
+
+class ItemListFindTest(unittest.TestCase):
+    """Test resolving a typed noun to an item."""
+
+    def setUp(self):
+        """Set up a list of items."""
+        self.sword = Item("Rusty Sword", "sword_1", "A rusty sword.")
+        self.lamp = Item("Brass Lamp", "lamp_1", "A lamp.", synonyms=["lantern"])
+        self.items = ItemList([self.sword, self.lamp])
+
+    def test_find_by_word_prefix(self):
+        """Test a prefix of any word of the name finds the item."""
+        self.assertIs(self.items.find("sw"), self.sword)
+        self.assertIs(self.items.find("RUSTY"), self.sword)
+
+    def test_find_by_synonym(self):
+        """Test synonyms are indexed too."""
+        self.assertIs(self.items.find("lant"), self.lamp)
+
+    def test_find_multi_word_term(self):
+        """Test a multi-word term is checked against the full name."""
+        self.assertIs(self.items.find("rusty sword"), self.sword)
+        self.assertIsNone(self.items.find("rusty lamp"))
+
+    def test_mid_word_term_still_matches(self):
+        """Test a substring that starts mid-word is found through the index."""
+        self.assertIs(self.items.find("ord"), self.sword)
+
+    def test_mid_word_match_listed_first_wins(self):
+        """Test a whole-word match does not jump ahead of an earlier item."""
+        broadsword = Item("Broadsword", "sword_3", "A broadsword.")
+        sword = Item("Sword", "sword_4", "A sword.")
+        items = ItemList([broadsword, sword])
+
+        self.assertIs(items.find("sword"), broadsword)
+        self.assertIs(items.find("sword"), find_named(list(items), "sword"))
+
+    def test_first_match_in_list_order(self):
+        """Test the earliest of several matching items is returned."""
+        other = Item("Short Sword", "sword_2", "A short sword.")
+        items = ItemList([other, self.sword])
+
+        self.assertIs(items.find("sword"), other)
+
+    def test_index_probe_avoids_scanning(self):
+        """Test only candidates sharing the prefix are checked."""
+        crowd = [Item(f"Pebble {n}", f"pebble_{n}", "A pebble.") for n in range(50)]
+        items = ItemList(crowd + [self.sword])
+        for pebble in crowd:
+            pebble.matches_name = Mock(return_value=False)
+
+        self.assertIs(items.find("sword"), self.sword)
+
+        for pebble in crowd:
+            pebble.matches_name.assert_not_called()
+
+    def test_non_item_entries_are_scanned(self):
+        """Test test doubles with matches_name are still found."""
+        double = MagicMock()
+        double.matches_name.return_value = True
+
+        self.assertIs(find_named(ItemList([double]), "anything"), double)
+
+
+class ItemListMaintenanceTest(unittest.TestCase):
+    """Test the index follows list mutations."""
+
+    def setUp(self):
+        """Set up an item and an empty list."""
+        self.sword = Item("Sword", "sword_1", "A sword.")
+        self.items = ItemList()
+
+    def test_append_and_remove(self):
+        """Test items are found only while they are in the list."""
+        self.items.append(self.sword)
+        self.assertIs(self.items.find("sword"), self.sword)
+
+        self.items.remove(self.sword)
+        self.assertIsNone(self.items.find("sword"))
+        self.assertEqual(self.items._index, {})
+
+    def test_pop_and_clear(self):
+        """Test pop and clear drop items from the index."""
+        self.items.extend([self.sword, Item("Shield", "shield_1", "A shield.")])
+
+        self.items.pop(0)
+        self.assertIsNone(self.items.find("sword"))
+        self.items.clear()
+        self.assertIsNone(self.items.find("shield"))
+
+    def test_duplicate_entries(self):
+        """Test an item listed twice stays indexed until both are removed."""
+        self.items.extend([self.sword, self.sword])
+
+        self.items.remove(self.sword)
+        self.assertIs(self.items.find("sword"), self.sword)
+        self.items.remove(self.sword)
+        self.assertIsNone(self.items.find("sword"))
+
+    def test_removing_one_duplicate_keeps_list_order(self):
+        """Test the remaining copy of an item ranks by its list position."""
+        shield = Item("Sword Shield", "shield_1", "A shield.")
+        self.items.extend([self.sword, shield, self.sword])
+
+        self.items.remove(self.sword)
+
+        self.assertIs(self.items.find("sword"), shield)
+
+    def test_insert_at_front_keeps_list_order(self):
+        """Test inserting ahead of a match makes the new item win."""
+        self.items.append(self.sword)
+        short = Item("Short Sword", "sword_2", "A short sword.")
+
+        self.items.insert(0, short)
+
+        self.assertIs(self.items.find("sword"), short)
+
+    def test_reindex_after_rename(self):
+        """Test reindex picks up a renamed item."""
+        self.items.append(self.sword)
+        self.sword.name = "Blade"
+
+        self.items.reindex()
+
+        self.assertIs(self.items.find("bla"), self.sword)
+
+    def test_pickle_round_trip(self):
+        """Test a pickled list comes back indexed."""
+        self.items.append(self.sword)
+
+        restored = pickle.loads(pickle.dumps(self.items))
+
+        self.assertIsInstance(restored, ItemList)
+        self.assertEqual(restored.find("sword").id, "sword_1")
+
+
+class ItemListHoldersTest(unittest.TestCase):
+    """Test rooms, inventories and containers keep their items in ItemLists."""
+
+    def test_assigned_lists_are_wrapped(self):
+        """Test assigning a plain list stores an ItemList."""
+        sword = Item("Sword", "sword_1", "A sword.")
+        room = Room("hall", "Hall", "A hall.")
+        player = Player("Tester")
+        bag = ContainerItem("Bag", "bag_1", "A bag.")
+
+        room.items = [sword]
+        player.inventory = [sword]
+        bag.items = [sword]
+
+        for items in (room.items, player.inventory, bag.items):
+            self.assertIsInstance(items, ItemList)
+            self.assertIs(items.find("sword"), sword)
+
+    def test_room_find_item_checks_hidden_items_lazily(self):
+        """Test only matching hidden items have their condition evaluated."""
+        room = Room("hall", "Hall", "A hall.")
+        gem = Item("Gem", "gem_1", "A gem.")
+        key = Item("Key", "key_1", "A key.")
+        gem_condition = Mock(return_value=True)
+        key_condition = Mock(return_value=True)
+        room.add_hidden_item(gem, gem_condition)
+        room.add_hidden_item(key, key_condition)
+
+        found = room.find_item("gem", game_state=object())
+
+        self.assertIs(found, gem)
+        gem_condition.assert_called_once()
+        key_condition.assert_not_called()
+
+    def test_room_find_item_prefers_visible_items(self):
+        """Test visible items come before hidden ones, as in get_items."""
+        room = Room("hall", "Hall", "A hall.")
+        visible = Item("Gem", "gem_1", "A gem.")
+        room.add_item(visible)
+        room.add_hidden_item(Item("Gem", "gem_2", "A gem."), lambda gs: True)
+
+        self.assertIs(room.find_item("gem", game_state=object()), visible)
+
+
+if __name__ == "__main__":
+    unittest.main()
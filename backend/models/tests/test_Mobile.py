@@ -4,7 +4,7 @@ Comprehensive tests for Mobile model - CRITICAL.
 Tests cover:
 - Mobile initialization
 - Combat behavior
-- Movement/patrol
+- Movement/patrol and dormant fast-forwarding
 - Aggression mechanics
 - Loot drops
 - Damage/death
@@ -316,6 +316,66 @@ class MobileMovementTest(unittest.TestCase):
         self.assertEqual(mob.last_move_tick, 15)
 
 
+class MobileFastForwardTest(unittest.TestCase):
+    """Test Mobile.fast_forward matches tick-by-tick simulation."""
+
+    def _mob(self, interval):
+        mob = Mobile(
+            "Orc",
+            "orc_1",
+            "desc",
+            aggressive=True,
+            patrol_rooms=["a", "b", "c"],
+            movement_interval=interval,
+            current_room="a",
+        )
+        mob.aggro_tick_counter = 7
+        return mob
+
+    def _simulate(self, mob, ticks):
+        for tick in range(1, ticks + 1):
+            mob.tick_aggro_counter()
+            if mob.should_move(tick):
+                mob.move_to_room(mob.choose_next_room(), tick)
+
+    def test_fast_forward_matches_stepwise_ticks(self):
+        """Test patrol position and timers equal the step-by-step result."""
+        for interval in (0, 1, 3, 10):
+            for ticks in (1, 2, 9, 10, 31):
+                stepped, skipped = self._mob(interval), self._mob(interval)
+                self._simulate(stepped, ticks)
+
+                room = skipped.fast_forward(ticks)
+
+                with self.subTest(interval=interval, ticks=ticks):
+                    self.assertEqual(room or "a", stepped.current_room)
+                    self.assertEqual(
+                        skipped.current_patrol_index, stepped.current_patrol_index
+                    )
+                    self.assertEqual(skipped.last_move_tick, stepped.last_move_tick)
+                    self.assertEqual(
+                        skipped.aggro_tick_counter, stepped.aggro_tick_counter
+                    )
+                    self.assertEqual(skipped.last_ai_tick, ticks)
+
+    def test_fast_forward_holds_mob_in_combat(self):
+        """Test a mob with a target only runs down its aggro timer."""
+        mob = self._mob(1)
+        mob.target_player = Mock()
+
+        self.assertIsNone(mob.fast_forward(20))
+        self.assertEqual(mob.current_patrol_index, 0)
+        self.assertEqual(mob.aggro_tick_counter, 0)
+
+    def test_fast_forward_is_noop_when_caught_up(self):
+        """Test nothing changes without elapsed ticks."""
+        mob = self._mob(1)
+        mob.last_ai_tick = 5
+
+        self.assertIsNone(mob.fast_forward(5))
+        self.assertEqual(mob.aggro_tick_counter, 7)
+
+
 class MobileCombatTest(unittest.TestCase):
     """Test Mobile combat mechanics."""
 
@@ -654,6 +654,52 @@ class PlayerFlagsTest(unittest.TestCase):
         self.assertEqual(restored.flags, {})
 
 
+class PlayerDirtyTrackingTest(unittest.TestCase):
+    """Test dirty flags used by the write-behind player flusher."""
+
+    def test___init___marks_new_player_dirty(self):
+        """Test a freshly created player needs saving."""
+        self.assertTrue(Player("Newbie").dirty)
+
+    def test___setattr___marks_persisted_field_dirty(self):
+        """Test assigning a persisted field sets dirty."""
+        player = Player("Walker")
+        player.dirty = False
+
+        player.set_current_room("tavern")
+
+        self.assertTrue(player.dirty)
+
+    def test___setattr___ignores_transient_field(self):
+        """Test stamina and other unsaved fields leave dirty alone."""
+        player = Player("Fighter")
+        player.dirty = False
+
+        player.stamina -= 1
+        player.visited.add("square")
+
+        self.assertFalse(player.dirty)
+
+    def test_set_flag_sets_flag_and_marks_dirty(self):
+        """Test set_flag covers the in-place flags mutation."""
+        player = Player("Pilgrim")
+        player.dirty = False
+
+        player.set_flag("dawnfather_blessing")
+
+        self.assertTrue(player.flags["dawnfather_blessing"])
+        self.assertTrue(player.dirty)
+
+    def test_mark_dirty_sets_dirty(self):
+        """Test mark_dirty flags the player explicitly."""
+        player = Player("Pilgrim")
+        player.dirty = False
+
+        player.mark_dirty()
+
+        self.assertTrue(player.dirty)
+
+
 class PlayerGoldTest(unittest.TestCase):
     """Test the gold currency attribute and its persistence."""
 
@@ -17,7 +17,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from models.Room import Room
 from models.Item import Item
+from models.StatefulItem import StatefulItem
 from managers.game_state import GameState
+from services.state_version import STATE, depends_on
 
 
 class RoomInitializationTest(unittest.TestCase):
@@ -210,6 +212,64 @@ class RoomHiddenItemsTest(unittest.TestCase):
         self.assertIn(hidden_item, all_items)
 
 
+class RoomVisibleItemsCacheTest(unittest.TestCase):
+    """Test get_items caches hidden-item visibility on state versions."""
+
+    def setUp(self):
+        """Set up a room with a chest whose state reveals a hidden gem."""
+        self.room = Room("vault", "Vault", "A quiet vault")
+        self.chest = StatefulItem("Chest", "chest_1", "A chest", state="closed")
+        self.gem = Item("Gem", "gem_1", "A hidden gem")
+        self.room.add_item(self.chest)
+        self.game_state = GameState()
+        self.calls = 0
+
+        @depends_on(STATE)
+        def chest_opened(gs):
+            self.calls += 1
+            return self.chest.state == "open"
+
+        self.room.add_hidden_item(self.gem, chest_opened)
+
+    def test_declared_condition_is_not_rerun_until_state_changes(self):
+        """Test repeated get_items reuse the result until an item state changes."""
+        self.assertNotIn(self.gem, self.room.get_items(self.game_state))
+        self.room.get_items(self.game_state)
+        self.assertEqual(self.calls, 1)
+
+        self.chest.state = "open"
+
+        self.assertIn(self.gem, self.room.get_items(self.game_state))
+        self.assertEqual(self.calls, 2)
+
+    def test_item_changes_invalidate_the_cache(self):
+        """Test adding an item is seen without any state bump."""
+        self.room.get_items(self.game_state)
+        torch = Item("Torch", "torch_1", "A torch")
+
+        self.room.add_item(torch)
+
+        self.assertIn(torch, self.room.get_items(self.game_state))
+
+    def test_undeclared_condition_is_always_rerun(self):
+        """Test a plain condition is evaluated on every call."""
+        calls = []
+        self.room.add_hidden_item(
+            Item("Coin", "coin_1", "A coin"), lambda gs: calls.append(gs)
+        )
+
+        self.room.get_items(self.game_state)
+        self.room.get_items(self.game_state)
+
+        self.assertEqual(len(calls), 2)
+
+    def test_returned_list_is_a_copy(self):
+        """Test callers may mutate the list get_items returns."""
+        self.room.get_items(self.game_state).clear()
+
+        self.assertIn(self.chest, self.room.get_items(self.game_state))
+
+
 class RoomExitsTest(unittest.TestCase):
     """Test room exit management and navigation."""
 
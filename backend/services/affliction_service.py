@@ -6,12 +6,19 @@ Service for managing afflictions (DEAF, BLIND, DUMB, CRIPPLE, MAGIC_SLEEP).
 Players store afflictions in online_sessions[sid]["afflictions"]; mobs store
 them directly on Mobile.afflictions. Both use the same record shape
 (applied_at, expires_at, caster) via the shared _apply/_is_active primitives.
+When a scheduler is installed every affliction also registers its expiry
+deadline, so the tick only visits afflictions that are actually due.
 """
 
 import logging
 import time
 from typing import Any, Awaitable, Callable, Dict, Optional, Set
 
+# Session lookups live in the session registry; re-exported for callers.
+from managers.session_registry import find_player_by_name as find_player_by_name
+from managers.session_registry import find_player_sid as find_player_sid
+from services.scheduler import AFFLICTION, MOB_AFFLICTION, get_scheduler
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,14 +51,23 @@ def _apply_to_store(
     affliction_type: str,
     duration_seconds: int,
     caster_name: str,
+    owner: Any = None,
+    kind: str = AFFLICTION,
 ) -> bool:
-    """Write an affliction record into a store (session sub-dict or mob dict)."""
+    """
+    Write an affliction record into a store (session sub-dict or mob dict)
+    and register its expiry with the scheduler, if one is installed.
+    """
     current_time = time.time()
+    expires_at = current_time + duration_seconds
     store[affliction_type] = {
         "applied_at": current_time,
-        "expires_at": current_time + duration_seconds,
+        "expires_at": expires_at,
         "caster": caster_name,
     }
+    scheduler = get_scheduler()
+    if scheduler is not None and owner is not None:
+        scheduler.schedule(kind, (id(owner), affliction_type), expires_at, owner)
     logger.debug(
         f"Applied {affliction_type} affliction for {duration_seconds}s by {caster_name}"
     )
@@ -87,7 +103,9 @@ def apply_affliction(
         True if affliction was applied successfully
     """
     store = session.setdefault("afflictions", {})
-    return _apply_to_store(store, affliction_type, duration_seconds, caster_name)
+    return _apply_to_store(
+        store, affliction_type, duration_seconds, caster_name, owner=session
+    )
 
 
 def has_affliction(session: Dict[str, Any], affliction_type: str) -> bool:
@@ -114,7 +132,12 @@ def apply_affliction_to_mob(
     if not isinstance(getattr(mob, "afflictions", None), dict):
         mob.afflictions = {}
     return _apply_to_store(
-        mob.afflictions, affliction_type, duration_seconds, caster_name
+        mob.afflictions,
+        affliction_type,
+        duration_seconds,
+        caster_name,
+        owner=mob,
+        kind=MOB_AFFLICTION,
     )
 
 
@@ -214,6 +237,51 @@ def get_affliction_time_remaining(
     return max(0.0, remaining)
 
 
+AFFLICTION_EXPIRY_MESSAGES = {
+    "deaf": "Your hearing returns to normal.",
+    "blind": "Your vision clears.",
+    "dumb": "You find your voice again.",
+    "cripple": "You can move freely again.",
+    "magic_sleep": "You wake from your magical slumber.",
+}
+
+
+def _expire_mob_afflictions(mob: Any, current_time: float) -> None:
+    store = getattr(mob, "afflictions", None)
+    if not isinstance(store, dict) or not store:
+        return
+    for aff_type in [
+        t for t, data in store.items() if current_time >= data["expires_at"]
+    ]:
+        del store[aff_type]
+        logger.debug(f"Affliction {aff_type} expired for mob {mob.name}")
+
+
+async def _expire_session_afflictions(
+    sio: Any, sid: str, session: Dict[str, Any], utils: Any, current_time: float
+) -> None:
+    afflictions = session.get("afflictions", {})
+    expired = [
+        aff_type
+        for aff_type, aff_data in afflictions.items()
+        if current_time >= aff_data["expires_at"]
+    ]
+
+    for aff_type in expired:
+        del session["afflictions"][aff_type]
+
+        # Clear magic sleep session flag if that's what expired
+        if aff_type == "magic_sleep" and session.get("sleeping"):
+            session["sleeping"] = False
+
+        # Notify player
+        message = AFFLICTION_EXPIRY_MESSAGES.get(
+            aff_type, f"The {aff_type} spell wears off."
+        )
+        await utils.send_message(sio, sid, message)
+        logger.debug(f"Affliction {aff_type} expired for {session['player'].name}")
+
+
 async def process_affliction_expiry(
     sio: Any,
     online_sessions: Dict[str, Dict[str, Any]],
@@ -224,6 +292,9 @@ async def process_affliction_expiry(
     Process affliction expiration for all players and (optionally) mobs.
     Called by tick service each tick.
 
+    With a scheduler installed only afflictions whose deadline has passed are
+    visited; otherwise every session and mob is scanned.
+
     Args:
         sio: Socket.IO server instance
         online_sessions: The global online sessions dict
@@ -232,89 +303,29 @@ async def process_affliction_expiry(
     """
     current_time = time.time()
 
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        for _key, mob in scheduler.pop_due(MOB_AFFLICTION, current_time):
+            _expire_mob_afflictions(mob, current_time)
+        for _key, session in scheduler.pop_due(AFFLICTION, current_time):
+            player = session.get("player")
+            sid = find_player_sid(player, online_sessions) if player else None
+            # Logged out (or reconnected under a new session) since applying
+            if sid is None or online_sessions[sid] is not session:
+                continue
+            await _expire_session_afflictions(sio, sid, session, utils, current_time)
+        return
+
     if mob_manager is not None:
         for mob in list(getattr(mob_manager, "mobs", {}).values()):
-            store = getattr(mob, "afflictions", None)
-            if not isinstance(store, dict) or not store:
-                continue
-            for aff_type in [
-                t for t, data in store.items() if current_time >= data["expires_at"]
-            ]:
-                del store[aff_type]
-                logger.debug(f"Affliction {aff_type} expired for mob {mob.name}")
+            _expire_mob_afflictions(mob, current_time)
 
     for sid, session in online_sessions.items():
         player = session.get("player")
         if not player:
             continue
 
-        afflictions = session.get("afflictions", {})
-        if not afflictions:
+        if not session.get("afflictions"):
             continue
 
-        expired = []
-
-        for aff_type, aff_data in afflictions.items():
-            if current_time >= aff_data["expires_at"]:
-                expired.append(aff_type)
-
-        for aff_type in expired:
-            del session["afflictions"][aff_type]
-
-            # Clear magic sleep session flag if that's what expired
-            if aff_type == "magic_sleep" and session.get("sleeping"):
-                session["sleeping"] = False
-
-            # Notify player
-            affliction_messages = {
-                "deaf": "Your hearing returns to normal.",
-                "blind": "Your vision clears.",
-                "dumb": "You find your voice again.",
-                "cripple": "You can move freely again.",
-                "magic_sleep": "You wake from your magical slumber.",
-            }
-            message = affliction_messages.get(
-                aff_type, f"The {aff_type} spell wears off."
-            )
-            await utils.send_message(sio, sid, message)
-            logger.debug(f"Affliction {aff_type} expired for {player.name}")
-
-
-def find_player_sid(
-    player: Any, online_sessions: Dict[str, Dict[str, Any]]
-) -> Optional[str]:
-    """
-    Find the session ID for a given player.
-
-    Args:
-        player: The player object to find
-        online_sessions: The global online sessions dict
-
-    Returns:
-        The session ID (sid) or None if not found
-    """
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            return sid
-    return None
-
-
-def find_player_by_name(
-    name: str, online_sessions: Dict[str, Dict[str, Any]]
-) -> tuple[Optional[Any], Optional[str]]:
-    """
-    Find a player and their session ID by name.
-
-    Args:
-        name: The player name to search for (case-insensitive)
-        online_sessions: The global online sessions dict
-
-    Returns:
-        Tuple of (player, sid) or (None, None) if not found
-    """
-    name_lower = name.lower()
-    for sid, session in online_sessions.items():
-        player = session.get("player")
-        if player and player.name.lower() == name_lower:
-            return player, sid
-    return None, None
+        await _expire_session_afflictions(sio, sid, session, utils, current_time)
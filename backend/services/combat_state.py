@@ -0,0 +1,308 @@
+# backend/services/combat_state.py
+"""
+Combat bookkeeping: who is fighting whom.
+
+``commands.combat.active_combats`` is a CombatRegistry: still a mapping of
+combat key (player name or mob id) -> that combatant's side of the fight, so
+``name in active_combats`` and ``active_combats[name]["weapon"]`` keep
+working, but every side is a Combatant and every engagement is a Combat
+object linked when its second participant is filed.
+
+- Each Combatant holds a back-reference to the Combat it is fighting in
+  (``combatant.combat``), its own session id and its weapon.
+- A Combat holds both sides, so a combat tick walks
+  ``active_combats.combats`` directly instead of re-deriving pairs from the
+  keys, sorting tuples into a ``processed`` set and searching for sids.
+
+Group fights are supported the way the old dict allowed: several players can
+engage one mob. Each engagement is its own Combat, and a side whose attention
+is on someone else just holds its ground in that Combat.
+"""
+
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+# Legacy entry keys, exposed through the mapping interface.
+FIELDS: Tuple[str, ...] = (
+    "target",
+    "target_sid",
+    "weapon",
+    "initiative",
+    "last_turn",
+    "is_mob",
+    "entity",
+    "skip_next_attack",
+)
+
+
+def combat_key(entity: Any) -> Any:
+    """The key an entity is filed under: mob id or player name."""
+    from models.Mobile import Mobile
+
+    return entity.id if isinstance(entity, Mobile) else entity.name
+
+
+class Combatant(MutableMapping[str, Any]):
+    """One side of a fight; also readable and writable as the old entry dict."""
+
+    __slots__ = (
+        "key",
+        "entity",
+        "target",
+        "target_sid",
+        "sid",
+        "weapon",
+        "initiative",
+        "last_turn",
+        "is_mob",
+        "skip_next_attack",
+        "combat",
+        "combats",
+        "_extra",
+    )
+
+    def __init__(
+        self,
+        entity: Any = None,
+        target: Any = None,
+        *,
+        sid: Optional[str] = None,
+        target_sid: Optional[str] = None,
+        weapon: Any = None,
+        initiative: bool = False,
+        is_mob: bool = False,
+        last_turn: Any = None,
+    ) -> None:
+        self.key: Any = None  # Set when filed in a registry
+        self.entity = entity
+        self.target = target
+        self.sid = sid
+        self.target_sid = target_sid
+        self.weapon = weapon
+        self.initiative = initiative
+        self.last_turn = last_turn
+        self.is_mob = is_mob
+        self.skip_next_attack = False
+        # The Combat against ``target`` (None until the target is filed)
+        self.combat: Optional["Combat"] = None
+        # Every Combat this side takes part in, including ones where it is
+        # only the target; insertion-ordered set.
+        self.combats: Dict["Combat", None] = {}
+        self._extra: Dict[str, Any] = {}
+
+    @classmethod
+    def from_entry(cls, entry: MutableMapping[str, Any]) -> "Combatant":
+        combatant = cls()
+        for name, value in entry.items():
+            combatant[name] = value
+        return combatant
+
+    def __getitem__(self, name: str) -> Any:
+        if name == "skip_next_attack" and not self.skip_next_attack:
+            raise KeyError(name)  # Only present while set, as in the old dict
+        if name in FIELDS:
+            return getattr(self, name)
+        return self._extra[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if name in FIELDS:
+            setattr(self, name, value)
+        else:
+            self._extra[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name == "skip_next_attack":
+            self.skip_next_attack = False
+        elif name in FIELDS:
+            setattr(self, name, None)
+        else:
+            del self._extra[name]
+
+    def __iter__(self) -> Iterator[str]:
+        for name in FIELDS:
+            if name != "skip_next_attack" or self.skip_next_attack:
+                yield name
+        yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Combatant({self.key!r} -> {getattr(self.target, 'name', None)!r})"
+
+
+class Combat:
+    """An engagement between two filed combatants."""
+
+    __slots__ = ("sides", "label")
+
+    def __init__(self, first: Combatant, second: Combatant) -> None:
+        self.sides = (first, second)
+        # Profiler series name, built once rather than every tick.
+        self.label = " vs ".join(sorted((str(first.key), str(second.key))))
+
+    def other(self, side: Combatant) -> Combatant:
+        first, second = self.sides
+        return second if side is first else first
+
+    def next_turn(self) -> Tuple[Combatant, Combatant]:
+        """(attacker, defender) for this round: whoever holds the initiative."""
+        first, second = self.sides
+        if first.initiative:
+            return first, second
+        if second.initiative:
+            return second, first
+        first.initiative = True
+        return first, second
+
+    @staticmethod
+    def pass_initiative(attacker: Combatant, defender: Combatant) -> None:
+        attacker.initiative = False
+        defender.initiative = True
+
+    def __repr__(self) -> str:
+        return f"Combat({self.label})"
+
+
+class CombatRegistry(Dict[Any, Combatant]):
+    """combat key -> Combatant, linking sides into Combat objects as they file."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        # Live engagements in the order they started
+        self.combats: Dict[Combat, None] = {}
+        # target key -> keys of combatants whose target is not filed
+        self._waiting: Dict[Any, Dict[Any, None]] = {}
+        # Bumped whenever a key is filed or removed, for cached "(in combat)"
+        self.version = 0
+        self.update(*args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # dict mutators
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, key: Any, entry: MutableMapping[str, Any]) -> None:
+        combatant = (
+            entry if isinstance(entry, Combatant) else Combatant.from_entry(entry)
+        )
+        if key in self:
+            self._unlink(key)
+        super().__setitem__(key, combatant)
+        self.version += 1
+        combatant.key = key
+        self._link(combatant)
+
+    def __delitem__(self, key: Any) -> None:
+        self._unlink(key)
+        super().__delitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self._unlink(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[Any, Combatant]:
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+        self.combats.clear()
+        self._waiting.clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, entry in dict(*args, **kwargs).items():
+            self[key] = entry
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    # ------------------------------------------------------------------
+    # Linking
+    # ------------------------------------------------------------------
+
+    def _link(self, combatant: Combatant) -> None:
+        if combatant.target is not None:
+            target_key = combat_key(combatant.target)
+            opponent = self.get(target_key)
+            if opponent is None:
+                self._waiting.setdefault(target_key, {})[combatant.key] = None
+            else:
+                existing = opponent.combat
+                if existing is not None and existing.other(opponent) is combatant:
+                    combatant.combat = existing
+                else:
+                    combatant.combat = self._engage(opponent, combatant)
+
+        # Combatants that were already waiting for this one
+        for key in self._waiting.pop(combatant.key, {}):
+            waiting = self.get(key)
+            if waiting is None or waiting.combat is not None:
+                continue
+            if (
+                combatant.combat is not None
+                and combatant.combat.other(combatant) is waiting
+            ):
+                waiting.combat = combatant.combat
+            else:
+                waiting.combat = self._engage(waiting, combatant)
+
+    def _engage(self, first: Combatant, second: Combatant) -> Combat:
+        combat = Combat(first, second)
+        first.combats[combat] = None
+        second.combats[combat] = None
+        self.combats[combat] = None
+        # Each side's sid, where only the opponent's entry recorded it
+        if first.target is second.entity and first.target_sid is not None:
+            second.sid = second.sid or first.target_sid
+        if second.target is first.entity and second.target_sid is not None:
+            first.sid = first.sid or second.target_sid
+        return combat
+
+    def _unlink(self, key: Any) -> None:
+        combatant = dict.get(self, key)
+        if combatant is None:
+            return
+        self.version += 1
+        if combatant.target is not None:
+            waiting = self._waiting.get(combat_key(combatant.target))
+            if waiting is not None:
+                waiting.pop(key, None)
+                if not waiting:
+                    del self._waiting[combat_key(combatant.target)]
+        for combat in combatant.combats:
+            self.combats.pop(combat, None)
+            other = combat.other(combatant)
+            other.combats.pop(combat, None)
+            if other.combat is combat:
+                # Its opponent left; it waits in case the key is filed again.
+                other.combat = None
+                self._waiting.setdefault(key, {})[other.key] = None
+        combatant.combats = {}
+        combatant.combat = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def unpaired(self) -> List[Combatant]:
+        """Filed combatants whose target is not (or no longer) filed."""
+        return [
+            self[key] for keys in self._waiting.values() for key in keys if key in self
+        ]
+
+    def withdraw(self, key: Any) -> List[Combatant]:
+        """Remove ``key`` and every combatant fighting it; returns them all."""
+        combatant = self.get(key)
+        if combatant is None:
+            return []
+        opponents = [
+            combat.other(combatant).key
+            for combat in combatant.combats
+            if combat.other(combatant).target is combatant.entity
+        ]
+        removed = [self.pop(key)]
+        removed.extend(self.pop(opponent_key) for opponent_key in opponents)
+        return removed
@@ -1,5 +1,6 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from globals import online_sessions
+from managers.session_registry import SessionRegistry
 
 
 def get_online_players() -> List[Any]:
@@ -22,3 +23,19 @@ def get_online_players() -> List[Any]:
             online_players.append(session_data.player)
 
     return online_players
+
+
+def find_online_player(name: str) -> Optional[Any]:
+    """
+    Returns the online player called ``name`` (case-insensitive), or None.
+
+    A dict lookup in the session registry's name index; other session
+    mappings are scanned.
+    """
+    if isinstance(online_sessions, SessionRegistry):
+        return online_sessions.player_by_name(name)
+    name_lower = name.lower()
+    for player in get_online_players():
+        if player.name.lower() == name_lower:
+            return player
+    return None
@@ -11,12 +11,22 @@ Invisibility is broken by:
 - Attacking a player (PvP)
 - Attacking a mob
 - Casting offensive spells (summon, force, cripple, dumb, blind)
+
+is_invisible runs for every recipient of a broadcast, so a Player carries
+its invisibility as cached fields: the archmage toggle, and the deadline of
+the invisibility item it carries, recomputed only when the inventory changed
+(picked up / dropped) or an item expired.
 """
 
 import logging
 import time
 from typing import Any, Dict, Optional
 
+from managers.session_registry import find_player_sid
+from models.ItemIndex import item_index
+from models.Player import Player
+from services.scheduler import INVISIBILITY, get_scheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +34,10 @@ def is_invisible(player: Any, online_sessions: Dict[str, Dict[str, Any]]) -> boo
     """
     Check if a player is invisible via session flag OR active invisibility item.
 
+    For a Player this reads the flags cached on it: the archmage toggle and
+    the item deadline, which is only recomputed after the inventory changed
+    or an item expired. Other objects (test doubles) are checked in full.
+
     Args:
         player: The player object to check
         online_sessions: The global online sessions dict
@@ -31,14 +45,41 @@ def is_invisible(player: Any, online_sessions: Dict[str, Dict[str, Any]]) -> boo
     Returns:
         True if player is invisible
     """
+    if isinstance(player, Player):
+        if player.invisible_by_command:
+            return True
+        if player.invisibility_stamp != player.inventory.version:
+            _refresh_item_invisibility(player)
+        return player.invisible_until is not None
+
     # Find player's session and check session-based invisibility (archmage)
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            if session.get("invisible", False):
-                return True
-            break
+    sid = find_player_sid(player, online_sessions)
+    if sid is not None and online_sessions[sid].get("invisible", False):
+        return True
+
+    return _item_invisibility_deadline(player) is not None
+
+
+def _refresh_item_invisibility(player: Player) -> None:
+    player.invisible_until = _item_invisibility_deadline(player)
+    player.invisibility_stamp = player.inventory.version
+
 
-    # Check inventory for active invisibility-granting items
+def _forget_item_invisibility(player: Any, item: Any) -> None:
+    """Make the next is_invisible check re-read the inventory holding ``item``."""
+    holder = item_index.holder(item)
+    for owner in (player, holder.owner if holder is not None else None):
+        if isinstance(owner, Player):
+            owner.invisibility_stamp = None
+
+
+def _item_invisibility_deadline(player: Any) -> Optional[float]:
+    """
+    When the invisibility item the player carries runs out, or None.
+
+    The first unexpired item decides; one never used before is activated
+    now and its expiry scheduled.
+    """
     current_time = time.time()
     inventory = getattr(player, "inventory", [])
 
@@ -58,20 +99,28 @@ def is_invisible(player: Any, online_sessions: Dict[str, Dict[str, Any]]) -> boo
                 # If never activated, activate now
                 if activated_at is None:
                     item.invisibility_activated_at = current_time
+                    scheduler = get_scheduler()
+                    if scheduler is not None:
+                        scheduler.schedule(
+                            INVISIBILITY,
+                            id(item),
+                            current_time + duration,
+                            (player, item),
+                        )
                     logger.debug(
                         f"Auto-activated invisibility item {item.name} for {player.name}"
                     )
-                    return True
+                    return float(current_time + duration)
 
                 # Check if still within duration
                 if current_time < activated_at + duration:
-                    return True
+                    return float(activated_at + duration)
                 else:
                     # Item has expired, mark it
                     item.invisibility_expired = True
                     logger.debug(f"Invisibility item {item.name} expired for holder")
 
-    return False
+    return None
 
 
 def break_invisibility(
@@ -93,14 +142,16 @@ def break_invisibility(
     Returns:
         True if invisibility was removed, False if player wasn't invisible via session
     """
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            if session.get("invisible", False):
-                session["invisible"] = False
-                logger.info(f"Broke invisibility for {player.name} due to {reason}")
-                return True
-            break
-    return False
+    sid = find_player_sid(player, online_sessions)
+    session_invisible = sid is not None and online_sessions[sid].get("invisible", False)
+    if isinstance(player, Player) and player.invisible_by_command:
+        player.invisible_by_command = False
+    elif not session_invisible:
+        return False
+    if sid is not None:
+        online_sessions[sid]["invisible"] = False
+    logger.info(f"Broke invisibility for {player.name} due to {reason}")
+    return True
 
 
 def get_invisibility_item(player: Any) -> Optional[Any]:
@@ -137,25 +188,6 @@ def get_invisibility_item(player: Any) -> Optional[Any]:
     return None
 
 
-def find_player_sid(
-    player: Any, online_sessions: Dict[str, Dict[str, Any]]
-) -> Optional[str]:
-    """
-    Find the session ID for a given player.
-
-    Args:
-        player: The player object to find
-        online_sessions: The global online sessions dict
-
-    Returns:
-        The session ID (sid) or None if not found
-    """
-    for sid, session in online_sessions.items():
-        if session.get("player") == player:
-            return sid
-    return None
-
-
 def set_invisible(
     player: Any,
     online_sessions: Dict[str, Dict[str, Any]],
@@ -173,6 +205,8 @@ def set_invisible(
         True if the session was found and updated
     """
     sid = find_player_sid(player, online_sessions)
+    if isinstance(player, Player):
+        player.invisible_by_command = invisible
     if sid:
         online_sessions[sid]["invisible"] = invisible
         logger.debug(f"Set invisibility to {invisible} for {player.name}")
@@ -180,6 +214,21 @@ def set_invisible(
     return False
 
 
+async def _expire_invisibility_item(
+    sio: Any, sid: str, player: Any, item: Any, utils: Any
+) -> None:
+    item.invisibility_expired = True
+    _forget_item_invisibility(player, item)
+    logger.info(f"Invisibility item {item.name} expired for {player.name}")
+
+    # Notify player
+    await utils.send_message(
+        sio,
+        sid,
+        f"Your {item.name} fades and loses its power. You are now visible.",
+    )
+
+
 async def process_invisibility_expiry(
     sio: Any,
     online_sessions: Dict[str, Dict[str, Any]],
@@ -189,6 +238,9 @@ async def process_invisibility_expiry(
     Process invisibility item expiration for all players.
     Called by tick service each tick to notify players when items expire.
 
+    With a scheduler installed only items whose deadline has passed are
+    visited; otherwise every online player's inventory is scanned.
+
     Args:
         sio: Socket.IO server instance
         online_sessions: The global online sessions dict
@@ -196,6 +248,20 @@ async def process_invisibility_expiry(
     """
     current_time = time.time()
 
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        for _key, (player, item) in scheduler.pop_due(INVISIBILITY, current_time):
+            if getattr(item, "invisibility_expired", False):
+                continue
+            sid = find_player_sid(player, online_sessions)
+            if sid is not None and item in getattr(player, "inventory", []):
+                await _expire_invisibility_item(sio, sid, player, item, utils)
+            else:
+                # Dropped or holder offline: the charge still runs out
+                item.invisibility_expired = True
+                _forget_item_invisibility(player, item)
+        return
+
     for sid, session in online_sessions.items():
         player = session.get("player")
         if not player:
@@ -227,12 +293,4 @@ async def process_invisibility_expiry(
 
             # Check if item has just expired
             if current_time >= activated_at + duration:
-                item.invisibility_expired = True
-                logger.info(f"Invisibility item {item.name} expired for {player.name}")
-
-                # Notify player
-                await utils.send_message(
-                    sio,
-                    sid,
-                    f"Your {item.name} fades and loses its power. You are now visible.",
-                )
+                await _expire_invisibility_item(sio, sid, player, item, utils)
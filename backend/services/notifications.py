@@ -3,6 +3,13 @@
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from managers.session_registry import (
+    AWAKE_CHANNEL,
+    awake_channel,
+    find_player_sid,
+    room_mirror_of,
+    sessions_in_room,
+)
 from services.invisibility_service import is_invisible
 
 # Set up logging
@@ -10,7 +17,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Global variables initialized as None
-SESSIONS: Optional[Dict[str, Dict[str, Any]]] = None
+SESSIONS: Optional[Dict[str, Any]] = None
 send_msg: Optional[Callable[[str, str], Awaitable[None]]] = None
 
 
@@ -45,17 +52,21 @@ async def broadcast_room(
         logger.warning("Attempted to broadcast room but context not initialized")
         return
 
-    for sid, session_data in SESSIONS.items():
+    mirror = room_mirror_of(SESSIONS)
+    if mirror is not None:
+        # One emit to the room's awake occupants; sleepers are not in it
+        skipped = _sids_of(SESSIONS, exclude_player)
+        await mirror.emit("message", message, awake_channel(room_id), skipped)
+        return
+
+    for sid, session_data in sessions_in_room(SESSIONS, room_id):
         other_player: Any = session_data.get("player")
-        if not other_player:
-            continue  # Skip sessions that haven't authenticated.
 
         # Skip if player is excluded or is sleeping
-        if other_player.name in exclude_player or session_data.get("sleeping", False):
+        if other_player.name in exclude_player or session_data.get("sleeping"):
             continue
 
-        if other_player.current_room == room_id:
-            await send_msg(sid, message)
+        await send_msg(sid, message)
 
 
 async def broadcast_arrival(player: Any) -> None:
@@ -186,13 +197,26 @@ async def broadcast_all(
     if exclude_players is None:
         exclude_players = []
 
+    mirror = room_mirror_of(SESSIONS)
+    if mirror is not None:
+        # One emit to every awake player; sleepers are not in the channel
+        skipped = _sids_of(SESSIONS, exclude_players)
+        await mirror.emit("message", message, AWAKE_CHANNEL, skipped)
+        return
+
     for sid, session_data in SESSIONS.items():
         other_player: Any = session_data.get("player")
         if not other_player:
             continue  # Skip sessions that haven't authenticated.
 
         # Skip if player is excluded or is sleeping
-        if other_player.name in exclude_players or session_data.get("sleeping", False):
+        if other_player.name in exclude_players or session_data.get("sleeping"):
             continue
 
         await send_msg(sid, message)
+
+
+def _sids_of(online_sessions: Dict[str, Any], player_names: List[str]) -> List[str]:
+    """Session ids of the named players who are online."""
+    sids = (find_player_sid(name, online_sessions) for name in player_names)
+    return [sid for sid in sids if sid is not None]
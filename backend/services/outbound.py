@@ -0,0 +1,278 @@
+# backend/services/outbound.py
+"""
+Outbound message coalescing.
+
+One player command typically produces an echo, a result, a statsUpdate and a
+handful of broadcast lines (mob movement, arrivals), each of which used to be
+its own Socket.IO packet. OutboundBuffer wraps the server and, while a tick is
+running inside ``collecting()``, queues emits instead of sending them. When
+the tick ends each target (a sid, or a room with its ``skip_sid``) gets a
+single ``batch`` event carrying its frames in order (a target with just one
+frame gets the plain event). A room broadcast stays one frame for the room,
+so it leaves as one emit whose fan-out happens in python-socketio's manager.
+
+Frames and room membership changes are kept in the order the tick produced
+them and replayed in that order at flush:
+
+- Room membership changes made through the buffer's ``manager`` (see
+  managers.session_registry.RoomMirror) are applied when the replay reaches
+  them, after the batches for that room so far have been sent. A broadcast
+  therefore reaches the room as it was when the message was said, not
+  whoever is in it when the tick ends.
+- Given a ``recipients`` resolver (``manager_recipients`` in the server),
+  open batches never share a client: before a batch is opened for a target,
+  any open batch with a recipient in common is sent. Each client then gets
+  its personal messages and room broadcasts in the order they were produced.
+  Without a resolver every target is treated as a recipient of its own.
+
+Latency-critical events (IMMEDIATE_EVENTS, e.g. ``setInputType``) are never
+held back: everything queued so far is flushed first so ordering is kept,
+then the event goes out at once. Outside ``collecting()`` every emit is sent
+immediately, exactly as before.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_EVENT = "batch"
+
+# Sent immediately even while collecting.
+IMMEDIATE_EVENTS: FrozenSet[str] = frozenset({"setInputType", "adminToken"})
+
+# State snapshots: only the newest one in a batch is worth sending. Dict
+# payloads may be partial (statsUpdate deltas), so a replaced frame's fields
+# are merged under the newer one's.
+LATEST_ONLY_EVENTS: FrozenSet[str] = frozenset({"statsUpdate"})
+
+# (room, skip_sid): emits to the same target with the same exclusion coalesce.
+# A list of skipped sids is held as a tuple so it can key the buffer.
+Target = Tuple[Hashable, Any]
+Frame = Tuple[str, Any]
+# (sid, namespace, room, entering): a room membership change to replay
+Membership = Tuple[str, str, Any, bool]
+
+# Sids currently in a Socket.IO room (a sid is a room of its own), or None if
+# that cannot be told.
+Recipients = Callable[[Any], Optional[Iterable[str]]]
+
+
+def manager_recipients(sio: Any, namespace: str = "/") -> Recipients:
+    """Recipients resolver reading room membership from ``sio.manager``."""
+
+    def recipients(room: Any) -> List[str]:
+        return [sid for sid, _ in sio.manager.get_participants(namespace, room)]
+
+    return recipients
+
+
+class DeferredRooms:
+    """
+    The server's manager as seen through an OutboundBuffer.
+
+    ``basic_enter_room``/``basic_leave_room`` are queued in order with the
+    buffered frames while the buffer is collecting and applied at once
+    otherwise; everything else reads the real manager.
+    """
+
+    def __init__(self, outbound: "OutboundBuffer") -> None:
+        self.outbound = outbound
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.outbound.sio.manager, name)
+
+    def basic_enter_room(self, sid: str, namespace: str, room: Any) -> None:
+        self.outbound.change_membership((sid, namespace, room, True))
+
+    def basic_leave_room(self, sid: str, namespace: str, room: Any) -> None:
+        self.outbound.change_membership((sid, namespace, room, False))
+
+
+class OutboundBuffer:
+    """Socket.IO server proxy that batches emits per target during a tick."""
+
+    def __init__(
+        self,
+        sio: Any,
+        immediate_events: FrozenSet[str] = IMMEDIATE_EVENTS,
+        recipients: Optional[Recipients] = None,
+    ) -> None:
+        self.sio = sio
+        self.immediate_events = immediate_events
+        self.recipients = recipients
+        self.manager = DeferredRooms(self)
+        # Frames (target, frame) and membership changes, in production order
+        self._queued: List[Tuple[Optional[Target], Any]] = []
+        self._depth = 0
+        # Held while queued output is replayed, so an emit that is sent
+        # straight away cannot overtake it.
+        self._flushing = asyncio.Lock()
+        # Packets actually sent vs. emits requested, for the tick profiler
+        # and for judging how much coalescing buys.
+        self.emits_requested = 0
+        self.packets_sent = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything but emit, disconnect and manager (enter_room, event
+        # decorators...) goes straight to the real server.
+        return getattr(self.sio, name)
+
+    async def disconnect(self, sid: str, *args: Any, **kwargs: Any) -> None:
+        """Send what is pending (a quit echo, a last statsUpdate) before
+        dropping the connection, which would otherwise discard it."""
+        await self.flush()
+        await self.sio.disconnect(sid, *args, **kwargs)
+
+    async def emit(
+        self,
+        event: str,
+        data: Any = None,
+        to: Any = None,
+        room: Any = None,
+        skip_sid: Any = None,
+        **kwargs: Any,
+    ) -> None:
+        self.emits_requested += 1
+        if isinstance(skip_sid, list):
+            skip_sid = tuple(skip_sid)
+        target_room = to if to is not None else room
+        if (
+            self._depth == 0
+            or target_room is None
+            or kwargs  # namespace/callback: not ours to reorder
+            or event in self.immediate_events
+        ):
+            await self.flush()
+            await self._send(event, data, target_room, skip_sid, **kwargs)
+            return
+        self._queued.append(((target_room, skip_sid), (event, data)))
+
+    def change_membership(self, change: Membership) -> None:
+        """Apply a room membership change, in order with queued frames."""
+        if self._depth == 0:
+            self._apply(change)
+        else:
+            self._queued.append((None, change))
+
+    @asynccontextmanager
+    async def collecting(self) -> AsyncIterator["OutboundBuffer"]:
+        """Hold emits back until the outermost ``collecting()`` block exits."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything queued, replaying membership changes in order."""
+        async with self._flushing:
+            queued, self._queued = self._queued, []
+            # Open batches, and the batch each recipient's frames are in
+            batches: Dict[Target, List[Frame]] = {}
+            members: Dict[Target, List[Hashable]] = {}
+            batch_of: Dict[Hashable, Target] = {}
+
+            async def send(target: Target) -> None:
+                for member in members.pop(target):
+                    del batch_of[member]
+                await self._send_batch(target, batches.pop(target))
+
+            for target, entry in queued:
+                if target is None:
+                    change: Membership = entry
+                    for other in [t for t in batches if t[0] == change[2]]:
+                        await send(other)
+                    self._apply(change)
+                    continue
+                if target not in batches:
+                    recipients = self._members(target)
+                    clashing = [batch_of[m] for m in recipients if m in batch_of]
+                    for other in dict.fromkeys(clashing):
+                        await send(other)
+                    batches[target] = []
+                    members[target] = recipients
+                    for member in recipients:
+                        batch_of[member] = target
+                _append(batches[target], entry)
+            for target in list(batches):
+                await send(target)
+
+    def pending_count(self) -> int:
+        return sum(1 for target, _ in self._queued if target is not None)
+
+    def _members(self, target: Target) -> List[Hashable]:
+        """Who a batch for ``target`` reaches, as of this point in the replay."""
+        room, skip_sid = target
+        sids = self.recipients(room) if self.recipients is not None else None
+        if sids is None:
+            return [target]
+        if skip_sid is None:
+            skipped: Tuple[Any, ...] = ()
+        elif isinstance(skip_sid, tuple):
+            skipped = skip_sid
+        else:
+            skipped = (skip_sid,)
+        return [sid for sid in sids if sid not in skipped]
+
+    def _apply(self, change: Membership) -> None:
+        sid, namespace, room, entering = change
+        manager = self.sio.manager
+        try:
+            if entering:
+                manager.basic_enter_room(sid, namespace, room)
+            else:
+                manager.basic_leave_room(sid, namespace, room)
+        except (KeyError, ValueError):
+            # Not (or no longer) connected; nothing to mirror.
+            logger.debug("Cannot add %s to %s: not connected", sid, room)
+
+    async def _send_batch(self, target: Target, frames: List[Frame]) -> None:
+        room, skip_sid = target
+        if len(frames) == 1:
+            event, data = frames[0]
+            await self._send(event, data, room, skip_sid)
+        else:
+            batch = [{"event": event, "data": data} for event, data in frames]
+            await self._send(BATCH_EVENT, batch, room, skip_sid)
+
+    async def _send(
+        self,
+        event: str,
+        data: Any,
+        room: Any,
+        skip_sid: Any,
+        **kwargs: Any,
+    ) -> None:
+        self.packets_sent += 1
+        if isinstance(skip_sid, tuple):
+            kwargs["skip_sid"] = list(skip_sid)
+        elif skip_sid is not None:
+            kwargs["skip_sid"] = skip_sid
+        await self.sio.emit(event, data, room=room, **kwargs)
+
+
+def _append(frames: List[Frame], frame: Frame) -> None:
+    event, data = frame
+    if event in LATEST_ONLY_EVENTS:
+        for old_event, old_data in frames:
+            if old_event == event and isinstance(old_data, dict):
+                if isinstance(data, dict):
+                    data = {**old_data, **data}
+        frames[:] = [old for old in frames if old[0] != event]
+    frames.append((event, data))
@@ -12,11 +12,22 @@ periodically restores any that are missing and still needed.
 Items sitting in a swamp treasure-sink room (e.g. 'underlake') count as
 GONE — the sink is unreachable by design, so a swamped quest item must be
 restored to its source like any other loss.
+
+Copies of a registered item are looked up by id in models.ItemIndex, which
+knows the list each item was last added to as it is picked up, dropped,
+given or swamped. A check follows each copy's holders up to its room or
+player, so it costs O(anchors) rather than a walk over every room, container
+and inventory. The full sweep is kept for confirming an item is really gone
+before minting a replacement, and as a periodic audit (``audit=True``).
 """
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from models.ItemIndex import item_index
+from models.Player import Player
+from models.Room import Room
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +44,9 @@ class QuestItemAnchor:
 
 _anchors: List[QuestItemAnchor] = []
 
+# (rooms dict, room count, sink room ids) from the last sink computation
+_sinks: Optional[Tuple[Dict[str, Any], int, Set[str]]] = None
+
 
 def register_quest_item(
     template: Any,
@@ -56,6 +70,16 @@ def clear_quest_item_registry() -> None:
     _anchors.clear()
 
 
+def export_quest_items() -> List[QuestItemAnchor]:
+    """Copy of the current registrations (for the world snapshot)."""
+    return list(_anchors)
+
+
+def restore_quest_items(anchors: List[QuestItemAnchor]) -> None:
+    """Replace all registrations with ``anchors`` (world snapshot load)."""
+    _anchors[:] = anchors
+
+
 def _iter_items_deep(items: Any) -> Iterator[Any]:
     """Yield every item in a list, recursing into container contents."""
     if not isinstance(items, list):
@@ -67,14 +91,55 @@ def _iter_items_deep(items: Any) -> Iterator[Any]:
 
 def _treasure_sink_room_ids(game_state: Any) -> Set[str]:
     """Room ids that swamp rooms teleport treasure into (unreachable sinks)."""
+    global _sinks
+    rooms = game_state.rooms
+    # Sinks are fixed at world build; only new rooms (golden doors) add any.
+    if _sinks is not None and _sinks[0] is rooms and _sinks[1] == len(rooms):
+        return _sinks[2]
     sinks: Set[str] = set()
-    for room in game_state.rooms.values():
+    for room in rooms.values():
         destination = getattr(room, "treasure_destination", None)
         if destination:
             sinks.add(destination)
+    _sinks = (rooms, len(rooms), sinks)
     return sinks
 
 
+def _online_players(online_sessions: Dict[str, Dict[str, Any]]) -> Set[int]:
+    """ids of the players in ``online_sessions``."""
+    return {
+        id(session["player"])
+        for session in online_sessions.values()
+        if session.get("player") is not None
+    }
+
+
+def _is_reachable(
+    item: Any, game_state: Any, online_players: Set[int], sinks: Set[str]
+) -> bool:
+    """Whether ``item`` is in a live room (hidden or not) or an online inventory."""
+    chain = item_index.chain(item)
+    if not chain:
+        return False
+    owner = chain[-1].owner
+    if isinstance(owner, Room):
+        room_id = owner.room_id
+        return room_id not in sinks and game_state.rooms.get(room_id) is owner
+    if isinstance(owner, Player):
+        return id(owner) in online_players
+    return False  # Mob loot, or a container that is nowhere
+
+
+def _is_present(
+    item_id: str, game_state: Any, online_players: Set[int], sinks: Set[str]
+) -> bool:
+    """O(copies) check that a registered item is still reachable."""
+    return any(
+        _is_reachable(item, game_state, online_players, sinks)
+        for item in item_index.with_id(item_id)
+    )
+
+
 def _present_item_ids(
     game_state: Any, online_sessions: Dict[str, Dict[str, Any]]
 ) -> Set[str]:
@@ -106,22 +171,36 @@ def _make_copy(template: Any) -> Any:
 
 
 def ensure_quest_items(
-    game_state: Any, online_sessions: Dict[str, Dict[str, Any]]
+    game_state: Any, online_sessions: Dict[str, Dict[str, Any]], audit: bool = False
 ) -> List[str]:
     """
     Restore any registered quest item that has vanished from the world and is
     still needed. Returns the ids of restored items.
+
+    Presence is read from the tracked locations; the full world sweep only
+    runs when an item looks missing, or on every call with ``audit``.
     """
     if not _anchors:
         return []
     restored: List[str] = []
-    present = _present_item_ids(game_state, online_sessions)
+    sinks = _treasure_sink_room_ids(game_state)
+    online_players = _online_players(online_sessions)
+    present: Optional[Set[str]] = (
+        _present_item_ids(game_state, online_sessions) if audit else None
+    )
     for anchor in _anchors:
         try:
             if anchor.done_check(game_state):
                 continue
             item_id = str(getattr(anchor.template, "id", ""))
-            if not item_id or item_id in present:
+            if not item_id:
+                continue
+            if present is None:
+                if _is_present(item_id, game_state, online_players, sinks):
+                    continue
+                # Looks gone: confirm with a sweep before minting a copy.
+                present = _present_item_ids(game_state, online_sessions)
+            if item_id in present:
                 continue
             room = game_state.get_room(anchor.room_id)
             if room is None:
@@ -0,0 +1,155 @@
+# backend/services/scheduler.py
+"""
+Shared deadline scheduler for timed game effects.
+
+Afflictions, invisibility items, sleep heals, mob respawns and held
+statsUpdates register the moment they fall due instead of being rediscovered
+by scanning every session or mob each tick. Each kind of timer has its own
+min-heap, so a tick that asks "what is due?" costs O(1) when nothing is and
+O(k log n) for k due entries otherwise.
+
+Timers are keyed: scheduling an existing (kind, key) pair moves it, and
+cancel() drops it. Superseded heap entries are discarded lazily when they
+reach the head of the heap.
+"""
+
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Timer kinds
+AFFLICTION = "affliction"
+MOB_AFFLICTION = "mob_affliction"
+INVISIBILITY = "invisibility"
+SLEEP_HEAL = "sleep_heal"
+RESPAWN = "respawn"
+STATS = "stats"
+
+TimeFunc = Callable[[], float]
+HeapEntry = Tuple[float, int, Hashable]
+
+
+class Scheduler:
+    """Per-kind min-heaps of keyed deadlines."""
+
+    def __init__(self, time_func: Optional[TimeFunc] = None) -> None:
+        self._time: TimeFunc = time_func or time.time
+        self._heaps: Dict[str, List[HeapEntry]] = {}
+        # (kind, key) -> (seq, deadline, payload) for the live entry
+        self._live: Dict[Tuple[str, Hashable], Tuple[int, float, Any]] = {}
+        self._counts: Dict[str, int] = {}  # kind -> number of live timers
+        self._seq = itertools.count()
+
+    def now(self) -> float:
+        return self._time()
+
+    def schedule(
+        self, kind: str, key: Hashable, deadline: float, payload: Any = None
+    ) -> None:
+        """Fire ``(kind, key)`` at ``deadline``, replacing any earlier timer."""
+        seq = next(self._seq)
+        if (kind, key) not in self._live:
+            self._counts[kind] = self._counts.get(kind, 0) + 1
+        self._live[(kind, key)] = (seq, deadline, payload)
+        heap = self._heaps.setdefault(kind, [])
+        heapq.heappush(heap, (deadline, seq, key))
+        self._maybe_compact(kind)
+
+    def schedule_in(
+        self, kind: str, key: Hashable, delay: float, payload: Any = None
+    ) -> None:
+        """Fire ``(kind, key)`` ``delay`` seconds from now."""
+        self.schedule(kind, key, self._time() + delay, payload)
+
+    def cancel(self, kind: str, key: Hashable) -> bool:
+        """Drop a pending timer. Returns True if one was pending."""
+        if self._live.pop((kind, key), None) is None:
+            return False
+        self._counts[kind] -= 1
+        return True
+
+    def is_scheduled(self, kind: str, key: Hashable) -> bool:
+        return (kind, key) in self._live
+
+    def next_deadline(self, kind: str) -> Optional[float]:
+        """Earliest live deadline of ``kind``, or None if none are pending."""
+        heap = self._heaps.get(kind)
+        if not heap:
+            return None
+        self._drop_stale_head(kind, heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(
+        self, kind: str, now: Optional[float] = None
+    ) -> List[Tuple[Hashable, Any]]:
+        """Remove and return (key, payload) for every timer due by ``now``."""
+        heap = self._heaps.get(kind)
+        if not heap:
+            return []
+        if now is None:
+            now = self._time()
+        due: List[Tuple[Hashable, Any]] = []
+        while heap and heap[0][0] <= now:
+            _deadline, seq, key = heapq.heappop(heap)
+            live = self._live.get((kind, key))
+            if live is None or live[0] != seq:
+                continue  # Cancelled or rescheduled
+            del self._live[(kind, key)]
+            self._counts[kind] -= 1
+            due.append((key, live[2]))
+        return due
+
+    def pending(self, kind: str) -> List[Tuple[float, Hashable, Any]]:
+        """(deadline, key, payload) for live timers of ``kind``, soonest first."""
+        live = [
+            (deadline, seq, key)
+            for (deadline, seq, key) in self._heaps.get(kind, [])
+            if self._live.get((kind, key), (None,))[0] == seq
+        ]
+        live.sort()
+        return [
+            (deadline, key, self._live[(kind, key)][2]) for deadline, _seq, key in live
+        ]
+
+    def count(self, kind: str) -> int:
+        """Number of live timers of ``kind``."""
+        return self._counts.get(kind, 0)
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _drop_stale_head(self, kind: str, heap: List[HeapEntry]) -> None:
+        while heap:
+            _deadline, seq, key = heap[0]
+            live = self._live.get((kind, key))
+            if live is not None and live[0] == seq:
+                return
+            heapq.heappop(heap)
+
+    def _maybe_compact(self, kind: str) -> None:
+        # Rescheduling leaves dead entries behind; rebuild the heap once they
+        # outnumber the live ones so memory tracks the number of timers.
+        heap = self._heaps[kind]
+        if len(heap) < 64 or len(heap) < 2 * self.count(kind):
+            return
+        self._heaps[kind] = [
+            (deadline, seq, key)
+            for (deadline, seq, key) in heap
+            if self._live.get((kind, key), (None,))[0] == seq
+        ]
+        heapq.heapify(self._heaps[kind])
+
+
+# Module-global accessor, mirroring world_clock.set_world_clock. Without a
+# scheduler the expiry processors fall back to scanning every tick.
+_scheduler: Optional[Scheduler] = None
+
+
+def set_scheduler(scheduler: Optional[Scheduler]) -> None:
+    global _scheduler
+    _scheduler = scheduler
+
+
+def get_scheduler() -> Optional[Scheduler]:
+    return _scheduler
@@ -0,0 +1,98 @@
+# backend/services/state_version.py
+"""
+Version counters for the game state that hidden-item conditions read.
+
+A hidden item's condition_func(game_state) used to run on every
+Room.get_items call. Conditions can now declare what they depend on with
+``@depends_on(...)``; their result is cached until one of those keys is
+bumped. Keys:
+
+- STATE: bumped whenever any StatefulItem (or Mobile) changes state
+- FLAGS: bumped whenever a player's persistent flag is set
+- DESCRIPTIONS: bumped when an item's description is rewritten other than
+  by a state change (a container's contents changing)
+- any other string, for conditions on state of their own; call
+  ``bump(key)`` wherever that state changes
+
+Conditions without a declaration keep being evaluated on every call.
+
+Rooms also get a counter of their own, outside the global version, for what
+is in them besides items: ``bump_room(room_id)`` when a mob enters or leaves.
+The look description caches its mob lines on it (commands.executor).
+"""
+
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+STATE = "state"
+FLAGS = "flags"
+DESCRIPTIONS = "descriptions"
+
+Condition = TypeVar("Condition", bound=Callable[..., Any])
+
+_versions: Dict[str, int] = {}
+# Bumped along with every key: anything cached on declared conditions is
+# valid while this is unchanged.
+_global_version = 0
+
+_room_versions: Dict[str, int] = {}
+
+# condition -> (game_state, key versions, result)
+_results: "weakref.WeakKeyDictionary[Any, Tuple[Any, Tuple[int, ...], bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def bump(key: str) -> None:
+    """Record that the state behind ``key`` changed."""
+    global _global_version
+    _versions[key] = _versions.get(key, 0) + 1
+    _global_version += 1
+
+
+def version(key: str) -> int:
+    return _versions.get(key, 0)
+
+
+def global_version() -> int:
+    return _global_version
+
+
+def bump_room(room_id: Optional[str]) -> None:
+    """Record that the mobs in room ``room_id`` changed."""
+    if room_id is not None:
+        _room_versions[room_id] = _room_versions.get(room_id, 0) + 1
+
+
+def room_version(room_id: str) -> int:
+    return _room_versions.get(room_id, 0)
+
+
+def depends_on(*keys: str) -> Callable[[Condition], Condition]:
+    """Declare the version keys a condition reads, making its result cacheable."""
+
+    def declare(condition: Condition) -> Condition:
+        condition.depends_on = keys  # type: ignore[attr-defined]
+        return condition
+
+    return declare
+
+
+def dependencies(condition: Any) -> Optional[Tuple[str, ...]]:
+    """The keys ``condition`` declared, or None if it declared nothing."""
+    keys = getattr(condition, "depends_on", None)
+    return keys if isinstance(keys, tuple) else None
+
+
+def condition_holds(condition: Callable[[Any], Any], game_state: Any) -> bool:
+    """Evaluate ``condition(game_state)``, reusing the cached result if current."""
+    keys = dependencies(condition)
+    if keys is None:
+        return bool(condition(game_state))
+    stamp = tuple(_versions.get(key, 0) for key in keys)
+    cached = _results.get(condition)
+    if cached is not None and cached[0] is game_state and cached[1] == stamp:
+        return cached[2]
+    result = bool(condition(game_state))
+    _results[condition] = (game_state, stamp, result)
+    return result
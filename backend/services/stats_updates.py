@@ -0,0 +1,110 @@
+# backend/services/stats_updates.py
+"""
+statsUpdate bookkeeping: send a player's stats only when they changed.
+
+Every command used to end with a full ``statsUpdate`` and every sleep heal
+sent another. Each session now remembers what it was last sent
+(``session["stats_sent"]``):
+
+- Nothing goes out while name, score, stamina and max_stamina all match
+  what the client already has, so look/say/exits cost no stats packet.
+- A client that connects with ``auth={"statsDelta": true}`` (kept as
+  ``session["stats_delta"]``) gets only the fields that changed.
+- At most one statsUpdate per STATS_MIN_INTERVAL seconds reaches a session.
+  A change inside the window is held (``session["stats_pending"]``) and
+  flush_stats sends the player's stats as they are once the window is over,
+  so the stamina ticks of a combat round merge into one packet.
+
+Timers for held updates go through the shared scheduler when one is
+installed; otherwise flush_stats scans the sessions.
+"""
+
+import time
+from typing import Any, Dict, MutableMapping, Optional
+
+from services.scheduler import STATS, get_scheduler
+
+STATS_EVENT = "statsUpdate"
+STATS_FIELDS = ("name", "score", "stamina", "max_stamina")
+STATS_MIN_INTERVAL = 1.0
+
+
+def player_stats(player: Any) -> Optional[Dict[str, Any]]:
+    """The statsUpdate payload for ``player``, or None if it is not a player."""
+    if not player:
+        return None
+    # Defensive: some call sites may pass non-player objects (e.g., mobs).
+    required_attrs = ("points", "stamina", "max_stamina")
+    if any(not hasattr(player, attr) for attr in required_attrs):
+        return None
+    return {
+        "name": player.name,
+        "score": player.points,
+        "stamina": player.stamina,
+        "max_stamina": player.max_stamina,
+    }
+
+
+async def send_stats(
+    sio: Any,
+    sid: str,
+    session: MutableMapping[str, Any],
+    player: Any,
+    force: bool = False,
+    now: Optional[float] = None,
+) -> bool:
+    """
+    Send ``player``'s stats to session ``sid`` if the client's copy is stale.
+
+    ``force`` sends the full stats at once (e.g. on login). Returns True if
+    a statsUpdate was emitted.
+    """
+    stats = player_stats(player)
+    if stats is None:
+        return False
+    sent: Optional[Dict[str, Any]] = session.get("stats_sent")
+    if not force and sent == stats:
+        session["stats_pending"] = False  # Changed and changed back
+        return False
+
+    if now is None:
+        now = time.time()
+    if not force:
+        ready_at = session.get("stats_sent_at", 0.0) + STATS_MIN_INTERVAL
+        if now < ready_at:
+            if not session.get("stats_pending"):
+                session["stats_pending"] = True
+                scheduler = get_scheduler()
+                if scheduler is not None:
+                    scheduler.schedule(STATS, sid, ready_at)
+            return False
+
+    payload = stats
+    if not force and sent is not None and session.get("stats_delta"):
+        payload = {key: value for key, value in stats.items() if sent[key] != value}
+    session["stats_sent"] = stats
+    session["stats_sent_at"] = now
+    session["stats_pending"] = False
+    await sio.emit(STATS_EVENT, payload, room=sid)
+    return True
+
+
+async def flush_stats(
+    sio: Any, online_sessions: Dict[str, Dict[str, Any]], now: Optional[float] = None
+) -> None:
+    """Send the held statsUpdates whose rate-limit window has passed."""
+    if now is None:
+        now = time.time()
+
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        for key, _payload in scheduler.pop_due(STATS, now):
+            sid = str(key)
+            session = online_sessions.get(sid)
+            if session is not None and session.get("stats_pending"):
+                await send_stats(sio, sid, session, session.get("player"), now=now)
+        return
+
+    for sid, session in list(online_sessions.items()):
+        if session.get("stats_pending"):
+            await send_stats(sio, sid, session, session.get("player"), now=now)
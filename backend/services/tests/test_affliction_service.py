@@ -21,6 +21,7 @@ from unittest.mock import AsyncMock, Mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from services.scheduler import Scheduler, set_scheduler
 from services.affliction_service import (
     set_context,
     apply_affliction,
@@ -792,5 +793,86 @@ class ProcessAfflictionExpiryMobTest(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn("deaf", online_sessions["sid1"]["afflictions"])
 
 
+class ScheduledAfflictionExpiryTest(unittest.IsolatedAsyncioTestCase):
+    """Test process_affliction_expiry with a scheduler installed."""
+
+    def setUp(self):
+        """Install a scheduler for the duration of each test."""
+        self.scheduler = Scheduler()
+        set_scheduler(self.scheduler)
+        self.addCleanup(set_scheduler, None)
+        self.sio = Mock()
+        self.utils = Mock()
+        self.utils.send_message = AsyncMock()
+        self.player = Mock()
+        self.player.name = "Test"
+
+    async def test_apply_affliction_registers_deadline(self):
+        """Test applying an affliction schedules its expiry."""
+        session = {"player": self.player}
+
+        apply_affliction(session, "blind", 30, "Caster")
+
+        self.assertEqual(
+            self.scheduler.next_deadline("affliction"),
+            session["afflictions"]["blind"]["expires_at"],
+        )
+
+    async def test_due_affliction_expires_and_notifies(self):
+        """Test a due affliction is removed and its holder told."""
+        session = {"player": self.player}
+        online_sessions = {"sid1": session}
+        apply_affliction(session, "blind", 0, "Caster")
+
+        await process_affliction_expiry(self.sio, online_sessions, self.utils)
+
+        self.assertNotIn("blind", session["afflictions"])
+        self.utils.send_message.assert_called_once_with(
+            self.sio, "sid1", "Your vision clears."
+        )
+
+    async def test_unscheduled_sessions_are_not_scanned(self):
+        """Test sessions without a due timer are never visited."""
+        online_sessions = {
+            "sid1": {
+                "player": self.player,
+                "afflictions": {"blind": {"expires_at": time.time() - 10}},
+            }
+        }
+
+        await process_affliction_expiry(self.sio, online_sessions, self.utils)
+
+        self.assertIn("blind", online_sessions["sid1"]["afflictions"])
+
+    async def test_reapplied_affliction_does_not_expire_early(self):
+        """Test re-applying moves the deadline instead of adding one."""
+        session = {"player": self.player}
+        apply_affliction(session, "blind", 0, "Caster")
+        apply_affliction(session, "blind", 60, "Caster")
+
+        await process_affliction_expiry(self.sio, {"sid1": session}, self.utils)
+
+        self.assertIn("blind", session["afflictions"])
+        self.utils.send_message.assert_not_called()
+
+    async def test_logged_out_session_is_skipped(self):
+        """Test a due timer for a departed session sends nothing."""
+        session = {"player": self.player}
+        apply_affliction(session, "deaf", 0, "Caster")
+
+        await process_affliction_expiry(self.sio, {}, self.utils)
+
+        self.utils.send_message.assert_not_called()
+
+    async def test_due_mob_affliction_expires(self):
+        """Test mob afflictions expire from their timer, no mob_manager needed."""
+        mob = SimpleNamespace(name="Orc", afflictions={})
+        apply_affliction_to_mob(mob, "blind", 0, "Caster")
+
+        await process_affliction_expiry(self.sio, {}, self.utils)
+
+        self.assertNotIn("blind", mob.afflictions)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,144 @@
+# backend/services/tests/test_combat_state.py
+
+"""
+Tests for the Combat/Combatant bookkeeping behind active_combats.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from services.combat_state import Combat, Combatant, CombatRegistry
+
+
+def _player(name: str) -> Mock:
+    player = Mock()
+    player.name = name
+    return player
+
+
+class CombatRegistryTest(unittest.TestCase):
+    """Test sides are linked into Combat objects as they are filed."""
+
+    def setUp(self) -> None:
+        self.registry = CombatRegistry()
+        self.alice = _player("Alice")
+        self.bob = _player("Bob")
+
+    def _engage(self) -> None:
+        self.registry["Alice"] = Combatant(
+            self.alice, self.bob, target_sid="bob_sid", initiative=True
+        )
+        self.registry["Bob"] = Combatant(self.bob, self.alice, target_sid="alice_sid")
+
+    def test_second_side_links_one_combat(self) -> None:
+        """Test filing both sides creates exactly one Combat."""
+        self.registry["Alice"] = Combatant(self.alice, self.bob)
+        self.assertEqual(list(self.registry.combats), [])
+
+        self.registry["Bob"] = Combatant(self.bob, self.alice)
+
+        (combat,) = self.registry.combats
+        self.assertIs(self.registry["Alice"].combat, combat)
+        self.assertIs(self.registry["Bob"].combat, combat)
+        self.assertEqual(combat.label, "Alice vs Bob")
+
+    def test_sids_are_taken_from_the_opponent(self) -> None:
+        """Test each side learns its own sid from the other's target_sid."""
+        self._engage()
+
+        self.assertEqual(self.registry["Alice"].sid, "alice_sid")
+        self.assertEqual(self.registry["Bob"].sid, "bob_sid")
+
+    def test_plain_entry_dicts_are_accepted(self) -> None:
+        """Test the old entry dict shape is coerced and stays readable."""
+        self.registry["Alice"] = {"target": self.bob, "weapon": "sword"}
+        self.registry["Bob"] = {"target": self.alice}
+
+        entry = self.registry["Alice"]
+        self.assertIsInstance(entry, Combatant)
+        self.assertEqual(entry["weapon"], "sword")
+        self.assertIs(entry.get("target"), self.bob)
+        self.assertEqual(len(self.registry.combats), 1)
+
+    def test_skip_next_attack_is_only_present_while_set(self) -> None:
+        """Test the flag behaves like the optional key it replaced."""
+        entry = Combatant(self.alice, self.bob)
+        self.assertNotIn("skip_next_attack", entry)
+
+        entry["skip_next_attack"] = True
+        self.assertIn("skip_next_attack", entry)
+        self.assertTrue(entry.pop("skip_next_attack", False))
+        self.assertNotIn("skip_next_attack", entry)
+
+    def test_removing_a_side_leaves_the_other_unpaired(self) -> None:
+        """Test deleting one side ends the Combat and reports the orphan."""
+        self._engage()
+
+        del self.registry["Bob"]
+
+        self.assertEqual(list(self.registry.combats), [])
+        self.assertEqual(self.registry.unpaired(), [self.registry["Alice"]])
+        self.assertIsNone(self.registry["Alice"].combat)
+
+    def test_refiling_a_side_relinks(self) -> None:
+        """Test an unpaired side pairs up again when its target re-enters."""
+        self._engage()
+        del self.registry["Bob"]
+
+        self.registry["Bob"] = Combatant(self.bob, self.alice)
+
+        self.assertEqual(len(self.registry.combats), 1)
+        self.assertEqual(self.registry.unpaired(), [])
+
+    def test_withdraw_removes_everyone_fighting_the_key(self) -> None:
+        """Test withdraw takes out the key and the sides targeting it."""
+        carol = _player("Carol")
+        self._engage()
+        self.registry["Carol"] = Combatant(carol, self.bob)
+
+        removed = self.registry.withdraw("Bob")
+
+        self.assertEqual({c.key for c in removed}, {"Alice", "Bob", "Carol"})
+        self.assertEqual(len(self.registry), 0)
+        self.assertEqual(list(self.registry.combats), [])
+
+    def test_clear_drops_combats(self) -> None:
+        """Test clear resets the links along with the entries."""
+        self._engage()
+
+        self.registry.clear()
+
+        self.assertEqual(list(self.registry.combats), [])
+        self.assertEqual(self.registry.unpaired(), [])
+
+
+class CombatTurnTest(unittest.TestCase):
+    """Test initiative handling on a Combat."""
+
+    def test_initiative_alternates(self) -> None:
+        """Test next_turn follows the initiative that pass_initiative hands over."""
+        first = Combatant(_player("A"), initiative=True)
+        second = Combatant(_player("B"))
+        first.key, second.key = "A", "B"
+        combat = Combat(first, second)
+
+        attackers = []
+        for _ in range(4):
+            attacker, defender = combat.next_turn()
+            attackers.append(attacker.key)
+            Combat.pass_initiative(attacker, defender)
+
+        self.assertEqual(attackers, ["A", "B", "A", "B"])
+
+    def test_first_side_starts_when_nobody_has_initiative(self) -> None:
+        """Test a combat with no initiative set gives it to the first side."""
+        first, second = Combatant(), Combatant()
+
+        attacker, _defender = Combat(first, second).next_turn()
+
+        self.assertIs(attacker, first)
+        self.assertTrue(first.initiative)
+
+
+if __name__ == "__main__":
+    unittest.main()
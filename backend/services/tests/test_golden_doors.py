@@ -15,6 +15,7 @@ import services.notifications as notifications
 from managers.game_state import GameState
 from managers.mob_definitions import get_mob_definitions
 from managers.mob_manager import MobManager
+from managers.session import Session
 from models.Item import Item
 from models.Player import Player
 from models.Room import Room
@@ -69,7 +70,9 @@ class GoldenDoorTestBase(unittest.IsolatedAsyncioTestCase):
         self._old_sessions = notifications.SESSIONS
         self._old_send = notifications.send_msg
         self.send_message = AsyncMock()
-        notifications.set_context({"sid1": {"player": self.player}}, self.send_message)
+        notifications.set_context(
+            {"sid1": Session({"player": self.player})}, self.send_message
+        )
 
         # _try_open reads utils.mob_manager; give it a real one.
         self._had_mob_manager = hasattr(utils_module, "mob_manager")
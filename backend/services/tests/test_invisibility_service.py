@@ -6,7 +6,10 @@ Tests for invisibility_service module.
 
 import time
 import unittest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
+
+from models.Item import Item
+from models.Player import Player
 
 from services.invisibility_service import (
     is_invisible,
@@ -16,6 +19,7 @@ from services.invisibility_service import (
     set_invisible,
     process_invisibility_expiry,
 )
+from services.scheduler import INVISIBILITY, Scheduler, set_scheduler
 
 
 class IsInvisibleSessionTest(unittest.TestCase):
@@ -397,5 +401,134 @@ class ProcessInvisibilityExpiryTest(unittest.IsolatedAsyncioTestCase):
         utils.send_message.assert_not_called()
 
 
+class ScheduledInvisibilityExpiryTest(unittest.IsolatedAsyncioTestCase):
+    """Test process_invisibility_expiry with a scheduler installed."""
+
+    def setUp(self) -> None:
+        self.scheduler = Scheduler()
+        set_scheduler(self.scheduler)
+        self.addCleanup(set_scheduler, None)
+        self.sio = Mock()
+        self.utils = Mock()
+        self.utils.send_message = AsyncMock()
+        self.ring = Mock()
+        self.ring.name = "Ring of Invisibility"
+        self.ring.grants_invisibility = True
+        self.ring.invisibility_expired = False
+        self.ring.invisibility_activated_at = None
+        self.ring.invisibility_duration_seconds = 0
+        self.player = Mock()
+        self.player.name = "TestPlayer"
+        self.player.inventory = [self.ring]
+        self.online_sessions = {"sid1": {"player": self.player}}
+
+    async def test_activation_schedules_expiry_and_notifies_holder(self) -> None:
+        """Test activating an item schedules its expiry notification."""
+        # Arrange
+        is_invisible(self.player, self.online_sessions)
+
+        # Act
+        await process_invisibility_expiry(self.sio, self.online_sessions, self.utils)
+
+        # Assert
+        self.assertTrue(self.ring.invisibility_expired)
+        self.utils.send_message.assert_called_once()
+        self.assertEqual(self.utils.send_message.call_args[0][1], "sid1")
+
+    async def test_dropped_item_expires_silently(self) -> None:
+        """Test an item no longer carried expires without a message."""
+        # Arrange
+        is_invisible(self.player, self.online_sessions)
+        self.player.inventory = []
+
+        # Act
+        await process_invisibility_expiry(self.sio, self.online_sessions, self.utils)
+
+        # Assert
+        self.assertTrue(self.ring.invisibility_expired)
+        self.utils.send_message.assert_not_called()
+
+
+class CachedInvisibilityTest(unittest.IsolatedAsyncioTestCase):
+    """Test the invisibility cached on a Player."""
+
+    def setUp(self) -> None:
+        self.scheduler = Scheduler()
+        set_scheduler(self.scheduler)
+        self.addCleanup(set_scheduler, None)
+        self.player = Player("Ghost")
+        self.online_sessions = {"sid1": {"player": self.player}}
+        self.ring = Item("Ring of Invisibility", "invis_ring", "A ring.")
+        self.ring.grants_invisibility = True
+        self.ring.invisibility_duration_seconds = 3600
+
+    def test_inventory_is_only_read_after_it_changes(self) -> None:
+        """Test repeat checks reuse the flag until an item is picked up."""
+        self.assertFalse(is_invisible(self.player, self.online_sessions))
+
+        with patch(
+            "services.invisibility_service._item_invisibility_deadline"
+        ) as deadline:
+            self.assertFalse(is_invisible(self.player, self.online_sessions))
+            deadline.assert_not_called()
+
+        self.player.add_item(self.ring)
+        self.assertTrue(is_invisible(self.player, self.online_sessions))
+        self.assertIsNotNone(self.ring.invisibility_activated_at)
+        self.assertEqual(
+            self.player.invisible_until,
+            self.ring.invisibility_activated_at + 3600,
+        )
+
+    def test_dropping_the_item_makes_the_player_visible(self) -> None:
+        """Test removing the item from the inventory clears the flag."""
+        self.player.add_item(self.ring)
+        self.assertTrue(is_invisible(self.player, self.online_sessions))
+
+        self.player.remove_item(self.ring)
+
+        self.assertFalse(is_invisible(self.player, self.online_sessions))
+
+    async def test_expiry_clears_the_flag(self) -> None:
+        """Test an expired item stops making its holder invisible."""
+        self.ring.invisibility_duration_seconds = 0
+        self.player.add_item(self.ring)
+        self.assertTrue(is_invisible(self.player, self.online_sessions))
+        utils = Mock()
+        utils.send_message = AsyncMock()
+
+        await process_invisibility_expiry(Mock(), self.online_sessions, utils)
+
+        self.assertFalse(is_invisible(self.player, self.online_sessions))
+
+    async def test_expiry_reaches_the_new_holder(self) -> None:
+        """Test an item handed over before expiring stops hiding its new holder."""
+        self.player.add_item(self.ring)
+        is_invisible(self.player, self.online_sessions)
+        friend = Player("Friend")
+        self.player.remove_item(self.ring)
+        friend.add_item(self.ring)
+        self.assertTrue(is_invisible(friend, {}))
+        # The charge runs out while the friend holds it
+        self.scheduler.schedule(
+            INVISIBILITY, id(self.ring), 0, (self.player, self.ring)
+        )
+
+        await process_invisibility_expiry(Mock(), self.online_sessions, Mock())
+
+        self.assertFalse(is_invisible(friend, {}))
+
+    def test_archmage_toggle_is_kept_on_the_player(self) -> None:
+        """Test set_invisible and break_invisibility update the player flag."""
+        set_invisible(self.player, self.online_sessions, True)
+        self.assertTrue(self.player.invisible_by_command)
+        self.assertTrue(is_invisible(self.player, {}))
+
+        self.assertTrue(break_invisibility(self.player, self.online_sessions))
+
+        self.assertFalse(is_invisible(self.player, self.online_sessions))
+        self.assertFalse(self.online_sessions["sid1"]["invisible"])
+
+
 if __name__ == "__main__":
     unittest.main()
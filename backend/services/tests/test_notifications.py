@@ -14,12 +14,25 @@ Tests cover:
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from managers.session import Session
+from managers.session_registry import (
+    AWAKE_CHANNEL,
+    RoomMirror,
+    SessionRegistry,
+    awake_channel,
+)
+from models.Player import Player
+from services.outbound import OutboundBuffer, manager_recipients
 from tests.test_base import BaseAsyncTest
-from tests.test_helpers import create_mock_player
+from tests.test_helpers import (
+    create_mirrored_sio,
+    create_mock_player,
+    record_deliveries,
+)
 from services import notifications
 
 
@@ -29,7 +42,7 @@ class SetContextTest(unittest.TestCase):
     def test_set_context_sets_sessions(self):
         """Test set_context sets SESSIONS variable."""
         # Arrange
-        mock_sessions = {"sid1": {"player": Mock()}}
+        mock_sessions = {"sid1": Session({"player": Mock()})}
         mock_send = AsyncMock()
 
         # Act
@@ -62,7 +75,10 @@ class BroadcastRoomTest(BaseAsyncTest):
         player2 = create_mock_player(name="Bob", location="room1")
         player2.current_room = "room1"
 
-        mock_sessions = {"sid1": {"player": player1}, "sid2": {"player": player2}}
+        mock_sessions = {
+            "sid1": Session({"player": player1}),
+            "sid2": Session({"player": player2}),
+        }
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -73,6 +89,29 @@ class BroadcastRoomTest(BaseAsyncTest):
         # Assert
         self.assertEqual(mock_send.call_count, 2)
 
+    async def test_broadcast_room_accepts_plain_dict_sessions(self):
+        """Test ad-hoc dict sessions work, as session_registry promises."""
+        player1 = create_mock_player(name="Alice", location="room1")
+        player1.current_room = "room1"
+        player2 = create_mock_player(name="Bob", location="room1")
+        player2.current_room = "room1"
+        mock_send = AsyncMock()
+        notifications.set_context(
+            {
+                "sid1": {"player": player1},
+                "sid2": {"player": player2, "sleeping": True},
+            },
+            mock_send,
+        )
+
+        await notifications.broadcast_room("room1", "Test message")
+        await notifications.broadcast_all("News")
+
+        self.assertEqual(
+            mock_send.await_args_list,
+            [call("sid1", "Test message"), call("sid1", "News")],
+        )
+
     async def test_broadcast_room_excludes_specified_players(self):
         """Test broadcast_room excludes specified players."""
         # Arrange
@@ -81,7 +120,10 @@ class BroadcastRoomTest(BaseAsyncTest):
         player2 = create_mock_player(name="Bob", location="room1")
         player2.current_room = "room1"
 
-        mock_sessions = {"sid1": {"player": player1}, "sid2": {"player": player2}}
+        mock_sessions = {
+            "sid1": Session({"player": player1}),
+            "sid2": Session({"player": player2}),
+        }
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -103,7 +145,7 @@ class BroadcastRoomTest(BaseAsyncTest):
         player1 = create_mock_player(name="Alice", location="room1")
         player1.current_room = "room1"
 
-        mock_sessions = {"sid1": {"player": player1, "sleeping": True}}
+        mock_sessions = {"sid1": Session({"player": player1, "sleeping": True})}
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -122,7 +164,10 @@ class BroadcastRoomTest(BaseAsyncTest):
         player2 = create_mock_player(name="Bob", location="room2")
         player2.current_room = "room2"
 
-        mock_sessions = {"sid1": {"player": player1}, "sid2": {"player": player2}}
+        mock_sessions = {
+            "sid1": Session({"player": player1}),
+            "sid2": Session({"player": player2}),
+        }
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -160,7 +205,7 @@ class BroadcastArrivalTest(BaseAsyncTest):
         player = create_mock_player(name="Alice", level="Hero")
         player.current_room = "room1"
 
-        mock_sessions = {"sid1": {"player": player, "invisible": True}}
+        mock_sessions = {"sid1": Session({"player": player, "invisible": True})}
         notifications.SESSIONS = mock_sessions
         mock_is_invisible.return_value = True
 
@@ -214,7 +259,7 @@ class BroadcastDepartureTest(BaseAsyncTest):
         # Arrange
         player = create_mock_player(name="Bob", level="Warrior")
 
-        mock_sessions = {"sid1": {"player": player, "invisible": True}}
+        mock_sessions = {"sid1": Session({"player": player, "invisible": True})}
         notifications.SESSIONS = mock_sessions
         mock_is_invisible.return_value = True
 
@@ -267,7 +312,7 @@ class BroadcastLogoutTest(BaseAsyncTest):
         player = create_mock_player(name="Charlie", level="Mage")
         player.current_room = "room1"
 
-        mock_sessions = {"sid1": {"player": player, "invisible": True}}
+        mock_sessions = {"sid1": Session({"player": player, "invisible": True})}
         notifications.SESSIONS = mock_sessions
         mock_is_invisible.return_value = True
 
@@ -320,7 +365,10 @@ class BroadcastAllTest(BaseAsyncTest):
         player2 = create_mock_player(name="Bob", location="room2")
         player2.current_room = "room2"
 
-        mock_sessions = {"sid1": {"player": player1}, "sid2": {"player": player2}}
+        mock_sessions = {
+            "sid1": Session({"player": player1}),
+            "sid2": Session({"player": player2}),
+        }
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -339,7 +387,10 @@ class BroadcastAllTest(BaseAsyncTest):
         player2 = create_mock_player(name="Bob", location="room2")
         player2.current_room = "room2"
 
-        mock_sessions = {"sid1": {"player": player1}, "sid2": {"player": player2}}
+        mock_sessions = {
+            "sid1": Session({"player": player1}),
+            "sid2": Session({"player": player2}),
+        }
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -358,7 +409,7 @@ class BroadcastAllTest(BaseAsyncTest):
         player1 = create_mock_player(name="Alice", location="room1")
         player1.current_room = "room1"
 
-        mock_sessions = {"sid1": {"player": player1, "sleeping": True}}
+        mock_sessions = {"sid1": Session({"player": player1, "sleeping": True})}
         mock_send = AsyncMock()
 
         notifications.set_context(mock_sessions, mock_send)
@@ -387,8 +438,8 @@ class BroadcastAllTest(BaseAsyncTest):
         player1.current_room = "room1"
 
         mock_sessions = {
-            "sid1": {"player": player1},
-            "sid2": {},  # Unauthenticated session
+            "sid1": Session({"player": player1}),
+            "sid2": Session(),  # Unauthenticated session
         }
         mock_send = AsyncMock()
 
@@ -457,5 +508,97 @@ class BroadcastItemDropTest(BaseAsyncTest):
         self.assertEqual(call_args[1], "Bob has dropped ancient shield.")
 
 
+class MirroredBroadcastTest(BaseAsyncTest):
+    """Test broadcasts become single emits when rooms are mirrored."""
+
+    def setUp(self):
+        super().setUp()
+        self.sio = create_mirrored_sio()
+        self.sessions = SessionRegistry()
+        self.sessions.set_room_mirror(RoomMirror(self.sio))
+        for sid, name in (("sid1", "Alice"), ("sid2", "Bob"), ("sid3", "Carol")):
+            player = Player(name)
+            player.current_room = "room1"
+            self.sessions[sid] = {"player": player}
+        self.sessions["sid3"]["sleeping"] = True
+        self.send = AsyncMock()
+        notifications.set_context(self.sessions, self.send)
+
+    async def test_broadcast_room_emits_once_to_awake_occupants(self):
+        """Test broadcast_room sends one emit; only the excluded are skipped."""
+        await notifications.broadcast_room("room1", "Hello", exclude_player=["Alice"])
+
+        self.send.assert_not_called()
+        self.sio.emit.assert_awaited_once_with(
+            "message", "Hello", room=awake_channel("room1"), skip_sid=["sid1"]
+        )
+        self.assertEqual(
+            self.sio.manager.members(awake_channel("room1")), {"sid1", "sid2"}
+        )
+
+    async def test_broadcast_all_emits_to_awake_channel(self):
+        """Test broadcast_all targets the channel of every awake player."""
+        await notifications.broadcast_all("News")
+
+        self.send.assert_not_called()
+        self.sio.emit.assert_awaited_once_with(
+            "message", "News", room=AWAKE_CHANNEL, skip_sid=None
+        )
+        self.assertEqual(self.sio.manager.members(AWAKE_CHANNEL), {"sid1", "sid2"})
+
+    async def test_waking_rejoins_the_awake_channels(self):
+        """Test a sleeper hears broadcasts again once awake."""
+        deliveries = record_deliveries(self.sio)
+
+        self.sessions["sid3"]["sleeping"] = False
+        await notifications.broadcast_room("room1", "Morning")
+        self.sessions["sid1"].sleeping = True
+        await notifications.broadcast_all("Night")
+
+        self.assertEqual(
+            deliveries,
+            [
+                ("message", "Morning", ["sid1", "sid2", "sid3"]),
+                ("message", "Night", ["sid2", "sid3"]),
+            ],
+        )
+
+    async def test_buffered_broadcast_reaches_the_room_as_it_was(self):
+        """Test moves later in the tick do not change who hears a broadcast."""
+        outbound = OutboundBuffer(self.sio, recipients=manager_recipients(self.sio))
+        self.sessions.set_room_mirror(RoomMirror(outbound))
+        dave = Player("Dave")
+        dave.current_room = "room2"
+        self.sessions["sid4"] = {"player": dave}
+        deliveries = record_deliveries(self.sio)
+
+        async with outbound.collecting():
+            await notifications.broadcast_room("room1", "Hi", exclude_player=["Alice"])
+            self.sessions["sid2"].player.current_room = "room2"
+            dave.current_room = "room1"
+            await notifications.broadcast_room("room1", "Bye")
+
+        self.assertEqual(
+            deliveries,
+            [("message", "Hi", ["sid2"]), ("message", "Bye", ["sid1", "sid4"])],
+        )
+
+    async def test_one_emit_per_broadcast_in_a_tick(self):
+        """Test a tick's broadcasts are not split into per-player packets."""
+        outbound = OutboundBuffer(self.sio, recipients=manager_recipients(self.sio))
+        self.sessions.set_room_mirror(RoomMirror(outbound))
+
+        async with outbound.collecting():
+            await outbound.emit("message", "You wave.", room="sid1")
+            await notifications.broadcast_room(
+                "room1", "Alice waves.", exclude_player=["Alice"]
+            )
+            await outbound.emit("statsUpdate", {"score": 1}, room="sid1")
+            await notifications.broadcast_all("The bell tolls.")
+
+        rooms = [call.kwargs["room"] for call in self.sio.emit.await_args_list]
+        self.assertEqual(rooms, ["sid1", awake_channel("room1"), AWAKE_CHANNEL])
+
+
 if __name__ == "__main__":
     unittest.main()
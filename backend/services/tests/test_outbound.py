@@ -0,0 +1,260 @@
+# backend/services/tests/test_outbound.py
+
+"""
+Tests for outbound message coalescing.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from services.outbound import BATCH_EVENT, OutboundBuffer, manager_recipients
+from tests.test_helpers import create_mirrored_sio, record_deliveries
+
+
+class OutboundBufferTest(unittest.IsolatedAsyncioTestCase):
+    """Test batching, immediate events and pass-through behaviour."""
+
+    def setUp(self) -> None:
+        self.sio = MagicMock()
+        self.sio.emit = AsyncMock()
+        self.outbound = OutboundBuffer(self.sio)
+
+    def _sent(self):
+        return [
+            (c.args[0], c.args[1], c.kwargs.get("room"))
+            for c in self.sio.emit.await_args_list
+        ]
+
+    async def test_emits_immediately_outside_collecting(self) -> None:
+        """Test emits pass straight through when no tick is collecting."""
+        await self.outbound.emit("message", "hello", room="sid-1")
+
+        self.assertEqual(self._sent(), [("message", "hello", "sid-1")])
+
+    async def test_collecting_sends_one_batch_per_target(self) -> None:
+        """Test several emits to one sid leave as a single ordered batch."""
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "one", room="sid-1")
+            await self.outbound.emit("message", "two", room="sid-1")
+            await self.outbound.emit("message", "other", room="sid-2")
+            self.sio.emit.assert_not_awaited()
+
+        self.assertEqual(
+            self._sent(),
+            [
+                (
+                    BATCH_EVENT,
+                    [
+                        {"event": "message", "data": "one"},
+                        {"event": "message", "data": "two"},
+                    ],
+                    "sid-1",
+                ),
+                ("message", "other", "sid-2"),
+            ],
+        )
+        self.assertEqual(self.outbound.emits_requested, 3)
+        self.assertEqual(self.outbound.packets_sent, 2)
+
+    async def test_immediate_event_flushes_pending_frames_first(self) -> None:
+        """Test setInputType is not delayed and keeps its place in order."""
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "Password:", room="sid-1")
+            await self.outbound.emit("setInputType", "password", room="sid-1")
+            self.assertEqual(
+                self._sent(),
+                [
+                    ("message", "Password:", "sid-1"),
+                    ("setInputType", "password", "sid-1"),
+                ],
+            )
+
+        self.assertEqual(self.sio.emit.await_count, 2)
+
+    async def test_only_latest_stats_update_is_sent(self) -> None:
+        """Test superseded statsUpdate frames are dropped from a batch."""
+        async with self.outbound.collecting():
+            await self.outbound.emit("statsUpdate", {"score": 1}, room="sid-1")
+            await self.outbound.emit("message", "You win.", room="sid-1")
+            await self.outbound.emit("statsUpdate", {"score": 2}, room="sid-1")
+
+        (event, frames, _room) = self._sent()[0]
+        self.assertEqual(event, BATCH_EVENT)
+        self.assertEqual(
+            frames,
+            [
+                {"event": "message", "data": "You win."},
+                {"event": "statsUpdate", "data": {"score": 2}},
+            ],
+        )
+
+    async def test_stats_update_deltas_are_merged(self) -> None:
+        """Test a partial statsUpdate keeps the fields of the one it replaces."""
+        async with self.outbound.collecting():
+            await self.outbound.emit(
+                "statsUpdate", {"score": 1, "stamina": 5}, room="sid-1"
+            )
+            await self.outbound.emit("statsUpdate", {"stamina": 4}, room="sid-1")
+
+        self.assertEqual(
+            self._sent(), [("statsUpdate", {"score": 1, "stamina": 4}, "sid-1")]
+        )
+
+    async def test_nested_collecting_flushes_at_outermost_exit(self) -> None:
+        """Test an inner collecting() block does not flush early."""
+        async with self.outbound.collecting():
+            async with self.outbound.collecting():
+                await self.outbound.emit("message", "hi", room="sid-1")
+            self.sio.emit.assert_not_awaited()
+
+        self.sio.emit.assert_awaited_once()
+
+    async def test_skip_sid_is_part_of_target(self) -> None:
+        """Test broadcasts excluding a sid are batched separately."""
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "a", room="room-1", skip_sid="x")
+            await self.outbound.emit("message", "b", room="room-1")
+
+        calls = self.sio.emit.await_args_list
+        self.assertEqual(calls[0].kwargs, {"room": "room-1", "skip_sid": "x"})
+        self.assertEqual(calls[1].kwargs, {"room": "room-1"})
+
+    async def test_room_frames_keep_their_place_per_recipient(self) -> None:
+        """Test a room broadcast is not reordered with personal messages."""
+        rooms = {"room-1": ["sid-1", "sid-2"]}
+        self.outbound.recipients = lambda room: rooms.get(room, [room])
+
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "You say hi.", room="sid-1")
+            await self.outbound.emit("message", "Bob waves.", room="room-1")
+            await self.outbound.emit("message", "Bob says hi.", room="sid-1")
+            await self.outbound.emit(
+                "message", "Alice says hi.", room="room-1", skip_sid=["sid-1"]
+            )
+
+        self.assertEqual(
+            self._sent(),
+            [
+                ("message", "You say hi.", "sid-1"),
+                ("message", "Bob waves.", "room-1"),
+                ("message", "Bob says hi.", "sid-1"),
+                ("message", "Alice says hi.", "room-1"),
+            ],
+        )
+
+    async def test_one_emit_per_room_broadcast_in_a_tick(self) -> None:
+        """Test a broadcast leaves as one emit to the room, not one per sid."""
+        rooms = {"room-1": ["sid-1", "sid-2", "sid-3"]}
+        self.outbound.recipients = lambda room: rooms.get(room, [room])
+
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "You wave.", room="sid-1")
+            await self.outbound.emit(
+                "message", "Alice waves.", room="room-1", skip_sid=["sid-1"]
+            )
+            await self.outbound.emit("statsUpdate", {"score": 1}, room="sid-1")
+            await self.outbound.emit(
+                "message", "A wolf howls.", room="room-1", skip_sid=["sid-1"]
+            )
+
+        self.assertEqual(
+            self._sent(),
+            [
+                (
+                    BATCH_EVENT,
+                    [
+                        {"event": "message", "data": "You wave."},
+                        {"event": "statsUpdate", "data": {"score": 1}},
+                    ],
+                    "sid-1",
+                ),
+                (
+                    BATCH_EVENT,
+                    [
+                        {"event": "message", "data": "Alice waves."},
+                        {"event": "message", "data": "A wolf howls."},
+                    ],
+                    "room-1",
+                ),
+            ],
+        )
+
+    async def test_membership_changes_are_replayed_in_order(self) -> None:
+        """Test a room broadcast reaches the room as it was when it was sent."""
+        sio = create_mirrored_sio()
+        outbound = OutboundBuffer(sio, recipients=manager_recipients(sio))
+        for sid in ("sid-1", "sid-2"):
+            sio.manager.basic_enter_room(sid, "/", "room-1")
+        deliveries = record_deliveries(sio)
+
+        async with outbound.collecting():
+            await outbound.emit("message", "Hi", room="room-1")
+            outbound.manager.basic_leave_room("sid-2", "/", "room-1")
+            outbound.manager.basic_enter_room("sid-3", "/", "room-1")
+            self.assertEqual(sio.manager.members("room-1"), {"sid-1", "sid-2"})
+            await outbound.emit("message", "Bye", room="room-1")
+
+        self.assertEqual(
+            deliveries,
+            [
+                ("message", "Hi", ["sid-1", "sid-2"]),
+                ("message", "Bye", ["sid-1", "sid-3"]),
+            ],
+        )
+
+    async def test_membership_changes_apply_at_once_outside_collecting(self) -> None:
+        """Test the buffer's manager enters rooms directly when not collecting."""
+        sio = create_mirrored_sio()
+        outbound = OutboundBuffer(sio)
+
+        outbound.manager.basic_enter_room("sid-1", "/", "room-1")
+
+        self.assertEqual(sio.manager.members("room-1"), {"sid-1"})
+
+    async def test_broadcast_to_everyone_flushes_pending_frames_first(self) -> None:
+        """Test an emit with no target does not overtake buffered frames."""
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "first", room="sid-1")
+            await self.outbound.emit("message", "second")
+
+            self.assertEqual(
+                self._sent(),
+                [("message", "first", "sid-1"), ("message", "second", None)],
+            )
+
+    async def test_manager_recipients_reads_room_membership(self) -> None:
+        """Test the resolver lists the sids the Socket.IO manager has in a room."""
+        self.sio.manager.get_participants.return_value = iter(
+            [("sid-1", "eio-1"), ("sid-2", "eio-2")]
+        )
+
+        sids = manager_recipients(self.sio)("room-1")
+
+        self.assertEqual(sids, ["sid-1", "sid-2"])
+        self.sio.manager.get_participants.assert_called_once_with("/", "room-1")
+
+    async def test_disconnect_sends_pending_frames_first(self) -> None:
+        """Test output queued for a sid is delivered before it is dropped."""
+        calls = []
+        self.sio.emit.side_effect = lambda event, data, **kw: calls.append(event)
+        self.sio.disconnect = AsyncMock(
+            side_effect=lambda sid: calls.append("disconnect")
+        )
+
+        async with self.outbound.collecting():
+            await self.outbound.emit("message", "Goodbye.", room="sid-1")
+            await self.outbound.emit("statsUpdate", {"score": 1}, room="sid-1")
+            await self.outbound.disconnect("sid-1")
+
+        self.assertEqual(calls, [BATCH_EVENT, "disconnect"])
+        self.sio.disconnect.assert_awaited_once_with("sid-1")
+
+    async def test_other_attributes_delegate_to_server(self) -> None:
+        """Test non-emit calls reach the wrapped server."""
+        self.outbound.enter_room("sid-1", "room-1")
+
+        self.sio.enter_room.assert_called_once_with("sid-1", "room-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,8 +9,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from managers.game_state import GameState
 from models.ContainerItem import ContainerItem
+from unittest.mock import patch
+
 from models.Item import Item
+from models.Player import Player
 from models.Room import Room
+from services import quest_items
 from services.quest_items import (
     clear_quest_item_registry,
     ensure_quest_items,
@@ -215,5 +219,105 @@ class QuestItemRestorationTest(unittest.TestCase):
         self.assertEqual(self.chest.items[0].id, "mist_token")
 
 
+class QuestItemTrackingTest(unittest.TestCase):
+    """Test presence is read from tracked locations, not a world sweep."""
+
+    def setUp(self):
+        """Register a token sitting in a chest in the cellar."""
+        clear_quest_item_registry()
+        self.game_state = GameState()
+        self.cellar = Room("cellar", "Cellar", "A damp cellar.")
+        self.chest = ContainerItem(
+            name="chest", id="cellar_chest", description="A chest.", takeable=False
+        )
+        self.cellar.add_item(self.chest)
+        self.game_state.add_room(self.cellar)
+        self.token = Item("token", "mist_token", "A silver token.")
+        register_quest_item(self.token, room_id="cellar", container_id="cellar_chest")
+        self.chest.items.append(self.token)
+        self.player = Player("Carrier")
+        self.sessions = {"sid1": {"player": self.player}}
+        self.sweep = patch.object(
+            quest_items,
+            "_present_item_ids",
+            side_effect=quest_items._present_item_ids,
+        )
+
+    def tearDown(self):
+        """Clear registry so tests stay independent."""
+        clear_quest_item_registry()
+
+    def test_tracked_item_needs_no_sweep(self):
+        """Test an item in its container is found without sweeping the world."""
+        with self.sweep as sweep:
+            restored = ensure_quest_items(self.game_state, self.sessions)
+
+        self.assertEqual(restored, [])
+        sweep.assert_not_called()
+
+    def test_item_carried_by_online_player_needs_no_sweep(self):
+        """Test an item moved into an online inventory is followed there."""
+        self.chest.items.remove(self.token)
+        self.player.inventory.append(self.token)
+
+        with self.sweep as sweep:
+            restored = ensure_quest_items(self.game_state, self.sessions)
+
+        self.assertEqual(restored, [])
+        sweep.assert_not_called()
+
+    def test_item_carried_offline_is_restored(self):
+        """Test a player logging out with the item counts as a loss."""
+        self.chest.items.remove(self.token)
+        self.player.inventory.append(self.token)
+
+        restored = ensure_quest_items(self.game_state, {})
+
+        self.assertEqual(restored, ["mist_token"])
+
+    def test_swamped_item_is_restored(self):
+        """Test an item moved into a treasure sink counts as a loss."""
+        swamp = Room("bog", "Bog", "A treasure-hungry bog.")
+        swamp.treasure_destination = "under_bog"
+        sink = Room("under_bog", "Under the Bog", "Lost things gather here.")
+        self.game_state.add_room(swamp)
+        self.game_state.add_room(sink)
+        self.chest.items.remove(self.token)
+        sink.add_item(self.token)
+
+        restored = ensure_quest_items(self.game_state, self.sessions)
+
+        self.assertEqual(restored, ["mist_token"])
+
+    def test_item_placed_before_registration_needs_no_sweep(self):
+        """Test items are indexed from the moment they are placed."""
+        clear_quest_item_registry()
+        register_quest_item(self.token, room_id="cellar", container_id="cellar_chest")
+
+        with self.sweep as sweep:
+            self.assertEqual(ensure_quest_items(self.game_state, self.sessions), [])
+
+        sweep.assert_not_called()
+
+    def test_item_hidden_in_room_needs_no_sweep(self):
+        """Test a hidden copy is found through the room's hidden holder."""
+        self.chest.items.remove(self.token)
+        self.cellar.add_hidden_item(self.token, lambda gs: False)
+
+        with self.sweep as sweep:
+            restored = ensure_quest_items(self.game_state, self.sessions)
+
+        self.assertEqual(restored, [])
+        sweep.assert_not_called()
+
+    def test_audit_sweeps_the_world(self):
+        """Test audit=True runs the full sweep even when tracking says present."""
+        with self.sweep as sweep:
+            restored = ensure_quest_items(self.game_state, self.sessions, audit=True)
+
+        self.assertEqual(restored, [])
+        sweep.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+# backend/services/tests/test_scheduler.py
+
+"""
+Tests for the shared deadline scheduler.
+"""
+
+import unittest
+
+from services.scheduler import Scheduler
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+class SchedulerTest(unittest.TestCase):
+    """Test keyed scheduling, cancellation and popping due timers."""
+
+    def setUp(self) -> None:
+        self.clock = _FakeTime()
+        self.scheduler = Scheduler(time_func=self.clock.time)
+
+    def test_pop_due_returns_only_due_timers_in_deadline_order(self) -> None:
+        """Test pop_due yields due (key, payload) pairs soonest first."""
+        self.scheduler.schedule("a", "late", 1010.0, "L")
+        self.scheduler.schedule("a", "early", 1005.0, "E")
+        self.scheduler.schedule("a", "future", 2000.0)
+
+        self.clock.now = 1010.0
+        due = self.scheduler.pop_due("a")
+
+        self.assertEqual(due, [("early", "E"), ("late", "L")])
+        self.assertEqual(self.scheduler.count("a"), 1)
+        self.assertEqual(self.scheduler.pop_due("a"), [])
+
+    def test_pop_due_keeps_kinds_separate(self) -> None:
+        """Test timers of one kind never surface under another."""
+        self.scheduler.schedule("a", 1, 900.0)
+        self.scheduler.schedule("b", 1, 900.0)
+
+        self.assertEqual(self.scheduler.pop_due("a"), [(1, None)])
+        self.assertTrue(self.scheduler.is_scheduled("b", 1))
+
+    def test_schedule_same_key_moves_timer(self) -> None:
+        """Test rescheduling replaces the earlier deadline."""
+        self.scheduler.schedule("a", "k", 1001.0)
+        self.scheduler.schedule("a", "k", 1100.0, "new")
+
+        self.clock.now = 1050.0
+        self.assertEqual(self.scheduler.pop_due("a"), [])
+        self.assertEqual(self.scheduler.next_deadline("a"), 1100.0)
+        self.assertEqual(self.scheduler.pop_due("a", now=1100.0), [("k", "new")])
+
+    def test_cancel_drops_timer(self) -> None:
+        """Test a cancelled timer never fires."""
+        self.scheduler.schedule_in("a", "k", 5.0)
+
+        self.assertTrue(self.scheduler.cancel("a", "k"))
+        self.assertFalse(self.scheduler.cancel("a", "k"))
+        self.assertIsNone(self.scheduler.next_deadline("a"))
+        self.assertEqual(self.scheduler.pop_due("a", now=2000.0), [])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_pending_lists_live_timers_sorted(self) -> None:
+        """Test pending reports live timers soonest first."""
+        self.scheduler.schedule("a", "x", 1003.0, "X")
+        self.scheduler.schedule("a", "y", 1001.0, "Y")
+        self.scheduler.schedule("a", "x", 1002.0, "X2")
+
+        self.assertEqual(
+            self.scheduler.pending("a"), [(1001.0, "y", "Y"), (1002.0, "x", "X2")]
+        )
+
+    def test_rescheduling_compacts_stale_entries(self) -> None:
+        """Test repeatedly moving one timer does not grow the heap unbounded."""
+        for i in range(1000):
+            self.scheduler.schedule("a", "k", 1000.0 + i)
+
+        self.assertLess(len(self.scheduler._heaps["a"]), 200)
+        self.assertEqual(self.scheduler.pending("a"), [(1999.0, "k", None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
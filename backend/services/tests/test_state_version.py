@@ -0,0 +1,103 @@
+# backend/services/tests/test_state_version.py
+"""Tests for the state version counters behind cached hidden-item conditions."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from models.Player import Player
+from models.StatefulItem import StatefulItem
+from services import state_version
+from services.state_version import FLAGS, STATE, condition_holds, depends_on
+
+
+class StateVersionTest(unittest.TestCase):
+    """Test the counters are bumped by the state they track."""
+
+    def test_state_change_bumps_state(self):
+        """Test changing a StatefulItem's state bumps STATE."""
+        item = StatefulItem("Door", "door_1", "A door", state="closed")
+        before = state_version.version(STATE)
+
+        item.state = "open"
+
+        self.assertEqual(state_version.version(STATE), before + 1)
+
+    def test_same_state_does_not_bump(self):
+        """Test re-assigning the current state leaves STATE alone."""
+        item = StatefulItem("Door", "door_1", "A door", state="closed")
+        before = state_version.version(STATE)
+
+        item.state = "closed"
+
+        self.assertEqual(state_version.version(STATE), before)
+
+    def test_set_flag_bumps_flags(self):
+        """Test setting a player flag bumps FLAGS and the global version."""
+        player = Player("Tester")
+        before, before_global = (
+            state_version.version(FLAGS),
+            state_version.global_version(),
+        )
+
+        player.set_flag("rang_bell")
+
+        self.assertEqual(state_version.version(FLAGS), before + 1)
+        self.assertGreater(state_version.global_version(), before_global)
+
+
+class ConditionHoldsTest(unittest.TestCase):
+    """Test condition_holds caches declared conditions only."""
+
+    def test_declared_condition_is_cached_per_version(self):
+        """Test a declared condition reruns only after its key is bumped."""
+        calls = []
+
+        @depends_on("test_key")
+        def condition(gs):
+            calls.append(gs)
+            return True
+
+        game_state = object()
+        self.assertTrue(condition_holds(condition, game_state))
+        self.assertTrue(condition_holds(condition, game_state))
+        self.assertEqual(len(calls), 1)
+
+        state_version.bump("test_key")
+        condition_holds(condition, game_state)
+
+        self.assertEqual(len(calls), 2)
+
+    def test_other_game_state_is_not_served_from_cache(self):
+        """Test results are not shared between game states."""
+        calls = []
+
+        @depends_on("test_key")
+        def condition(gs):
+            calls.append(gs)
+            return False
+
+        condition_holds(condition, object())
+        condition_holds(condition, object())
+
+        self.assertEqual(len(calls), 2)
+
+    def test_undeclared_condition_always_runs(self):
+        """Test a condition without depends_on is evaluated every time."""
+        calls = []
+
+        def condition(gs):
+            calls.append(gs)
+            return False
+
+        condition_holds(condition, None)
+        condition_holds(condition, None)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIsNone(state_version.dependencies(condition))
+
+
+if __name__ == "__main__":
+    unittest.main()
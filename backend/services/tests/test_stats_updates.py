@@ -0,0 +1,110 @@
+# backend/services/tests/test_stats_updates.py
+
+"""
+Tests for change-only, rate-capped statsUpdates.
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from services.scheduler import Scheduler, set_scheduler
+from services.stats_updates import STATS_MIN_INTERVAL, flush_stats, send_stats
+
+
+class SendStatsTest(unittest.IsolatedAsyncioTestCase):
+    """Test send_stats against the per-session record."""
+
+    def setUp(self) -> None:
+        self.sio = Mock()
+        self.sio.emit = AsyncMock()
+        self.player = Mock()
+        self.player.name = "Hero"
+        self.player.points = 10
+        self.player.stamina = 20
+        self.player.max_stamina = 30
+        self.session = {"player": self.player}
+        self.online_sessions = {"sid1": self.session}
+
+    def _payloads(self):
+        return [c.args[1] for c in self.sio.emit.await_args_list]
+
+    async def test_unchanged_stats_are_not_resent(self) -> None:
+        """Test only the first of two identical updates is emitted."""
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.0)
+        await send_stats(self.sio, "sid1", self.session, self.player, now=200.0)
+
+        self.assertEqual(
+            self._payloads(),
+            [{"name": "Hero", "score": 10, "stamina": 20, "max_stamina": 30}],
+        )
+
+    async def test_force_resends_in_full(self) -> None:
+        """Test force sends unchanged stats and ignores the rate cap."""
+        self.session["stats_delta"] = True
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.0)
+
+        await send_stats(
+            self.sio, "sid1", self.session, self.player, force=True, now=100.1
+        )
+
+        self.assertEqual(len(self._payloads()), 2)
+        self.assertEqual(self._payloads()[1]["name"], "Hero")
+
+    async def test_delta_sessions_get_changed_fields_only(self) -> None:
+        """Test a session that asked for deltas gets just what changed."""
+        self.session["stats_delta"] = True
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.0)
+        self.player.stamina = 19
+
+        await send_stats(self.sio, "sid1", self.session, self.player, now=200.0)
+
+        self.assertEqual(self._payloads()[1], {"stamina": 19})
+
+    async def test_changes_inside_the_window_are_merged(self) -> None:
+        """Test rapid changes are held and flushed once as the latest stats."""
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.0)
+        for stamina in (19, 18, 17):
+            self.player.stamina = stamina
+            await send_stats(self.sio, "sid1", self.session, self.player, now=100.2)
+        self.assertEqual(len(self._payloads()), 1)
+
+        await flush_stats(self.sio, self.online_sessions, now=100.5)
+        self.assertEqual(len(self._payloads()), 1)
+        await flush_stats(
+            self.sio, self.online_sessions, now=100.0 + STATS_MIN_INTERVAL
+        )
+
+        self.assertEqual(len(self._payloads()), 2)
+        self.assertEqual(self._payloads()[1]["stamina"], 17)
+
+    async def test_held_update_is_flushed_by_the_scheduler(self) -> None:
+        """Test the held update's timer fires through the shared scheduler."""
+        scheduler = Scheduler()
+        set_scheduler(scheduler)
+        self.addCleanup(set_scheduler, None)
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.0)
+        self.player.points = 11
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.2)
+
+        await flush_stats(
+            self.sio, self.online_sessions, now=100.0 + STATS_MIN_INTERVAL
+        )
+
+        self.assertEqual(self._payloads()[1]["score"], 11)
+        self.assertFalse(self.session["stats_pending"])
+
+    async def test_change_reverted_inside_the_window_sends_nothing(self) -> None:
+        """Test a held change that was undone is dropped."""
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.0)
+        self.player.stamina = 19
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.2)
+        self.player.stamina = 20
+        await send_stats(self.sio, "sid1", self.session, self.player, now=100.4)
+
+        await flush_stats(self.sio, self.online_sessions, now=102.0)
+
+        self.assertEqual(len(self._payloads()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
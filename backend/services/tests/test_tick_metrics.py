@@ -0,0 +1,130 @@
+# backend/services/tests/test_tick_metrics.py
+
+"""
+Tests for the tick profiler.
+"""
+
+import unittest
+
+from services.tick_metrics import (
+    COMMAND,
+    EXPIRED,
+    REFUSED,
+    STAGE,
+    RollingHistogram,
+    TickProfiler,
+)
+
+
+class RollingHistogramTest(unittest.TestCase):
+    """Test percentile summaries over the rolling window."""
+
+    def test_summary_reports_percentiles_in_milliseconds(self) -> None:
+        """Test p50/p95/max come from the window, in ms."""
+        histogram = RollingHistogram(size=100)
+        for i in range(1, 101):
+            histogram.add(i / 1000)
+
+        summary = histogram.summary()
+
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["p50"], 51.0, delta=1.0)
+        self.assertAlmostEqual(summary["p95"], 95.0, delta=1.0)
+        self.assertEqual(summary["max"], 100.0)
+
+    def test_window_drops_old_samples_but_keeps_count(self) -> None:
+        """Test the window is bounded while count is all-time."""
+        histogram = RollingHistogram(size=2)
+        for seconds in (1.0, 0.001, 0.002):
+            histogram.add(seconds)
+
+        summary = histogram.summary()
+
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["max"], 2.0)
+
+    def test_empty_summary_is_zero(self) -> None:
+        """Test an unused histogram summarises to zeros."""
+        self.assertEqual(RollingHistogram().summary()["p99"], 0.0)
+
+
+class TickProfilerTest(unittest.TestCase):
+    """Test overrun counting, series caps and reports."""
+
+    def test_record_tick_counts_overruns(self) -> None:
+        """Test only ticks longer than the budget are overruns."""
+        profiler = TickProfiler(budget_seconds=0.5)
+
+        profiler.record_tick(0.1)
+        profiler.record_tick(0.9)
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["ticks"], 2)
+        self.assertEqual(snapshot["overruns"], 1)
+        self.assertEqual(snapshot["worst_overrun_ms"], 900.0)
+
+    def test_series_per_category_are_capped(self) -> None:
+        """Test the least recently updated series is evicted past the cap."""
+        profiler = TickProfiler(max_series=2)
+        profiler.record(COMMAND, "look", 0.001)
+        profiler.record(COMMAND, "get", 0.001)
+        profiler.record(COMMAND, "look", 0.001)
+
+        profiler.record(COMMAND, "drop", 0.001)
+
+        self.assertEqual(
+            sorted(profiler.snapshot()["series"][COMMAND]), ["drop", "look"]
+        )
+
+    def test_measure_uses_clock(self) -> None:
+        """Test measure() records the clock delta around the block."""
+        times = iter([10.0, 10.25])
+        profiler = TickProfiler(clock=lambda: next(times))
+
+        with profiler.measure(STAGE, "combat"):
+            pass
+
+        self.assertEqual(profiler.snapshot()["series"][STAGE]["combat"]["max"], 250.0)
+
+    def test_format_report_ranks_slowest_first(self) -> None:
+        """Test the text report lists series by p95, slowest first."""
+        profiler = TickProfiler()
+        profiler.record(STAGE, "fast", 0.001)
+        profiler.record(STAGE, "slow", 0.2)
+
+        report = profiler.format_report()
+
+        self.assertLess(report.index("slow"), report.index("fast"))
+
+    def test_reset_clears_everything(self) -> None:
+        """Test reset drops counters and series."""
+        profiler = TickProfiler()
+        profiler.record_tick(1.0)
+        profiler.record_loop_lag(0.1)
+        profiler.record(STAGE, "x", 0.1)
+
+        profiler.reset()
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["ticks"], 0)
+        self.assertEqual(snapshot["loop_lag"]["count"], 0)
+        self.assertEqual(snapshot["series"], {})
+
+    def test_queue_depth_and_events(self) -> None:
+        """Test queue depths are summarised as counts and events are counted."""
+        profiler = TickProfiler()
+        profiler.record_queue_depth(3, 2)
+        profiler.record_queue_depth(40, 30)
+        profiler.count_queue_event(REFUSED)
+        profiler.count_queue_event(EXPIRED, 4)
+
+        queues = profiler.snapshot()["queues"]
+
+        self.assertEqual(queues["queued"]["max"], 40)
+        self.assertEqual(queues["deepest"]["max"], 30)
+        self.assertEqual((queues[REFUSED], queues[EXPIRED]), (1, 4))
+        self.assertIn("deepest queue max 30", profiler.format_report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, Mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from managers.session import Session
 from models.Room import Room
 from services.world_clock import (
     CYCLE_SECONDS,
@@ -185,9 +186,9 @@ class WorldClockTickTest(unittest.IsolatedAsyncioTestCase):
         self.sleeping_player = Mock()
         self.sleeping_player.current_room = "crossroads"
         self.online_sessions = {
-            "sid_out": {"player": self.outdoor_player},
-            "sid_in": {"player": self.indoor_player},
-            "sid_sleep": {"player": self.sleeping_player, "sleeping": True},
+            "sid_out": Session({"player": self.outdoor_player}),
+            "sid_in": Session({"player": self.indoor_player}),
+            "sid_sleep": Session({"player": self.sleeping_player, "sleeping": True}),
         }
 
         self.sio = Mock()
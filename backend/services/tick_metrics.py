@@ -0,0 +1,228 @@
+# backend/services/tick_metrics.py
+"""
+Tick profiler: where does the tick budget go?
+
+TickService times every stage of a tick, every command handler and every
+combat pair into rolling histograms, and counts ticks that overran their
+budget along with event-loop lag (how late the loop woke up for a tick).
+It also samples how many commands sit in the sessions' queues and counts
+queue events (commands refused by a full queue, expired before their turn,
+or deferred by the per-tick command budget). The admin API
+(/admin/api/metrics/tick) and the archmage ``tickstats`` command read the
+same snapshot.
+"""
+
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+# Samples kept per histogram; percentiles describe roughly the last few
+# minutes of ticks rather than all time.
+HISTORY_SIZE = 1024
+# Named series kept per category (command verbs, combat pairs); the least
+# recently updated one is dropped beyond this.
+MAX_SERIES_PER_CATEGORY = 64
+DEFAULT_BUDGET_SECONDS = 0.5  # TickService's default tick interval
+
+STAGE = "stage"
+COMMAND = "command"
+COMBAT = "combat"
+
+# Command queue events (see managers.command_queue and TickService)
+REFUSED = "refused"
+EXPIRED = "expired"
+DEFERRED = "deferred"
+
+ClockFunc = Callable[[], float]
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class RollingHistogram:
+    """The last ``size`` samples of a duration, summarised on demand."""
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+        self.count = 0  # All-time number of samples
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def summary(self, scale: float = 1000) -> Dict[str, float]:
+        """
+        count plus p50/p95/p99/max of the window, durations in ms (samples
+        times ``scale``; pass 1 for counts).
+        """
+        if not self._samples:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "p50": round(_percentile(ordered, 0.50) * scale, 3),
+            "p95": round(_percentile(ordered, 0.95) * scale, 3),
+            "p99": round(_percentile(ordered, 0.99) * scale, 3),
+            "max": round(ordered[-1] * scale, 3),
+        }
+
+
+class TickProfiler:
+    """Rolling timing histograms for the tick loop."""
+
+    def __init__(
+        self,
+        budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+        *,
+        history_size: int = HISTORY_SIZE,
+        max_series: int = MAX_SERIES_PER_CATEGORY,
+        clock: Optional[ClockFunc] = None,
+    ) -> None:
+        self.budget_seconds = budget_seconds
+        self.history_size = history_size
+        self.max_series = max_series
+        self.clock: ClockFunc = clock or time.perf_counter
+        self.reset()
+
+    def reset(self) -> None:
+        self._series: Dict[str, "OrderedDict[str, RollingHistogram]"] = {}
+        self.tick_times = RollingHistogram(self.history_size)
+        self.loop_lag = RollingHistogram(self.history_size)
+        self.ticks = 0
+        self.overruns = 0
+        self.worst_overrun = 0.0
+        # Commands waiting in all queues / the deepest queue, per tick
+        self.queued_commands = RollingHistogram(self.history_size)
+        self.deepest_queue = RollingHistogram(self.history_size)
+        self.queue_events: Dict[str, int] = {REFUSED: 0, EXPIRED: 0, DEFERRED: 0}
+
+    def record(self, category: str, name: str, seconds: float) -> None:
+        """Add one duration sample to ``category``/``name``."""
+        series = self._series.setdefault(category, OrderedDict())
+        histogram = series.get(name)
+        if histogram is None:
+            if len(series) >= self.max_series:
+                series.popitem(last=False)
+            histogram = series[name] = RollingHistogram(self.history_size)
+        else:
+            series.move_to_end(name)
+        histogram.add(seconds)
+
+    @contextmanager
+    def measure(self, category: str, name: str) -> Iterator[None]:
+        """Time the body of a ``with`` block into ``category``/``name``."""
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.record(category, name, self.clock() - started)
+
+    def record_tick(self, seconds: float) -> None:
+        """Record a whole tick's duration and whether it blew the budget."""
+        self.ticks += 1
+        self.tick_times.add(seconds)
+        if seconds > self.budget_seconds:
+            self.overruns += 1
+            self.worst_overrun = max(self.worst_overrun, seconds)
+
+    def record_loop_lag(self, seconds: float) -> None:
+        """Record how much later than requested the loop resumed a sleep."""
+        self.loop_lag.add(max(0.0, seconds))
+
+    def record_queue_depth(self, total: int, deepest: int) -> None:
+        """Record the commands queued at the start of a tick's command stage."""
+        self.queued_commands.add(total)
+        self.deepest_queue.add(deepest)
+
+    def count_queue_event(self, event: str, count: int = 1) -> None:
+        """Count ``count`` commands refused, expired or deferred."""
+        self.queue_events[event] = self.queue_events.get(event, 0) + count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready view of every histogram and counter."""
+        return {
+            "budget_ms": round(self.budget_seconds * 1000, 3),
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "worst_overrun_ms": round(self.worst_overrun * 1000, 3),
+            "tick": self.tick_times.summary(),
+            "loop_lag": self.loop_lag.summary(),
+            "queues": {
+                "queued": self.queued_commands.summary(scale=1),
+                "deepest": self.deepest_queue.summary(scale=1),
+                **self.queue_events,
+            },
+            "series": {
+                category: {
+                    name: histogram.summary() for name, histogram in series.items()
+                }
+                for category, series in self._series.items()
+            },
+        }
+
+    def format_report(self, top: int = 5) -> str:
+        """Plain-text summary for the in-game archmage command."""
+        tick = self.tick_times.summary()
+        lag = self.loop_lag.summary()
+        lines = [
+            f"Ticks: {self.ticks}, overruns: {self.overruns} "
+            f"(budget {self.budget_seconds * 1000:.0f}ms, "
+            f"worst {self.worst_overrun * 1000:.1f}ms)",
+            _format_line("tick", tick),
+            _format_line("loop lag", lag),
+            _format_queue_line(
+                self.queued_commands.summary(scale=1),
+                self.deepest_queue.summary(scale=1),
+                self.queue_events,
+            ),
+        ]
+        for category in (STAGE, COMMAND, COMBAT):
+            series = self._series.get(category)
+            if not series:
+                continue
+            lines.append(f"-- slowest {category} (by p95) --")
+            ranked = sorted(
+                ((name, h.summary()) for name, h in series.items()),
+                key=lambda item: item[1]["p95"],
+                reverse=True,
+            )
+            lines.extend(_format_line(name, summary) for name, summary in ranked[:top])
+        return "\n".join(lines)
+
+
+def _format_line(label: str, summary: Dict[str, float]) -> str:
+    return (
+        f"{label}: p50 {summary['p50']:.1f}ms p95 {summary['p95']:.1f}ms "
+        f"p99 {summary['p99']:.1f}ms max {summary['max']:.1f}ms "
+        f"(n={int(summary['count'])})"
+    )
+
+
+def _format_queue_line(
+    queued: Dict[str, float], deepest: Dict[str, float], events: Dict[str, int]
+) -> str:
+    counts = ", ".join(f"{event} {count}" for event, count in events.items())
+    return (
+        f"queued commands: p50 {queued['p50']:.0f} p95 {queued['p95']:.0f} "
+        f"max {queued['max']:.0f}, deepest queue max {deepest['max']:.0f} "
+        f"({counts})"
+    )
+
+
+# Module-global accessor, mirroring world_clock.set_world_clock. Nothing is
+# recorded until a profiler is installed.
+_tick_profiler: Optional[TickProfiler] = None
+
+
+def set_tick_profiler(profiler: Optional[TickProfiler]) -> None:
+    global _tick_profiler
+    _tick_profiler = profiler
+
+
+def get_tick_profiler() -> Optional[TickProfiler]:
+    return _tick_profiler
@@ -12,6 +12,8 @@ import logging
 import time
 from typing import Any, Callable, Dict, List, Optional
 
+from managers.session_registry import sessions_by_room
+
 logger = logging.getLogger(__name__)
 
 DAY_SECONDS = 1800.0  # 30 minutes of daylight
@@ -112,13 +114,13 @@ class WorldClock:
         game_state: Any,
         utils: Any,
     ) -> None:
-        for sid, session in online_sessions.items():
-            player = session.get("player")
-            if not player or session.get("sleeping"):
+        for room_id, occupants in sessions_by_room(online_sessions).items():
+            room = game_state.get_room(room_id)
+            if room is None or not getattr(room, "is_outdoor", False):
                 continue
-            room = game_state.get_room(player.current_room)
-            if room is not None and getattr(room, "is_outdoor", False):
-                await utils.send_message(sio, sid, message)
+            for sid, session in occupants:
+                if not session.get("sleeping"):
+                    await utils.send_message(sio, sid, message)
 
     def _spawn_night_mobs(self, game_state: Any, mob_manager: Any) -> None:
         from managers.mob_definitions import NIGHT_SPAWNS
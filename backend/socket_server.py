@@ -2,10 +2,11 @@
 import asyncio
 import logging
 import os
+import signal
 import ssl
 import sys
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Optional
 
 import socketio
 import utils
@@ -36,9 +37,15 @@ from managers.game_state import GameState
 from managers.mob_definitions import get_mob_definitions
 from managers.mob_manager import MobManager
 from managers.player import PlayerManager
+from managers.session_registry import RoomMirror
+from managers.storage import migrate_json_to_sqlite, open_sqlite_stores
 from managers.world import generate_world
+from managers.world_snapshot import load_or_generate_world
 from services.notifications import set_context
-from tick_service import start_background_tick
+from services.outbound import OutboundBuffer, manager_recipients
+from services.scheduler import Scheduler, set_scheduler
+from services.tick_metrics import TickProfiler, set_tick_profiler
+from tick_service import SEQUENTIAL, start_background_tick
 
 # Configure logging
 logging.basicConfig(
@@ -65,14 +72,39 @@ sio = socketio.AsyncServer(
 )
 app = web.Application()
 sio.attach(app)
+# Game output produced during a tick leaves as one batched packet per client.
+outbound = OutboundBuffer(sio, recipients=manager_recipients(sio))
+# Mirror room occupancy into Socket.IO rooms so broadcasts are single emits.
+online_sessions.set_room_mirror(RoomMirror(outbound))
 
 # Initialize managers and game state.
 logger.info("Initializing game managers and state...")
-auth_manager = AuthManager()
-player_manager = PlayerManager(
-    auth_manager=auth_manager
-)  # Uses SPAWN_ROOM from globals
-mob_manager = MobManager()
+# PLAYER_DB=storage/mud.db switches accounts to SQLite (imported once from
+# the JSON files on first boot); unset keeps the JSON files.
+player_db = os.environ.get("PLAYER_DB", "").strip()
+if player_db:
+    if migrate_json_to_sqlite(player_db):
+        logger.info(f"Imported JSON accounts into {player_db}.")
+    player_store, credential_store = open_sqlite_stores(player_db)
+    auth_manager = AuthManager(store=credential_store)
+    player_manager = PlayerManager(
+        auth_manager=auth_manager, store=player_store
+    )  # Uses SPAWN_ROOM from globals
+else:
+    auth_manager = AuthManager()
+    player_manager = PlayerManager(
+        auth_manager=auth_manager
+    )  # Uses SPAWN_ROOM from globals
+# Shared deadline scheduler: timed effects register when they fall due so the
+# tick only handles what is due instead of rescanning sessions and mobs.
+scheduler = Scheduler()
+set_scheduler(scheduler)
+# Mob AI only runs near online players; distant mobs catch up on approach.
+mob_manager = MobManager(
+    scheduler=scheduler, activity_radius=MobManager.DEFAULT_ACTIVITY_RADIUS
+)
+# Per-stage tick timings, read by /admin/api/metrics/tick and 'tickstats'
+set_tick_profiler(TickProfiler())
 
 # Load mob definitions
 mob_definitions = get_mob_definitions()
@@ -82,7 +114,12 @@ logger.info(f"Loaded {len(mob_definitions)} mob definitions.")
 game_state = GameState()
 if not game_state.rooms:
     logger.info("No game rooms found. Generating world...")
-    new_rooms = generate_world(mob_manager=mob_manager)
+    # WORLD_SNAPSHOT=storage/world.snapshot boots from a pickled world while
+    # the generator sources are unchanged (rebuilt and re-saved otherwise).
+    world_snapshot = os.environ.get("WORLD_SNAPSHOT", "").strip() or None
+    new_rooms = load_or_generate_world(
+        world_snapshot, generate_world, mob_manager=mob_manager
+    )
     for room in new_rooms.values():
         game_state.add_room(room)
     # game_state.save_rooms()
@@ -91,7 +128,7 @@ else:
     logger.info("Game rooms loaded from existing state.")
 
 # Set context for notifications.
-set_context(online_sessions, lambda sid, msg: utils.send_message(sio, sid, msg))
+set_context(online_sessions, lambda sid, msg: utils.send_message(outbound, sid, msg))
 logger.info("Notification context set successfully.")
 
 # Attach mob_manager to utils for global access
@@ -130,7 +167,25 @@ else:
     logger.info("🛠 Running without SSL (Test Mode)")
 
 
+def install_shutdown_handlers(task: "asyncio.Task[None]") -> None:
+    """
+    Cancel ``task`` on SIGTERM (docker/systemd stop) or SIGINT, so its
+    finally block runs and the write-behind flusher saves pending changes.
+    """
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, task.cancel)
+        except NotImplementedError:
+            # No signal handlers on this platform's loop (Windows)
+            logger.warning("Cannot install a handler for %s", signum)
+
+
 async def main() -> None:
+    write_behind: Optional["asyncio.Task[None]"] = None
+    main_task = asyncio.current_task()
+    if main_task is not None:
+        install_shutdown_handlers(main_task)
     try:
         runner = web.AppRunner(app)
         await runner.setup()
@@ -140,20 +195,36 @@ async def main() -> None:
         )
         await site.start()
 
-        # Start background tick in a separate task.
+        # Start background tick in a separate task. TICK_COMMAND_MODE=concurrent
+        # runs the sessions' commands side by side under room/entity locks.
+        command_mode = os.environ.get("TICK_COMMAND_MODE", "").strip() or SEQUENTIAL
         asyncio.create_task(
             start_background_tick(
-                sio, online_sessions, player_manager, game_state, utils
+                outbound,
+                online_sessions,
+                player_manager,
+                game_state,
+                utils,
+                command_mode=command_mode,
             )
         )
         logger.info("Background tick service started.")
 
+        # Coalesce player saves and write them off the event loop.
+        write_behind = asyncio.create_task(player_manager.run_write_behind())
+
         # Keep the server running.
         while True:
             await asyncio.sleep(3600)
+    except asyncio.CancelledError:
+        logger.info("Shutdown requested, stopping the server...")
     except Exception:
         logger.exception("An error occurred in the main loop:")
     finally:
+        # Cancelling the flusher writes any pending player changes.
+        if write_behind is not None:
+            write_behind.cancel()
+            await asyncio.gather(write_behind, return_exceptions=True)
         await runner.cleanup()
         logger.info("Server runner cleanup complete.")
 
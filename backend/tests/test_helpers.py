@@ -143,6 +143,60 @@ def create_mock_sio():
     return sio
 
 
+class FakeRoomManager:
+    """Stand-in for python-socketio's manager: room name -> sids in order."""
+
+    def __init__(self):
+        self.rooms = {}
+
+    def basic_enter_room(self, sid, namespace, room):
+        # Like a connected socket, every sid is also a room of its own.
+        self.rooms.setdefault(sid, {})[sid] = None
+        self.rooms.setdefault(room, {})[sid] = None
+
+    def basic_leave_room(self, sid, namespace, room):
+        self.rooms.get(room, {}).pop(sid, None)
+
+    def get_participants(self, namespace, room):
+        for sid in list(self.rooms.get(room, ())):
+            yield sid, sid
+
+    def members(self, room):
+        return set(self.rooms.get(room, ()))
+
+
+def create_mirrored_sio():
+    """
+    Create a mock SocketIO instance whose manager tracks room membership,
+    for use with managers.session_registry.RoomMirror.
+
+    Returns:
+        AsyncMock SocketIO object with a FakeRoomManager as ``manager``
+    """
+    sio = create_mock_sio()
+    sio.manager = FakeRoomManager()
+    return sio
+
+
+def record_deliveries(sio):
+    """
+    Make ``sio.emit`` on a create_mirrored_sio() server note who each emit
+    reaches, going by the room membership at the moment it is sent.
+
+    Returns:
+        List filled with an (event, data, recipient sids) tuple per emit
+    """
+    deliveries = []
+
+    def emit(event, data=None, room=None, skip_sid=None, **kwargs):
+        skipped = skip_sid if isinstance(skip_sid, list) else [skip_sid]
+        sids = [sid for sid in sio.manager.rooms.get(room, ()) if sid not in skipped]
+        deliveries.append((event, data, sids))
+
+    sio.emit.side_effect = emit
+    return deliveries
+
+
 def create_mock_utils():
     """
     Create a mock utils module.
@@ -1,10 +1,17 @@
+import asyncio
 import sys
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from tick_service import COMBAT_TICK_INTERVAL, TickService
+from managers.command_queue import CommandQueue
+from managers.session import Session
+from models.Room import Room
+from services.outbound import BATCH_EVENT, OutboundBuffer
+from services.tick_metrics import COMMAND, DEFERRED, REFUSED, STAGE, TickProfiler
+from tick_service import COMBAT_TICK_INTERVAL, CONCURRENT, TickService
 
 
 class FakeTime:
@@ -46,6 +53,10 @@ class FakeUtils:
 class FakeSio:
     def __init__(self):
         self.disconnected = []
+        self.emitted = []
+
+    async def emit(self, event, data=None, room=None, **_kwargs):
+        self.emitted.append((event, data, room))
 
     async def disconnect(self, sid):
         self.disconnected.append(sid)
@@ -65,10 +76,12 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
 
     async def test_processes_command_queue_and_echoes(self):
         player = FakePlayer()
-        session = {
-            "command_queue": ["look"],
-            "player": player,
-        }
+        session = Session(
+            {
+                "command_queue": ["look"],
+                "player": player,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         parse_calls = []
@@ -121,6 +134,32 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertIn("it works", messages)
         self.assertEqual(len(self.utils.stats_updates), 1)
 
+    async def test_processes_plain_dict_sessions(self):
+        session = {"command_queue": ["look"], "player": FakePlayer()}
+
+        async def fake_execute(cmd, *args, **kwargs):
+            return "it works"
+
+        service = TickService(
+            self.sio,
+            {"sid-1": session},
+            self.player_manager,
+            self.game_state,
+            self.utils,
+            time_func=self.fake_time.time,
+            sleep_func=self.fake_time.sleep,
+            parse_command=lambda cmd_str, **_kw: [
+                {"original": cmd_str, "verb": "look"}
+            ],
+            execute_command=fake_execute,
+            sleeping_players_callable=noop_async,
+        )
+
+        await service.tick_once()
+
+        self.assertEqual(session["command_queue"], [])
+        self.assertIn("it works", [message for _sid, message in self.utils.messages])
+
     async def test_combat_tick_runs_after_interval(self):
         online_sessions = {}
         combat_calls = []
@@ -178,10 +217,12 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
 
     async def test_command_error_logged_and_user_notified(self):
         player = FakePlayer()
-        session = {
-            "command_queue": ["boom"],
-            "player": player,
-        }
+        session = Session(
+            {
+                "command_queue": ["boom"],
+                "player": player,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         def fake_parse(cmd_str, **_kwargs):
@@ -236,11 +277,13 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_sleeping_player_blocked_from_commands(self):
         """Test sleeping player cannot execute most commands."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["look"],
-            "player": player,
-            "sleeping": True,
-        }
+        session = Session(
+            {
+                "command_queue": ["look"],
+                "player": player,
+                "sleeping": True,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         def fake_parse(cmd_str, **_kwargs):
@@ -267,10 +310,12 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_quit_command_triggers_disconnect(self):
         """Test quit command sets should_disconnect flag."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["quit"],
-            "player": player,
-        }
+        session = Session(
+            {
+                "command_queue": ["quit"],
+                "player": player,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         def fake_parse(cmd_str, **_kwargs):
@@ -304,10 +349,12 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_multiple_commands_requeued(self):
         """Test multiple parsed commands are requeued properly."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["n;s"],
-            "player": player,
-        }
+        session = Session(
+            {
+                "command_queue": ["n;s"],
+                "player": player,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         def fake_parse(cmd_str, **_kwargs):
@@ -340,11 +387,13 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_pending_communication_handled(self):
         """Test pending communication is processed."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["response"],
-            "player": player,
-            "pending_comm": {"type": "tell"},
-        }
+        session = Session(
+            {
+                "command_queue": ["response"],
+                "player": player,
+                "pending_comm": {"type": "tell"},
+            }
+        )
         online_sessions = {"sid-1": session}
 
         async def fake_pending(pending_comm, cmd_str, *args, **kwargs):
@@ -370,11 +419,13 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_converse_mode_prepends_say(self):
         """Test converse mode prepends 'say' to commands."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["hello world"],
-            "player": player,
-            "converse_mode": True,
-        }
+        session = Session(
+            {
+                "command_queue": ["hello world"],
+                "player": player,
+                "converse_mode": True,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         parse_calls = []
@@ -406,11 +457,13 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_converse_mode_exits_with_star(self):
         """Test converse mode exits with * prefix."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["*look"],
-            "player": player,
-            "converse_mode": True,
-        }
+        session = Session(
+            {
+                "command_queue": ["*look"],
+                "player": player,
+                "converse_mode": True,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         service = TickService(
@@ -435,10 +488,12 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_unparseable_command_returns_error(self):
         """Test unparseable commands return error message."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["invalid"],
-            "player": player,
-        }
+        session = Session(
+            {
+                "command_queue": ["invalid"],
+                "player": player,
+            }
+        )
         online_sessions = {"sid-1": session}
 
         def fake_parse(cmd_str, **_kwargs):
@@ -465,10 +520,12 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_player_sid_passed_to_execute_command(self):
         """Test player_sid is passed to execute_command for respawn interception."""
         player = FakePlayer()
-        session = {
-            "command_queue": ["look"],
-            "player": player,
-        }
+        session = Session(
+            {
+                "command_queue": ["look"],
+                "player": player,
+            }
+        )
         online_sessions = {"sid-123": session}
 
         execute_kwargs = {}
@@ -499,6 +556,309 @@ class TickServiceTestCase(unittest.IsolatedAsyncioTestCase):
         self.assertIn("player_sid", execute_kwargs)
         self.assertEqual(execute_kwargs["player_sid"], "sid-123")
 
+    async def test_profiler_records_stages_and_commands(self):
+        profiler = TickProfiler()
+        session = Session({"command_queue": ["look"], "player": FakePlayer()})
+
+        def fake_parse(cmd_str, **_kwargs):
+            return [{"original": cmd_str, "verb": "look"}]
+
+        async def fake_execute(*_args, **_kwargs):
+            return "ok"
+
+        async def fake_pending(*_args, **_kwargs):
+            return ""
+
+        service = TickService(
+            self.sio,
+            {"sid-1": session},
+            self.player_manager,
+            self.game_state,
+            self.utils,
+            time_func=self.fake_time.time,
+            sleep_func=self.fake_time.sleep,
+            parse_command=fake_parse,
+            execute_command=fake_execute,
+            handle_pending_communication=fake_pending,
+            combat_tick_callable=noop_async,
+            sleeping_players_callable=noop_async,
+            broadcast_logout_callable=noop_async,
+            profiler=profiler,
+        )
+
+        await service.tick_once()
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["ticks"], 1)
+        self.assertIn("commands", snapshot["series"][STAGE])
+        self.assertEqual(snapshot["series"][COMMAND]["look"]["count"], 1)
+
+    async def test_outbound_buffer_coalesces_tick_output(self):
+        session = Session({"command_queue": ["look"], "player": FakePlayer()})
+        outbound = OutboundBuffer(self.sio)
+
+        async def send_message(sio, sid, message):
+            await sio.emit("message", message, room=sid)
+
+        self.utils.send_message = send_message
+
+        def fake_parse(cmd_str, **_kwargs):
+            return [{"original": cmd_str, "verb": "look"}]
+
+        async def fake_execute(*_args, **_kwargs):
+            return "You see a road."
+
+        async def fake_pending(*_args, **_kwargs):
+            return ""
+
+        service = TickService(
+            outbound,
+            {"sid-1": session},
+            self.player_manager,
+            self.game_state,
+            self.utils,
+            time_func=self.fake_time.time,
+            sleep_func=self.fake_time.sleep,
+            parse_command=fake_parse,
+            execute_command=fake_execute,
+            handle_pending_communication=fake_pending,
+            combat_tick_callable=noop_async,
+            sleeping_players_callable=noop_async,
+            broadcast_logout_callable=noop_async,
+        )
+
+        await service.tick_once()
+
+        self.assertEqual(len(self.sio.emitted), 1)
+        event, frames, room = self.sio.emitted[0]
+        self.assertEqual((event, room), (BATCH_EVENT, "sid-1"))
+        self.assertEqual(
+            [frame["data"] for frame in frames], ["look", "You see a road."]
+        )
+
+    def _command_service(self, online_sessions, executed, **kwargs):
+        def fake_parse(cmd_str, **_kwargs):
+            return [
+                {"original": part, "verb": part.split()[0]}
+                for part in cmd_str.split(";")
+            ]
+
+        async def fake_execute(cmd, player, *_args, **_kwargs):
+            executed.append((player.name, cmd["original"]))
+            return ""
+
+        return TickService(
+            self.sio,
+            online_sessions,
+            self.player_manager,
+            self.game_state,
+            self.utils,
+            time_func=self.fake_time.time,
+            sleep_func=self.fake_time.sleep,
+            parse_command=fake_parse,
+            execute_command=fake_execute,
+            sleeping_players_callable=noop_async,
+            **kwargs,
+        )
+
+    async def test_command_budget_rotates_across_sessions(self):
+        names = ["a", "b", "c"]
+        online_sessions = {
+            name: Session(
+                command_queue=CommandQueue(["look", "look"], now=0.0),
+                player=FakePlayer(name=name),
+            )
+            for name in names
+        }
+        executed = []
+        profiler = TickProfiler()
+        service = self._command_service(
+            online_sessions, executed, commands_per_tick=2, profiler=profiler
+        )
+
+        await service.tick_once()
+        await service.tick_once()
+        await service.tick_once()
+
+        served = [name for name, _command in executed]
+        self.assertEqual(served, ["a", "b", "c", "a", "b", "c"])
+        queues = profiler.snapshot()["queues"]
+        self.assertEqual(queues[DEFERRED], 2)
+        self.assertEqual(queues["queued"]["max"], 6)
+        self.assertEqual(queues["deepest"]["max"], 2)
+
+    async def test_stale_type_ahead_is_dropped(self):
+        queue = CommandQueue(max_age=10.0)
+        queue.push("n", now=0.0)
+        queue.push("s", now=8.0)
+        online_sessions = {"sid-1": Session(command_queue=queue, player=FakePlayer())}
+        executed = []
+        service = self._command_service(online_sessions, executed)
+        self.fake_time.advance(15.0)
+
+        await service.tick_once()
+
+        self.assertEqual(executed, [("Hero", "s")])
+        messages = [message for _sid, message in self.utils.messages]
+        self.assertIn("(1 typed-ahead command expired unrun.)", messages)
+
+    async def test_requeued_chain_respects_the_cap(self):
+        queue = CommandQueue(max_length=2)
+        queue.push("n;e;s;w", now=0.0)
+        online_sessions = {"sid-1": Session(command_queue=queue, player=FakePlayer())}
+        executed = []
+        profiler = TickProfiler()
+        service = self._command_service(online_sessions, executed, profiler=profiler)
+
+        await service.tick_once()
+
+        self.assertEqual(executed, [("Hero", "n")])
+        self.assertEqual(queue, ["e", "s"])
+        self.assertEqual(profiler.snapshot()["queues"][REFUSED], 1)
+
+
+class ConcurrentCommandsTest(unittest.IsolatedAsyncioTestCase):
+    """The concurrent command mode: tasks per session under room locks."""
+
+    async def asyncSetUp(self):
+        self.fake_time = FakeTime()
+        self.utils = FakeUtils()
+        self.events = []
+
+    def _service(self, online_sessions, execute, game_state=None, **kwargs):
+        def fake_parse(cmd_str, **_kwargs):
+            return [{"original": cmd_str, "verb": cmd_str.split()[0]}]
+
+        return TickService(
+            FakeSio(),
+            online_sessions,
+            object(),
+            game_state if game_state is not None else object(),
+            self.utils,
+            time_func=self.fake_time.time,
+            sleep_func=self.fake_time.sleep,
+            parse_command=fake_parse,
+            execute_command=execute,
+            sleeping_players_callable=noop_async,
+            command_mode=CONCURRENT,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _session(name, room, command):
+        return Session(
+            command_queue=CommandQueue([command], now=0.0),
+            player=FakePlayer(name=name, room=room),
+        )
+
+    async def test_slow_command_does_not_hold_up_other_rooms(self):
+        released = asyncio.Event()
+
+        async def execute(cmd, player, *_args, **_kwargs):
+            if cmd["verb"] == "slow":
+                await released.wait()
+            else:
+                released.set()
+            self.events.append(player.name)
+            return ""
+
+        online_sessions = {
+            "sid-a": self._session("Alice", "room-1", "slow"),
+            "sid-b": self._session("Bob", "room-2", "fast"),
+        }
+        service = self._service(online_sessions, execute)
+
+        await asyncio.wait_for(service.tick_once(), timeout=1)
+
+        self.assertEqual(self.events, ["Bob", "Alice"])
+
+    async def test_same_room_commands_serialize(self):
+        async def execute(cmd, player, *_args, **_kwargs):
+            self.events.append(("start", player.name))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            self.events.append(("end", player.name))
+            return ""
+
+        online_sessions = {
+            "sid-b": self._session("Bob", "room-1", "look"),
+            "sid-a": self._session("Alice", "room-1", "look"),
+        }
+        service = self._service(online_sessions, execute, deterministic=True)
+
+        await service.tick_once()
+
+        self.assertEqual(
+            self.events,
+            [("start", "Alice"), ("end", "Alice"), ("start", "Bob"), ("end", "Bob")],
+        )
+
+    async def test_exclusive_commands_run_after_the_batch(self):
+        async def execute(cmd, player, *_args, **_kwargs):
+            self.events.append(cmd["verb"])
+            return ""
+
+        online_sessions = {
+            "sid-a": self._session("Alice", "room-1", "summon bob"),
+            "sid-b": self._session("Bob", "room-2", "look"),
+            "sid-c": self._session("Cara", "room-3", "say hi"),
+        }
+        service = self._service(online_sessions, execute)
+
+        await service.tick_once()
+
+        self.assertEqual(self.events, ["look", "say", "summon"])
+
+    async def test_flee_waits_for_the_room_it_may_flee_into(self):
+        async def execute(cmd, player, *_args, **_kwargs):
+            self.events.append(("start", player.name))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            self.events.append(("end", player.name))
+            return ""
+
+        rooms = {
+            "room-1": Room("room-1", "Hall", "", exits={"east": "room-2"}),
+            "room-2": Room("room-2", "Yard", "", exits={"west": "room-1"}),
+        }
+        online_sessions = {
+            "sid-a": self._session("Alice", "room-1", "flee"),
+            "sid-b": self._session("Bob", "room-2", "look"),
+        }
+        service = self._service(
+            online_sessions,
+            execute,
+            game_state=SimpleNamespace(get_room=rooms.get),
+            deterministic=True,
+        )
+
+        await service.tick_once()
+
+        self.assertEqual(
+            self.events,
+            [("start", "Alice"), ("end", "Alice"), ("start", "Bob"), ("end", "Bob")],
+        )
+
+    async def test_respawn_answer_runs_after_the_batch(self):
+        async def execute(cmd, player, *_args, **_kwargs):
+            self.events.append(player.name)
+            return ""
+
+        online_sessions = {
+            "sid-a": self._session("Alice", None, "yes"),
+            "sid-b": self._session("Bob", "room-2", "look"),
+        }
+        online_sessions["sid-a"].awaiting_respawn = True
+        service = self._service(online_sessions, execute, deterministic=True)
+
+        await service.tick_once()
+
+        self.assertEqual(self.events, ["Bob", "Alice"])
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            TickService(None, {}, None, None, None, command_mode="parallel")
+
 
 if __name__ == "__main__":
     unittest.main()
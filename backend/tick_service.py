@@ -5,15 +5,42 @@
 import asyncio
 import logging
 import time
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, cast
+from contextlib import nullcontext
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from commands.combat import process_combat_tick
+from commands.concurrency import CommandLocks, command_lock_keys
 from commands.communication import handle_pending_communication
 from commands.executor import execute_command
 from commands.parser import parse_command_wrapper
 from commands.rest import process_sleeping_players
+from services.stats_updates import flush_stats
+from managers.command_queue import CommandQueue
+from managers.session_registry import players_in_room as players_in_room_of
 from services.error_reporter import report_error
 from services.notifications import broadcast_logout
+from services.outbound import OutboundBuffer
+from services.tick_metrics import (
+    COMMAND,
+    DEFERRED,
+    EXPIRED,
+    REFUSED,
+    STAGE,
+    TickProfiler,
+    get_tick_profiler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +49,19 @@ COMBAT_TICK_INTERVAL = 3.0  # Combat actions occur every 3 seconds
 DEFAULT_TICK_INTERVAL = 0.5
 INACTIVITY_RESET_SECONDS = 120 * 30  # Matches legacy behaviour (logged as 2 hours)
 QUEST_ITEM_CHECK_INTERVAL = 60.0
+QUEST_ITEM_AUDIT_INTERVAL = 600.0  # Full world sweep behind the tracked check
 ERROR_RETRY_DELAY = 1.0
+# Commands run per tick across all sessions (one per session at most); the
+# sessions that waited longest go first and the rest wait for the next tick.
+COMMANDS_PER_TICK = 200
+
+# How the command stage runs the sessions' commands:
+# - SEQUENTIAL: one after another, in session order
+# - CONCURRENT: each in its own task, under commands.concurrency's room and
+#   entity locks; exclusive commands run afterwards, one at a time
+SEQUENTIAL = "sequential"
+CONCURRENT = "concurrent"
+COMMAND_MODES = (SEQUENTIAL, CONCURRENT)
 
 
 TimeFunc = Callable[[], float]
@@ -35,7 +74,7 @@ class TickService:
     def __init__(
         self,
         sio: Any,
-        online_sessions: Dict[str, Dict[str, Any]],
+        online_sessions: Dict[str, Any],
         player_manager: Any,
         game_state: Any,
         utils: Any,
@@ -45,12 +84,16 @@ class TickService:
         combat_tick_interval: float = COMBAT_TICK_INTERVAL,
         tick_interval: float = DEFAULT_TICK_INTERVAL,
         inactivity_reset_seconds: float = INACTIVITY_RESET_SECONDS,
+        commands_per_tick: int = COMMANDS_PER_TICK,
+        command_mode: str = SEQUENTIAL,
+        deterministic: bool = False,
         parse_command: Any = parse_command_wrapper,
         execute_command: Any = execute_command,
         handle_pending_communication: Any = handle_pending_communication,
         combat_tick_callable: Any = process_combat_tick,
         sleeping_players_callable: Any = process_sleeping_players,
         broadcast_logout_callable: Any = broadcast_logout,
+        profiler: Optional[TickProfiler] = None,
     ) -> None:
         self.sio = sio
         self.online_sessions = online_sessions
@@ -64,6 +107,14 @@ class TickService:
         self.combat_tick_interval = combat_tick_interval
         self.tick_interval = tick_interval
         self.inactivity_reset_seconds = inactivity_reset_seconds
+        self.commands_per_tick = commands_per_tick
+        if command_mode not in COMMAND_MODES:
+            raise ValueError(f"Unknown command mode: {command_mode!r}")
+        self.command_mode = command_mode
+        # Concurrent mode: start the tasks in session id order instead of
+        # turn order, so commands contending for a lock (and their output)
+        # come out in the same order every run. For tests.
+        self.deterministic = deterministic
 
         self.parse_command = parse_command
         self.execute_command = execute_command
@@ -71,61 +122,104 @@ class TickService:
         self.combat_tick_callable = combat_tick_callable
         self.sleeping_players_callable = sleeping_players_callable
         self.broadcast_logout_callable = broadcast_logout_callable
+        # Stage/command timings; None (the default outside the server) means
+        # ticks run uninstrumented.
+        self.profiler = profiler or get_tick_profiler()
 
         now = self._time()
         self._last_activity = now
         self._last_combat_tick = now
         self._last_quest_item_check = now
+        self._last_quest_item_audit = now
+        self._command_ticks = 0  # Command stages run, for CommandQueue.last_served
 
     async def run_forever(self) -> None:
         """Run the background tick loop indefinitely, handling errors resiliently."""
         logger.info("Background tick service running")
         while True:
             try:
-                await self._sleep(self.tick_interval)
+                await self._sleep_measuring_lag()
                 await self.tick_once()
             except Exception as exc:  # pragma: no cover - defensive guard
                 logger.error("Critical background tick error: %s", exc, exc_info=True)
                 print(f"[Error] Critical background tick error: {str(exc)}")
                 await self._sleep(ERROR_RETRY_DELAY)
 
+    async def _sleep_measuring_lag(self) -> None:
+        if self.profiler is None:
+            await self._sleep(self.tick_interval)
+            return
+        started = self.profiler.clock()
+        await self._sleep(self.tick_interval)
+        slept = self.profiler.clock() - started
+        self.profiler.record_loop_lag(slept - self.tick_interval)
+
+    def _measure(self, category: str, name: str) -> ContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.measure(category, name)
+
+    def _stage(self, name: str) -> ContextManager[None]:
+        return self._measure(STAGE, name)
+
+    def _collecting(self) -> AsyncContextManager[Any]:
+        # With a coalescing server, everything the tick emits leaves as one
+        # batch per target when the tick ends.
+        if isinstance(self.sio, OutboundBuffer):
+            return self.sio.collecting()
+        return nullcontext()
+
     async def tick_once(self) -> None:
         """Execute a single tick worth of work without any sleeping."""
+        if self.profiler is None:
+            async with self._collecting():
+                await self._run_stages()
+            return
+        started = self.profiler.clock()
+        try:
+            async with self._collecting():
+                await self._run_stages()
+        finally:
+            self.profiler.record_tick(self.profiler.clock() - started)
+
+    async def _run_stages(self) -> None:
         current_time = self._time()
 
-        await self._handle_inactivity_reset(current_time)
-        await self._maybe_process_combat(current_time)
-        await self._process_mob_ai()
-        await self._process_world_clock()
-        await self.sleeping_players_callable(
-            self.sio, self.online_sessions, self.player_manager, self.utils
-        )
+        with self._stage("inactivity"):
+            await self._handle_inactivity_reset(current_time)
+        with self._stage("combat"):
+            await self._maybe_process_combat(current_time)
+        with self._stage("mob_ai"):
+            await self._process_mob_ai()
+        with self._stage("world_clock"):
+            await self._process_world_clock()
+        with self._stage("sleep"):
+            await self.sleeping_players_callable(
+                self.sio, self.online_sessions, self.player_manager, self.utils
+            )
 
         # Process affliction expiry
-        await self._process_affliction_expiry()
+        with self._stage("afflictions"):
+            await self._process_affliction_expiry()
 
         # Process invisibility item expiry
-        await self._process_invisibility_expiry()
+        with self._stage("invisibility"):
+            await self._process_invisibility_expiry()
 
         if not self.online_sessions:
             return
 
         # Restore vanished progression-critical items (world can only
         # change while players are online, so skip the scan when empty)
-        self._maybe_ensure_quest_items(current_time)
-
-        for sid, session in list(self.online_sessions.items()):
-            self._update_last_activity(session, current_time)
+        with self._stage("quest_items"):
+            self._maybe_ensure_quest_items(current_time)
 
-            command_queue: Optional[List[str]] = session.get("command_queue")
-            if not command_queue:
-                continue
-
-            player = session.get("player")
-            if not player:
-                continue
+        with self._stage("commands"):
+            await self._process_commands(current_time)
 
-            await self._process_player_command(sid, session, player, command_queue)
+        # statsUpdates held back by the rate cap whose window has passed
+        with self._stage("stats"):
+            await flush_stats(self.sio, self.online_sessions)
 
     async def _handle_inactivity_reset(self, current_time: float) -> None:
         if not self.online_sessions:
@@ -203,8 +297,11 @@ class TickService:
             return
         from services.quest_items import ensure_quest_items
 
-        ensure_quest_items(self.game_state, self.online_sessions)
+        audit = current_time - self._last_quest_item_audit >= QUEST_ITEM_AUDIT_INTERVAL
+        ensure_quest_items(self.game_state, self.online_sessions, audit=audit)
         self._last_quest_item_check = current_time
+        if audit:
+            self._last_quest_item_audit = current_time
 
     def _get_mob_manager(self) -> Any:
         return getattr(self.utils, "mob_manager", None)
@@ -215,10 +312,121 @@ class TickService:
         if session.get("command_queue") or session.get("player"):
             self._last_activity = current_time
 
+    async def _process_commands(self, current_time: float) -> None:
+        """Run the next queued command of up to commands_per_tick sessions."""
+        self._command_ticks += 1
+        ready: List[Tuple[str, Any, Any, CommandQueue]] = []
+        queued = deepest = 0
+        for sid, session in list(self.online_sessions.items()):
+            self._update_last_activity(session, current_time)
+
+            command_queue = session.get("command_queue")
+            if not command_queue:
+                continue
+            if not isinstance(command_queue, CommandQueue):
+                # A list queued by code predating CommandQueue
+                command_queue = CommandQueue.from_list(command_queue, current_time)
+                session["command_queue"] = command_queue
+            queued += len(command_queue)
+            deepest = max(deepest, len(command_queue))
+
+            player = session.get("player")
+            if not player:
+                continue
+
+            expired = command_queue.drop_stale(current_time)
+            if expired:
+                self._count_queue_event(EXPIRED, expired)
+                await self.utils.send_message(
+                    self.sio,
+                    sid,
+                    f"({expired} typed-ahead command"
+                    f"{'s' if expired != 1 else ''} expired unrun.)",
+                )
+                if not command_queue:
+                    continue
+            ready.append((sid, session, player, command_queue))
+
+        if self.profiler is not None:
+            self.profiler.record_queue_depth(queued, deepest)
+
+        if len(ready) > self.commands_per_tick:
+            # Stable sort: ties keep session order
+            ready.sort(key=lambda entry: entry[3].last_served)
+            self._count_queue_event(DEFERRED, len(ready) - self.commands_per_tick)
+            del ready[self.commands_per_tick :]
+
+        for _sid, _session, _player, command_queue in ready:
+            command_queue.last_served = self._command_ticks
+        if self.command_mode == CONCURRENT and len(ready) > 1:
+            await self._run_commands_concurrently(ready)
+        else:
+            for sid, session, player, command_queue in ready:
+                await self._process_player_command(sid, session, player, command_queue)
+
+    async def _run_commands_concurrently(
+        self, ready: List[Tuple[str, Any, Any, CommandQueue]]
+    ) -> None:
+        """One task per session under its command's locks; exclusive ones last."""
+        if self.deterministic:
+            ready = sorted(ready, key=lambda entry: entry[0])
+        locks = CommandLocks()
+        exclusive: List[Tuple[str, Any, Any, CommandQueue]] = []
+        async with asyncio.TaskGroup() as group:
+            for entry in ready:
+                _sid, session, player, command_queue = entry
+                keys = self._lock_keys(session, player, command_queue)
+                if keys is None:
+                    exclusive.append(entry)
+                    continue
+                group.create_task(self._process_locked(locks, keys, *entry))
+        for sid, session, player, command_queue in exclusive:
+            await self._process_player_command(sid, session, player, command_queue)
+
+    def _lock_keys(
+        self, session: Dict[str, Any], player: Any, command_queue: CommandQueue
+    ) -> Optional[FrozenSet[str]]:
+        if session.get("awaiting_respawn"):
+            # Answering the respawn prompt puts the player in the spawn room
+            return None
+        if session.get("pwd_change") or session.get("pending_comm"):
+            # The line answers a prompt; it is not a command
+            return command_lock_keys("", player, self.game_state)
+        return command_lock_keys(command_queue.peek(), player, self.game_state)
+
+    async def _process_locked(
+        self,
+        locks: CommandLocks,
+        keys: FrozenSet[str],
+        sid: str,
+        session: Dict[str, Any],
+        player: Any,
+        command_queue: CommandQueue,
+    ) -> None:
+        while True:
+            async with locks.hold(keys):
+                # A command that ran while this one waited may have moved the
+                # player (a kill, a respawn); take the new room's lock first.
+                current = self._lock_keys(session, player, command_queue)
+                if current is None or current <= keys:
+                    await self._process_player_command(
+                        sid, session, player, command_queue
+                    )
+                    return
+            keys = current
+
+    def _count_queue_event(self, event: str, count: int) -> None:
+        if self.profiler is not None:
+            self.profiler.count_queue_event(event, count)
+
     async def _process_player_command(
-        self, sid: str, session: Dict[str, Any], player: Any, command_queue: List[str]
+        self,
+        sid: str,
+        session: Dict[str, Any],
+        player: Any,
+        command_queue: CommandQueue,
     ) -> None:
-        cmd_str = command_queue.pop(0)
+        cmd_str, queued_at = command_queue.pop_next()
         logger.info(
             "Processing command: %s for player %s",
             cmd_str,
@@ -246,10 +454,14 @@ class TickService:
             if len(parsed_cmds) > 1:
                 await self.utils.send_message(self.sio, sid, f"{cmd_str}")
                 first_cmd = parsed_cmds[0]
-                for i in range(len(parsed_cmds) - 1, 0, -1):
-                    cmd_to_requeue = parsed_cmds[i].get("original", "")
-                    if cmd_to_requeue:
-                        command_queue.insert(0, cmd_to_requeue)
+                chained = [
+                    str(parsed.get("original", "")) for parsed in parsed_cmds[1:]
+                ]
+                refused = command_queue.push_front(
+                    [text for text in chained if text], queued_at
+                )
+                if refused:
+                    self._count_queue_event(REFUSED, refused)
                 parsed_cmds = [first_cmd]
 
             cmd = parsed_cmds[0] if parsed_cmds else None
@@ -264,16 +476,17 @@ class TickService:
                     self.sio, sid, f"{cmd.get('original', cmd_str)}"
                 )
 
-            result = await self.execute_command(
-                cmd,
-                player,
-                self.game_state,
-                self.player_manager,
-                self.online_sessions,
-                self.sio,
-                self.utils,
-                player_sid=sid,
-            )
+            with self._measure(COMMAND, str(cmd.get("verb") or "?")):
+                result = await self.execute_command(
+                    cmd,
+                    player,
+                    self.game_state,
+                    self.player_manager,
+                    self.online_sessions,
+                    self.sio,
+                    self.utils,
+                    player_sid=sid,
+                )
 
             if result:
                 await self.utils.send_message(self.sio, sid, result)
@@ -374,13 +587,7 @@ class TickService:
         self, cmd_str: str, session: Dict[str, Any], player: Any
     ) -> List[Dict[str, Any]]:
         mob_manager = self._get_mob_manager()
-        players_in_room = []
-
-        if self.online_sessions:
-            for osid, osession in self.online_sessions.items():
-                other_player = osession.get("player")
-                if other_player and other_player.current_room == player.current_room:
-                    players_in_room.append(other_player)
+        players_in_room = players_in_room_of(self.online_sessions, player.current_room)
 
         context = {
             "player": player,
@@ -420,10 +627,11 @@ class TickService:
 
 async def start_background_tick(
     sio: Any,
-    online_sessions: Dict[str, Dict[str, Any]],
+    online_sessions: Dict[str, Any],
     player_manager: Any,
     game_state: Any,
     utils: Any,
+    command_mode: str = SEQUENTIAL,
 ) -> None:
     """Legacy entry point retained for backwards compatibility."""
     print("[Tick] Background tick service starting...")
@@ -435,6 +643,7 @@ async def start_background_tick(
         player_manager,
         game_state,
         utils,
+        command_mode=command_mode,
     )
 
     await service.run_forever()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# backend/tools/parser_bench.py
+"""
+Micro-benchmark for the natural language parser.
+
+Parses a corpus of commands the way players type them (mostly the same few
+short commands over and over) twice: cold, with the parse caches cleared
+before every command, and warm, with the caches kept. Debug logging is
+switched off so the numbers measure parsing, not log I/O.
+
+Usage (from anywhere):
+    python3 backend/tools/parser_bench.py [--rounds N]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import argparse
+import logging
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from commands import natural_language_parser as nlp
+from managers.game_state import GameState
+from models.Item import Item
+from models.Player import Player
+from models.Room import Room
+
+# Roughly the mix seen in play: movement and look/inventory dominate.
+CORPUS: Tuple[str, ...] = (
+    ("n", "s", "e", "w", "l", "i", "look", "north", "go south", "score")
+    + ("kill rat", "get sword", "get all", "drop coins", "look at sword")
+    + ("l", "n", "n", "i", "kill rat", "e", "l", "w", "get sword")
+    + ("put sword in chest", "give coins to guard", "say hello there")
+    + ("get sword and n, look", "attack rat with sword")
+)
+
+
+def _world() -> Tuple[Player, GameState]:
+    game_state = GameState()
+    room = Room("bench_room", "Bench Room", "A room for benchmarks.")
+    for name in ("Sword", "Chest", "Coins"):
+        room.add_item(Item(name, f"{name.lower()}_1", f"A {name.lower()}."))
+    game_state.add_room(room)
+    player = Player("Bencher")
+    player.set_current_room("bench_room")
+    return player, game_state
+
+
+def clear_caches(parser: nlp.NaturalLanguageParser) -> None:
+    nlp._scan_tokens.cache_clear()
+    nlp.split_chained_commands.cache_clear()
+    parser._syntax_cache.clear()
+
+
+def run(rounds: int, before_each: Optional[Callable[[], None]] = None) -> float:
+    """Seconds per parse over ``rounds`` passes of the corpus."""
+    player, game_state = _world()
+    parser = nlp.natural_language_parser
+    parse: Callable[[str, Any, Any], List[Any]] = parser.parse
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for command in CORPUS:
+            if before_each is not None:
+                before_each()
+            parse(command, player, game_state)
+    return (time.perf_counter() - started) / (rounds * len(CORPUS))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rounds", type=int, default=200)
+    args = arg_parser.parse_args(argv)
+
+    logger = logging.getLogger(nlp.__name__)
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    parser = nlp.natural_language_parser
+    try:
+        cold = run(args.rounds, lambda: clear_caches(parser))
+        clear_caches(parser)
+        warm = run(args.rounds)
+    finally:
+        logger.setLevel(level)
+
+    print(f"corpus: {len(CORPUS)} commands x {args.rounds} rounds")
+    print(f"cold (caches cleared): {cold * 1e6:8.1f} us/parse")
+    print(f"warm (cached stages):  {warm * 1e6:8.1f} us/parse")
+    print(f"speedup: {cold / warm:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
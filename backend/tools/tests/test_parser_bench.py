@@ -0,0 +1,30 @@
+# backend/tools/tests/test_parser_bench.py
+"""Tests for tools.parser_bench."""
+
+import contextlib
+import io
+import unittest
+
+from tools import parser_bench
+
+
+class ParserBenchTest(unittest.TestCase):
+    """Test the parser micro-benchmark runs end to end."""
+
+    def test_main_reports_cold_and_warm_timings(self) -> None:
+        """Test one round prints both timings and the speedup."""
+        # Arrange
+        out = io.StringIO()
+
+        # Act
+        with contextlib.redirect_stdout(out):
+            status = parser_bench.main(["--rounds", "1"])
+
+        # Assert
+        self.assertEqual(status, 0)
+        self.assertIn("cold (caches cleared)", out.getvalue())
+        self.assertIn("speedup:", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
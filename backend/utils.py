@@ -1,27 +1,31 @@
 # backend/utils.py
 from typing import Any, Dict, Optional, Tuple
+from globals import online_sessions
+from managers.session import Session
 from models.StatefulItem import StatefulItem
+from services.stats_updates import player_stats, send_stats
 
 
 async def send_message(sio: Any, sid: str, message: str) -> None:
     await sio.emit("message", message, room=sid)
 
 
-async def send_stats_update(sio: Any, sid: str, player: Any) -> None:
-    if not player:
+async def send_stats_update(
+    sio: Any, sid: str, player: Any, force: bool = False
+) -> None:
+    """
+    Send ``player``'s stats to ``sid``: only when they changed, at a capped
+    rate (see services.stats_updates). Sessions the server does not know
+    (tools, tests) always get the full stats.
+    """
+    session = online_sessions.get(sid)
+    if isinstance(session, (dict, Session)):
+        await send_stats(sio, sid, session, player, force=force)
         return
 
-    # Defensive: some call sites may pass non-player objects (e.g., mobs).
-    required_attrs = ("points", "stamina", "max_stamina")
-    if any(not hasattr(player, attr) for attr in required_attrs):
-        return
-    stats_data: Dict[str, Any] = {
-        "name": player.name,
-        "score": player.points,
-        "stamina": player.stamina,
-        "max_stamina": player.max_stamina,
-    }
-    await sio.emit("statsUpdate", stats_data, room=sid)
+    stats_data = player_stats(player)
+    if stats_data is not None:
+        await sio.emit("statsUpdate", stats_data, room=sid)
 
 
 # utils/door_utils.py
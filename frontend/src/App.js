@@ -59,6 +59,7 @@ function App() {
 
     socketRef.current = io(SOCKET_URL, {
       transports: ['websocket'],
+      auth: { statsDelta: true },
       reconnection: false,   // Disable auto-reconnection
       pingInterval: 60000,   // 60 seconds (in ms)
       pingTimeout: 180000,    // 180 seconds (in ms)
@@ -75,8 +76,8 @@ function App() {
       setInputDisabled(true);
     });
 
-    // Listen for general messages from the server
-    socketRef.current.on('message', (msg) => {
+    // General messages from the server
+    const handleMessage = (msg) => {
       setMessages((prev) => {
         let newMessages = [...prev];
         if (newMessages.length > 0 && newMessages[newMessages.length - 1] === "* ") {
@@ -84,20 +85,41 @@ function App() {
         }
         return [...newMessages, msg, "* "];
       });
-    });
+    };
 
-    // Listen for input type changes (e.g., switching to password mode)
-    socketRef.current.on('setInputType', (type) => {
+    // Input type changes (e.g., switching to password mode)
+    const handleSetInputType = (type) => {
       setInputType(type);
-    });
+    };
 
-    // Listen for stats updates (HUD)
-    socketRef.current.on('statsUpdate', (data) => {
-      setPlayerName(data.name);
-      setPlayerScore(data.score);
-      setPlayerStamina(data.stamina);
-      setMaxStamina(data.max_stamina);
+    // Stats updates (HUD)
+    // Updates may carry only the fields that changed (auth.statsDelta)
+    const handleStatsUpdate = (data) => {
+      if ('name' in data) setPlayerName(data.name);
+      if ('score' in data) setPlayerScore(data.score);
+      if ('stamina' in data) setPlayerStamina(data.stamina);
+      if ('max_stamina' in data) setMaxStamina(data.max_stamina);
       setPhase("game");
+    };
+
+    const batchHandlers = {
+      message: handleMessage,
+      setInputType: handleSetInputType,
+      statsUpdate: handleStatsUpdate,
+    };
+
+    socketRef.current.on('message', handleMessage);
+    socketRef.current.on('setInputType', handleSetInputType);
+    socketRef.current.on('statsUpdate', handleStatsUpdate);
+
+    // The server coalesces a tick's output into one packet of ordered frames
+    socketRef.current.on('batch', (frames) => {
+      (frames || []).forEach(({ event, data }) => {
+        const handler = batchHandlers[event];
+        if (handler) {
+          handler(data);
+        }
+      });
     });
 
     socketRef.current.on('adminToken', (payload) => {
@@ -258,6 +258,21 @@ test('renders the existing game terminal on normal paths', () => {
   expect(screen.queryByText('Admin World Builder')).not.toBeInTheDocument();
 });
 
+test('dispatches each frame of a coalesced batch in order', () => {
+  render(<App />);
+
+  act(() => {
+    socket.handlers.batch([
+      { event: 'message', data: 'You pick up the lamp.' },
+      { event: 'message', data: 'The guard arrives from the north.' },
+    ]);
+  });
+
+  const first = screen.getByText('You pick up the lamp.');
+  const second = screen.getByText('The guard arrives from the north.');
+  expect(first.compareDocumentPosition(second) & Node.DOCUMENT_POSITION_FOLLOWING).toBeTruthy();
+});
+
 test('renders the admin world builder route with the login panel until a token arrives', () => {
   routeTo('/admin/world-builder');
 
@@ -588,6 +603,31 @@ test('surfaces publish failures instead of reporting success', async () => {
   await screen.findByText(/Publish failed: remote rejected/);
 });
 
+test('polls background publish jobs and shows their output', async () => {
+  await renderBuilder({
+    'POST /admin/api/world/publish': () => Promise.resolve({
+      ok: true,
+      status: 202,
+      json: () => Promise.resolve({ job: { id: 'job1', status: 'queued', next_offset: 0, output: [] } }),
+    }),
+    'GET /admin/api/world/publish/jobs/job1?offset=0': () => okJson({
+      job: {
+        id: 'job1',
+        status: 'succeeded',
+        step: 'push',
+        next_offset: 1,
+        output: ['Ran 3 tests'],
+        publish: { ok: true, step: 'push', commit: 'abc123' },
+      },
+    }),
+  });
+
+  fireEvent.click(screen.getByRole('button', { name: 'Publish Git' }));
+
+  await screen.findByText(/Publish complete \(abc123\)/);
+  expect(screen.getByLabelText('Publish output')).toHaveTextContent('Ran 3 tests');
+});
+
 test('clicking a validation issue selects the offending room', async () => {
   await renderBuilder({
     'POST /admin/api/world/validate': () => okJson({
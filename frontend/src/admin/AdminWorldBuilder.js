@@ -33,6 +33,8 @@ import {
 } from './worldUtils';
 
 const HISTORY_LIMIT = 50;
+const PUBLISH_POLL_MS = 1000;
+const PUBLISH_LOG_LIMIT = 200;
 const DIG_DIRECTIONS = ['northwest', 'north', 'northeast', 'west', 'east', 'southwest', 'south', 'southeast', 'up', 'down'];
 const DIG_LABELS = {
   northwest: 'NW', north: 'N', northeast: 'NE', west: 'W', east: 'E',
@@ -133,6 +135,7 @@ export default function AdminWorldBuilder({ adminToken, onAdminTokenInvalid }) {
   const [validation, setValidation] = useState({ ok: true, errors: [], warnings: [] });
   const [apiStatus, setApiStatus] = useState(adminToken ? 'Ready' : 'Waiting for stupidgem admin token.');
   const [apiError, setApiError] = useState('');
+  const [publishLog, setPublishLog] = useState([]);
   const [isBusy, setIsBusy] = useState(false);
   const [drafts, setDrafts] = useState([]);
   const [activeDraftId, setActiveDraftId] = useState('');
@@ -1071,6 +1074,32 @@ export default function AdminWorldBuilder({ adminToken, onAdminTokenInvalid }) {
     }
   }
 
+  // Publishing runs as a background job on the server; poll it for new
+  // output lines until it finishes, then hand back its publish result.
+  async function waitForPublishJob(job) {
+    let current = job;
+    let lines = current.output || [];
+    setPublishLog(lines);
+    const isActive = (candidate) => candidate.status === 'queued' || candidate.status === 'running';
+    while (isActive(current)) {
+      const offset = current.next_offset ?? 0;
+      const payload = await apiRequest(`/admin/api/world/publish/jobs/${encodeURIComponent(current.id)}?offset=${offset}`);
+      current = payload.job;
+      lines = [...lines, ...(current.output || [])].slice(-PUBLISH_LOG_LIMIT);
+      setPublishLog(lines);
+      setApiStatus(`Publishing through Git (${current.step || current.status})...`);
+      if (isActive(current)) {
+        await new Promise((resolve) => setTimeout(resolve, PUBLISH_POLL_MS));
+      }
+    }
+    if (current.status !== 'succeeded') {
+      const failure = new Error(`Publish failed: ${current.error || current.step || 'unknown error'}`);
+      failure.payload = current;
+      throw failure;
+    }
+    return current.publish || { ok: true, step: current.step };
+  }
+
   async function runWorldAction(action) {
     if (busyRef.current) {
       return;
@@ -1100,6 +1129,9 @@ export default function AdminWorldBuilder({ adminToken, onAdminTokenInvalid }) {
     setApiStatus(config.busy);
     try {
       const payload = await apiRequest(config.path, config);
+      if (payload.job) {
+        payload.publish = await waitForPublishJob(payload.job);
+      }
       // Edits made while the request was in flight must survive: never
       // overwrite the local world or clear the dirty flag for a stale send.
       const worldUnchanged = worldRef.current === sentWorld;
@@ -1260,6 +1292,9 @@ export default function AdminWorldBuilder({ adminToken, onAdminTokenInvalid }) {
       <section className="admin-builder__status" aria-live="polite">
         <strong>API status:</strong> {apiStatus}
         {apiError ? <div className="admin-builder__error" role="alert">{apiError}</div> : null}
+        {publishLog.length ? (
+          <pre className="admin-builder__publish-log" aria-label="Publish output">{publishLog.join('\n')}</pre>
+        ) : null}
       </section>
 
       <div className="admin-builder__workspace">